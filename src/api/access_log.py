@@ -0,0 +1,106 @@
+"""
+Structured, sampled access logs.
+
+One JSON line per sampled request on the 'access' logger:
+
+    {"ts": "2026-01-01T10:00:00.123Z", "method": "GET", "path": "/payouts/7",
+     "endpoint": "payouts.get_payout", "status": 200, "duration_ms": 3.2,
+     "bytes": 231, "remote": "10.0.0.4"}
+
+The request thread only samples, builds a small dict and queues it; JSON
+encoding and file I/O happen on the listener thread (app_logging.queued).
+Server errors and slow requests are always logged, the rest at
+ACCESS_LOG_SAMPLE_RATE. Headers and bodies are never logged by default;
+a route opts in to request body capture, truncated to a size cap:
+
+    @bp.route('/', methods=['POST'])
+    @capture_body(max_bytes=1024)
+    def create_payout(): ...
+"""
+import json
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from flask import Response, current_app, g, request
+
+from app_logging import queued
+
+logger = logging.getLogger('access')
+
+_BODY_CAP_ATTRIBUTE = 'access_log_body_max_bytes'
+
+
+class JsonLineFormatter(logging.Formatter):
+    """Formats a record whose msg is a dict as one JSON line, led by its UTC time"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp = datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds')
+        entry = {'ts': timestamp.replace('+00:00', 'Z')}
+        entry.update(record.msg if isinstance(record.msg, dict) else {'message': record.getMessage()})
+        return json.dumps(entry, separators=(',', ':'), default=str)
+
+
+def capture_body(max_bytes: Optional[int] = None):
+    """
+    Include the request body (at most max_bytes, ACCESS_LOG_BODY_MAX_BYTES
+    by default) in the access log lines of a route. Only sampled requests
+    are logged; views that parsed the body share its cached copy.
+    """
+    def decorator(view):
+        setattr(view, _BODY_CAP_ATTRIBUTE, max_bytes if max_bytes is not None else 0)
+        return view
+    return decorator
+
+
+def init_access_log(config):
+    """Send the 'access' logger to ACCESS_LOG_FILE (stdout when empty) through a queue"""
+    if logger.handlers:
+        return
+    handler = logging.FileHandler(config.ACCESS_LOG_FILE) if config.ACCESS_LOG_FILE else logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonLineFormatter())
+    logger.addHandler(queued(handler))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False  # access lines do not belong in app.log
+
+
+def begin_access_log():
+    g.access_log_started = time.perf_counter()
+
+
+def _body(cap: int, config) -> str:
+    limit = cap or config.ACCESS_LOG_BODY_MAX_BYTES
+    # The copy cached when the view parsed the body, so it is not read twice
+    data = request.get_data(cache=True)
+    text = data[:limit].decode('utf-8', errors='replace')
+    return text + '...' if len(data) > limit else text
+
+
+def log_access(response: Response, config):
+    """Queue the access line of the current request, if it is sampled"""
+    started = g.pop('access_log_started', None)
+    if started is None:
+        return
+    duration_ms = (time.perf_counter() - started) * 1000
+    if (response.status_code < 500 and duration_ms < config.ACCESS_LOG_SLOW_MS
+            and random.random() >= config.ACCESS_LOG_SAMPLE_RATE):
+        return
+
+    entry: Dict[str, Any] = {
+        'method': request.method,
+        'path': request.path,
+        'endpoint': request.endpoint,
+        'status': response.status_code,
+        'duration_ms': round(duration_ms, 2),
+        # Known length only: measuring a streamed body would buffer it here, before it is sent
+        'bytes': None if response.is_streamed else response.content_length,
+        'remote': request.remote_addr,
+    }
+    view = current_app.view_functions.get(request.endpoint)
+    cap = getattr(view, _BODY_CAP_ATTRIBUTE, None)
+    if cap is not None:
+        entry['body'] = _body(cap, config)
+    logger.info(entry)
@@ -0,0 +1,165 @@
+"""
+Response compression (gzip, and brotli when the `brotli` package is installed).
+
+Applied last in after_request, once the body and its ETag are final:
+
+    - the encoding is negotiated from Accept-Encoding (q-values honoured,
+      brotli preferred on a tie);
+    - only allowlisted content types are compressed, never
+      text/event-stream, and never a response that already carries a
+      Content-Encoding (the exports gzip themselves) or Cache-Control:
+      no-transform;
+    - buffered bodies under min_size go out as they are: the framing
+      costs more than it saves;
+    - streamed bodies are compressed chunk by chunk with a sync flush, so
+      each chunk still reaches the client as soon as it is produced.
+
+Responses under the cached paths (swagger.json, subject lists, ...) are
+the same bytes request after request; their compressed bodies are kept
+in an LRU keyed by encoding and body digest, compressed once at the
+highest level and then served from memory.
+"""
+import hashlib
+import logging
+import zlib
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+
+from flask import Response, request
+
+from services.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+# Never compressed: every event must reach the client unbuffered
+NEVER_COMPRESSED = frozenset({'text/event-stream'})
+
+
+def _gzip(body: bytes, level: int) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 16+15: gzip header and trailer
+    return compressor.compress(body) + compressor.flush()
+
+
+def _gzip_stream(chunks: Iterable[bytes], level: int) -> Iterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        compressed = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _brotli_stream(chunks: Iterable[bytes], quality: int) -> Iterator[bytes]:
+    compressor = brotli.Compressor(quality=quality)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        compressed = compressor.process(chunk) + compressor.flush()
+        if compressed:
+            yield compressed
+    yield compressor.finish()
+
+
+class ResponseCompression:
+    """Compresses responses in place; one instance per app"""
+
+    def __init__(
+        self,
+        min_size: int = 1024,
+        mimetypes: Sequence[str] = ('application/json',),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        cache_paths: Sequence[str] = (),
+        cache_size: int = 256,
+        cache_max_body: int = 1024 * 1024
+    ):
+        self.min_size = min_size
+        self.mimetypes = frozenset(mimetypes) - NEVER_COMPRESSED
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache_paths = tuple(cache_paths)
+        self.cache_max_body = cache_max_body
+        # Keyed by content digest, so an entry never goes stale; the TTL only frees idle ones
+        self.cache = TTLCache(max_entries=cache_size, ttl_seconds=24 * 3600)
+        self.encodings = ['br', 'gzip'] if brotli is not None else ['gzip']
+
+    @classmethod
+    def from_config(cls, config) -> 'ResponseCompression':
+        return cls(
+            min_size=config.COMPRESSION_MIN_SIZE,
+            mimetypes=config.COMPRESSION_MIMETYPES,
+            gzip_level=config.COMPRESSION_GZIP_LEVEL,
+            brotli_quality=config.COMPRESSION_BROTLI_QUALITY,
+            cache_paths=config.COMPRESSION_CACHE_PATHS,
+            cache_size=config.COMPRESSION_CACHE_SIZE,
+            cache_max_body=config.COMPRESSION_CACHE_MAX_BODY
+        )
+
+    def _compress(self, body: bytes, encoding: str, best: bool = False) -> bytes:
+        if encoding == 'br':
+            return brotli.compress(body, quality=11 if best else self.brotli_quality)
+        return _gzip(body, 9 if best else self.gzip_level)
+
+    def _compress_cached(self, body: bytes, encoding: str) -> bytes:
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        compressed = self.cache.get(key)
+        if compressed is None:
+            compressed = self._compress(body, encoding, best=True)
+            self.cache.set(key, compressed)
+        return compressed
+
+    def _cacheable(self, response: Response, size: int) -> bool:
+        return (request.method == 'GET' and response.status_code == 200 and size <= self.cache_max_body
+                and request.path.startswith(self.cache_paths))
+
+    def _skip(self, response: Response) -> bool:
+        return (response.status_code < 200 or response.status_code in (204, 206, 304)
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers
+                or 'no-transform' in response.headers.get('Cache-Control', ''))
+
+    def apply(self, response: Response) -> Response:
+        """Compress response for the current request when worthwhile; returns it"""
+        if response.mimetype not in self.mimetypes or self._skip(response):
+            return response
+        # The body depends on Accept-Encoding from here on, whether or not this one is compressed
+        response.vary.add('Accept-Encoding')
+        encoding = request.accept_encodings.best_match(self.encodings)
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            chunks = response.response
+            if encoding == 'br':
+                response.response = _brotli_stream(chunks, self.brotli_quality)
+            else:
+                response.response = _gzip_stream(chunks, self.gzip_level)
+            response.headers.pop('Content-Length', None)
+        else:
+            body = response.get_data()
+            if len(body) < self.min_size:
+                return response
+            if self._cacheable(response, len(body)):
+                compressed = self._compress_cached(body, encoding)
+            else:
+                compressed = self._compress(body, encoding)
+            if len(compressed) >= len(body):
+                return response  # incompressible (already compressed data)
+            response.set_data(compressed)
+
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            # The compressed bytes differ from the identity ones; a strong ETag must not claim otherwise
+            response.set_etag(etag, weak=True)
+        return response
+
+    def stats(self) -> Dict[str, Optional[int]]:
+        """Precompressed body cache counters"""
+        return self.cache.stats()
@@ -0,0 +1,53 @@
+# conditional.py
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Callable, Optional, Tuple
+from flask import current_app, make_response, request
+
+# (row count, latest updated_at, highest id) of a collection, from one aggregate query
+Fingerprint = Tuple[int, Optional[datetime], Optional[int]]
+
+
+def _digest(*parts) -> str:
+    return hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()[:20]
+
+def entity_validators(entity) -> Tuple[str, Optional[datetime]]:
+    """ETag and Last-Modified of a single domain object, from its id and updated_at"""
+    return _digest(type(entity).__name__, entity.id, entity.updated_at.isoformat()), entity.updated_at
+
+def collection_validators(fingerprint: Fingerprint) -> Tuple[str, Optional[datetime]]:
+    """
+    ETag and Last-Modified of a collection. Inserts move the count/max id,
+    updates move the latest updated_at and deletes move the count; the full
+    path (query string included) keeps pages and filters apart.
+    """
+    count, last_updated, max_id = fingerprint
+    return _digest(request.full_path, count, last_updated.isoformat() if last_updated else '', max_id), last_updated
+
+def _not_modified(etag: str, last_modified: Optional[datetime]) -> bool:
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    # If-Modified-Since is only consulted without If-None-Match (RFC 9110 13.2.2)
+    if request.if_modified_since and last_modified:
+        return last_modified.replace(microsecond=0, tzinfo=timezone.utc) <= request.if_modified_since
+    return False
+
+def conditional_response(validators: Tuple[str, Optional[datetime]], build: Callable):
+    """
+    Answer 304 when the client's copy is current, otherwise call build()
+    (which serializes the body). Either way the validators are sent along.
+    """
+    etag, last_modified = validators
+    if _not_modified(etag, last_modified):
+        response = current_app.response_class(status=304)
+    else:
+        response = make_response(build())
+        if response.status_code != 200:
+            return response
+    response.set_etag(etag, weak=True)
+    if last_modified:
+        response.last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # Clients may keep the body but must revalidate before using it
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
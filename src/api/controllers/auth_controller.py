@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from infrastructure.models.user_model import UserModel
 from infrastructure.models.subject_model import SubjectModel
 from infrastructure.repositories.subject_repository import SubjectRepository
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import get_session
 from domain.models.subject import Subject, SubjectLevel
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
@@ -18,7 +18,7 @@ def login():
 @auth_bp.route('/test-subject-repository', methods=['GET'])
 def test_subject_repository():
     try:
-        subject_repo = SubjectRepository(session=session)
+        subject_repo = SubjectRepository(session=get_session())
         
         subject = subject_repo.count()
         return jsonify({
@@ -26,7 +26,7 @@ def test_subject_repository():
             'data': {
                 'total_subjects': subject,
                 'repository_type': 'SubjectRepository',
-                'session_management': 'Shared session from controller'
+                'session_management': 'Request-scoped session'
             },
             'message': '123456789'
         }), 200       
@@ -0,0 +1,321 @@
+from flask import Blueprint, request, jsonify
+from marshmallow import ValidationError
+from datetime import datetime
+from services.availability_service import AvailabilityService
+from infrastructure.repositories.availability_slot_repository import AvailabilitySlotRepository
+from infrastructure.repositories.booking_repository import BookingRepository
+from infrastructure.repositories.tutor_subject_repository import TutorSubjectRepository
+from api.schemas.availability import (
+    AvailabilityWindowRequestSchema,
+    FreeWindowsRequestSchema,
+    FreeWindowSchema,
+    FreeGridRequestSchema,
+    FreeGridResponseSchema,
+    TutorFreeResponseSchema
+)
+from infrastructure.cache.indexes import availability_index
+from infrastructure.databases.mssql import get_session
+from config import get_config
+
+bp = Blueprint('availability', __name__, url_prefix='/availability')
+
+Config = get_config()
+
+# Service factory (one service per request, bound to the request-scoped session)
+def get_availability_service() -> AvailabilityService:
+    """Build the availability service on the session of the current request"""
+    session = get_session()
+    return AvailabilityService(
+        AvailabilitySlotRepository(session),
+        BookingRepository(session),
+        TutorSubjectRepository(session),
+        availability_index,
+        horizon_days=Config.AVAILABILITY_HORIZON_DAYS
+    )
+
+# Initialize schemas
+window_schema = AvailabilityWindowRequestSchema()
+free_windows_schema = FreeWindowsRequestSchema()
+free_window_schema = FreeWindowSchema()
+tutor_free_schema = TutorFreeResponseSchema()
+free_grid_request_schema = FreeGridRequestSchema()
+free_grid_response_schema = FreeGridResponseSchema()
+
+@bp.route('/tutors/<int:tutor_id>/free', methods=['GET'])
+def is_tutor_free(tutor_id):
+    """
+    Check whether a tutor is free
+    ---
+    get:
+      summary: Check whether a tutor is free for the whole of [start, end)
+      description: >
+        Slots come from the availability index; bookings are checked in the
+        database, so a booking made a moment ago already makes the tutor busy.
+      parameters:
+        - name: tutor_id
+          in: path
+          required: true
+          schema:
+            type: integer
+        - name: start
+          in: query
+          required: true
+          schema:
+            type: string
+            format: date-time
+          description: Window start (UTC)
+        - name: end
+          in: query
+          required: true
+          schema:
+            type: string
+            format: date-time
+          description: Window end (UTC, exclusive)
+      tags:
+        - Availability
+      responses:
+        200:
+          description: Free/busy answer
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/TutorFreeResponseSchema'
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        data = window_schema.load(request.args)
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        free = get_availability_service().can_book(tutor_id, data['start'], data['end'])
+        return jsonify(tutor_free_schema.dump({'tutor_id': tutor_id, 'free': free})), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/tutors/<int:tutor_id>/windows', methods=['GET'])
+def get_free_windows(tutor_id):
+    """
+    Get the next free windows of a tutor
+    ---
+    get:
+      summary: Next free windows of at least `duration` minutes
+      parameters:
+        - name: tutor_id
+          in: path
+          required: true
+          schema:
+            type: integer
+        - name: after
+          in: query
+          required: false
+          schema:
+            type: string
+            format: date-time
+          description: Earliest start (UTC), defaults to now
+        - name: count
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 5
+        - name: duration
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 60
+          description: Minimum window length in minutes
+      tags:
+        - Availability
+      responses:
+        200:
+          description: Free windows in ascending order
+          content:
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/FreeWindowSchema'
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        data = free_windows_schema.load(request.args)
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        windows = get_availability_service().get_next_free_windows(
+            tutor_id,
+            data.get('after') or datetime.utcnow(),
+            count=data['count'],
+            duration_minutes=data['duration']
+        )
+        return jsonify(free_window_schema.dump(
+            [{'start': start, 'end': end} for start, end in windows], many=True
+        )), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/tutors', methods=['GET'])
+def get_free_tutors():
+    """
+    Get all tutors free in a window
+    ---
+    get:
+      summary: Ids of all tutors free for the whole of [start, end)
+      description: >
+        Answered from the availability index, so bookings made in the last
+        AVAILABILITY_INDEX_TTL seconds (60 by default) may not be subtracted yet.
+        Confirm a candidate with /availability/tutors/{tutor_id}/free.
+      parameters:
+        - name: start
+          in: query
+          required: true
+          schema:
+            type: string
+            format: date-time
+        - name: end
+          in: query
+          required: true
+          schema:
+            type: string
+            format: date-time
+        - name: subject_id
+          in: query
+          required: false
+          schema:
+            type: integer
+          description: Only tutors teaching this subject
+      tags:
+        - Availability
+      responses:
+        200:
+          description: Free tutor ids
+          content:
+            application/json:
+              schema:
+                type: array
+                items:
+                  type: integer
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        data = window_schema.load(request.args)
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        tutor_ids = get_availability_service().get_free_tutors(data['start'], data['end'], data.get('subject_id'))
+        return jsonify(tutor_ids), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/grid', methods=['GET'])
+def get_free_grid():
+    """
+    Get the free grid of all tutors
+    ---
+    get:
+      summary: For each tutor, which windows of a regular grid (e.g. every hour of a week) are free
+      description: >
+        Windows start at start + k * step for k < count and last duration minutes.
+        Only tutors free in at least one window are listed, paginated with limit/offset.
+        Bookings made in the last AVAILABILITY_INDEX_TTL seconds may not be subtracted yet.
+      parameters:
+        - name: start
+          in: query
+          required: true
+          schema:
+            type: string
+            format: date-time
+          description: Start of the first window (UTC)
+        - name: step
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 60
+          description: Minutes between window starts
+        - name: count
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 168
+          description: Number of windows (max 672)
+        - name: duration
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 60
+          description: Window length in minutes
+        - name: subject_id
+          in: query
+          required: false
+          schema:
+            type: integer
+          description: Only tutors teaching this subject
+        - name: limit
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 100
+          description: Page size (max 1000)
+        - name: offset
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 0
+      tags:
+        - Availability
+      responses:
+        200:
+          description: Window starts and, per tutor, the positions of its free windows
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/FreeGridResponseSchema'
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        data = free_grid_request_schema.load(request.args)
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        windows, total, tutors = get_availability_service().get_free_grid(
+            data['start'],
+            data['step'],
+            data['count'],
+            data['duration'],
+            subject_id=data.get('subject_id'),
+            limit=data['limit'],
+            offset=data['offset']
+        )
+        return jsonify(free_grid_response_schema.dump({
+            'windows': windows,
+            'total': total,
+            'tutors': [{'tutor_id': tutor_id, 'free_windows': free} for tutor_id, free in tutors]
+        })), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,147 @@
+from flask import Blueprint, request, jsonify
+from marshmallow import ValidationError
+from services.booking_detail_service import BookingDetailService
+from infrastructure.repositories.booking_repository import BookingRepository
+from api.schemas.booking import BookingDetailRequestSchema, BookingDetailResponseSchema
+from infrastructure.databases.mssql import get_session
+from api.requests import get_pagination_args, PaginationError
+from api.responses import paginated_response
+
+bp = Blueprint('booking_details', __name__, url_prefix='/bookings')
+
+# Service factory (one service per request, bound to the request-scoped session)
+def get_booking_detail_service() -> BookingDetailService:
+    """Build the booking detail service on the session of the current request"""
+    return BookingDetailService(BookingRepository(get_session()))
+
+# Initialize schemas
+request_schema = BookingDetailRequestSchema()
+detail_schema = BookingDetailResponseSchema()
+
+def parse_include(data: dict):
+    """Relationship names of the include parameter, None (all) when absent"""
+    if 'include' not in data:
+        return None
+    return [name.strip() for name in data['include'].split(',') if name.strip()]
+
+@bp.route('/<int:booking_id>/detail', methods=['GET'])
+def get_booking_detail(booking_id):
+    """
+    Get a booking with its related records
+    ---
+    get:
+      summary: Booking with student, tutor, service, subject, payment, payouts, review and complaints
+      parameters:
+        - name: booking_id
+          in: path
+          required: true
+          schema:
+            type: integer
+        - name: include
+          in: query
+          required: false
+          schema:
+            type: string
+            example: payment,payouts
+          description: Comma-separated relationships to load, all by default (empty for none)
+      tags:
+        - Bookings
+      responses:
+        200:
+          description: Booking detail
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/BookingDetailResponseSchema'
+        400:
+          description: Invalid query parameters
+        404:
+          description: Booking not found
+        500:
+          description: Internal server error
+    """
+    try:
+        include = parse_include(request_schema.load(request.args))
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        detail = get_booking_detail_service().get_booking_detail(booking_id, include)
+        if not detail:
+            return jsonify({'error': 'Booking not found'}), 404
+        return jsonify(detail_schema.dump(detail)), 200
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/student/<int:student_id>/detail', methods=['GET'])
+def get_student_booking_details(student_id):
+    """
+    Get a student's bookings with their related records
+    ---
+    get:
+      summary: One page of a student's bookings with related records, newest first
+      parameters:
+        - name: student_id
+          in: path
+          required: true
+          schema:
+            type: integer
+        - name: include
+          in: query
+          required: false
+          schema:
+            type: string
+          description: Comma-separated relationships to load, all by default (empty for none)
+        - name: limit
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 20
+          description: Page size (max 100)
+        - name: after
+          in: query
+          required: false
+          schema:
+            type: string
+          description: Cursor from the X-Next-Cursor header of the previous page
+      tags:
+        - Bookings
+      responses:
+        200:
+          description: One page of booking details
+          headers:
+            X-Next-Cursor:
+              description: Cursor of the next page, absent on the last page
+              schema:
+                type: string
+          content:
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/BookingDetailResponseSchema'
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        include = parse_include(request_schema.load(request.args))
+        limit, after = get_pagination_args()
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        details = get_booking_detail_service().get_student_booking_details(student_id, limit, after, include)
+        return paginated_response(details, detail_schema, limit)
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,36 @@
+from flask import Blueprint, jsonify
+from infrastructure.cache.read_through import get_cache_stats
+
+bp = Blueprint('cache', __name__, url_prefix='/cache')
+
+@bp.route('/stats', methods=['GET'])
+def cache_stats():
+    """
+    Get read-through cache counters
+    ---
+    get:
+      summary: Hits, misses, entries and evictions per reference data cache (this process)
+      tags:
+        - Cache
+      responses:
+        200:
+          description: Counters keyed by cache name
+          content:
+            application/json:
+              schema:
+                type: object
+                additionalProperties:
+                  type: object
+                  properties:
+                    hits:
+                      type: integer
+                    misses:
+                      type: integer
+                    entries:
+                      type: integer
+                      nullable: true
+                    evictions:
+                      type: integer
+                      nullable: true
+    """
+    return jsonify(get_cache_stats()), 200
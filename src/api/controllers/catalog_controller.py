@@ -0,0 +1,203 @@
+from flask import Blueprint, request, jsonify
+from marshmallow import ValidationError
+from services.catalog_service import CatalogService
+from infrastructure.repositories.cached_repositories import (
+    CachedSubjectRepository,
+    CachedTutorProfileRepository,
+    CachedServiceListingRepository
+)
+from api.schemas.catalog import (
+    SubjectListRequestSchema,
+    ListingListRequestSchema,
+    SubjectResponseSchema,
+    TutorProfileResponseSchema,
+    ServiceListingResponseSchema
+)
+from api.serializers import compile_schema
+from domain.models.subject import SubjectLevel
+from infrastructure.databases.mssql import get_session
+
+bp = Blueprint('catalog', __name__, url_prefix='/catalog')
+
+# Service factory (one service per request, bound to the request-scoped session)
+def get_catalog_service() -> CatalogService:
+    """Build the catalog service on the cached repositories and the session of the current request"""
+    session = get_session()
+    return CatalogService(
+        CachedSubjectRepository(session),
+        CachedTutorProfileRepository(session),
+        CachedServiceListingRepository(session)
+    )
+
+# Initialize schemas
+subject_list_schema = SubjectListRequestSchema()
+listing_list_schema = ListingListRequestSchema()
+subject_serializer = compile_schema(SubjectResponseSchema)
+tutor_profile_serializer = compile_schema(TutorProfileResponseSchema)
+listing_serializer = compile_schema(ServiceListingResponseSchema)
+
+@bp.route('/subjects', methods=['GET'])
+def list_subjects():
+    """
+    List subjects
+    ---
+    get:
+      summary: All subjects, or those of one level
+      description: >
+        Served from the subject cache (see /cache/stats); subject writes
+        made through the repositories clear it.
+      parameters:
+        - name: level
+          in: query
+          required: false
+          schema:
+            type: string
+            enum: [K12, Undergrad, Graduate, Other]
+      tags:
+        - Catalog
+      responses:
+        200:
+          description: Subjects
+          content:
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/SubjectResponseSchema'
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        data = subject_list_schema.load(request.args)
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        level = SubjectLevel(data['level']) if 'level' in data else None
+        subjects = get_catalog_service().list_subjects(level)
+        return jsonify(subject_serializer.dump(subjects, many=True)), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/subjects/<int:subject_id>', methods=['GET'])
+def get_subject(subject_id):
+    """
+    Get subject by ID
+    ---
+    get:
+      summary: Get subject by ID (cached)
+      parameters:
+        - name: subject_id
+          in: path
+          required: true
+          schema:
+            type: integer
+      tags:
+        - Catalog
+      responses:
+        200:
+          description: Subject found
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/SubjectResponseSchema'
+        404:
+          description: Subject not found
+        500:
+          description: Internal server error
+    """
+    try:
+        subject = get_catalog_service().get_subject(subject_id)
+        if not subject:
+            return jsonify({'error': 'Subject not found'}), 404
+        return jsonify(subject_serializer.dump(subject)), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/tutors/<int:tutor_id>', methods=['GET'])
+def get_tutor_profile(tutor_id):
+    """
+    Get a tutor profile
+    ---
+    get:
+      summary: Get the profile of a tutor (cached)
+      description: >
+        Served from the tutor profile cache; profile writes and reviews
+        (rating changes) drop the tutor's entry.
+      parameters:
+        - name: tutor_id
+          in: path
+          required: true
+          schema:
+            type: integer
+          description: User ID of the tutor
+      tags:
+        - Catalog
+      responses:
+        200:
+          description: Tutor profile found
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/TutorProfileResponseSchema'
+        404:
+          description: Tutor profile not found
+        500:
+          description: Internal server error
+    """
+    try:
+        profile = get_catalog_service().get_tutor_profile(tutor_id)
+        if not profile:
+            return jsonify({'error': 'Tutor profile not found'}), 404
+        return jsonify(tutor_profile_serializer.dump(profile)), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/listings', methods=['GET'])
+def list_active_listings():
+    """
+    List active service listings
+    ---
+    get:
+      summary: Active service listings, optionally of one tutor
+      description: >
+        Served from the service listing cache; listing writes made through
+        the repositories drop it.
+      parameters:
+        - name: tutor_id
+          in: query
+          required: false
+          schema:
+            type: integer
+      tags:
+        - Catalog
+      responses:
+        200:
+          description: Active listings
+          content:
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/ServiceListingResponseSchema'
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        data = listing_list_schema.load(request.args)
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        listings = get_catalog_service().list_active_listings(data.get('tutor_id'))
+        return jsonify(listing_serializer.dump(listings, many=True)), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
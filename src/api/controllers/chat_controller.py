@@ -0,0 +1,257 @@
+from flask import Blueprint, request, jsonify
+from marshmallow import ValidationError
+from services.chat_service import ChatService
+from infrastructure.repositories.chat_thread_repository import ChatThreadRepository
+from infrastructure.repositories.message_repository import MessageRepository
+from infrastructure.realtime import event_broker
+from api.schemas.chat import (
+    MessageRequestSchema,
+    MessageResponseSchema,
+    ThreadMessagesRequestSchema,
+    ThreadSummaryRequestSchema,
+    ThreadReadRequestSchema,
+    ThreadSummaryResponseSchema
+)
+from infrastructure.databases.mssql import get_session
+from api.requests import get_pagination_args, PaginationError
+from api.responses import paginated_response
+
+bp = Blueprint('chat', __name__, url_prefix='/chat')
+
+# Service factory (one service per request, bound to the request-scoped session)
+def get_chat_service() -> ChatService:
+    """Build the chat service on the session of the current request"""
+    session = get_session()
+    return ChatService(ChatThreadRepository(session), MessageRepository(session), event_broker)
+
+# Initialize schemas
+request_schema = MessageRequestSchema()
+response_schema = MessageResponseSchema()
+thread_messages_schema = ThreadMessagesRequestSchema()
+summary_request_schema = ThreadSummaryRequestSchema()
+read_request_schema = ThreadReadRequestSchema()
+summary_schema = ThreadSummaryResponseSchema()
+
+@bp.route('/threads', methods=['GET'])
+def get_threads():
+    """
+    Get a user's chat inbox
+    ---
+    get:
+      summary: Threads of a user with last message and unread count, most recently active first
+      parameters:
+        - name: user_id
+          in: query
+          required: true
+          schema:
+            type: integer
+        - name: limit
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 20
+          description: Page size (max 100)
+        - name: after
+          in: query
+          required: false
+          schema:
+            type: string
+          description: Cursor from the X-Next-Cursor header of the previous page
+      tags:
+        - Chat
+      responses:
+        200:
+          description: One page of thread summaries
+          headers:
+            X-Next-Cursor:
+              description: Cursor of the next page, absent on the last page
+              schema:
+                type: string
+          content:
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/ThreadSummaryResponseSchema'
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        data = summary_request_schema.load(request.args)
+        limit, after = get_pagination_args()
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        summaries = get_chat_service().get_thread_summaries(data['user_id'], limit, after)
+        return paginated_response(summaries, summary_schema, limit, cursor_attribute='last_activity_at')
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/threads/<int:thread_id>/read', methods=['POST'])
+def mark_thread_read(thread_id):
+    """
+    Mark a chat thread as read
+    ---
+    post:
+      summary: Reset the user's unread count of a thread
+      parameters:
+        - name: thread_id
+          in: path
+          required: true
+          schema:
+            type: integer
+      requestBody:
+        required: true
+        content:
+          application/json:
+            schema:
+              $ref: '#/components/schemas/ThreadReadRequestSchema'
+      tags:
+        - Chat
+      responses:
+        200:
+          description: Updated thread summary
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/ThreadSummaryResponseSchema'
+        400:
+          description: Invalid request data or user not in the thread
+        404:
+          description: Thread not found
+        500:
+          description: Internal server error
+    """
+    try:
+        data = read_request_schema.load(request.json or {})
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        summary = get_chat_service().mark_thread_read(thread_id, data['user_id'])
+        if not summary:
+            return jsonify({'error': 'Chat thread not found'}), 404
+        return jsonify(summary_schema.dump(summary)), 200
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/threads/<int:thread_id>/messages', methods=['POST'])
+def send_message(thread_id):
+    """
+    Send a chat message
+    ---
+    post:
+      summary: Post a message to a thread; both participants get it on their event stream
+      parameters:
+        - name: thread_id
+          in: path
+          required: true
+          schema:
+            type: integer
+      requestBody:
+        required: true
+        content:
+          application/json:
+            schema:
+              $ref: '#/components/schemas/MessageRequestSchema'
+      tags:
+        - Chat
+      responses:
+        201:
+          description: Message created
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/MessageResponseSchema'
+        400:
+          description: Invalid request data or sender not in the thread
+        404:
+          description: Thread not found
+        500:
+          description: Internal server error
+    """
+    try:
+        data = request_schema.load(request.json or {})
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        message = get_chat_service().send_message(
+            thread_id, data['sender_id'], data['body'], data.get('attachment_url')
+        )
+        if not message:
+            return jsonify({'error': 'Chat thread not found'}), 404
+        return jsonify(response_schema.dump(message)), 201
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/threads/<int:thread_id>/messages', methods=['GET'])
+def get_thread_messages(thread_id):
+    """
+    Get the latest messages of a thread
+    ---
+    get:
+      summary: Latest messages of a thread, oldest first (use /stream for new ones)
+      parameters:
+        - name: thread_id
+          in: path
+          required: true
+          schema:
+            type: integer
+        - name: user_id
+          in: query
+          required: true
+          schema:
+            type: integer
+        - name: limit
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 50
+      tags:
+        - Chat
+      responses:
+        200:
+          description: Messages
+          content:
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/MessageResponseSchema'
+        400:
+          description: Invalid query parameters or user not in the thread
+        404:
+          description: Thread not found
+        500:
+          description: Internal server error
+    """
+    try:
+        data = thread_messages_schema.load(request.args)
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        messages = get_chat_service().get_latest_messages(thread_id, data['user_id'], data['limit'])
+        if messages is None:
+            return jsonify({'error': 'Chat thread not found'}), 404
+        return jsonify(response_schema.dump(messages, many=True)), 200
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,260 @@
+from flask import Blueprint, request, jsonify
+from marshmallow import ValidationError
+from services.export_service import ExportService
+from infrastructure.repositories.payment_repository import PaymentRepository
+from infrastructure.repositories.payout_repository import PayoutRepository
+from infrastructure.repositories.booking_repository import BookingRepository
+from domain.models.booking import BookingStatus
+from domain.models.payment import PaymentStatus
+from domain.models.payout import PayoutStatus
+from api.schemas.export import ExportRequestSchema
+from api.exports import export_response
+from infrastructure.databases.mssql import get_session
+from config import get_config
+
+bp = Blueprint('exports', __name__, url_prefix='/exports')
+
+Config = get_config()
+
+# Service factory (one service per request, bound to the request-scoped session)
+def get_export_service() -> ExportService:
+    """Build the export service on the session of the current request"""
+    session = get_session()
+    return ExportService(
+        PaymentRepository(session),
+        PayoutRepository(session),
+        BookingRepository(session),
+        chunk_size=Config.EXPORT_FETCH_SIZE
+    )
+
+# Initialize schemas
+request_schema = ExportRequestSchema()
+
+def load_args() -> dict:
+    """Export query parameters; status may be repeated"""
+    args = {key: value for key, value in request.args.items() if key != 'status'}
+    if 'status' in request.args:
+        args['status'] = request.args.getlist('status')
+    return request_schema.load(args)
+
+@bp.route('/payments', methods=['GET'])
+def export_payments():
+    """
+    Export payments
+    ---
+    get:
+      summary: Stream all matching payments, oldest first, as NDJSON or a JSON array
+      parameters:
+        - name: status
+          in: query
+          required: false
+          schema:
+            type: array
+            items:
+              type: string
+              enum: [Authorized, Captured, Failed, Refunded]
+          description: Repeat for several statuses (all by default)
+        - name: from
+          in: query
+          required: false
+          schema:
+            type: string
+            format: date-time
+          description: Only payments created at or after this time (UTC)
+        - name: to
+          in: query
+          required: false
+          schema:
+            type: string
+            format: date-time
+          description: Only payments created before this time (UTC)
+        - name: format
+          in: query
+          required: false
+          schema:
+            type: string
+            enum: [ndjson, json]
+            default: ndjson
+      tags:
+        - Exports
+      responses:
+        200:
+          description: Streamed payments, gzip-encoded when the client accepts it
+          content:
+            application/x-ndjson:
+              schema:
+                $ref: '#/components/schemas/PaymentResponseSchema'
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/PaymentResponseSchema'
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        data = load_args()
+        statuses = [PaymentStatus(status) for status in data['status']]
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+    except ValueError:
+        return jsonify({'error': 'Invalid payment status'}), 400
+
+    try:
+        rows = get_export_service().export_payments(statuses, data.get('created_from'), data.get('created_to'))
+        return export_response(rows, data['format'], 'payments')
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/payouts', methods=['GET'])
+def export_payouts():
+    """
+    Export payouts
+    ---
+    get:
+      summary: Stream all matching payouts, oldest first, as NDJSON or a JSON array
+      parameters:
+        - name: status
+          in: query
+          required: false
+          schema:
+            type: array
+            items:
+              type: string
+              enum: [Pending, Processing, Paid, Failed]
+          description: Repeat for several statuses (all by default)
+        - name: from
+          in: query
+          required: false
+          schema:
+            type: string
+            format: date-time
+          description: Only payouts created at or after this time (UTC)
+        - name: to
+          in: query
+          required: false
+          schema:
+            type: string
+            format: date-time
+          description: Only payouts created before this time (UTC)
+        - name: format
+          in: query
+          required: false
+          schema:
+            type: string
+            enum: [ndjson, json]
+            default: ndjson
+      tags:
+        - Exports
+      responses:
+        200:
+          description: Streamed payouts, gzip-encoded when the client accepts it
+          content:
+            application/x-ndjson:
+              schema:
+                $ref: '#/components/schemas/PayoutResponseSchema'
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/PayoutResponseSchema'
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        data = load_args()
+        statuses = [PayoutStatus(status) for status in data['status']]
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+    except ValueError:
+        return jsonify({'error': 'Invalid payout status'}), 400
+
+    try:
+        rows = get_export_service().export_payouts(statuses, data.get('created_from'), data.get('created_to'))
+        return export_response(rows, data['format'], 'payouts')
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/bookings', methods=['GET'])
+def export_bookings():
+    """
+    Export bookings
+    ---
+    get:
+      summary: Stream all matching bookings, oldest first, as NDJSON or a JSON array
+      parameters:
+        - name: status
+          in: query
+          required: false
+          schema:
+            type: array
+            items:
+              type: string
+              enum: [Pending, Confirmed, InProgress, Completed, Canceled, Refunded]
+          description: Repeat for several statuses (all by default)
+        - name: from
+          in: query
+          required: false
+          schema:
+            type: string
+            format: date-time
+          description: Only bookings created at or after this time (UTC)
+        - name: to
+          in: query
+          required: false
+          schema:
+            type: string
+            format: date-time
+          description: Only bookings created before this time (UTC)
+        - name: format
+          in: query
+          required: false
+          schema:
+            type: string
+            enum: [ndjson, json]
+            default: ndjson
+      tags:
+        - Exports
+      responses:
+        200:
+          description: Streamed bookings, gzip-encoded when the client accepts it
+          content:
+            application/x-ndjson:
+              schema:
+                $ref: '#/components/schemas/BookingResponseSchema'
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/BookingResponseSchema'
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        data = load_args()
+        statuses = [BookingStatus(status) for status in data['status']]
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+    except ValueError:
+        return jsonify({'error': 'Invalid booking status'}), 400
+
+    try:
+        rows = get_export_service().export_bookings(statuses, data.get('created_from'), data.get('created_to'))
+        return export_response(rows, data['format'], 'bookings')
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,116 @@
+import hmac
+import logging
+
+from flask import Blueprint, Response, current_app, jsonify, request
+from api.instrumentation import endpoint_metrics
+from api.prometheus import CONTENT_TYPE, PrometheusText
+from infrastructure.databases.mssql import get_pool_stats, get_session
+from infrastructure.notifications import build_senders
+from infrastructure.realtime import event_broker
+from infrastructure.repositories.notification_repository import NotificationRepository
+from services.notification_dispatch_service import NotificationDispatchService
+from config import get_config
+
+logger = logging.getLogger(__name__)
+
+bp = Blueprint('metrics', __name__)
+
+Config = get_config()
+
+# Service factory (one service per request, bound to the request-scoped session)
+def get_dispatch_service() -> NotificationDispatchService:
+    """Build the dispatch service on the session of the current request (for queue stats)"""
+    session = get_session()
+    return NotificationDispatchService(lambda: NotificationRepository(session), build_senders())
+
+def authorized() -> bool:
+    """With METRICS_TOKEN set, scrapes must send it as a bearer token"""
+    if not Config.METRICS_TOKEN:
+        return True
+    header = request.headers.get('Authorization', '')
+    return hmac.compare_digest(header, f'Bearer {Config.METRICS_TOKEN}')
+
+def add_request_metrics(text: PrometheusText):
+    snapshot = endpoint_metrics.snapshot()
+    labels = {key: {'endpoint': key[0], 'method': key[1]} for key in snapshot}
+
+    text.add('http_requests_total', 'counter', 'Requests handled',
+             [(labels[key], stats['requests']) for key, stats in snapshot.items()])
+    text.add('http_request_errors_total', 'counter', 'Requests answered with a 5xx status',
+             [(labels[key], stats['errors']) for key, stats in snapshot.items()])
+    text.add('http_request_duration_seconds', 'summary', 'Request latency (quantiles over the most recent requests)',
+             [({**labels[key], 'quantile': str(fraction)}, value)
+              for key, stats in snapshot.items() for fraction, value in stats['quantiles'].items()])
+    text.add('http_request_duration_seconds', 'summary', '',
+             [(labels[key], stats['seconds']) for key, stats in snapshot.items()], suffix='_sum')
+    text.add('http_request_duration_seconds', 'summary', '',
+             [(labels[key], stats['requests']) for key, stats in snapshot.items()], suffix='_count')
+    text.add('http_request_db_seconds_total', 'counter', 'Time spent executing SQL statements',
+             [(labels[key], stats['db_seconds']) for key, stats in snapshot.items()])
+    text.add('http_request_db_queries_total', 'counter', 'SQL statements executed',
+             [(labels[key], stats['queries']) for key, stats in snapshot.items()])
+    text.add('http_request_db_rows_total', 'counter', 'Rows reported by the database driver',
+             [(labels[key], stats['rows']) for key, stats in snapshot.items()])
+    text.add('http_request_serialize_seconds_total', 'counter', 'Time spent serializing responses to JSON',
+             [(labels[key], stats['serialize_seconds']) for key, stats in snapshot.items()])
+
+def add_pool_metrics(text: PrometheusText):
+    for name, value in get_pool_stats().items():
+        metric_type = 'counter' if name.endswith('_total') else 'gauge'
+        name = name[len('pool_'):] if name.startswith('pool_') else name
+        text.add(f'db_pool_{name}', metric_type, f'Connection pool {name.replace("_", " ")}', [({}, value)])
+
+def add_stream_metrics(text: PrometheusText):
+    stats = event_broker.stats()
+    text.add('stream_subscribers', 'gauge', 'Open event stream subscriptions', [({}, stats['subscribers'])])
+    text.add('stream_buffered_users', 'gauge', 'Users with buffered events for resume', [({}, stats['buffered_users'])])
+
+def add_dispatch_metrics(text: PrometheusText):
+    queues = get_dispatch_service().queue_stats()
+    text.add('notification_queue_depth', 'gauge', 'Notifications waiting for delivery',
+             [({'channel': channel.value}, stats.depth) for channel, stats in queues.items()])
+    text.add('notification_queue_due', 'gauge', 'Notifications ready to be claimed',
+             [({'channel': channel.value}, stats.due) for channel, stats in queues.items()])
+    text.add('notification_queue_oldest_age_seconds', 'gauge', 'Age of the oldest waiting notification',
+             [({'channel': channel.value}, stats.oldest_age_seconds()) for channel, stats in queues.items()])
+
+def add_compression_metrics(text: PrometheusText):
+    compression = current_app.extensions.get('compression')
+    if compression is None:
+        return
+    stats = compression.stats()
+    text.add('compression_cache_entries', 'gauge', 'Precompressed bodies in memory', [({}, stats['entries'])])
+    for name in ('hits', 'misses', 'evictions'):
+        text.add(f'compression_cache_{name}_total', 'counter', f'Precompressed body cache {name}', [({}, stats[name])])
+
+@bp.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    Get process metrics
+    ---
+    get:
+      summary: Request latencies (p50/p95/p99), DB time and query counts per endpoint, pool, stream and dispatch queue gauges
+      description: Prometheus text exposition format. Requires a bearer token when METRICS_TOKEN is set.
+      tags:
+        - Metrics
+      responses:
+        200:
+          description: Metrics in Prometheus text format
+          content:
+            text/plain:
+              schema:
+                type: string
+        401:
+          description: Missing or wrong token
+    """
+    if not authorized():
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    text = PrometheusText()
+    # A failing source (e.g. the database behind the queue stats) must not hide the others
+    for add in (add_request_metrics, add_pool_metrics, add_stream_metrics, add_dispatch_metrics, add_compression_metrics):
+        try:
+            add(text)
+        except Exception as e:
+            logger.warning('Metrics source %s failed: %s', add.__name__, e)
+    return Response(text.render(), content_type=CONTENT_TYPE)
@@ -0,0 +1,324 @@
+from flask import Blueprint, request, jsonify
+from marshmallow import ValidationError
+from services.notification_inbox_service import NotificationInboxService
+from services.notification_dispatch_service import NotificationDispatchService
+from infrastructure.notifications import build_senders
+from infrastructure.realtime import event_broker
+from infrastructure.repositories.notification_repository import NotificationRepository
+from api.schemas.notification import (
+    NotificationRequestSchema,
+    NotificationResponseSchema,
+    NotificationUserSchema,
+    NotificationInboxRequestSchema,
+    UnreadCountResponseSchema,
+    ChannelQueueStatsSchema
+)
+from domain.models.notification import NotificationType, NotificationChannel
+from infrastructure.databases.mssql import get_session
+from api.requests import get_pagination_args, PaginationError
+from api.responses import paginated_response
+from api.conditional import collection_validators, conditional_response
+
+bp = Blueprint('notifications', __name__, url_prefix='/notifications')
+
+# Service factory (one service per request, bound to the request-scoped session)
+def get_inbox_service() -> NotificationInboxService:
+    """Build the inbox service on the session of the current request"""
+    return NotificationInboxService(NotificationRepository(get_session()), event_broker)
+
+def get_dispatch_service() -> NotificationDispatchService:
+    """Build the dispatch service on the session of the current request (for queue stats)"""
+    session = get_session()
+    return NotificationDispatchService(lambda: NotificationRepository(session), build_senders())
+
+# Initialize schemas
+request_schema = NotificationRequestSchema()
+response_schema = NotificationResponseSchema()
+user_schema = NotificationUserSchema()
+inbox_schema = NotificationInboxRequestSchema()
+unread_count_schema = UnreadCountResponseSchema()
+queue_stats_schema = ChannelQueueStatsSchema()
+
+@bp.route('/', methods=['POST'])
+def create_notification():
+    """
+    Create a notification
+    ---
+    post:
+      summary: Create a notification (in-app ones count as unread at once)
+      tags:
+        - Notifications
+      requestBody:
+        required: true
+        content:
+          application/json:
+            schema:
+              $ref: '#/components/schemas/NotificationRequestSchema'
+      responses:
+        201:
+          description: Notification created
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/NotificationResponseSchema'
+        400:
+          description: Invalid request data
+        500:
+          description: Internal server error
+    """
+    try:
+        data = request_schema.load(request.json or {})
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        notification = get_inbox_service().notify(
+            user_id=data['user_id'],
+            type=NotificationType(data['type']),
+            payload=data['payload'],
+            channel=NotificationChannel(data['channel'])
+        )
+        return jsonify(response_schema.dump(notification)), 201
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/', methods=['GET'])
+def get_inbox():
+    """
+    Get a user's inbox
+    ---
+    get:
+      summary: Notifications of a user, newest first, one keyset page
+      parameters:
+        - name: user_id
+          in: query
+          required: true
+          schema:
+            type: integer
+        - name: unread
+          in: query
+          required: false
+          schema:
+            type: boolean
+            default: false
+          description: Only sent, unread notifications
+        - name: limit
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 20
+          description: Page size (max 100)
+        - name: after
+          in: query
+          required: false
+          schema:
+            type: string
+          description: Cursor from the X-Next-Cursor header of the previous page
+        - name: If-None-Match
+          in: header
+          required: false
+          schema:
+            type: string
+          description: ETag of the copy held by the client
+      tags:
+        - Notifications
+      responses:
+        200:
+          description: One page of notifications
+          headers:
+            X-Next-Cursor:
+              description: Cursor of the next page, absent on the last page
+              schema:
+                type: string
+          content:
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/NotificationResponseSchema'
+        304:
+          description: Not modified since the ETag / Last-Modified sent by the client
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        data = inbox_schema.load(request.args)
+        limit, after = get_pagination_args()
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        service = get_inbox_service()
+        user_id = data['user_id']
+        # One aggregate query decides 304 before the page is loaded
+        return conditional_response(
+            collection_validators(service.get_inbox_fingerprint(user_id)),
+            lambda: paginated_response(
+                service.get_inbox(user_id, limit, after, unread_only=data['unread']), response_schema, limit
+            )
+        )
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/unread-count', methods=['GET'])
+def get_unread_count():
+    """
+    Get the unread badge count
+    ---
+    get:
+      summary: Number of sent, unread notifications of a user (one key lookup)
+      parameters:
+        - name: user_id
+          in: query
+          required: true
+          schema:
+            type: integer
+      tags:
+        - Notifications
+      responses:
+        200:
+          description: Unread count
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/UnreadCountResponseSchema'
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        user_id = user_schema.load(request.args)['user_id']
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        count = get_inbox_service().get_unread_count(user_id)
+        return jsonify(unread_count_schema.dump({'user_id': user_id, 'unread_count': count})), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/<int:notification_id>/read', methods=['POST'])
+def mark_read(notification_id):
+    """
+    Mark a notification as read
+    ---
+    post:
+      summary: Mark one of the user's notifications as read
+      parameters:
+        - name: notification_id
+          in: path
+          required: true
+          schema:
+            type: integer
+      requestBody:
+        required: true
+        content:
+          application/json:
+            schema:
+              $ref: '#/components/schemas/NotificationUserSchema'
+      tags:
+        - Notifications
+      responses:
+        200:
+          description: Notification marked as read
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/NotificationResponseSchema'
+        400:
+          description: Invalid request data
+        404:
+          description: Notification not found for this user
+        500:
+          description: Internal server error
+    """
+    try:
+        user_id = user_schema.load(request.json or {})['user_id']
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        notification = get_inbox_service().mark_read(user_id, notification_id)
+        if not notification:
+            return jsonify({'error': 'Notification not found'}), 404
+        return jsonify(response_schema.dump(notification)), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/read-all', methods=['POST'])
+def mark_all_read():
+    """
+    Mark all notifications as read
+    ---
+    post:
+      summary: Mark all sent notifications of a user as read (one UPDATE)
+      requestBody:
+        required: true
+        content:
+          application/json:
+            schema:
+              $ref: '#/components/schemas/NotificationUserSchema'
+      tags:
+        - Notifications
+      responses:
+        200:
+          description: Unread count after the update (always 0)
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/UnreadCountResponseSchema'
+        400:
+          description: Invalid request data
+        500:
+          description: Internal server error
+    """
+    try:
+        user_id = user_schema.load(request.json or {})['user_id']
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+
+    try:
+        service = get_inbox_service()
+        service.mark_all_read(user_id)
+        return jsonify(unread_count_schema.dump({'user_id': user_id, 'unread_count': service.get_unread_count(user_id)})), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/queue', methods=['GET'])
+def get_queue_stats():
+    """
+    Get the notification dispatch queue
+    ---
+    get:
+      summary: Notifications waiting for delivery per channel, and the age of the oldest
+      tags:
+        - Notifications
+      responses:
+        200:
+          description: Queue depth per channel
+          content:
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/ChannelQueueStatsSchema'
+        500:
+          description: Internal server error
+    """
+    try:
+        stats = get_dispatch_service().queue_stats()
+        return jsonify(queue_stats_schema.dump(list(stats.values()), many=True)), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -1,4 +1,5 @@
 from flask import Blueprint, request, jsonify
+from marshmallow import ValidationError
 from services.payment_service import PaymentService
 from infrastructure.repositories.payment_repository import PaymentRepository
 from api.schemas.payment import (
@@ -8,28 +9,44 @@ from api.schemas.payment import (
     PaymentActionSchema
 )
 from domain.models.payment import PaymentMethod, PaymentStatus
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import get_session
 from decimal import Decimal
 from datetime import datetime
+from api.requests import get_pagination_args, PaginationError
+from api.responses import paginated_response
+from api.serializers import compile_schema
+from api.idempotency import idempotent
+from api.conditional import conditional_response, entity_validators
 
 bp = Blueprint('payments', __name__, url_prefix='/payments')
 
-# Initialize service with repository
-payment_service = PaymentService(PaymentRepository(session))
+# Service factory (one service per request, bound to the request-scoped session)
+def get_payment_service() -> PaymentService:
+    """Build the payment service on the session of the current request"""
+    return PaymentService(PaymentRepository(get_session()))
 
 # Initialize schemas
 request_schema = PaymentRequestSchema()
-response_schema = PaymentResponseSchema()
+response_serializer = compile_schema(PaymentResponseSchema)
 update_schema = PaymentUpdateSchema()
 action_schema = PaymentActionSchema()
 
 @bp.route('/', methods=['POST'])
+@idempotent
 def create_payment():
     """
     Create a new payment
     ---
     post:
       summary: Create a new payment
+      parameters:
+        - name: Idempotency-Key
+          in: header
+          required: false
+          schema:
+            type: string
+            maxLength: 255
+          description: Retries with the same key and body return the first successful response without repeating the action (error responses are not kept)
       tags:
         - Payments
       requestBody:
@@ -47,18 +64,22 @@ def create_payment():
                 $ref: '#/components/schemas/PaymentResponseSchema'
         400:
           description: Invalid request data
+        409:
+          description: A request with the same Idempotency-Key is still in progress
+        422:
+          description: Idempotency-Key already used with a different request body
         500:
           description: Internal server error
     """
     try:
         # Validate request data
-        data = request_schema.load(request.json)
+        data = request_schema.load(request.get_json(silent=True))
         
         # Convert method string to enum
         method = PaymentMethod(data['method'])
         
         # Create payment
-        payment = payment_service.create_payment(
+        payment = get_payment_service().create_payment(
             booking_id=data['booking_id'],
             amount=Decimal(str(data['amount'])),
             method=method,
@@ -66,10 +87,12 @@ def create_payment():
             currency=data.get('currency', 'USD')
         )
         
-        return jsonify(response_schema.dump(payment)), 201
+        return jsonify(response_serializer.dump(payment)), 201
         
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return jsonify({'error': str(e)}), 500
 
 @bp.route('/<int:payment_id>', methods=['GET'])
 def get_payment(payment_id):
@@ -85,6 +108,12 @@ def get_payment(payment_id):
           schema:
             type: integer
           description: ID của payment cần lấy
+        - name: If-None-Match
+          in: header
+          required: false
+          schema:
+            type: string
+          description: ETag of the copy held by the client
       tags:
         - Payments
       responses:
@@ -94,18 +123,20 @@ def get_payment(payment_id):
             application/json:
               schema:
                 $ref: '#/components/schemas/PaymentResponseSchema'
+        304:
+          description: Not modified since the ETag / Last-Modified sent by the client
         404:
           description: Payment not found
         500:
           description: Internal server error
     """
     try:
-        payment = payment_service.get_payment(payment_id)
+        payment = get_payment_service().get_payment(payment_id)
         
         if not payment:
             return jsonify({'error': 'Payment not found'}), 404
             
-        return jsonify(response_schema.dump(payment)), 200
+        return conditional_response(entity_validators(payment), lambda: jsonify(response_serializer.dump(payment)))
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -139,17 +170,18 @@ def get_payment_by_booking(booking_id):
           description: Internal server error
     """
     try:
-        payment = payment_service.get_payment_by_booking(booking_id)
+        payment = get_payment_service().get_payment_by_booking(booking_id)
         
         if not payment:
             return jsonify({'error': 'Payment not found for this booking'}), 404
             
-        return jsonify(response_schema.dump(payment)), 200
+        return jsonify(response_serializer.dump(payment)), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @bp.route('/<int:payment_id>/actions', methods=['POST'])
+@idempotent
 def payment_action(payment_id):
     """
     Perform action on payment (capture, refund, fail)
@@ -157,6 +189,13 @@ def payment_action(payment_id):
     post:
       summary: Perform action on payment
       parameters:
+        - name: Idempotency-Key
+          in: header
+          required: false
+          schema:
+            type: string
+            maxLength: 255
+          description: Retries with the same key and body return the first successful response without repeating the action (error responses are not kept)
         - name: payment_id
           in: path
           required: true
@@ -182,6 +221,10 @@ def payment_action(payment_id):
           description: Invalid action or payment state
         404:
           description: Payment not found
+        409:
+          description: A request with the same Idempotency-Key is still in progress
+        422:
+          description: Idempotency-Key already used with a different request body
         500:
           description: Internal server error
     """
@@ -193,16 +236,16 @@ def payment_action(payment_id):
         payment = None
         
         if action == 'capture':
-            payment = payment_service.capture_payment(payment_id)
+            payment = get_payment_service().capture_payment(payment_id)
         elif action == 'refund':
-            payment = payment_service.refund_payment(payment_id)
+            payment = get_payment_service().refund_payment(payment_id)
         elif action == 'fail':
-            payment = payment_service.fail_payment(payment_id)
+            payment = get_payment_service().fail_payment(payment_id)
             
         if not payment:
             return jsonify({'error': 'Payment not found'}), 404
             
-        return jsonify(response_schema.dump(payment)), 200
+        return jsonify(response_serializer.dump(payment)), 200
         
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -252,12 +295,12 @@ def update_payment_status(payment_id):
         # Convert status string to enum
         status = PaymentStatus(data['status'])
         
-        payment = payment_service.update_payment_status(payment_id, status)
+        payment = get_payment_service().update_payment_status(payment_id, status)
         
         if not payment:
             return jsonify({'error': 'Payment not found'}), 404
             
-        return jsonify(response_schema.dump(payment)), 200
+        return jsonify(response_serializer.dump(payment)), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 400
@@ -277,11 +320,29 @@ def list_payments_by_status(status):
             type: string
             enum: [Authorized, Captured, Failed, Refunded]
           description: Payment status
+        - name: limit
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 20
+          description: Page size (max 100)
+        - name: after
+          in: query
+          required: false
+          schema:
+            type: string
+          description: Cursor from the X-Next-Cursor header of the previous page
       tags:
         - Payments
       responses:
         200:
           description: List of payments
+          headers:
+            X-Next-Cursor:
+              description: Cursor of the next page, absent on the last page
+              schema:
+                type: string
           content:
             application/json:
               schema:
@@ -294,13 +355,18 @@ def list_payments_by_status(status):
           description: Internal server error
     """
     try:
+        limit, after = get_pagination_args()
+
         # Convert status string to enum
         payment_status = PaymentStatus(status)
         
-        payments = payment_service.list_payments_by_status(payment_status)
+        # Raw read path: rows go to JSON without entities or domain objects
+        payments = get_payment_service().list_payment_rows_by_status(payment_status, limit, after)
         
-        return jsonify(response_schema.dump(payments, many=True)), 200
+        return paginated_response(payments, None, limit)
         
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
     except ValueError:
         return jsonify({'error': 'Invalid payment status'}), 400
     except Exception as e:
@@ -340,10 +406,10 @@ def check_payment_success(payment_id):
           description: Internal server error
     """
     try:
-        is_successful = payment_service.is_payment_successful(payment_id)
+        is_successful = get_payment_service().is_payment_successful(payment_id)
         
         # Check if payment exists
-        payment = payment_service.get_payment(payment_id)
+        payment = get_payment_service().get_payment(payment_id)
         if not payment:
             return jsonify({'error': 'Payment not found'}), 404
             
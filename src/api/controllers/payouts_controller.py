@@ -9,21 +9,29 @@ from api.schemas.payout import (
     TutorEarningsResponseSchema
 )
 from domain.models.payout import PayoutStatus
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import get_session
 from decimal import Decimal
 from datetime import datetime
+from api.requests import get_pagination_args, PaginationError
+from api.responses import paginated_response
+from api.serializers import compile_schema
+from api.idempotency import idempotent
+from api.conditional import collection_validators, conditional_response, entity_validators
+from domain.constants import MAX_BATCH_SIZE
 
 bp = Blueprint('payouts', __name__, url_prefix='/payouts')
 
-# Initialize service with repository
-payout_service = PayoutService(PayoutRepository(session))
+# Service factory (one service per request, bound to the request-scoped session)
+def get_payout_service() -> PayoutService:
+    """Build the payout service on the session of the current request"""
+    return PayoutService(PayoutRepository(get_session()))
 
 # Initialize schemas
 request_schema = PayoutRequestSchema()
-response_schema = PayoutResponseSchema()
+response_serializer = compile_schema(PayoutResponseSchema)
 update_schema = PayoutUpdateSchema()
 action_schema = PayoutActionSchema()
-earnings_schema = TutorEarningsResponseSchema()
+earnings_serializer = compile_schema(TutorEarningsResponseSchema)
 
 @bp.route('/', methods=['POST'])
 def create_payout():
@@ -57,13 +65,13 @@ def create_payout():
         data = request_schema.load(request.json)
         
         # Create payout
-        payout = payout_service.create_payout(
+        payout = get_payout_service().create_payout(
             tutor_id=data['tutor_id'],
             booking_id=data['booking_id'],
             amount=Decimal(str(data['amount']))
         )
         
-        return jsonify(response_schema.dump(payout)), 201
+        return jsonify(response_serializer.dump(payout)), 201
         
     except Exception as e:
         return jsonify({'error': str(e)}), 400
@@ -82,6 +90,12 @@ def get_payout(payout_id):
           schema:
             type: integer
           description: ID của payout cần lấy
+        - name: If-None-Match
+          in: header
+          required: false
+          schema:
+            type: string
+          description: ETag of the copy held by the client
       tags:
         - Payouts
       responses:
@@ -91,18 +105,20 @@ def get_payout(payout_id):
             application/json:
               schema:
                 $ref: '#/components/schemas/PayoutResponseSchema'
+        304:
+          description: Not modified since the ETag / Last-Modified sent by the client
         404:
           description: Payout not found
         500:
           description: Internal server error
     """
     try:
-        payout = payout_service.get_payout(payout_id)
+        payout = get_payout_service().get_payout(payout_id)
         
         if not payout:
             return jsonify({'error': 'Payout not found'}), 404
             
-        return jsonify(response_schema.dump(payout)), 200
+        return conditional_response(entity_validators(payout), lambda: jsonify(response_serializer.dump(payout)))
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -121,24 +137,57 @@ def get_tutor_payouts(tutor_id):
           schema:
             type: integer
           description: ID của tutor
+        - name: limit
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 20
+          description: Page size (max 100)
+        - name: after
+          in: query
+          required: false
+          schema:
+            type: string
+          description: Cursor from the X-Next-Cursor header of the previous page
+        - name: If-None-Match
+          in: header
+          required: false
+          schema:
+            type: string
+          description: ETag of the copy held by the client
       tags:
         - Payouts
       responses:
         200:
           description: List of payouts for the tutor
+          headers:
+            X-Next-Cursor:
+              description: Cursor of the next page, absent on the last page
+              schema:
+                type: string
           content:
             application/json:
               schema:
                 type: array
                 items:
                   $ref: '#/components/schemas/PayoutResponseSchema'
+        304:
+          description: Not modified since the ETag / Last-Modified sent by the client
         500:
           description: Internal server error
     """
     try:
-        payouts = payout_service.get_tutor_payouts(tutor_id)
-        return jsonify(response_schema.dump(payouts, many=True)), 200
+        limit, after = get_pagination_args()
+        service = get_payout_service()
+        # One aggregate query decides 304 before the page is loaded
+        return conditional_response(
+            collection_validators(service.get_tutor_payouts_fingerprint(tutor_id)),
+            lambda: paginated_response(service.get_tutor_payouts(tutor_id, limit, after), response_serializer, limit)
+        )
         
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -156,11 +205,29 @@ def get_booking_payouts(booking_id):
           schema:
             type: integer
           description: ID của booking
+        - name: limit
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 20
+          description: Page size (max 100)
+        - name: after
+          in: query
+          required: false
+          schema:
+            type: string
+          description: Cursor from the X-Next-Cursor header of the previous page
       tags:
         - Payouts
       responses:
         200:
           description: List of payouts for the booking
+          headers:
+            X-Next-Cursor:
+              description: Cursor of the next page, absent on the last page
+              schema:
+                type: string
           content:
             application/json:
               schema:
@@ -171,13 +238,17 @@ def get_booking_payouts(booking_id):
           description: Internal server error
     """
     try:
-        payouts = payout_service.get_booking_payouts(booking_id)
-        return jsonify(response_schema.dump(payouts, many=True)), 200
+        limit, after = get_pagination_args()
+        payouts = get_payout_service().get_booking_payouts(booking_id, limit, after)
+        return paginated_response(payouts, response_serializer, limit)
         
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @bp.route('/<int:payout_id>/actions', methods=['POST'])
+@idempotent
 def payout_action(payout_id):
     """
     Perform action on payout (process, complete, fail)
@@ -185,6 +256,13 @@ def payout_action(payout_id):
     post:
       summary: Perform action on payout
       parameters:
+        - name: Idempotency-Key
+          in: header
+          required: false
+          schema:
+            type: string
+            maxLength: 255
+          description: Retries with the same key and body return the first successful response without repeating the action (error responses are not kept)
         - name: payout_id
           in: path
           required: true
@@ -210,27 +288,31 @@ def payout_action(payout_id):
           description: Invalid action or payout state
         404:
           description: Payout not found
+        409:
+          description: A request with the same Idempotency-Key is still in progress
+        422:
+          description: Idempotency-Key already used with a different request body
         500:
           description: Internal server error
     """
     try:
         # Validate request data
         data = action_schema.load(request.json)
-        action = data['actionSchema']
+        action = data['action']
         
         payout = None
         
         if action == 'process':
-            payout = payout_service.process_payout(payout_id)
+            payout = get_payout_service().process_payout(payout_id)
         elif action == 'complete':
-            payout = payout_service.complete_payout(payout_id)
+            payout = get_payout_service().complete_payout(payout_id)
         elif action == 'fail':
-            payout = payout_service.fail_payout(payout_id)
+            payout = get_payout_service().fail_payout(payout_id)
             
         if not payout:
             return jsonify({'error': 'Payout not found'}), 404
             
-        return jsonify(response_schema.dump(payout)), 200
+        return jsonify(response_serializer.dump(payout)), 200
         
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -280,12 +362,12 @@ def update_payout_status(payout_id):
         # Convert status string to enum
         status = PayoutStatus(data['status'])
         
-        payout = payout_service.update_payout_status(payout_id, status)
+        payout = get_payout_service().update_payout_status(payout_id, status)
         
         if not payout:
             return jsonify({'error': 'Payout not found'}), 404
             
-        return jsonify(response_schema.dump(payout)), 200
+        return jsonify(response_serializer.dump(payout)), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 400
@@ -305,11 +387,29 @@ def list_payouts_by_status(status):
             type: string
             enum: [Pending, Processing, Paid, Failed]
           description: Payout status
+        - name: limit
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 20
+          description: Page size (max 100)
+        - name: after
+          in: query
+          required: false
+          schema:
+            type: string
+          description: Cursor from the X-Next-Cursor header of the previous page
       tags:
         - Payouts
       responses:
         200:
           description: List of payouts
+          headers:
+            X-Next-Cursor:
+              description: Cursor of the next page, absent on the last page
+              schema:
+                type: string
           content:
             application/json:
               schema:
@@ -322,13 +422,18 @@ def list_payouts_by_status(status):
           description: Internal server error
     """
     try:
+        limit, after = get_pagination_args()
+
         # Convert status string to enum
         payout_status = PayoutStatus(status)
         
-        payouts = payout_service.get_payouts_by_status(payout_status)
+        # Raw read path: rows go to JSON without entities or domain objects
+        payouts = get_payout_service().get_payout_rows_by_status(payout_status, limit, after)
         
-        return jsonify(response_schema.dump(payouts, many=True)), 200
+        return paginated_response(payouts, None, limit)
         
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
     except ValueError:
         return jsonify({'error': 'Invalid payout status'}), 400
     except Exception as e:
@@ -341,11 +446,30 @@ def get_pending_payouts():
     ---
     get:
       summary: Get all pending payouts for processing
+      parameters:
+        - name: limit
+          in: query
+          required: false
+          schema:
+            type: integer
+            default: 20
+          description: Page size (max 100)
+        - name: after
+          in: query
+          required: false
+          schema:
+            type: string
+          description: Cursor from the X-Next-Cursor header of the previous page
       tags:
         - Payouts
       responses:
         200:
           description: List of pending payouts
+          headers:
+            X-Next-Cursor:
+              description: Cursor of the next page, absent on the last page
+              schema:
+                type: string
           content:
             application/json:
               schema:
@@ -356,9 +480,12 @@ def get_pending_payouts():
           description: Internal server error
     """
     try:
-        payouts = payout_service.get_pending_payouts()
-        return jsonify(response_schema.dump(payouts, many=True)), 200
+        limit, after = get_pagination_args()
+        payouts = get_payout_service().get_pending_payouts(limit, after)
+        return paginated_response(payouts, response_serializer, limit)
         
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -389,24 +516,52 @@ def get_tutor_earnings(tutor_id):
           description: Internal server error
     """
     try:
-        # Calculate earnings
-        total_earnings = payout_service.calculate_tutor_earnings(tutor_id)
-        pending_earnings = payout_service.calculate_pending_earnings(tutor_id)
-        
-        # Get payouts for counting
-        all_payouts = payout_service.get_tutor_payouts(tutor_id)
-        completed_count = len([p for p in all_payouts if p.status == PayoutStatus.PAID])
-        pending_count = len([p for p in all_payouts if p.status in [PayoutStatus.PENDING, PayoutStatus.PROCESSING]])
-        
-        earnings_data = {
-            'tutor_id': tutor_id,
-            'total_earnings': total_earnings,
-            'pending_earnings': pending_earnings,
-            'completed_payouts_count': completed_count,
-            'pending_payouts_count': pending_count
-        }
+        earnings = get_payout_service().get_earnings_summary(tutor_id)
+        return jsonify(earnings_serializer.dump(earnings)), 200
         
-        return jsonify(earnings_schema.dump(earnings_data)), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/earnings', methods=['GET'])
+def get_tutors_earnings():
+    """
+    Get earnings summaries for several tutors
+    ---
+    get:
+      summary: Get earnings summaries for many tutors in one query
+      parameters:
+        - name: tutor_ids
+          in: query
+          required: true
+          schema:
+            type: string
+          description: Comma separated tutor IDs (max 500)
+      tags:
+        - Payouts
+      responses:
+        200:
+          description: Earnings summaries, one per requested tutor
+          content:
+            application/json:
+              schema:
+                type: array
+                items:
+                  $ref: '#/components/schemas/TutorEarningsResponseSchema'
+        400:
+          description: Invalid tutor_ids
+        500:
+          description: Internal server error
+    """
+    try:
+        tutor_ids = [int(tutor_id) for tutor_id in request.args.get('tutor_ids', '').split(',') if tutor_id.strip()]
+    except ValueError:
+        return jsonify({'error': 'tutor_ids must be a comma separated list of integers'}), 400
+    if not tutor_ids or len(tutor_ids) > MAX_BATCH_SIZE:
+        return jsonify({'error': f'Provide between 1 and {MAX_BATCH_SIZE} tutor_ids'}), 400
+
+    try:
+        summaries = get_payout_service().get_earnings_summaries(tutor_ids)
+        return jsonify(earnings_serializer.dump(summaries.values(), many=True)), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -445,10 +600,10 @@ def check_payout_completed(payout_id):
           description: Internal server error
     """
     try:
-        is_completed = payout_service.is_payout_completed(payout_id)
+        is_completed = get_payout_service().is_payout_completed(payout_id)
         
         # Check if payout exists
-        payout = payout_service.get_payout(payout_id)
+        payout = get_payout_service().get_payout(payout_id)
         if not payout:
             return jsonify({'error': 'Payout not found'}), 404
             
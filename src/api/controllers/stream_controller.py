@@ -0,0 +1,213 @@
+import json
+import time
+from flask import Blueprint, Response, request, jsonify
+from marshmallow import ValidationError
+from services.stream_service import StreamService
+from infrastructure.repositories.message_repository import MessageRepository
+from infrastructure.repositories.notification_repository import NotificationRepository
+from infrastructure.realtime import event_broker
+from domain.models.stream_event import StreamEvent, StreamCursor
+from api.schemas.chat import MessageResponseSchema
+from api.schemas.notification import NotificationResponseSchema
+from api.schemas.stream import StreamRequestSchema, StreamPollRequestSchema, StreamPollResponseSchema
+from infrastructure.databases.mssql import get_session, remove_session
+from config import get_config
+
+bp = Blueprint('stream', __name__, url_prefix='/stream')
+
+Config = get_config()
+
+# Milliseconds an EventSource waits before reconnecting
+RECONNECT_MS = 1000
+
+# Service factory (one service per request, bound to the request-scoped session)
+def get_stream_service() -> StreamService:
+    """Build the stream service on the session of the current request"""
+    session = get_session()
+    return StreamService(
+        MessageRepository(session),
+        NotificationRepository(session),
+        event_broker,
+        catch_up_limit=Config.STREAM_CATCH_UP_LIMIT
+    )
+
+# Initialize schemas
+stream_schema = StreamRequestSchema()
+poll_schema = StreamPollRequestSchema()
+poll_response_schema = StreamPollResponseSchema()
+message_schema = MessageResponseSchema()
+notification_schema = NotificationResponseSchema()
+
+def _event_data(event: StreamEvent) -> dict:
+    schema = message_schema if event.kind == StreamEvent.MESSAGE else notification_schema
+    return schema.dump(event.entity)
+
+def _sse(event: StreamEvent, cursor: StreamCursor) -> str:
+    return f'id: {cursor.encode()}\nevent: {event.kind}\ndata: {json.dumps(_event_data(event))}\n\n'
+
+@bp.route('/events', methods=['GET'])
+def stream_events():
+    """
+    Stream new messages and notifications (server-sent events)
+    ---
+    get:
+      summary: SSE stream of a user's new messages and notifications
+      description: >
+        Events are `message` or `notification`, with the JSON of the row as
+        data. Each event id is a cursor; EventSource sends it back as
+        Last-Event-ID on reconnect and missed events are replayed. The
+        server ends the connection every few minutes (and when a client
+        falls too far behind); clients simply reconnect. Events reach an
+        open stream in commit order, not always in id order; one published
+        while the client is disconnected with an id below the last one it
+        received is not replayed.
+      parameters:
+        - name: user_id
+          in: query
+          required: true
+          schema:
+            type: integer
+        - name: Last-Event-ID
+          in: header
+          required: false
+          schema:
+            type: string
+          description: Cursor of the last event received
+        - name: last_event_id
+          in: query
+          required: false
+          schema:
+            type: string
+          description: Same as the header, for clients that cannot set it
+      tags:
+        - Stream
+      responses:
+        200:
+          description: text/event-stream
+        400:
+          description: Invalid query parameters or cursor
+        500:
+          description: Internal server error
+    """
+    try:
+        data = stream_schema.load(request.args)
+        last_event_id = request.headers.get('Last-Event-ID') or data.get('last_event_id')
+        cursor = StreamCursor.decode(last_event_id) if last_event_id else None
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        subscription, cursor, backlog, more = get_stream_service().subscribe(data['user_id'], cursor)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+    heartbeat = Config.STREAM_HEARTBEAT_SECONDS
+    deadline = time.monotonic() + Config.STREAM_MAX_SECONDS
+
+    # Runs after the request (and its session) has ended: no database access below
+    def generate():
+        try:
+            yield f'retry: {RECONNECT_MS}\nid: {cursor.encode()}\n\n'
+            # Published during the catch-up: on the subscription as well
+            replayed = {event.key for event in backlog}
+            for event in backlog:
+                cursor.advance(event)
+                yield _sse(event, cursor)
+            if more:
+                # Let the client reconnect for the next page of its backlog
+                return
+            while time.monotonic() < deadline:
+                events = subscription.wait(min(heartbeat, max(0.0, deadline - time.monotonic())))
+                if subscription.overflowed:
+                    return
+                if not events:
+                    yield ': keep-alive\n\n'
+                    continue
+                for event in events:
+                    # Not cursor.has_seen: an id below the cursor may just have committed
+                    if event.key not in replayed:
+                        cursor.advance(event)
+                        yield _sse(event, cursor)
+        finally:
+            subscription.close()
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # no proxy buffering (nginx)
+    })
+
+@bp.route('/poll', methods=['GET'])
+def poll_events():
+    """
+    Long-poll new messages and notifications
+    ---
+    get:
+      summary: Fallback for clients without SSE; waits until there is something new
+      description: >
+        Returns at once when events past `cursor` exist, otherwise waits up
+        to `timeout` seconds for one. Pass the returned cursor to the next
+        call; without a cursor only events from now on are returned. An event
+        whose transaction commits after a later-id event was returned, and
+        before the next call is open, is not returned.
+      parameters:
+        - name: user_id
+          in: query
+          required: true
+          schema:
+            type: integer
+        - name: cursor
+          in: query
+          required: false
+          schema:
+            type: string
+        - name: timeout
+          in: query
+          required: false
+          schema:
+            type: number
+            default: 25
+          description: Seconds to wait (capped by the server)
+      tags:
+        - Stream
+      responses:
+        200:
+          description: Events (possibly none) and the cursor to poll with next
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/StreamPollResponseSchema'
+        400:
+          description: Invalid query parameters or cursor
+        500:
+          description: Internal server error
+    """
+    try:
+        data = poll_schema.load(request.args)
+        cursor = StreamCursor.decode(data['cursor']) if data.get('cursor') else None
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        subscription, cursor, events, more = get_stream_service().subscribe(data['user_id'], cursor)
+        try:
+            if not events:
+                # Give the pooled connection back before waiting
+                remove_session()
+                timeout = min(data.get('timeout', Config.STREAM_POLL_TIMEOUT), Config.STREAM_POLL_TIMEOUT)
+                # The backlog was empty, so everything published since subscribing is new
+                events = subscription.wait(timeout)
+        finally:
+            subscription.close()
+
+        items = []
+        for event in events:
+            cursor.advance(event)
+            items.append({'id': event.id, 'type': event.kind, 'data': _event_data(event)})
+        return jsonify(poll_response_schema.dump({'cursor': cursor.encode(), 'more': more, 'events': items})), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
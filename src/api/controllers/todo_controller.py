@@ -3,10 +3,12 @@ from services.todo_service import TodoService
 from infrastructure.repositories.todo_repository import TodoRepository
 from api.schemas.todo import TodoRequestSchema, TodoResponseSchema
 from datetime import datetime
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import get_session
 bp = Blueprint('todo', __name__, url_prefix='/todos')
 
-todo_service = TodoService(TodoRepository(session))
+def get_todo_service() -> TodoService:
+    """Build the todo service on the session of the current request"""
+    return TodoService(TodoRepository(get_session()))
 
 request_schema = TodoRequestSchema()
 response_schema = TodoResponseSchema()
@@ -30,7 +32,7 @@ def list_todos():
                 items:
                   $ref: '#/components/schemas/TodoResponse'
     """
-    todos = todo_service.list_todos()
+    todos = get_todo_service().list_todos()
     return jsonify(response_schema.dump(todos, many=True)), 200
 
 @bp.route('/<int:todo_id>', methods=['GET'])
@@ -66,7 +68,7 @@ def get_todo(todo_id):
                   message:
                     type: string
     """
-    todo = todo_service.get_todo(todo_id)
+    todo = get_todo_service().get_todo(todo_id)
     if not todo:
         return jsonify({'message': 'Todo not found'}), 404
     return jsonify(response_schema.dump(todo)), 200
@@ -109,7 +111,7 @@ def create_todo():
     if errors:
         return jsonify(errors), 400
     now = datetime.utcnow()
-    todo = todo_service.create_todo(
+    todo = get_todo_service().create_todo(
         title=data['title'],
         description=data['description'],
         status=data['status'],
@@ -170,7 +172,7 @@ def update_todo(todo_id):
     errors = request_schema.validate(data)
     if errors:
         return jsonify(errors), 400
-    todo = todo_service.update_todo(
+    todo = get_todo_service().update_todo(
         todo_id=todo_id,
         title=data['title'],
         description=data['description'],
@@ -209,5 +211,5 @@ def delete_todo(todo_id):
                   message:
                     type: string
     """
-    todo_service.delete_todo(todo_id)
+    get_todo_service().delete_todo(todo_id)
     return '', 204
\ No newline at end of file
@@ -0,0 +1,162 @@
+from flask import Blueprint, request, jsonify
+from marshmallow import ValidationError
+from services.tutor_search_service import TutorSearchService
+from infrastructure.repositories.tutor_profile_repository import TutorProfileRepository
+from infrastructure.repositories.tutor_subject_repository import TutorSubjectRepository
+from infrastructure.repositories.availability_slot_repository import AvailabilitySlotRepository
+from api.schemas.tutor_search import TutorSearchRequestSchema, TutorSearchResponseSchema
+from domain.models.tutor_search import TutorSearchQuery
+from domain.models.subject import SubjectLevel
+from domain.models.tutor_profile import VerificationStatus
+from domain.models.availability_slot import Weekday
+from infrastructure.cache.indexes import tutor_search_index
+from infrastructure.databases.mssql import get_session
+
+bp = Blueprint('tutor_search', __name__, url_prefix='/tutors')
+
+# Service factory (one service per request, bound to the request-scoped session)
+def get_tutor_search_service() -> TutorSearchService:
+    """Build the tutor search service on the session of the current request"""
+    session = get_session()
+    return TutorSearchService(
+        TutorProfileRepository(session),
+        TutorSubjectRepository(session),
+        AvailabilitySlotRepository(session),
+        tutor_search_index
+    )
+
+# Initialize schemas
+request_schema = TutorSearchRequestSchema()
+response_schema = TutorSearchResponseSchema()
+
+LIST_ARGS = ('subject_id', 'level', 'verification_status')
+
+@bp.route('/search', methods=['GET'])
+def search_tutors():
+    """
+    Search tutors
+    ---
+    get:
+      summary: Full-text and faceted tutor search, ranked and paginated
+      description: >
+        Served from an in-memory index per process. Profile, subject, slot and
+        review writes show up in the process that made them after the next
+        rebuild (at most INDEX_MIN_REBUILD_SECONDS, 1 by default, after the
+        previous one), and within TUTOR_SEARCH_INDEX_TTL seconds (300 by
+        default) in the others.
+      parameters:
+        - name: q
+          in: query
+          schema:
+            type: string
+          description: Words matched against name and bio (last word also as prefix)
+        - name: subject_id
+          in: query
+          schema:
+            type: array
+            items:
+              type: integer
+          description: Repeat for several subjects (any of)
+        - name: level
+          in: query
+          schema:
+            type: array
+            items:
+              type: string
+              enum: [K12, Undergrad, Graduate, Other]
+        - name: min_rate
+          in: query
+          schema:
+            type: number
+        - name: max_rate
+          in: query
+          schema:
+            type: number
+        - name: min_rating
+          in: query
+          schema:
+            type: number
+        - name: verification_status
+          in: query
+          schema:
+            type: array
+            items:
+              type: string
+              enum: [Unverified, Pending, Verified, Rejected]
+        - name: weekday
+          in: query
+          schema:
+            type: string
+            enum: [Mon, Tue, Wed, Thu, Fri, Sat, Sun]
+          description: UTC weekday; slots are converted from their own timezone
+        - name: start_time
+          in: query
+          schema:
+            type: string
+            example: "09:00"
+          description: >
+            With weekday, only tutors available for the whole of start_time..end_time (UTC);
+            back-to-back slots count as one
+        - name: end_time
+          in: query
+          schema:
+            type: string
+            example: "11:00"
+        - name: limit
+          in: query
+          schema:
+            type: integer
+            default: 20
+          description: Page size (max 100)
+        - name: offset
+          in: query
+          schema:
+            type: integer
+            default: 0
+          description: next_offset of the previous page
+      tags:
+        - Tutors
+      responses:
+        200:
+          description: Ranked page of tutors with facet counts over all matches
+          content:
+            application/json:
+              schema:
+                $ref: '#/components/schemas/TutorSearchResponseSchema'
+        400:
+          description: Invalid query parameters
+        500:
+          description: Internal server error
+    """
+    try:
+        args = {key: value for key, value in request.args.items() if key not in LIST_ARGS}
+        for key in LIST_ARGS:
+            if key in request.args:
+                args[key] = request.args.getlist(key)
+        data = request_schema.load(args)
+
+        query = TutorSearchQuery(
+            text=data.get('q'),
+            subject_ids=data.get('subject_id'),
+            levels=[SubjectLevel(level) for level in data.get('level', [])],
+            min_rate=data.get('min_rate'),
+            max_rate=data.get('max_rate'),
+            min_rating=data.get('min_rating'),
+            verification_statuses=[VerificationStatus(status) for status in data.get('verification_status', [])],
+            weekday=Weekday(data['weekday']) if 'weekday' in data else None,
+            start_time=data.get('start_time'),
+            end_time=data.get('end_time'),
+            limit=data['limit'],
+            offset=data['offset']
+        )
+    except ValidationError as e:
+        return jsonify({'errors': e.messages}), 400
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        result = get_tutor_search_service().search(query)
+        return jsonify(response_schema.dump(result)), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,86 @@
+# exports.py
+
+import json
+import zlib
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator
+from flask import Response, request, stream_with_context
+
+# Bytes gathered before a chunk is written out (one write per row would be mostly framing)
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'json': 'application/json',
+}
+
+
+def _dumps(row: Dict[str, Any]) -> str:
+    return json.dumps(row, separators=(',', ':'), default=str)
+
+def ndjson_chunks(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """One JSON document per line, gathered into chunks of about EXPORT_CHUNK_BYTES"""
+    buffer, size = [], 0
+    for row in rows:
+        line = _dumps(row) + '\n'
+        buffer.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_BYTES:
+            yield ''.join(buffer).encode('utf-8')
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+def json_array_chunks(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """A single JSON array, written element by element"""
+    buffer, size, separator = ['['], 1, ''
+    for row in rows:
+        item = separator + _dumps(row)
+        separator = ','
+        buffer.append(item)
+        size += len(item)
+        if size >= EXPORT_CHUNK_BYTES:
+            yield ''.join(buffer).encode('utf-8')
+            buffer, size = [], 0
+    buffer.append(']')
+    yield ''.join(buffer).encode('utf-8')
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compress a chunk stream incrementally into one gzip member"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 16+15: gzip header and trailer
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def accepts_gzip() -> bool:
+    # By quality: "gzip;q=0" refuses gzip, and a higher-rated identity wins over it
+    return request.accept_encodings.best_match(['gzip', 'identity']) == 'gzip'
+
+def export_response(rows: Iterable[Dict[str, Any]], export_format: str, filename: str) -> Response:
+    """
+    Stream rows as NDJSON or a JSON array, gzip-encoded when the client
+    accepts it. Rows are pulled from the iterator while the body is sent,
+    so memory stays flat whatever the row count; the request context (and
+    its database session) stays open until the last chunk. Errors after the
+    first row can only end the stream early.
+    """
+    # Run the query now, so a failing one still gets an error status instead of a cut stream
+    rows = iter(rows)
+    first = next(rows, None)
+    rows = rows if first is None else chain((first,), rows)
+
+    chunks = ndjson_chunks(rows) if export_format == 'ndjson' else json_array_chunks(rows)
+    gzipped = accepts_gzip()
+    if gzipped:
+        chunks = gzip_chunks(chunks)
+
+    response = Response(stream_with_context(chunks), mimetype=EXPORT_FORMATS[export_format])
+    extension = 'ndjson' if export_format == 'ndjson' else 'json'
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}.{extension}"'
+    response.headers['Cache-Control'] = 'no-store'
+    response.vary.add('Accept-Encoding')
+    if gzipped:
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
@@ -0,0 +1,62 @@
+# idempotency.py
+
+import hashlib
+from functools import wraps
+from flask import current_app, jsonify, make_response, request
+from config import get_config
+from infrastructure.repositories.idempotency_key_repository import IdempotencyKeyRepository
+from services.idempotency_service import IdempotencyKeyInProgress, IdempotencyKeyReused, IdempotencyService
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+
+Config = get_config()
+
+# One store per process; repositories open their own short sessions
+idempotency_service = IdempotencyService(
+    IdempotencyKeyRepository,
+    ttl_seconds=Config.IDEMPOTENCY_KEY_TTL,
+    max_entries=Config.IDEMPOTENCY_CACHE_SIZE,
+    wait_seconds=Config.IDEMPOTENCY_WAIT_SECONDS,
+    lease_seconds=Config.IDEMPOTENCY_LEASE_SECONDS
+)
+
+def idempotent(view):
+    """
+    Honour an Idempotency-Key header on a mutating endpoint.
+    The first request runs the view; retries with the same key and body get
+    its response back (with Idempotent-Replayed: true) without running it again.
+    Requests without the header are handled as usual.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view(*args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return jsonify({'error': f'{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters'}), 400
+
+        def handle():
+            response = make_response(view(*args, **kwargs))
+            return response.status_code, response.content_type, response.get_data(as_text=True)
+
+        try:
+            record, replayed = idempotency_service.execute(
+                f'{request.method} {request.path} {key}',
+                hashlib.sha256(request.get_data()).hexdigest(),
+                handle
+            )
+        except IdempotencyKeyReused as e:
+            return jsonify({'error': str(e)}), 422
+        except IdempotencyKeyInProgress as e:
+            response = jsonify({'error': str(e)})
+            response.headers['Retry-After'] = '1'
+            return response, 409
+
+        response = current_app.response_class(
+            record.response_body, status=record.status_code, content_type=record.content_type
+        )
+        if replayed:
+            response.headers['Idempotent-Replayed'] = 'true'
+        return response
+    return wrapper
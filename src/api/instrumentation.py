@@ -0,0 +1,131 @@
+"""
+Per-request performance instrumentation.
+
+For every request the middleware records total time, database time,
+statement count and rows (from the query scope of
+infrastructure.databases.query_counter) and serialization time (reported
+by the JSON provider and the compiled serializers). Each request then:
+
+    - gets a Server-Timing header, shown by browser dev tools:
+          Server-Timing: db;dur=4.1;desc="queries=3", serialize;dur=0.8, total;dur=7.9
+    - is added to the metrics of its endpoint (counters, and the latencies
+      of the most recent requests for p50/p95/p99), exposed at GET /metrics.
+
+Totals stop when after_request runs: the sending of streamed bodies
+(exports, event streams) is not included.
+"""
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from flask import Response, g, has_request_context, request
+
+from config import get_config
+from infrastructure.databases.query_counter import QueryScope
+
+QUANTILES = (0.50, 0.95, 0.99)
+
+
+def _percentile(ordered: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list (None when empty)"""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class EndpointMetrics:
+    """
+    Per (endpoint, method) request counters plus the most recent latencies,
+    for percentiles. Endpoints are route names, so the label set stays bounded.
+    """
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._endpoints: Dict[Tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, key: Tuple[str, str]) -> dict:
+        stats = self._endpoints.get(key)
+        if stats is None:
+            stats = self._endpoints[key] = {
+                'requests': 0, 'errors': 0, 'seconds': 0.0, 'db_seconds': 0.0,
+                'queries': 0, 'rows': 0, 'serialize_seconds': 0.0,
+                'latency': deque(maxlen=self.window)
+            }
+        return stats
+
+    def record(
+        self,
+        endpoint: str,
+        method: str,
+        status: int,
+        seconds: float,
+        db_seconds: float = 0.0,
+        queries: int = 0,
+        rows: int = 0,
+        serialize_seconds: float = 0.0
+    ):
+        with self._lock:
+            stats = self._endpoint((endpoint, method))
+            stats['requests'] += 1
+            if status >= 500:
+                stats['errors'] += 1
+            stats['seconds'] += seconds
+            stats['db_seconds'] += db_seconds
+            stats['queries'] += queries
+            stats['rows'] += rows
+            stats['serialize_seconds'] += serialize_seconds
+            stats['latency'].append(seconds)
+
+    def snapshot(self) -> Dict[Tuple[str, str], dict]:
+        """Counters and latency percentiles (seconds) per (endpoint, method)"""
+        with self._lock:
+            endpoints = {key: (dict(stats), sorted(stats['latency'])) for key, stats in self._endpoints.items()}
+        result = {}
+        for key, (stats, latency) in endpoints.items():
+            stats.pop('latency')
+            stats['quantiles'] = {fraction: _percentile(latency, fraction) for fraction in QUANTILES}
+            result[key] = stats
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+# One registry per process, shared by all requests
+endpoint_metrics = EndpointMetrics(window=get_config().METRICS_WINDOW)
+
+
+def record_serialization(seconds: float):
+    """Add time spent turning objects into JSON to the current request"""
+    if has_request_context():
+        g.serialize_seconds = g.get('serialize_seconds', 0.0) + seconds
+
+
+def begin_request_timing():
+    g.request_started = time.perf_counter()
+
+
+def server_timing(seconds: float, db_seconds: float, queries: int, serialize_seconds: float) -> str:
+    """Server-Timing header value (durations in milliseconds)"""
+    return (f'db;dur={db_seconds * 1000:.1f};desc="queries={queries}", '
+            f'serialize;dur={serialize_seconds * 1000:.1f}, total;dur={seconds * 1000:.1f}')
+
+
+def end_request_timing(response: Response, scope: Optional[QueryScope], metrics: EndpointMetrics,
+                       add_header: bool = True) -> Response:
+    """Record the request in metrics and, when add_header, set Server-Timing"""
+    started = g.pop('request_started', None)
+    if started is None:
+        return response
+    seconds = time.perf_counter() - started
+    db_seconds, queries, rows = (scope.seconds, scope.count, scope.rows) if scope is not None else (0.0, 0, 0)
+    serialize_seconds = g.pop('serialize_seconds', 0.0)
+
+    metrics.record(request.endpoint or 'unmatched', request.method, response.status_code,
+                   seconds, db_seconds, queries, rows, serialize_seconds)
+    if add_header:
+        response.headers['Server-Timing'] = server_timing(seconds, db_seconds, queries, serialize_seconds)
+    return response
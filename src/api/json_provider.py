@@ -0,0 +1,105 @@
+"""
+JSON encoding of API responses (jsonify, app.json).
+
+Flask's default provider is the stdlib json module plus a Python-level
+default() hook for every Decimal and datetime. FastJSONProvider encodes
+with orjson when it is installed, which handles datetimes, enums,
+dataclasses and non-str keys in C; only Decimals reach the default hook.
+Without orjson it falls back to the stdlib, with the same output:
+
+    datetime / date / time  ISO 8601 (as the response schemas render them)
+    Decimal                 string ("12.50", as Flask renders it)
+    Enum                    its value
+
+Keys are sorted and the body ends in a newline, as with Flask's provider;
+non-ASCII text is written as UTF-8 rather than ASCII escapes.
+"""
+import dataclasses
+import json
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from time import perf_counter
+from typing import Any
+
+from flask.json.provider import JSONProvider
+
+from api.instrumentation import record_serialization
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib path is slower but produces the same JSON
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Conversion of values the encoder has no native support for"""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, '__html__'):
+        return str(value.__html__())
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+class FastJSONProvider(JSONProvider):
+    """JSON provider backed by orjson when available, the stdlib otherwise"""
+
+    sort_keys = True
+    compact = None  # None: indented in debug mode, compact otherwise (as Flask's provider)
+    mimetype = 'application/json'
+
+    def _options(self, indent: bool) -> int:
+        options = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def _indent(self) -> bool:
+        return self.compact is False or (self.compact is None and self._app.debug)
+
+    def dumps_bytes(self, obj: Any, indent: bool = False) -> bytes:
+        """UTF-8 JSON of obj"""
+        if orjson is not None:
+            return orjson.dumps(obj, default=_default, option=self._options(indent))
+        return json.dumps(
+            obj, default=_default, sort_keys=self.sort_keys, ensure_ascii=False,
+            **({'indent': 2} if indent else {'separators': (',', ':')})
+        ).encode('utf-8')
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            # Caller-specific json.dumps arguments: only the stdlib knows them all
+            kwargs.setdefault('default', _default)
+            kwargs.setdefault('sort_keys', self.sort_keys)
+            return json.dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        started = perf_counter()
+        body = self.dumps_bytes(obj, self._indent()) + b'\n'
+        record_serialization(perf_counter() - started)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def init_json(app):
+    """Encode the app's JSON (jsonify, request.get_json) with FastJSONProvider"""
+    app.json = FastJSONProvider(app)
+    if orjson is None:
+        logger.info('orjson is not installed; JSON responses use the stdlib encoder')
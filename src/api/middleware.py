@@ -1,10 +1,12 @@
 # Middleware functions for processing requests and responses
 
-from flask import  request, jsonify
-
-def log_request_info(app):
-    app.logger.debug('Headers: %s', request.headers)
-    app.logger.debug('Body: %s', request.get_data())
+from flask import  request, jsonify, g
+from config import get_config
+from infrastructure.databases import query_counter
+from api.json_provider import init_json
+from api.compression import ResponseCompression
+from api.access_log import begin_access_log, init_access_log, log_access
+from api.instrumentation import begin_request_timing, end_request_timing, endpoint_metrics
 
 def handle_options_request():
     return jsonify({'message': 'CORS preflight response'}), 200
@@ -18,14 +20,73 @@ def add_custom_headers(response):
     response.headers['X-Custom-Header'] = 'Value'
     return response
 
+def add_conditional_headers(response):
+    """
+    Body-hash ETag for GET responses without validators of their own, and 304
+    when it matches If-None-Match. Saves the transfer, not the serialization:
+    endpoints that can check freshness first use api.conditional instead.
+    """
+    if (request.method != 'GET' or response.status_code != 200
+            or response.is_streamed or response.get_etag()[0]):
+        return response
+    response.add_etag(weak=True)
+    return response.make_conditional(request)
+
+def begin_query_budget(config):
+    """Start counting the statements of this request (N+1 detection, metrics)"""
+    if config.QUERY_BUDGET > 0:
+        g.query_scope_token = query_counter.begin_scope(config.QUERY_BUDGET, config.QUERY_REPEAT_LIMIT)
+    elif config.METRICS_ENABLED:
+        g.query_scope_token = query_counter.begin_scope()
+
+def end_query_budget(app, config):
+    """Stop counting and return the scope; log budget violations, or fail the request in strict mode"""
+    token = g.pop('query_scope_token', None)
+    if token is None:
+        return None
+    scope = query_counter.end_scope(token)
+    problems = scope.problems()
+    if not problems:
+        return scope
+    if config.QUERY_BUDGET_STRICT:
+        raise query_counter.QueryBudgetExceeded(f'{request.method} {request.path}: ' + '; '.join(problems))
+    app.logger.warning('Query budget exceeded by %s %s: %s', request.method, request.path, '; '.join(problems))
+    return scope
+
 def middleware(app):
+    config = get_config()
+    init_json(app)
+    compression = ResponseCompression.from_config(config) if config.COMPRESSION_ENABLED else None
+    app.extensions['compression'] = compression
+    if config.ACCESS_LOG_ENABLED:
+        init_access_log(config)
+
     @app.before_request
     def before_request():
-        log_request_info(app)
+        if config.ACCESS_LOG_ENABLED:
+            begin_access_log()
+        if config.METRICS_ENABLED:
+            begin_request_timing()
+        begin_query_budget(config)
 
     @app.after_request
     def after_request(response):
-        return add_custom_headers(response)
+        scope = end_query_budget(app, config)
+        response = add_conditional_headers(add_custom_headers(response))
+        # Last: compresses the final body, after its ETag was computed
+        response = compression.apply(response) if compression else response
+        if config.METRICS_ENABLED:
+            end_request_timing(response, scope, endpoint_metrics, config.SERVER_TIMING_ENABLED)
+        if config.ACCESS_LOG_ENABLED:
+            log_access(response, config)
+        return response
+
+    @app.teardown_request
+    def teardown_request(exception=None):
+        # The view raised before after_request could close the scope
+        token = g.pop('query_scope_token', None)
+        if token is not None:
+            query_counter.end_scope(token)
 
     @app.errorhandler(Exception)
     def handle_exception(error):
@@ -0,0 +1,54 @@
+"""
+Prometheus text exposition format (version 0.0.4), for GET /metrics.
+
+    text = PrometheusText()
+    text.add('db_pool_checked_out', 'gauge', 'Connections in use', [({}, 3)])
+    body = text.render()
+"""
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+Sample = Tuple[Mapping[str, str], Optional[float]]
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _number(value: float) -> str:
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+class PrometheusText:
+    """Metric families gathered for one scrape"""
+
+    def __init__(self):
+        self._lines: List[str] = []
+        self._families: Dict[str, bool] = {}
+
+    def add(self, name: str, metric_type: str, help_text: str, samples: Iterable[Sample], suffix: str = ''):
+        """
+        Add samples of a family; HELP/TYPE are written once per name.
+        suffix names the series of a summary (_sum, _count). None values are skipped.
+        """
+        if name not in self._families:
+            self._families[name] = True
+            self._lines.append(f'# HELP {name} {help_text}')
+            self._lines.append(f'# TYPE {name} {metric_type}')
+        for labels, value in samples:
+            if value is not None:
+                self._lines.append(f'{name}{suffix}{_labels(labels)} {_number(value)}')
+
+    def render(self) -> str:
+        return '\n'.join(self._lines) + '\n'
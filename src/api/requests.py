@@ -1,6 +1,13 @@
 # requests.py
 
 from flask import request, jsonify
+from domain.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from infrastructure.repositories.pagination import decode_cursor, InvalidCursorError
+
+
+class PaginationError(ValueError):
+    """Raised when `limit` / `after` query parameters are invalid"""
+    pass
 
 def get_request_data():
     """Extracts and returns JSON data from the request."""
@@ -17,6 +24,23 @@ def validate_request_schema(schema):
         return jsonify({"errors": errors}), 400
     return data
 
+def get_pagination_args():
+    """Parses keyset pagination parameters (`limit`, `after`) from the query string."""
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise PaginationError('limit must be an integer')
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise PaginationError(f'limit must be between 1 and {MAX_PAGE_SIZE}')
+
+    after = request.args.get('after') or None
+    if after is not None:
+        try:
+            decode_cursor(after)
+        except InvalidCursorError as e:
+            raise PaginationError(str(e))
+    return limit, after
+
 def handle_get_request():
     """Handles GET requests."""
     # Logic for handling GET requests goes here
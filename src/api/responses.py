@@ -1,6 +1,7 @@
 # src/api/responses.py
 
 from flask import jsonify
+from infrastructure.repositories.pagination import next_cursor
 
 def success_response(data, message="Success"):
     return jsonify({"message": message, "data": data}), 200
@@ -12,4 +13,16 @@ def not_found_response(message="Resource not found"):
     return jsonify({"message": message}), 404
 
 def validation_error_response(errors):
-    return jsonify({"message": "Validation errors", "errors": errors}), 422
\ No newline at end of file
+    return jsonify({"message": "Validation errors", "errors": errors}), 422
+
+def paginated_response(items, schema, limit, cursor_attribute='created_at'):
+    """
+    Serialize one keyset page; the cursor of the next page goes in X-Next-Cursor.
+    schema is a Schema or a compiled serializer (api.serializers); schema=None
+    sends items as they are (JSON-ready dicts of the raw read path).
+    """
+    response = jsonify(items if schema is None else schema.dump(items, many=True))
+    cursor = next_cursor(items, limit, cursor_attribute)
+    if cursor:
+        response.headers['X-Next-Cursor'] = cursor
+    return response, 200
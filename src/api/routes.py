@@ -2,9 +2,29 @@ from src.api.controllers.todo_controller import bp as todo_bp
 from src.api.controllers.auth_controller import auth_bp
 from src.api.controllers.payments_controller import bp as payments_bp
 from src.api.controllers.payouts_controller import bp as payouts_bp
+from src.api.controllers.tutor_search_controller import bp as tutor_search_bp
+from src.api.controllers.availability_controller import bp as availability_bp
+from src.api.controllers.cache_controller import bp as cache_bp
+from src.api.controllers.notifications_controller import bp as notifications_bp
+from src.api.controllers.chat_controller import bp as chat_bp
+from src.api.controllers.stream_controller import bp as stream_bp
+from src.api.controllers.booking_details_controller import bp as booking_details_bp
+from src.api.controllers.exports_controller import bp as exports_bp
+from src.api.controllers.metrics_controller import bp as metrics_bp
+from src.api.controllers.catalog_controller import bp as catalog_bp
 
 def register_routes(app):
     app.register_blueprint(todo_bp)
     app.register_blueprint(auth_bp)
     app.register_blueprint(payments_bp)
-    app.register_blueprint(payouts_bp) 
\ No newline at end of file
+    app.register_blueprint(payouts_bp)
+    app.register_blueprint(tutor_search_bp)
+    app.register_blueprint(availability_bp)
+    app.register_blueprint(cache_bp)
+    app.register_blueprint(notifications_bp)
+    app.register_blueprint(chat_bp)
+    app.register_blueprint(stream_bp)
+    app.register_blueprint(booking_details_bp)
+    app.register_blueprint(exports_bp)
+    app.register_blueprint(metrics_bp)
+    app.register_blueprint(catalog_bp)
\ No newline at end of file
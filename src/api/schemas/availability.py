@@ -0,0 +1,49 @@
+from marshmallow import Schema, fields, validate, validates_schema, ValidationError
+
+class AvailabilityWindowRequestSchema(Schema):
+    """Schema for a [start, end) window in the query string"""
+    start = fields.DateTime(required=True)
+    end = fields.DateTime(required=True)
+    subject_id = fields.Int(required=False)
+
+    @validates_schema
+    def validate_window(self, data, **kwargs):
+        if data['start'] >= data['end']:
+            raise ValidationError('start must be before end', 'end')
+
+class FreeWindowsRequestSchema(Schema):
+    """Schema for next-free-windows query parameters"""
+    after = fields.DateTime(required=False)
+    count = fields.Int(required=False, load_default=5, validate=validate.Range(min=1, max=50))
+    duration = fields.Int(required=False, load_default=60, validate=validate.Range(min=1, max=24 * 60))
+
+class FreeGridRequestSchema(Schema):
+    """Schema for free-grid query parameters"""
+    start = fields.DateTime(required=True)
+    step = fields.Int(required=False, load_default=60, validate=validate.Range(min=5, max=24 * 60))
+    count = fields.Int(required=False, load_default=168, validate=validate.Range(min=1, max=7 * 24 * 4))
+    duration = fields.Int(required=False, load_default=60, validate=validate.Range(min=1, max=24 * 60))
+    subject_id = fields.Int(required=False)
+    limit = fields.Int(required=False, load_default=100, validate=validate.Range(min=1, max=1000))
+    offset = fields.Int(required=False, load_default=0, validate=validate.Range(min=0))
+
+class FreeWindowSchema(Schema):
+    """Schema for one free window"""
+    start = fields.DateTime(required=True)
+    end = fields.DateTime(required=True)
+
+class TutorFreeGridSchema(Schema):
+    """Schema for one tutor's row of the free grid"""
+    tutor_id = fields.Int(required=True)
+    free_windows = fields.List(fields.Int(), required=True)
+
+class FreeGridResponseSchema(Schema):
+    """Schema for the free grid of many tutors"""
+    windows = fields.List(fields.DateTime(), required=True)
+    total = fields.Int(required=True)
+    tutors = fields.List(fields.Nested(TutorFreeGridSchema), required=True)
+
+class TutorFreeResponseSchema(Schema):
+    """Schema for a single tutor free/busy answer"""
+    tutor_id = fields.Int(required=True)
+    free = fields.Bool(required=True)
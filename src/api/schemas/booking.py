@@ -0,0 +1,79 @@
+from marshmallow import Schema, fields
+from api.schemas.payment import PaymentResponseSchema
+from api.schemas.payout import PayoutResponseSchema
+
+class BookingDetailRequestSchema(Schema):
+    """Schema for booking detail query parameters (limit/after are read separately)"""
+    include = fields.Str(required=False)  # comma-separated relationship names, all by default
+    limit = fields.Int()
+    after = fields.Str()
+
+class BookingResponseSchema(Schema):
+    """Schema for booking responses"""
+    id = fields.Int(required=True)
+    student_id = fields.Int(required=True)
+    tutor_id = fields.Int(required=True)
+    service_id = fields.Int(required=True)
+    subject_id = fields.Int(required=True)
+    start_at = fields.DateTime(required=True)
+    end_at = fields.DateTime(required=True)
+    hours = fields.Decimal(required=True, places=2)
+    total_amount = fields.Decimal(required=True, places=2)
+    status = fields.Function(lambda booking: booking.status.value)
+    created_at = fields.DateTime(required=True)
+    updated_at = fields.DateTime(required=True)
+
+class BookingStudentSchema(Schema):
+    """Schema for the student of a booking"""
+    user_id = fields.Int(required=True)
+    full_name = fields.Str(required=True)
+
+class BookingTutorSchema(Schema):
+    """Schema for the tutor of a booking"""
+    user_id = fields.Int(required=True)
+    full_name = fields.Str(required=True)
+    hourly_rate = fields.Decimal(required=True, places=2)
+    verification_status = fields.Function(lambda tutor: tutor.verification_status.value)
+    rating_avg = fields.Float(required=True)
+    rating_count = fields.Int(required=True)
+
+class BookingServiceSchema(Schema):
+    """Schema for the service listing of a booking"""
+    id = fields.Int(required=True)
+    title = fields.Str(required=True)
+    price_per_hour = fields.Decimal(required=True, places=2)
+    active = fields.Bool(required=True)
+
+class BookingSubjectSchema(Schema):
+    """Schema for the subject of a booking"""
+    id = fields.Int(required=True)
+    name = fields.Str(required=True)
+    level = fields.Function(lambda subject: subject.level.value)
+
+class BookingReviewSchema(Schema):
+    """Schema for the review of a booking"""
+    id = fields.Int(required=True)
+    rating = fields.Int(required=True)
+    comment = fields.Str(allow_none=True)
+    created_at = fields.DateTime(required=True)
+
+class BookingComplaintSchema(Schema):
+    """Schema for a complaint about a booking"""
+    id = fields.Int(required=True)
+    raised_by_user = fields.Int(required=True)
+    against_user = fields.Int(required=True)
+    type = fields.Function(lambda complaint: complaint.type.value)
+    status = fields.Function(lambda complaint: complaint.status.value)
+    created_at = fields.DateTime(required=True)
+
+class BookingDetailResponseSchema(Schema):
+    """Schema for a booking with its related records (unrequested ones are null/empty)"""
+    booking = fields.Nested(BookingResponseSchema, required=True)
+    student = fields.Nested(BookingStudentSchema, allow_none=True)
+    tutor = fields.Nested(BookingTutorSchema, allow_none=True)
+    service = fields.Nested(BookingServiceSchema, allow_none=True)
+    subject = fields.Nested(BookingSubjectSchema, allow_none=True)
+    payment = fields.Nested(PaymentResponseSchema, allow_none=True)
+    payouts = fields.List(fields.Nested(PayoutResponseSchema))
+    review = fields.Nested(BookingReviewSchema, allow_none=True)
+    complaints = fields.List(fields.Nested(BookingComplaintSchema))
@@ -0,0 +1,44 @@
+from marshmallow import Schema, fields, validate
+
+class SubjectListRequestSchema(Schema):
+    """Schema for subject list query parameters"""
+    level = fields.Str(required=False, validate=validate.OneOf(['K12', 'Undergrad', 'Graduate', 'Other']))
+
+class ListingListRequestSchema(Schema):
+    """Schema for service listing query parameters"""
+    tutor_id = fields.Int(required=False)
+
+class SubjectResponseSchema(Schema):
+    """Schema for subject responses"""
+    id = fields.Int(required=True)
+    name = fields.Str(required=True)
+    level = fields.Function(lambda subject: subject.level.value)
+    created_at = fields.DateTime(required=True)
+    updated_at = fields.DateTime(required=True)
+
+class TutorProfileResponseSchema(Schema):
+    """Schema for tutor profile responses"""
+    user_id = fields.Int(required=True)
+    full_name = fields.Str(required=True)
+    bio = fields.Str(required=True)
+    years_experience = fields.Int(required=True)
+    hourly_rate = fields.Decimal(required=True, places=2)
+    verification_status = fields.Function(lambda tutor: tutor.verification_status.value)
+    rating_avg = fields.Float(required=True)
+    rating_count = fields.Int(required=True)
+    rating_histogram = fields.Function(
+        lambda tutor: {str(stars): count for stars, count in sorted(tutor.rating_histogram.items())}
+    )
+    created_at = fields.DateTime(required=True)
+    updated_at = fields.DateTime(required=True)
+
+class ServiceListingResponseSchema(Schema):
+    """Schema for service listing responses"""
+    id = fields.Int(required=True)
+    tutor_id = fields.Int(required=True)
+    title = fields.Str(required=True)
+    description = fields.Str(required=True)
+    price_per_hour = fields.Decimal(required=True, places=2)
+    active = fields.Bool(required=True)
+    created_at = fields.DateTime(required=True)
+    updated_at = fields.DateTime(required=True)
@@ -0,0 +1,46 @@
+from marshmallow import Schema, fields, validate
+
+class MessageRequestSchema(Schema):
+    """Schema for posting a chat message"""
+    sender_id = fields.Int(required=True)
+    body = fields.Str(required=True, validate=validate.Length(min=1))
+    attachment_url = fields.Str(allow_none=True, validate=validate.Length(max=500))
+
+class MessageResponseSchema(Schema):
+    """Schema for chat message responses"""
+    id = fields.Int(required=True)
+    thread_id = fields.Int(required=True)
+    sender_id = fields.Int(required=True)
+    body = fields.Str(required=True)
+    attachment_url = fields.Str(allow_none=True)
+    created_at = fields.DateTime(required=True)
+    updated_at = fields.DateTime(required=True)
+
+class ThreadMessagesRequestSchema(Schema):
+    """Schema for reading the latest messages of a thread"""
+    user_id = fields.Int(required=True)
+    limit = fields.Int(load_default=50, validate=validate.Range(min=1, max=200))
+
+class ThreadSummaryRequestSchema(Schema):
+    """Schema for inbox query parameters (limit/after are read separately)"""
+    user_id = fields.Int(required=True)
+    limit = fields.Int()
+    after = fields.Str()
+
+class ThreadReadRequestSchema(Schema):
+    """Schema for marking a thread as read"""
+    user_id = fields.Int(required=True)
+
+class ThreadSummaryResponseSchema(Schema):
+    """Schema for a thread in a user's inbox"""
+    id = fields.Int(required=True)
+    student_id = fields.Int(required=True)
+    tutor_id = fields.Int(required=True)
+    counterpart_id = fields.Int(required=True)
+    last_message_id = fields.Int(allow_none=True)
+    last_message_at = fields.DateTime(allow_none=True)
+    last_sender_id = fields.Int(allow_none=True)
+    last_message_snippet = fields.Str(allow_none=True)
+    last_activity_at = fields.DateTime(required=True)
+    unread_count = fields.Int(required=True)
+    created_at = fields.DateTime(required=True)
@@ -0,0 +1,8 @@
+from marshmallow import Schema, fields, validate
+
+class ExportRequestSchema(Schema):
+    """Schema for export query parameters (status is validated per entity)"""
+    status = fields.List(fields.Str(), load_default=list)  # repeat for several statuses
+    created_from = fields.DateTime(data_key='from')
+    created_to = fields.DateTime(data_key='to')
+    format = fields.Str(load_default='ndjson', validate=validate.OneOf(['ndjson', 'json']))
@@ -0,0 +1,42 @@
+from marshmallow import Schema, fields, validate
+
+class NotificationRequestSchema(Schema):
+    """Schema for notification creation requests"""
+    user_id = fields.Int(required=True)
+    type = fields.Str(required=True, validate=validate.OneOf(['OTP', 'BookingUpdate', 'Payment', 'Message', 'System']))
+    channel = fields.Str(load_default='InApp', validate=validate.OneOf(['Email', 'SMS', 'Push', 'InApp']))
+    payload = fields.Str(required=True)
+
+class NotificationResponseSchema(Schema):
+    """Schema for notification responses"""
+    id = fields.Int(required=True)
+    user_id = fields.Int(required=True)
+    type = fields.Function(lambda notification: notification.type.value)
+    channel = fields.Function(lambda notification: notification.channel.value)
+    payload = fields.Str(required=True)
+    sent_at = fields.DateTime(allow_none=True)
+    read_at = fields.DateTime(allow_none=True)
+    created_at = fields.DateTime(required=True)
+    updated_at = fields.DateTime(required=True)
+
+class NotificationUserSchema(Schema):
+    """Schema for requests acting on one user's inbox"""
+    user_id = fields.Int(required=True)
+
+class NotificationInboxRequestSchema(NotificationUserSchema):
+    """Schema for inbox query parameters (limit/after are read separately)"""
+    unread = fields.Bool(load_default=False)
+    limit = fields.Int()
+    after = fields.Str()
+
+class UnreadCountResponseSchema(Schema):
+    """Schema for the unread badge"""
+    user_id = fields.Int(required=True)
+    unread_count = fields.Int(required=True)
+
+class ChannelQueueStatsSchema(Schema):
+    """Schema for the dispatch queue of one channel"""
+    channel = fields.Function(lambda stats: stats.channel.value)
+    depth = fields.Int(required=True)
+    due = fields.Int(required=True)
+    oldest_age_seconds = fields.Function(lambda stats: round(stats.oldest_age_seconds(), 3))
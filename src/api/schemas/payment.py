@@ -17,11 +17,11 @@ class PaymentResponseSchema(Schema):
     """Schema for payment responses"""
     id = fields.Int(required=True)
     booking_id = fields.Int(required=True)
-    method = fields.Str(required=True)
+    method = fields.Function(lambda payment: payment.method.value)
     provider_txn_id = fields.Str(required=True)
     amount = fields.Decimal(required=True, places=2)
     currency = fields.Str(required=True)
-    status = fields.Str(required=True)
+    status = fields.Function(lambda payment: payment.status.value)
     created_at = fields.DateTime(required=True)
     updated_at = fields.DateTime(required=True)
 
@@ -17,7 +17,8 @@ class PayoutResponseSchema(Schema):
     tutor_id = fields.Int(required=True)
     booking_id = fields.Int(required=True)
     amount = fields.Decimal(required=True, places=2)
-    status = fields.Str(required=True)
+    status = fields.Function(lambda payout: payout.status.value)
+    batch_id = fields.Str(allow_none=True)
     created_at = fields.DateTime(required=True)
     updated_at = fields.DateTime(required=True)
 
@@ -0,0 +1,24 @@
+from marshmallow import Schema, fields, validate
+
+class StreamRequestSchema(Schema):
+    """Schema for opening an event stream (SSE)"""
+    user_id = fields.Int(required=True)
+    last_event_id = fields.Str()  # for clients that cannot send the Last-Event-ID header
+
+class StreamPollRequestSchema(Schema):
+    """Schema for long-polling an event stream"""
+    user_id = fields.Int(required=True)
+    cursor = fields.Str()
+    timeout = fields.Float(validate=validate.Range(min=0))
+
+class StreamEventSchema(Schema):
+    """Schema for one event of a long-poll response"""
+    id = fields.Int(required=True)
+    type = fields.Str(required=True)
+    data = fields.Dict(required=True)
+
+class StreamPollResponseSchema(Schema):
+    """Schema for a long-poll response"""
+    cursor = fields.Str(required=True)
+    more = fields.Bool(required=True)
+    events = fields.List(fields.Nested(StreamEventSchema), required=True)
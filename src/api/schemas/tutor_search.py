@@ -0,0 +1,38 @@
+from marshmallow import Schema, fields, validate
+from decimal import Decimal
+from domain.constants import MAX_PAGE_SIZE, DEFAULT_PAGE_SIZE
+
+class TutorSearchRequestSchema(Schema):
+    """Schema for tutor search query parameters"""
+    q = fields.Str(required=False, validate=validate.Length(max=200))
+    subject_id = fields.List(fields.Int(), required=False)
+    level = fields.List(fields.Str(validate=validate.OneOf(['K12', 'Undergrad', 'Graduate', 'Other'])), required=False)
+    min_rate = fields.Decimal(required=False, places=2, validate=validate.Range(min=Decimal('0')))
+    max_rate = fields.Decimal(required=False, places=2, validate=validate.Range(min=Decimal('0')))
+    min_rating = fields.Float(required=False, validate=validate.Range(min=0, max=5))
+    verification_status = fields.List(
+        fields.Str(validate=validate.OneOf(['Unverified', 'Pending', 'Verified', 'Rejected'])), required=False
+    )
+    weekday = fields.Str(required=False, validate=validate.OneOf(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']))
+    start_time = fields.Time(required=False)
+    end_time = fields.Time(required=False)
+    limit = fields.Int(required=False, load_default=DEFAULT_PAGE_SIZE, validate=validate.Range(min=1, max=MAX_PAGE_SIZE))
+    offset = fields.Int(required=False, load_default=0, validate=validate.Range(min=0))
+
+class TutorSearchHitSchema(Schema):
+    """Schema for one tutor search result"""
+    tutor_id = fields.Int(required=True)
+    full_name = fields.Str(required=True)
+    hourly_rate = fields.Decimal(required=True, places=2)
+    verification_status = fields.Function(lambda hit: hit.verification_status.value)
+    rating_avg = fields.Float(required=True)
+    rating_count = fields.Int(required=True)
+    subject_ids = fields.List(fields.Int())
+    score = fields.Float(required=True)
+
+class TutorSearchResponseSchema(Schema):
+    """Schema for a page of tutor search results with facet counts"""
+    items = fields.List(fields.Nested(TutorSearchHitSchema))
+    total = fields.Int(required=True)
+    facets = fields.Dict(keys=fields.Str(), values=fields.Dict(keys=fields.Str(), values=fields.Int()))
+    next_offset = fields.Int(allow_none=True)
@@ -0,0 +1,147 @@
+"""
+Precompiled response serializers generated from Marshmallow schemas.
+
+Schema.dump walks every field of every object through several method
+calls (get_value, serialize, _serialize, formatting), which dominates the
+CPU time of list responses. compile_schema reads a response schema once
+and generates a plain function building the output dict directly:
+
+    payment_serializer = compile_schema(PaymentResponseSchema)
+    jsonify(payment_serializer.dump(payments, many=True))
+
+Marshmallow stays the source of truth (and does all request validation);
+the generated code only mirrors what dump would produce for the common
+field types. Datetimes and enums are left native for the JSON provider
+(api.json_provider) to encode, which renders them as the schema would.
+Field types without a fast path use the schema's own field, and objects
+the generated code cannot read (dicts, missing attributes) go through
+Schema.dump, so the output never depends on which path ran.
+"""
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Type, Union
+
+from marshmallow import Schema, fields, missing
+
+from api.instrumentation import record_serialization
+
+# Field types whose values pass through when they already have the output type
+_PASSTHROUGH = (
+    (fields.Boolean, 'bool'),
+    (fields.Integer, 'int'),
+    (fields.Float, 'float'),
+    (fields.String, 'str'),
+)
+
+
+def _decimal_formatter(field: fields.Decimal):
+    """Decimal value -> what fields.Decimal dumps, without the per-call dispatch"""
+    places, rounding, as_string, allow_nan = field.places, field.rounding, field.as_string, field.allow_nan
+    format_num = field._format_num
+
+    def format_decimal(value):
+        if places is None or allow_nan or value.__class__ is not field.num_type or not value.is_finite():
+            value = format_num(value)
+        else:
+            value = value.quantize(places, rounding=rounding)
+        return format(value, 'f') if as_string else value
+
+    return format_decimal
+
+
+def _is_native_temporal(field: fields.Field) -> bool:
+    """ISO datetime/date/time fields, whose values the JSON provider encodes as is"""
+    if not isinstance(field, (fields.DateTime, fields.Date, fields.Time)):
+        return False
+    if isinstance(field, (fields.NaiveDateTime, fields.AwareDateTime)):
+        return False  # these convert time zones before formatting
+    return (field.format or field.DEFAULT_FORMAT) == 'iso'
+
+
+class CompiledSerializer:
+    """Generated dump function for one schema; drop-in for Schema.dump in responses"""
+
+    def __init__(self, schema: Schema):
+        self.schema = schema
+        self._dump_one = self._compile(schema)
+
+    def _compile(self, schema: Schema):
+        namespace: Dict[str, Any] = {'missing': missing}
+        lines, items, optional = [], [], []
+        for position, (name, field) in enumerate(schema.dump_fields.items()):
+            key = field.data_key if field.data_key is not None else name
+            attribute = field.attribute or name
+            value, helper = f'_v{position}', f'_f{position}'
+            passthrough = next((type_name for cls, type_name in _PASSTHROUGH if type(field) is cls), None)
+
+            if isinstance(field, fields.Function) and field.serialize_func is not None:
+                namespace[helper] = field.serialize_func
+                items.append((key, f'{helper}(obj)'))
+            elif not attribute.isidentifier():
+                # Dotted attribute paths: marshmallow's own lookup
+                namespace[helper] = field.serialize
+                optional.append((key, f'{helper}({name!r}, obj)'))
+            elif passthrough:
+                namespace[helper] = field._serialize
+                lines.append(f'{value} = obj.{attribute}')
+                items.append((key, f'{value} if {value} is None or {value}.__class__ is {passthrough} '
+                                   f'else {helper}({value}, None, obj)'))
+            elif type(field) is fields.Decimal:
+                namespace[helper] = _decimal_formatter(field)
+                lines.append(f'{value} = obj.{attribute}')
+                items.append((key, f'None if {value} is None else {helper}({value})'))
+            elif _is_native_temporal(field) or type(field) is fields.Raw:
+                items.append((key, f'obj.{attribute}'))
+            else:
+                namespace[helper] = field.serialize
+                optional.append((key, f'{helper}({name!r}, obj)'))
+
+        source = ['def dump(obj):']
+        source += [f'    {line}' for line in lines]
+        source.append('    data = {' + ', '.join(f'{key!r}: {expression}' for key, expression in items) + '}')
+        for position, (key, expression) in enumerate(optional):
+            # Fields without a fast path may dump nothing (missing), as in Schema.dump
+            source.append(f'    _o{position} = {expression}')
+            source.append(f'    if _o{position} is not missing:')
+            source.append(f'        data[{key!r}] = _o{position}')
+        source.append('    return data')
+
+        exec(compile('\n'.join(source), f'<serializer {type(schema).__name__}>', 'exec'), namespace)
+        return namespace['dump']
+
+    def _dump(self, obj: Any) -> Dict[str, Any]:
+        try:
+            return self._dump_one(obj)
+        except AttributeError:
+            # Mappings and objects lacking an attribute: Schema.dump knows how to handle them
+            return self.schema.dump(obj)
+
+    def dump(self, obj: Any, many: bool = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        started = time.perf_counter()
+        if many if many is not None else self.schema.many:
+            dump = self._dump
+            data = [dump(item) for item in obj]
+        else:
+            data = self._dump(obj)
+        record_serialization(time.perf_counter() - started)
+        return data
+
+
+@lru_cache(maxsize=None)
+def _compile_class(schema_cls: Type[Schema]) -> CompiledSerializer:
+    return CompiledSerializer(schema_cls())
+
+
+def compile_schema(schema: Union[Schema, Type[Schema]]) -> CompiledSerializer:
+    """
+    Serializer equivalent to schema.dump
+
+    Args:
+        schema: Schema class (compiled once per process) or configured instance (only=, exclude=, ...)
+
+    Returns:
+        CompiledSerializer with the same dump(obj, many=...) interface
+    """
+    if isinstance(schema, type):
+        return _compile_class(schema)
+    return CompiledSerializer(schema)
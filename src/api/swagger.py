@@ -10,6 +10,21 @@ from api.schemas.payment import (
     PaymentRequestSchema, PaymentUpdateSchema,
     PaymentResponseSchema, PaymentActionSchema,
 )
+from api.schemas.tutor_search import TutorSearchHitSchema, TutorSearchResponseSchema
+from api.schemas.availability import (
+    FreeWindowSchema, TutorFreeResponseSchema, TutorFreeGridSchema, FreeGridResponseSchema,
+)
+from api.schemas.notification import (
+    NotificationRequestSchema, NotificationResponseSchema,
+    NotificationUserSchema, UnreadCountResponseSchema, ChannelQueueStatsSchema,
+)
+from api.schemas.chat import (
+    MessageRequestSchema, MessageResponseSchema,
+    ThreadReadRequestSchema, ThreadSummaryResponseSchema,
+)
+from api.schemas.stream import StreamEventSchema, StreamPollResponseSchema
+from api.schemas.booking import BookingDetailResponseSchema, BookingResponseSchema
+from api.schemas.catalog import SubjectResponseSchema, TutorProfileResponseSchema, ServiceListingResponseSchema
 spec = APISpec(
     title="Todo API",
     version="1.0.0",
@@ -28,4 +43,31 @@ spec.components.schema("TutorEarningsResponseSchema", schema=TutorEarningsRespon
 spec.components.schema("PaymentRequestSchema", schema=PaymentRequestSchema)
 spec.components.schema("PaymentUpdateSchema",  schema=PaymentUpdateSchema)
 spec.components.schema("PaymentResponseSchema", schema=PaymentResponseSchema)
-spec.components.schema("PaymentActionSchema",  schema=PaymentActionSchema)
\ No newline at end of file
+spec.components.schema("PaymentActionSchema",  schema=PaymentActionSchema)
+
+spec.components.schema("TutorSearchHitSchema", schema=TutorSearchHitSchema)
+spec.components.schema("TutorSearchResponseSchema", schema=TutorSearchResponseSchema)
+spec.components.schema("FreeWindowSchema", schema=FreeWindowSchema)
+spec.components.schema("TutorFreeResponseSchema", schema=TutorFreeResponseSchema)
+spec.components.schema("TutorFreeGridSchema", schema=TutorFreeGridSchema)
+spec.components.schema("FreeGridResponseSchema", schema=FreeGridResponseSchema)
+
+spec.components.schema("NotificationRequestSchema", schema=NotificationRequestSchema)
+spec.components.schema("NotificationResponseSchema", schema=NotificationResponseSchema)
+spec.components.schema("NotificationUserSchema", schema=NotificationUserSchema)
+spec.components.schema("UnreadCountResponseSchema", schema=UnreadCountResponseSchema)
+spec.components.schema("ChannelQueueStatsSchema", schema=ChannelQueueStatsSchema)
+
+spec.components.schema("MessageRequestSchema", schema=MessageRequestSchema)
+spec.components.schema("MessageResponseSchema", schema=MessageResponseSchema)
+spec.components.schema("ThreadReadRequestSchema", schema=ThreadReadRequestSchema)
+spec.components.schema("ThreadSummaryResponseSchema", schema=ThreadSummaryResponseSchema)
+spec.components.schema("StreamEventSchema", schema=StreamEventSchema)
+spec.components.schema("StreamPollResponseSchema", schema=StreamPollResponseSchema)
+
+spec.components.schema("BookingDetailResponseSchema", schema=BookingDetailResponseSchema)
+spec.components.schema("BookingResponseSchema", schema=BookingResponseSchema)
+
+spec.components.schema("SubjectResponseSchema", schema=SubjectResponseSchema)
+spec.components.schema("TutorProfileResponseSchema", schema=TutorProfileResponseSchema)
+spec.components.schema("ServiceListingResponseSchema", schema=ServiceListingResponseSchema)
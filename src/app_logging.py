@@ -1,13 +1,49 @@
+import atexit
 import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 
-def setup_logging():
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler("app.log"),
-            logging.StreamHandler()
-        ]
-    )
-
-setup_logging() 
\ No newline at end of file
+from config import get_config
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread. The stock
+    prepare() formats the message on the calling thread; here the caller
+    only pays for putting the record on the queue.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def queued(*handlers: logging.Handler) -> QueueHandler:
+    """
+    Handler that hands records to a background thread writing them to handlers.
+    The thread is stopped (and the queue drained) at interpreter exit.
+    """
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return DeferredQueueHandler(records)
+
+
+def setup_logging(app=None):
+    """
+    Application logs to LOG_FILE and stderr, written off the request thread.
+    Safe to call more than once: only the first call configures.
+    """
+    root = logging.getLogger()
+    if any(isinstance(handler, QueueHandler) for handler in root.handlers):
+        return
+    config = get_config()
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [logging.StreamHandler(sys.stderr)]
+    if config.LOG_FILE:
+        handlers.append(logging.FileHandler(config.LOG_FILE))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    root.setLevel(config.LOG_LEVEL)
+    root.addHandler(queued(*handlers))
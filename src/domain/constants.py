@@ -6,5 +6,6 @@
 API_VERSION = "v1"
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
+MAX_BATCH_SIZE = 500
 
 # Add more constants as needed for your application.
\ No newline at end of file
@@ -1,8 +1,17 @@
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 
+from domain.models.complaint import Complaint
+from domain.models.payment import Payment
+from domain.models.payout import Payout
+from domain.models.review import Review
+from domain.models.service_listing import ServiceListing
+from domain.models.student_profile import StudentProfile
+from domain.models.subject import Subject
+from domain.models.tutor_profile import TutorProfile
+
 class BookingStatus(Enum):
     PENDING = "Pending"
     CONFIRMED = "Confirmed"
@@ -11,7 +20,13 @@ class BookingStatus(Enum):
     CANCELED = "Canceled"
     REFUNDED = "Refunded"
 
+# Bookings in these states hold the tutor's time
+BLOCKING_BOOKING_STATUSES = (BookingStatus.PENDING, BookingStatus.CONFIRMED, BookingStatus.IN_PROGRESS)
+
 class Booking:
+    __slots__ = ('id', 'student_id', 'tutor_id', 'service_id', 'subject_id', 'start_at', 'end_at', 'hours',
+                 'status', 'total_amount', 'created_at', 'updated_at')
+    
     def __init__(
         self,
         id: Optional[int] = None,
@@ -53,3 +68,40 @@ class Booking:
     def calculate_duration_hours(self) -> Decimal:
         duration = self.end_at - self.start_at
         return Decimal(str(duration.total_seconds() / 3600))
+
+
+class BookingDetail:
+    """
+    A booking with the records around it, for a booking detail view.
+    Related records that were not requested are None (or empty).
+    """
+
+    def __init__(
+        self,
+        booking: Booking,
+        student: Optional[StudentProfile] = None,
+        tutor: Optional[TutorProfile] = None,
+        service: Optional[ServiceListing] = None,
+        subject: Optional[Subject] = None,
+        payment: Optional[Payment] = None,
+        payouts: Optional[List[Payout]] = None,
+        review: Optional[Review] = None,
+        complaints: Optional[List[Complaint]] = None
+    ):
+        self.booking = booking
+        self.student = student
+        self.tutor = tutor
+        self.service = service
+        self.subject = subject
+        self.payment = payment
+        self.payouts = payouts or []
+        self.review = review
+        self.complaints = complaints or []
+    
+    @property
+    def id(self) -> Optional[int]:
+        return self.booking.id
+    
+    @property
+    def created_at(self) -> datetime:
+        return self.booking.created_at
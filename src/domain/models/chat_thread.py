@@ -8,13 +8,28 @@ class ChatThread:
         student_id: int = 0,
         tutor_id: int = 0,
         created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None,
+        last_message_id: Optional[int] = None,
+        last_message_at: Optional[datetime] = None,
+        last_sender_id: Optional[int] = None,
+        last_message_snippet: Optional[str] = None,
+        last_activity_at: Optional[datetime] = None,
+        student_unread_count: int = 0,
+        tutor_unread_count: int = 0
     ):
         self.id = id
         self.student_id = student_id
         self.tutor_id = tutor_id
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
+        # Summary projection, maintained by the message repository
+        self.last_message_id = last_message_id
+        self.last_message_at = last_message_at
+        self.last_sender_id = last_sender_id
+        self.last_message_snippet = last_message_snippet
+        self.last_activity_at = last_activity_at or last_message_at or self.created_at
+        self.student_unread_count = student_unread_count
+        self.tutor_unread_count = tutor_unread_count
     
     def update_timestamp(self):
         """Update the last activity timestamp"""
@@ -27,3 +42,31 @@ class ChatThread:
     def involves_user(self, user_id: int) -> bool:
         """Check if user is part of this chat thread"""
         return user_id in [self.student_id, self.tutor_id]
+    
+    def unread_count_for(self, user_id: int) -> int:
+        """Messages from the other participant the user has not read"""
+        if user_id == self.student_id:
+            return self.student_unread_count
+        if user_id == self.tutor_id:
+            return self.tutor_unread_count
+        return 0
+    
+    def counterpart_of(self, user_id: int) -> int:
+        """The other participant"""
+        return self.tutor_id if user_id == self.student_id else self.student_id
+
+
+class ChatThreadSummary:
+    """A thread as listed in one user's inbox: last message and that user's unread count"""
+    def __init__(self, thread: ChatThread, user_id: int):
+        self.id = thread.id
+        self.student_id = thread.student_id
+        self.tutor_id = thread.tutor_id
+        self.counterpart_id = thread.counterpart_of(user_id)
+        self.last_message_id = thread.last_message_id
+        self.last_message_at = thread.last_message_at
+        self.last_sender_id = thread.last_sender_id
+        self.last_message_snippet = thread.last_message_snippet
+        self.last_activity_at = thread.last_activity_at
+        self.unread_count = thread.unread_count_for(user_id)
+        self.created_at = thread.created_at
@@ -0,0 +1,36 @@
+from typing import Optional
+from datetime import datetime
+
+
+class IdempotencyRecord:
+    """
+    Outcome of the first request sent with an Idempotency-Key.
+    status_code is None while that request is still being handled.
+    """
+    def __init__(
+        self,
+        key: str,
+        request_hash: str,
+        expires_at: datetime,
+        status_code: Optional[int] = None,
+        content_type: Optional[str] = None,
+        response_body: Optional[str] = None,
+        id: Optional[int] = None,
+        created_at: Optional[datetime] = None
+    ):
+        self.id = id
+        self.key = key
+        self.request_hash = request_hash
+        self.status_code = status_code
+        self.content_type = content_type
+        self.response_body = response_body
+        self.created_at = created_at or datetime.utcnow()
+        self.expires_at = expires_at
+    
+    def is_complete(self) -> bool:
+        """Check if the response has been recorded"""
+        return self.status_code is not None
+    
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        """Check if the key may be reused"""
+        return (now or datetime.utcnow()) >= self.expires_at
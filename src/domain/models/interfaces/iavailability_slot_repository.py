@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import time
+from typing import List, Optional, Tuple
 from ..availability_slot import AvailabilitySlot, Weekday
 
 class IAvailabilitySlotRepository(ABC):
@@ -41,3 +42,8 @@ class IAvailabilitySlotRepository(ABC):
     def delete_by_tutor_id(self, tutor_id: int) -> bool:
         """Delete all availability slots for a tutor"""
         pass
+    
+    @abstractmethod
+    def get_window_rows(self) -> List[Tuple[int, str, time, time, str]]:
+        """Get (tutor_id, weekday, start_time, end_time, timezone) for every slot"""
+        pass
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
-from ..booking import Booking, BookingStatus
+from ..booking import Booking, BookingDetail, BookingStatus
 
 class IBookingRepository(ABC):
     """
@@ -19,20 +19,47 @@ class IBookingRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_student_id(self, student_id: int) -> List[Booking]:
+    def get_detail(self, booking_id: int, include: Optional[Iterable[str]] = None) -> Optional[BookingDetail]:
+        """Get a booking with its related records (all, or only the named ones)"""
+        pass
+    
+    @abstractmethod
+    def get_details_by_student_id(
+        self,
+        student_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        include: Optional[Iterable[str]] = None
+    ) -> List[BookingDetail]:
+        """Get a student's bookings with their related records"""
+        pass
+    
+    @abstractmethod
+    def get_by_student_id(self, student_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Booking]:
         """Get all bookings for a student"""
         pass
     
     @abstractmethod
-    def get_by_tutor_id(self, tutor_id: int) -> List[Booking]:
+    def get_by_tutor_id(self, tutor_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Booking]:
         """Get all bookings for a tutor"""
         pass
     
     @abstractmethod
-    def get_by_status(self, status: BookingStatus) -> List[Booking]:
+    def get_by_status(self, status: BookingStatus, limit: Optional[int] = None, after: Optional[str] = None) -> List[Booking]:
         """Get bookings by status"""
         pass
     
+    @abstractmethod
+    def iter_rows(
+        self,
+        statuses: Optional[Iterable[BookingStatus]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream bookings created in [created_from, created_to), oldest first, as JSON-ready dicts"""
+        pass
+    
     @abstractmethod
     def get_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Booking]:
         """Get bookings within a date range"""
@@ -52,3 +79,13 @@ class IBookingRepository(ABC):
     def delete(self, booking_id: int) -> bool:
         """Delete booking"""
         pass
+    
+    @abstractmethod
+    def get_blocking_rows(self, start: datetime, end: datetime) -> List[Tuple[int, datetime, datetime]]:
+        """Get (tutor_id, start_at, end_at) of blocking bookings overlapping [start, end)"""
+        pass
+    
+    @abstractmethod
+    def has_overlapping_booking(self, tutor_id: int, start: datetime, end: datetime) -> bool:
+        """Check whether the tutor has a blocking booking overlapping [start, end)"""
+        pass
@@ -46,3 +46,18 @@ class IChatThreadRepository(ABC):
     def delete(self, thread_id: int) -> bool:
         """Delete chat thread"""
         pass
+    
+    @abstractmethod
+    def get_summaries_by_user_id(self, user_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[ChatThread]:
+        """Threads of a user with their summary projection, most recently active first"""
+        pass
+    
+    @abstractmethod
+    def mark_read(self, thread_id: int, user_id: int) -> Optional[ChatThread]:
+        """Mark every message of the thread read for the user"""
+        pass
+    
+    @abstractmethod
+    def rebuild_summaries(self, chunk_size: int = 1000) -> int:
+        """Recompute the summary projection of every thread from messages"""
+        pass
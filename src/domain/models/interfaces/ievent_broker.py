@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+from ..stream_event import StreamEvent, StreamCursor
+
+class ISubscription(ABC):
+    """
+    Interface for one subscriber of a user's events
+    """
+    
+    overflowed: bool  # events were dropped; the subscriber must resume from its cursor
+    
+    @abstractmethod
+    def wait(self, timeout: float) -> List[StreamEvent]:
+        """Events received since the last call, waiting up to timeout seconds for the first"""
+        pass
+    
+    @abstractmethod
+    def close(self):
+        """Stop receiving events"""
+        pass
+
+class IEventBroker(ABC):
+    """
+    Interface for the fan-out of stream events to subscribed users
+    """
+    
+    @abstractmethod
+    def publish(self, user_ids: Iterable[int], event: StreamEvent):
+        """Deliver an event to the streams of the given users (in every process)"""
+        pass
+    
+    @abstractmethod
+    def subscribe(self, user_id: int) -> ISubscription:
+        """Start receiving the events of a user"""
+        pass
+    
+    @abstractmethod
+    def recent(self, user_id: int, cursor: StreamCursor) -> Optional[List[StreamEvent]]:
+        """Buffered events of a user past cursor; None when the buffer cannot tell (read the database)"""
+        pass
+    
+    @abstractmethod
+    def latest_cursor(self) -> Optional[StreamCursor]:
+        """Highest ids seen by the broker, the start of a fresh stream (None until the watermark is set)"""
+        pass
+    
+    @abstractmethod
+    def needs_watermark(self) -> bool:
+        """True until set_watermark was called (again, after a gap in delivery)"""
+        pass
+    
+    @abstractmethod
+    def set_watermark(self, cursor: StreamCursor):
+        """Highest ids committed before the broker saw every event; older ones are read from the database"""
+        pass
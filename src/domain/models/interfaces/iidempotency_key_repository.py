@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from datetime import datetime
+from ..idempotency_record import IdempotencyRecord
+
+class IIdempotencyKeyRepository(ABC):
+    """
+    Interface for Idempotency Key Repository
+    """
+    
+    @abstractmethod
+    def claim(self, record: IdempotencyRecord) -> Optional[IdempotencyRecord]:
+        """Store an in-flight record (expires_at is its lease); return the live record already holding the key, None if claimed"""
+        pass
+    
+    @abstractmethod
+    def complete(self, key: str, status_code: int, content_type: Optional[str], response_body: str,
+                 expires_at: datetime) -> bool:
+        """Record the response of an in-flight key, kept until expires_at"""
+        pass
+    
+    @abstractmethod
+    def release(self, key: str) -> bool:
+        """Drop an in-flight claim so the request can be retried"""
+        pass
+    
+    @abstractmethod
+    def purge_expired(self, now: datetime) -> int:
+        """Delete expired records, returns the number deleted"""
+        pass
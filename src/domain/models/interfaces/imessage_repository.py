@@ -46,3 +46,13 @@ class IMessageRepository(ABC):
     def count_messages_in_thread(self, thread_id: int) -> int:
         """Count messages in a thread"""
         pass
+    
+    @abstractmethod
+    def get_for_user_after(self, user_id: int, after_id: int, limit: int) -> List[Message]:
+        """Messages with id > after_id in the threads of a user, oldest first"""
+        pass
+    
+    @abstractmethod
+    def max_id(self) -> int:
+        """Highest message id (0 when there are none)"""
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from ..notification import Notification, NotificationType, NotificationChannel
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from ..notification import Notification, NotificationType, NotificationChannel, ChannelQueueStats
 
 class INotificationRepository(ABC):
     """
@@ -18,22 +19,22 @@ class INotificationRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_user_id(self, user_id: int) -> List[Notification]:
+    def get_by_user_id(self, user_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Notification]:
         """Get all notifications for a user"""
         pass
     
     @abstractmethod
-    def get_unread_by_user_id(self, user_id: int) -> List[Notification]:
+    def get_unread_by_user_id(self, user_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Notification]:
         """Get unread notifications for a user"""
         pass
     
     @abstractmethod
-    def get_by_type(self, notification_type: NotificationType) -> List[Notification]:
+    def get_by_type(self, notification_type: NotificationType, limit: Optional[int] = None, after: Optional[str] = None) -> List[Notification]:
         """Get notifications by type"""
         pass
     
     @abstractmethod
-    def get_by_channel(self, channel: NotificationChannel) -> List[Notification]:
+    def get_by_channel(self, channel: NotificationChannel, limit: Optional[int] = None, after: Optional[str] = None) -> List[Notification]:
         """Get notifications by channel"""
         pass
     
@@ -51,3 +52,54 @@ class INotificationRepository(ABC):
     def mark_all_read_for_user(self, user_id: int) -> bool:
         """Mark all notifications as read for a user"""
         pass
+    
+    @abstractmethod
+    def mark_read(self, notification_id: int, user_id: int) -> Optional[Notification]:
+        """Mark one of the user's notifications as read; None if it is not theirs"""
+        pass
+    
+    @abstractmethod
+    def get_unread_count(self, user_id: int) -> int:
+        """Number of sent, unread notifications of a user"""
+        pass
+    
+    @abstractmethod
+    def fingerprint_by_user_id(self, user_id: int) -> Tuple[int, Optional[datetime], Optional[int]]:
+        """(count, latest updated_at, highest id) of a user's notifications"""
+        pass
+    
+    @abstractmethod
+    def claim_pending(
+        self,
+        channel: NotificationChannel,
+        token: str,
+        limit: int,
+        lease_until: datetime
+    ) -> List[Notification]:
+        """Claim up to limit due notifications of a channel for delivery until lease_until"""
+        pass
+    
+    @abstractmethod
+    def mark_sent_many(self, notification_ids: List[int], token: str, sent_at: datetime) -> int:
+        """Mark claimed notifications sent (and count them unread), returns the number marked"""
+        pass
+    
+    @abstractmethod
+    def record_failures(self, notifications: List[Notification], token: str) -> int:
+        """Store attempts/next_attempt_at/failed_at of claimed notifications and release them"""
+        pass
+    
+    @abstractmethod
+    def get_queue_stats(self) -> Dict[NotificationChannel, ChannelQueueStats]:
+        """Dispatch queue depth per channel"""
+        pass
+    
+    @abstractmethod
+    def get_for_user_after(self, user_id: int, after_id: int, limit: int) -> List[Notification]:
+        """Notifications of a user with id > after_id, oldest first"""
+        pass
+    
+    @abstractmethod
+    def max_id(self) -> int:
+        """Highest notification id (0 when there are none)"""
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+from ..notification import Notification, NotificationChannel
+
+class INotificationSender(ABC):
+    """
+    Interface for the delivery of one notification channel
+    """
+    
+    channel: NotificationChannel
+    
+    @abstractmethod
+    def send_batch(self, notifications: List[Notification]) -> Dict[int, str]:
+        """
+        Deliver a batch; returns {notification id: error} for the ones that failed.
+        Raising fails the whole batch. Called from worker threads, so it must
+        not use a database session and should bound its own network timeouts.
+        """
+        pass
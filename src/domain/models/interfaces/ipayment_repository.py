@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional
+from datetime import datetime
 from ..payment import Payment, PaymentStatus
 
 class IPaymentRepository(ABC):
@@ -33,11 +34,33 @@ class IPaymentRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_status(self, status: PaymentStatus) -> List[Payment]:
+    def get_by_status(self, status: PaymentStatus, limit: Optional[int] = None, after: Optional[str] = None) -> List[Payment]:
         """Get payments by status"""
         pass
     
+    @abstractmethod
+    def get_rows_by_status(self, status: PaymentStatus, limit: Optional[int] = None,
+                           after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get payments by status as JSON-ready dicts"""
+        pass
+    
+    @abstractmethod
+    def iter_rows(
+        self,
+        statuses: Optional[Iterable[PaymentStatus]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream payments created in [created_from, created_to), oldest first, as JSON-ready dicts"""
+        pass
+    
     @abstractmethod
     def get_by_provider_txn_id(self, provider_txn_id: str) -> Optional[Payment]:
         """Get payment by provider transaction ID"""
         pass
+    
+    @abstractmethod
+    def transaction(self) -> ContextManager:
+        """Open a unit of work spanning several repository calls"""
+        pass
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from ..payout import Payout, PayoutStatus
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime
+from decimal import Decimal
+from ..payout import Payout, PayoutStatus, TutorEarnings
 
 class IPayoutRepository(ABC):
     """
@@ -18,20 +20,42 @@ class IPayoutRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_tutor_id(self, tutor_id: int) -> List[Payout]:
+    def get_by_tutor_id(self, tutor_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Payout]:
         """Get all payouts for a tutor"""
         pass
     
     @abstractmethod
-    def get_by_booking_id(self, booking_id: int) -> List[Payout]:
+    def fingerprint_by_tutor_id(self, tutor_id: int) -> Tuple[int, Optional[datetime], Optional[int]]:
+        """(count, latest updated_at, highest id) of a tutor's payouts"""
+        pass
+    
+    @abstractmethod
+    def get_by_booking_id(self, booking_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Payout]:
         """Get payouts for a booking"""
         pass
     
     @abstractmethod
-    def get_by_status(self, status: PayoutStatus) -> List[Payout]:
+    def get_by_status(self, status: PayoutStatus, limit: Optional[int] = None, after: Optional[str] = None) -> List[Payout]:
         """Get payouts by status"""
         pass
     
+    @abstractmethod
+    def get_rows_by_status(self, status: PayoutStatus, limit: Optional[int] = None,
+                           after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get payouts by status as JSON-ready dicts"""
+        pass
+    
+    @abstractmethod
+    def iter_rows(
+        self,
+        statuses: Optional[Iterable[PayoutStatus]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream payouts created in [created_from, created_to), oldest first, as JSON-ready dicts"""
+        pass
+    
     @abstractmethod
     def update(self, payout: Payout) -> Payout:
         """Update payout"""
@@ -43,6 +67,47 @@ class IPayoutRepository(ABC):
         pass
     
     @abstractmethod
-    def get_pending_payouts(self) -> List[Payout]:
+    def get_pending_payouts(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[Payout]:
         """Get all pending payouts"""
         pass
+    
+    @abstractmethod
+    def earnings_summary(self, tutor_id: int) -> TutorEarnings:
+        """Get payout totals and counts by status for a tutor"""
+        pass
+    
+    @abstractmethod
+    def earnings_summaries(self, tutor_ids: List[int]) -> Dict[int, TutorEarnings]:
+        """Get payout totals and counts by status for many tutors"""
+        pass
+    
+    @abstractmethod
+    def get_payable_booking_rows(
+        self,
+        after_booking_id: int = 0,
+        limit: int = 1000,
+        completed_before: Optional[datetime] = None
+    ) -> List[Tuple[int, int, Decimal]]:
+        """(booking_id, tutor_id, captured amount) of completed bookings still without a payout"""
+        pass
+    
+    @abstractmethod
+    def add_batch(self, payouts: Iterable[Payout], chunk_size: int = 1000) -> int:
+        """Insert many payouts at once, returns the number inserted"""
+        pass
+    
+    @abstractmethod
+    def transition_batch_status(
+        self,
+        batch_id: str,
+        from_status: PayoutStatus,
+        to_status: PayoutStatus,
+        chunk_size: int = 1000
+    ) -> int:
+        """Move every payout of a batch from one status to another, returns the number moved"""
+        pass
+    
+    @abstractmethod
+    def transaction(self) -> ContextManager:
+        """Open a unit of work spanning several repository calls"""
+        pass
@@ -23,12 +23,12 @@ class IReviewRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_tutor_id(self, tutor_id: int) -> List[Review]:
+    def get_by_tutor_id(self, tutor_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Review]:
         """Get all reviews for a tutor"""
         pass
     
     @abstractmethod
-    def get_by_student_id(self, student_id: int) -> List[Review]:
+    def get_by_student_id(self, student_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Review]:
         """Get all reviews by a student"""
         pass
     
@@ -46,3 +46,8 @@ class IReviewRepository(ABC):
     def get_average_rating_for_tutor(self, tutor_id: int) -> float:
         """Get average rating for a tutor"""
         pass
+    
+    @abstractmethod
+    def reconcile_rating_aggregates(self, dry_run: bool = False) -> List[int]:
+        """Recompute drifted tutor rating aggregates, return the affected tutor ids"""
+        pass
@@ -33,6 +33,6 @@ class IStudentProfileRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self) -> List[StudentProfile]:
+    def get_all(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[StudentProfile]:
         """Get all student profiles"""
         pass
@@ -28,7 +28,7 @@ class ISubjectRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self) -> List[Subject]:
+    def get_all(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[Subject]:
         """Get all subjects"""
         pass
     
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from ..tutor_profile import TutorProfile, VerificationStatus
 
 class ITutorProfileRepository(ABC):
@@ -46,3 +46,8 @@ class ITutorProfileRepository(ABC):
     def get_by_rating_range(self, min_rating: float, max_rating: float) -> List[TutorProfile]:
         """Get tutors by rating range"""
         pass
+    
+    @abstractmethod
+    def get_search_rows(self) -> List[Tuple]:
+        """Get (user_id, full_name, bio, hourly_rate, verification_status, rating_avg, rating_count) rows"""
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from ..tutor_subject import TutorSubject
 
 class ITutorSubjectRepository(ABC):
@@ -41,3 +41,8 @@ class ITutorSubjectRepository(ABC):
     def delete_by_tutor_id(self, tutor_id: int) -> bool:
         """Delete all subjects for a tutor"""
         pass
+    
+    @abstractmethod
+    def get_subject_level_rows(self) -> List[Tuple[int, int, str]]:
+        """Get (tutor_id, subject_id, subject level) for every tutor subject"""
+        pass
@@ -28,7 +28,7 @@ class IUserRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self) -> List[User]:
+    def get_all(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[User]:
         """Get all users"""
         pass
     
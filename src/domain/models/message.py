@@ -2,6 +2,8 @@ from typing import Optional
 from datetime import datetime
 
 class Message:
+    __slots__ = ('id', 'thread_id', 'sender_id', 'body', 'attachment_url', 'created_at', 'updated_at')
+    
     def __init__(
         self,
         id: Optional[int] = None,
@@ -1,5 +1,5 @@
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 
 class NotificationType(Enum):
@@ -16,6 +16,9 @@ class NotificationChannel(Enum):
     IN_APP = "InApp"
 
 class Notification:
+    __slots__ = ('id', 'user_id', 'type', 'channel', 'payload', 'sent_at', 'read_at', 'created_at',
+                 'updated_at', 'attempts', 'next_attempt_at', 'last_error', 'failed_at')
+    
     def __init__(
         self,
         id: Optional[int] = None,
@@ -26,7 +29,11 @@ class Notification:
         sent_at: Optional[datetime] = None,
         read_at: Optional[datetime] = None,
         created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None,
+        attempts: int = 0,
+        next_attempt_at: Optional[datetime] = None,
+        last_error: Optional[str] = None,
+        failed_at: Optional[datetime] = None
     ):
         self.id = id
         self.user_id = user_id
@@ -37,6 +44,11 @@ class Notification:
         self.read_at = read_at
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
+        # Delivery bookkeeping of the dispatch queue
+        self.attempts = attempts
+        self.next_attempt_at = next_attempt_at
+        self.last_error = last_error
+        self.failed_at = failed_at
     
     def mark_sent(self):
         """Mark notification as sent"""
@@ -59,3 +71,38 @@ class Notification:
     def is_unread(self) -> bool:
         """Check if notification is unread"""
         return self.sent_at is not None and self.read_at is None
+    
+    def schedule_retry(self, error: str, delay: timedelta, max_attempts: int):
+        """Record a failed delivery attempt; give up once max_attempts is reached"""
+        now = datetime.utcnow()
+        self.attempts += 1
+        self.last_error = error
+        if self.attempts >= max_attempts:
+            self.failed_at = now
+        else:
+            self.next_attempt_at = now + delay
+    
+    def is_failed(self) -> bool:
+        """Check if delivery was given up"""
+        return self.failed_at is not None
+
+
+class ChannelQueueStats:
+    """Dispatch queue of one channel: notifications neither sent nor given up"""
+    def __init__(
+        self,
+        channel: NotificationChannel,
+        depth: int = 0,
+        due: int = 0,
+        oldest_created_at: Optional[datetime] = None
+    ):
+        self.channel = channel
+        self.depth = depth          # waiting, including ones backing off after a failure
+        self.due = due              # ready to be claimed now
+        self.oldest_created_at = oldest_created_at
+    
+    def oldest_age_seconds(self, now: Optional[datetime] = None) -> float:
+        """How long the oldest waiting notification has been queued"""
+        if self.oldest_created_at is None:
+            return 0.0
+        return max(0.0, ((now or datetime.utcnow()) - self.oldest_created_at).total_seconds())
@@ -15,6 +15,9 @@ class PaymentStatus(Enum):
     REFUNDED = "Refunded"
 
 class Payment:
+    __slots__ = ('id', 'booking_id', 'method', 'provider_txn_id', 'amount', 'currency', 'status',
+                 'created_at', 'updated_at')
+    
     def __init__(
         self,
         id: Optional[int] = None,
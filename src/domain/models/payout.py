@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 from enum import Enum
 from decimal import Decimal
@@ -10,6 +10,9 @@ class PayoutStatus(Enum):
     FAILED = "Failed"
 
 class Payout:
+    __slots__ = ('id', 'tutor_id', 'booking_id', 'amount', 'status', 'created_at', 'updated_at', 'batch_id',
+                 'idempotency_key')
+    
     def __init__(
         self,
         id: Optional[int] = None,
@@ -18,7 +21,9 @@ class Payout:
         amount: Decimal = Decimal('0.00'),
         status: PayoutStatus = PayoutStatus.PENDING,
         created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None,
+        batch_id: Optional[str] = None,
+        idempotency_key: Optional[str] = None
     ):
         self.id = id
         self.tutor_id = tutor_id
@@ -27,6 +32,8 @@ class Payout:
         self.status = status
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
+        self.batch_id = batch_id
+        self.idempotency_key = idempotency_key
     
     def process(self):
         """Mark payout as processing"""
@@ -54,3 +61,43 @@ class Payout:
     def is_failed(self) -> bool:
         """Check if payout is failed"""
         return self.status == PayoutStatus.FAILED
+
+def booking_payout_key(booking_id: int) -> str:
+    """Idempotency key of the batch payout for a booking (one per booking)"""
+    return f'booking:{booking_id}'
+
+class TutorEarnings:
+    """Per-status payout totals and counts for one tutor"""
+    def __init__(
+        self,
+        tutor_id: int,
+        totals_by_status: Optional[Dict[PayoutStatus, Decimal]] = None,
+        counts_by_status: Optional[Dict[PayoutStatus, int]] = None
+    ):
+        self.tutor_id = tutor_id
+        self.totals_by_status = totals_by_status or {}
+        self.counts_by_status = counts_by_status or {}
+    
+    def _total(self, *statuses: PayoutStatus) -> Decimal:
+        return sum((self.totals_by_status.get(s, Decimal('0.00')) for s in statuses), Decimal('0.00'))
+    
+    def _count(self, *statuses: PayoutStatus) -> int:
+        return sum(self.counts_by_status.get(s, 0) for s in statuses)
+    
+    @property
+    def total_earnings(self) -> Decimal:
+        """Earnings already paid out"""
+        return self._total(PayoutStatus.PAID)
+    
+    @property
+    def pending_earnings(self) -> Decimal:
+        """Earnings waiting to be paid (pending and processing)"""
+        return self._total(PayoutStatus.PENDING, PayoutStatus.PROCESSING)
+    
+    @property
+    def completed_payouts_count(self) -> int:
+        return self._count(PayoutStatus.PAID)
+    
+    @property
+    def pending_payouts_count(self) -> int:
+        return self._count(PayoutStatus.PENDING, PayoutStatus.PROCESSING)
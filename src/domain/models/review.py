@@ -2,6 +2,9 @@ from typing import Optional
 from datetime import datetime
 
 class Review:
+    __slots__ = ('id', 'booking_id', 'student_id', 'tutor_id', 'rating', 'comment', 'created_at',
+                 'updated_at')
+    
     def __init__(
         self,
         id: Optional[int] = None,
@@ -3,6 +3,9 @@ from datetime import datetime
 from decimal import Decimal
 
 class ServiceListing:
+    __slots__ = ('id', 'tutor_id', 'title', 'description', 'price_per_hour', 'active', 'created_at',
+                 'updated_at')
+    
     def __init__(
         self,
         id: Optional[int] = None,
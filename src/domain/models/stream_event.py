@@ -0,0 +1,74 @@
+from typing import Union
+
+from .message import Message
+from .notification import Notification
+
+
+class StreamEvent:
+    """A new message or notification pushed to a user's event stream"""
+    MESSAGE = 'message'
+    NOTIFICATION = 'notification'
+
+    def __init__(self, entity: Union[Message, Notification]):
+        self.kind = self.MESSAGE if isinstance(entity, Message) else self.NOTIFICATION
+        self.entity = entity
+
+    @property
+    def id(self) -> int:
+        return self.entity.id
+
+    @property
+    def key(self) -> tuple:
+        """Identity of the event across both kinds"""
+        return self.kind, self.entity.id
+
+
+class StreamCursor:
+    """
+    Position in a user's stream: the highest message id and notification id
+    delivered. Sent as the SSE event id ('<message_id>-<notification_id>')
+    and read back from Last-Event-ID to resume after a reconnect.
+
+    Ids are assigned at insert but events are published at commit, so a
+    transaction can publish an id lower than one already delivered. Open
+    connections still deliver it (they skip events by identity, not by
+    cursor), but a resume only replays ids past the cursor: such an event
+    is missed if it is published while the client is disconnected or
+    between two long-polls.
+    """
+
+    def __init__(self, message_id: int = 0, notification_id: int = 0):
+        self.message_id = message_id
+        self.notification_id = notification_id
+
+    @classmethod
+    def decode(cls, value: str) -> 'StreamCursor':
+        try:
+            message_id, notification_id = (int(part) for part in value.split('-'))
+        except (AttributeError, ValueError):
+            raise ValueError(f'Invalid stream cursor: {value!r}')
+        if message_id < 0 or notification_id < 0:
+            raise ValueError(f'Invalid stream cursor: {value!r}')
+        return cls(message_id, notification_id)
+
+    def encode(self) -> str:
+        return f'{self.message_id}-{self.notification_id}'
+
+    def has_seen(self, event: StreamEvent) -> bool:
+        """True if the event was delivered already (its id is not past the cursor)"""
+        if event.kind == StreamEvent.MESSAGE:
+            return event.id <= self.message_id
+        return event.id <= self.notification_id
+
+    def covers(self, other: 'StreamCursor') -> bool:
+        """True if this cursor is at or past other on both ids"""
+        return self.message_id >= other.message_id and self.notification_id >= other.notification_id
+
+    def advance(self, event: StreamEvent):
+        if event.kind == StreamEvent.MESSAGE:
+            self.message_id = max(self.message_id, event.id)
+        else:
+            self.notification_id = max(self.notification_id, event.id)
+
+    def merged(self, other: 'StreamCursor') -> 'StreamCursor':
+        return StreamCursor(max(self.message_id, other.message_id), max(self.notification_id, other.notification_id))
@@ -9,6 +9,8 @@ class SubjectLevel(Enum):
     OTHER = "Other"
 
 class Subject:
+    __slots__ = ('id', 'name', 'level', 'created_at', 'updated_at')
+    
     def __init__(
         self,
         id: Optional[int] = None,
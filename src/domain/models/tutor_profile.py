@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
@@ -10,6 +10,9 @@ class VerificationStatus(Enum):
     REJECTED = "Rejected"
 
 class TutorProfile:
+    __slots__ = ('user_id', 'full_name', 'bio', 'years_experience', 'hourly_rate', 'verification_status',
+                 'rating_avg', 'rating_count', 'rating_histogram', 'created_at', 'updated_at')
+    
     def __init__(
         self,
         user_id: int,
@@ -20,6 +23,7 @@ class TutorProfile:
         verification_status: VerificationStatus = VerificationStatus.UNVERIFIED,
         rating_avg: Decimal = Decimal('0.00'),
         rating_count: int = 0,
+        rating_histogram: Optional[Dict[int, int]] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
     ):
@@ -31,6 +35,8 @@ class TutorProfile:
         self.verification_status = verification_status
         self.rating_avg = rating_avg
         self.rating_count = rating_count
+        # stars (1-5) -> number of reviews
+        self.rating_histogram = rating_histogram or {stars: 0 for stars in range(1, 6)}
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
     
@@ -38,6 +44,7 @@ class TutorProfile:
         """Update average rating when a new review is added"""
         total_points = self.rating_avg * self.rating_count + new_rating
         self.rating_count += 1
+        self.rating_histogram[new_rating] = self.rating_histogram.get(new_rating, 0) + 1
         self.rating_avg = Decimal(str(total_points / self.rating_count))
         self.updated_at = datetime.utcnow()
     
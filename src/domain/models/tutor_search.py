@@ -0,0 +1,89 @@
+from typing import Dict, List, Optional
+from datetime import time
+from decimal import Decimal
+
+from .availability_slot import Weekday
+from .subject import SubjectLevel
+from .tutor_profile import VerificationStatus
+
+
+class TutorSearchQuery:
+    """
+    Combined tutor search: free text over name/bio plus facet filters.
+    Filters left as None/empty are not applied. An availability filter
+    needs a (UTC) weekday; start/end narrow it to tutors available for that whole window.
+    """
+    def __init__(
+        self,
+        text: Optional[str] = None,
+        subject_ids: Optional[List[int]] = None,
+        levels: Optional[List[SubjectLevel]] = None,
+        min_rate: Optional[Decimal] = None,
+        max_rate: Optional[Decimal] = None,
+        min_rating: Optional[float] = None,
+        verification_statuses: Optional[List[VerificationStatus]] = None,
+        weekday: Optional[Weekday] = None,
+        start_time: Optional[time] = None,
+        end_time: Optional[time] = None,
+        limit: int = 20,
+        offset: int = 0
+    ):
+        if (start_time or end_time) and weekday is None:
+            raise ValueError("An availability window needs a weekday")
+        if start_time and end_time and start_time >= end_time:
+            raise ValueError("Start time must be before end time")
+        if min_rate is not None and max_rate is not None and min_rate > max_rate:
+            raise ValueError("min_rate must not exceed max_rate")
+        self.text = text
+        self.subject_ids = subject_ids or []
+        self.levels = levels or []
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.min_rating = min_rating
+        self.verification_statuses = verification_statuses or []
+        self.weekday = weekday
+        self.start_time = start_time
+        self.end_time = end_time
+        self.limit = limit
+        self.offset = offset
+
+
+class TutorSearchHit:
+    def __init__(
+        self,
+        tutor_id: int,
+        full_name: str,
+        hourly_rate: Decimal,
+        verification_status: VerificationStatus,
+        rating_avg: float,
+        rating_count: int,
+        subject_ids: List[int],
+        score: float = 0.0
+    ):
+        self.tutor_id = tutor_id
+        self.full_name = full_name
+        self.hourly_rate = hourly_rate
+        self.verification_status = verification_status
+        self.rating_avg = rating_avg
+        self.rating_count = rating_count
+        self.subject_ids = subject_ids
+        self.score = score
+
+
+class TutorSearchResult:
+    """
+    One page of ranked hits.
+    facets maps facet name -> {value: number of matching tutors}, counted
+    over all matches (not just the page).
+    """
+    def __init__(
+        self,
+        items: List[TutorSearchHit],
+        total: int,
+        facets: Dict[str, Dict[str, int]],
+        next_offset: Optional[int] = None
+    ):
+        self.items = items
+        self.total = total
+        self.facets = facets
+        self.next_offset = next_offset
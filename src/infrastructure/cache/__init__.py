@@ -0,0 +1,15 @@
+from .backends import CacheBackend, LocalCacheBackend, RedisCacheBackend, MISSING
+from .read_through import (
+    ReadThroughCache,
+    build_cache,
+    get_cache_stats,
+    subject_cache,
+    tutor_profile_cache,
+    service_listing_cache
+)
+
+__all__ = [
+    'CacheBackend', 'LocalCacheBackend', 'RedisCacheBackend', 'MISSING',
+    'ReadThroughCache', 'build_cache', 'get_cache_stats',
+    'subject_cache', 'tutor_profile_cache', 'service_listing_cache'
+]
@@ -0,0 +1,132 @@
+import copy
+import logging
+import pickle
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from services.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Returned by CacheBackend.get when the key is absent (None is a cacheable value)
+MISSING = object()
+
+
+class CacheBackend(ABC):
+    """Key/value store behind a ReadThroughCache; keys are strings"""
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """Value stored under key, or MISSING"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float):
+        pass
+
+    @abstractmethod
+    def delete(self, key: str):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """Drop every key of this backend's namespace"""
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Optional[int]]:
+        """Backend-side counters: entries and evictions (None when unknown)"""
+        pass
+
+
+class LocalCacheBackend(CacheBackend):
+    """
+    In-process TTL/LRU store. Reads return shallow copies so callers that
+    modify a domain object do not change the cached one. Each process has
+    its own copy; writes in other processes are seen after the TTL.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 300):
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    def get(self, key: str) -> Any:
+        value = self._cache.get(key, MISSING)
+        if value is MISSING or value is None:
+            return value
+        if isinstance(value, list):
+            return [copy.copy(item) for item in value]
+        return copy.copy(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: float):
+        self._cache.set(key, value, ttl_seconds)
+
+    def delete(self, key: str):
+        self._cache.delete(key)
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Optional[int]]:
+        return {'entries': len(self._cache), 'evictions': self._cache.evictions}
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Shared store in Redis (optional `redis` package), so invalidations made by
+    one process are seen by all. Values are pickled under '<namespace>:<key>'.
+    Redis errors are logged and treated as misses: the cache never fails a read.
+    """
+
+    def __init__(self, client, namespace: str):
+        self.client = client
+        self.prefix = f'cache:{namespace}:'
+
+    def get(self, key: str) -> Any:
+        try:
+            data = self.client.get(self.prefix + key)
+        except Exception as e:
+            logger.warning('Cache read failed for %s: %s', key, e)
+            return MISSING
+        return MISSING if data is None else pickle.loads(data)
+
+    def set(self, key: str, value: Any, ttl_seconds: float):
+        try:
+            self.client.set(self.prefix + key, pickle.dumps(value), ex=max(1, int(ttl_seconds)))
+        except Exception as e:
+            logger.warning('Cache write failed for %s: %s', key, e)
+
+    def delete(self, key: str):
+        try:
+            self.client.delete(self.prefix + key)
+        except Exception as e:
+            logger.warning('Cache delete failed for %s: %s', key, e)
+
+    def clear(self):
+        try:
+            keys = list(self.client.scan_iter(match=self.prefix + '*', count=500))
+            if keys:
+                self.client.delete(*keys)
+        except Exception as e:
+            logger.warning('Cache clear failed for %s: %s', self.prefix, e)
+
+    def stats(self) -> Dict[str, Optional[int]]:
+        # Redis evicts by its own maxmemory policy, server-wide
+        return {'entries': None, 'evictions': None}
+
+
+def build_backend(namespace: str, backend: str = 'local', redis_url: Optional[str] = None,
+                  max_entries: int = 10000, ttl_seconds: float = 300) -> CacheBackend:
+    """
+    Backend named by config. 'redis' falls back to the local store when the
+    redis package or URL is missing, so a single process works unchanged.
+    """
+    if backend == 'redis':
+        try:
+            import redis
+        except ImportError:
+            logger.warning('CACHE_BACKEND=redis but the redis package is not installed; using local cache')
+        else:
+            if redis_url:
+                return RedisCacheBackend(redis.Redis.from_url(redis_url), namespace)
+            logger.warning('CACHE_BACKEND=redis but CACHE_REDIS_URL is not set; using local cache')
+    return LocalCacheBackend(max_entries=max_entries, ttl_seconds=ttl_seconds)
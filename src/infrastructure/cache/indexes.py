@@ -0,0 +1,86 @@
+"""
+Process-wide in-memory indexes, shared by every request.
+
+An index is built from a few tables and rebuilt once older than its TTL.
+Writes to those tables mark it stale as soon as they commit, whichever
+repository made them, and the next reader rebuilds it (bursts of writes
+are coalesced into one rebuild per INDEX_MIN_REBUILD_SECONDS): the tables touched by flushed ORM changes and by
+ORM bulk INSERT/UPDATE/DELETE statements are noted per session and
+checked on commit. Writes committed by other processes show up within
+the TTL.
+"""
+from typing import FrozenSet, List, Set, Tuple
+
+from sqlalchemy import event
+
+from config import get_config
+from infrastructure.databases.mssql import SessionLocal
+from infrastructure.models.availability_slot_model import AvailabilitySlotModel
+from infrastructure.models.tutor_profile_model import TutorProfileModel
+from infrastructure.models.tutor_subject_model import TutorSubjectModel
+from services.index_cache import IndexCache
+
+WRITTEN_TABLES_KEY = 'written_tables'
+
+# (index, names of the tables it is built from)
+_watched: List[Tuple[IndexCache, FrozenSet[str]]] = []
+
+
+def watch_tables(index: IndexCache, *models) -> IndexCache:
+    """Invalidate index whenever a transaction writing to the tables of models commits"""
+    _watched.append((index, frozenset(model.__table__.name for model in models)))
+    return index
+
+
+def _written_tables(session) -> Set[str]:
+    return session.info.setdefault(WRITTEN_TABLES_KEY, set())
+
+
+@event.listens_for(SessionLocal, 'before_flush')
+def _note_flushed_tables(session, flush_context, instances):
+    written = _written_tables(session)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(type(instance), '__table__', None)
+        if table is not None:
+            written.add(table.name)
+
+
+@event.listens_for(SessionLocal, 'do_orm_execute')
+def _note_bulk_write_table(orm_execute_state):
+    # update(Model)/delete(Model) statements bypass the flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            _written_tables(orm_execute_state.session).add(mapper.local_table.name)
+
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _invalidate_written_indexes(session):
+    written = session.info.pop(WRITTEN_TABLES_KEY, None)
+    if not written:
+        return
+    for index, tables in _watched:
+        if tables & written:
+            index.invalidate()
+
+
+@event.listens_for(SessionLocal, 'after_rollback')
+def _forget_written_tables(session):
+    session.info.pop(WRITTEN_TABLES_KEY, None)
+
+
+Config = get_config()
+
+# Tutor search (services/tutor_search_service.py): profiles (incl. rating aggregates), subjects, slots
+tutor_search_index = watch_tables(
+    IndexCache(Config.TUTOR_SEARCH_INDEX_TTL, Config.INDEX_MIN_REBUILD_SECONDS),
+    TutorProfileModel, TutorSubjectModel, AvailabilitySlotModel
+)
+
+# Availability (services/availability_service.py): slots and subjects. Bookings are
+# not watched: they change with every booking and a rebuild reads the whole horizon,
+# so the index picks them up within the TTL and can_book re-checks them in the database
+availability_index = watch_tables(
+    IndexCache(Config.AVAILABILITY_INDEX_TTL, Config.INDEX_MIN_REBUILD_SECONDS),
+    AvailabilitySlotModel, TutorSubjectModel
+)
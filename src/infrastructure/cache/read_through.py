@@ -0,0 +1,83 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from config import get_config
+from infrastructure.cache.backends import CacheBackend, MISSING, build_backend
+
+
+class ReadThroughCache:
+    """
+    Loads a value on a miss and keeps it for ttl_seconds.
+    invalidate() bumps a generation so a load that started before a write
+    does not put the pre-write value back.
+    """
+
+    def __init__(self, name: str, backend: CacheBackend, ttl_seconds: float):
+        self.name = name
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return repr(key)
+
+    def get_or_load(self, key: Hashable, load: Callable[..., Any], *args) -> Any:
+        """Cached value of key, else load(*args) (None results are cached too)"""
+        cache_key = self._key(key)
+        value = self.backend.get(cache_key)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+        generation = self._generation
+        value = load(*args)
+        if generation == self._generation:
+            self.backend.set(cache_key, value, self.ttl_seconds)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one key, or every key of this cache when key is None"""
+        with self._lock:
+            self._generation += 1
+        if key is None:
+            self.backend.clear()
+        else:
+            self.backend.delete(self._key(key))
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {'hits': self.hits, 'misses': self.misses}
+        stats.update(self.backend.stats())
+        return stats
+
+
+_caches: List[ReadThroughCache] = []
+
+def build_cache(name: str, ttl_seconds: float) -> ReadThroughCache:
+    """Create a process-wide cache on the configured backend and register it for stats"""
+    config = get_config()
+    backend = build_backend(
+        name,
+        backend=config.CACHE_BACKEND,
+        redis_url=config.CACHE_REDIS_URL,
+        max_entries=config.CACHE_MAX_ENTRIES,
+        ttl_seconds=ttl_seconds
+    )
+    cache = ReadThroughCache(name, backend, ttl_seconds)
+    _caches.append(cache)
+    return cache
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss/eviction counters of every registered cache"""
+    return {cache.name: cache.stats() for cache in _caches}
+
+
+Config = get_config()
+
+# Reference data caches, shared by every repository instance in the process
+subject_cache = build_cache('subjects', Config.SUBJECT_CACHE_TTL)
+tutor_profile_cache = build_cache('tutor_profiles', Config.TUTOR_PROFILE_CACHE_TTL)
+service_listing_cache = build_cache('service_listings', Config.SERVICE_LISTING_CACHE_TTL)
@@ -0,0 +1,109 @@
+"""
+Check that the lookup paths repositories declare are backed by an index.
+
+Every repository lists the column sequences it filters/orders on in a
+``QUERY_PATHS`` class attribute. A path is supported when it is a leading
+prefix of the primary key, a unique constraint or an index on the model's
+table. Run it as a module to get a report (non-zero exit on problems):
+
+    python -m infrastructure.databases.index_check
+"""
+import importlib
+import pkgutil
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy import PrimaryKeyConstraint, Table, UniqueConstraint
+
+import infrastructure.repositories
+from infrastructure.repositories.base_repository import BaseRepository
+
+
+def _load_repositories(errors: Dict[str, List[str]]) -> List[type]:
+    """Import every repository module and return the BaseRepository subclasses"""
+    for module in pkgutil.iter_modules(infrastructure.repositories.__path__):
+        try:
+            importlib.import_module(f'infrastructure.repositories.{module.name}')
+        except ImportError as e:
+            errors[module.name] = [f'could not be imported: {str(e)}']
+
+    found = []
+    pending = list(BaseRepository.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        found.append(cls)
+        pending.extend(cls.__subclasses__())
+    return sorted(found, key=lambda cls: cls.__name__)
+
+
+def _model_of(repository_cls: type):
+    """
+    Model class passed to BaseRepository[...] by the repository itself;
+    None for subclasses of a repository (e.g. cached ones), checked via their parent
+    """
+    for base in repository_cls.__dict__.get('__orig_bases__', ()):
+        if getattr(base, '__origin__', None) is BaseRepository:
+            return base.__args__[0]
+    return None
+
+
+def index_column_lists(table: Table) -> List[Tuple[str, ...]]:
+    """Column name sequences of the primary key, unique constraints and indexes"""
+    lists = []
+    for constraint in table.constraints:
+        if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint)) and constraint.columns:
+            lists.append(tuple(column.name for column in constraint.columns))
+    for column in table.columns:
+        if column.unique or column.index:
+            lists.append((column.name,))
+    for index in table.indexes:
+        lists.append(tuple(column.name for column in index.columns))
+    return lists
+
+
+def is_supported(path: Sequence[str], indexes: List[Tuple[str, ...]]) -> bool:
+    """A path is supported when it is a leading prefix of some index"""
+    path = tuple(path)
+    return any(index[:len(path)] == path for index in indexes)
+
+
+def check_repositories() -> Dict[str, List[str]]:
+    """Return problems per repository name (empty dict when everything is covered)"""
+    problems = {}
+    for repository_cls in _load_repositories(problems):
+        model = _model_of(repository_cls)
+        if model is None:
+            continue
+
+        paths = repository_cls.__dict__.get('QUERY_PATHS')
+        if paths is None:
+            problems[repository_cls.__name__] = ['no QUERY_PATHS declared']
+            continue
+
+        table = model.__table__
+        indexes = index_column_lists(table)
+        missing = []
+        for path in paths:
+            unknown = [name for name in path if name not in table.columns]
+            if unknown:
+                missing.append(f'{path}: unknown column(s) {", ".join(unknown)} on {table.name}')
+            elif not is_supported(path, indexes):
+                missing.append(f'{path}: no index on {table.name} starts with these columns')
+        if missing:
+            problems[repository_cls.__name__] = missing
+    return problems
+
+
+def main() -> int:
+    problems = check_repositories()
+    if not problems:
+        print('All repository query paths are index-backed')
+        return 0
+    for name, messages in problems.items():
+        for message in messages:
+            print(f'{name}: {message}')
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
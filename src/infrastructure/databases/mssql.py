@@ -1,12 +1,119 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from config import Config
+import threading
+
+from flask import has_app_context
+from flask.globals import app_ctx
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from config import get_config
 from infrastructure.databases.base import Base
+from infrastructure.databases.pool_metrics import InstrumentedQueuePool, pool_metrics
+from infrastructure.databases import query_counter
 
 # Database configuration
+Config = get_config()
 DATABASE_URI = Config.DATABASE_URI
-engine = create_engine(DATABASE_URI)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-session = SessionLocal()
+
+
+def build_engine_options(config) -> dict:
+    """Translate the DB_* settings of a config class into create_engine kwargs"""
+    url = make_url(config.DATABASE_URI)
+    if url.get_backend_name() == 'sqlite':
+        # SQLite uses its own single-file pools; queue pool settings don't apply
+        return {}
+
+    options = {
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': config.DB_POOL_SIZE,
+        'max_overflow': config.DB_MAX_OVERFLOW,
+        'pool_recycle': config.DB_POOL_RECYCLE,
+        'pool_pre_ping': config.DB_POOL_PRE_PING,
+        'pool_timeout': config.DB_POOL_TIMEOUT,
+    }
+    driver = url.get_driver_name()
+    if driver == 'pyodbc':
+        options['fast_executemany'] = config.DB_FAST_EXECUTEMANY
+    elif driver == 'pymssql' and config.DB_STATEMENT_TIMEOUT:
+        options['connect_args'] = {'timeout': config.DB_STATEMENT_TIMEOUT}
+    return options
+
+
+engine = create_engine(DATABASE_URI, **build_engine_options(Config))
+# Per-request query counts and DB time (N+1 detection, Server-Timing, /metrics)
+query_counter.install(engine)
+
+if engine.dialect.driver == 'pyodbc' and Config.DB_STATEMENT_TIMEOUT:
+    @event.listens_for(engine, 'connect')
+    def _set_statement_timeout(dbapi_connection, connection_record):
+        # pyodbc applies the query timeout per connection
+        dbapi_connection.timeout = Config.DB_STATEMENT_TIMEOUT
+# expire_on_commit=False keeps loaded rows usable after commit without a reload
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+
+def _session_scope():
+    """
+    Scope key for the request-scoped session.
+    Inside Flask this is the current app context (one per request),
+    outside of it (scripts, shell) it falls back to the current thread.
+    """
+    if has_app_context():
+        return id(app_ctx._get_current_object())
+    return threading.get_ident()
+
+
+# Request-scoped session registry. The underlying Session (and its pooled
+# connection) is only created on first use inside a scope.
+ScopedSession = scoped_session(SessionLocal, scopefunc=_session_scope)
+
+
+def get_session() -> Session:
+    """Return the session bound to the current request (created lazily)"""
+    return ScopedSession()
+
+
+# session.info flag: finish the request's session with a rollback
+ROLLBACK_KEY = 'rollback_on_teardown'
+
+
+def rollback_on_error_response(response):
+    """
+    after_request hook: roll the request's session back when the response
+    has an error status. Error handlers turn exceptions into responses, so
+    the teardown hook does not see them.
+    """
+    if response.status_code >= 400 and ScopedSession.registry.has():
+        ScopedSession().info[ROLLBACK_KEY] = True
+    return response
+
+
+def remove_session(exception=None):
+    """
+    Finish the session of the current scope: commit when the request
+    succeeded, roll back when it raised or answered with an error status
+    (see rollback_on_error_response), then return the connection to the pool
+    """
+    if not ScopedSession.registry.has():
+        return
+    session = ScopedSession()
+    try:
+        if exception is None and not session.info.pop(ROLLBACK_KEY, False):
+            session.commit()
+        else:
+            session.rollback()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        ScopedSession.remove()
+
+
+def get_pool_stats() -> dict:
+    """Pool checkout / overflow / wait-time counters for the main engine"""
+    return pool_metrics.snapshot(engine.pool)
+
+
 def init_mssql(app):
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    app.after_request(rollback_on_error_response)
+    app.teardown_appcontext(remove_session)
+    Base.metadata.create_all(bind=engine)
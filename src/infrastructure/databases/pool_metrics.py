@@ -0,0 +1,83 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """
+    Process-wide counters for the connection pool.
+    Used to size pool_size / max_overflow from real traffic.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.timeouts = 0
+            self.overflow_checkouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+
+    def record_checkout(self, wait_seconds: float, overflow: int):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += wait_seconds
+            if wait_seconds > self.wait_seconds_max:
+                self.wait_seconds_max = wait_seconds
+            if overflow > 0:
+                self.overflow_checkouts += 1
+
+    def record_checkin(self):
+        with self._lock:
+            self.checkins += 1
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool=None) -> dict:
+        """Return counters (and live pool gauges when a pool is given)"""
+        with self._lock:
+            data = {
+                'checkouts_total': self.checkouts,
+                'checkins_total': self.checkins,
+                'checkout_timeouts_total': self.timeouts,
+                'overflow_checkouts_total': self.overflow_checkouts,
+                'checkout_wait_seconds_total': self.wait_seconds_total,
+                'checkout_wait_seconds_max': self.wait_seconds_max,
+            }
+        if isinstance(pool, QueuePool):
+            data.update({
+                'pool_size': pool.size(),
+                'checked_out': pool.checkedout(),
+                'checked_in': pool.checkedin(),
+                'overflow': pool.overflow(),
+            })
+        return data
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records checkout wait time, overflow usage and timeouts"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.record_timeout()
+            raise
+        pool_metrics.record_checkout(time.perf_counter() - start, self.overflow())
+        return connection
+
+    def _do_return_conn(self, record):
+        pool_metrics.record_checkin()
+        super()._do_return_conn(record)
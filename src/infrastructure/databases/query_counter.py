@@ -0,0 +1,145 @@
+"""
+Per-scope SQL statement counting and timing, to catch N+1 query patterns
+and to see how much of a request is spent in the database.
+
+A scope (one request, or a block in a test or script) counts every
+statement executed on the engine from its thread/context, how often each
+distinct statement text was repeated, the time spent executing them and
+the rows the driver reported (cursor.rowcount: rows written, and rows read
+where the driver knows them at execute time). Lazy loading in a loop
+shows up as the same SELECT repeated once per row:
+
+    with query_budget(max_queries=10, max_repeats=3) as scope:
+        service.get_booking_detail(42)
+    # raises QueryBudgetExceeded on exit when a limit was crossed
+
+The Flask hooks in api.middleware open a scope per request when
+QUERY_BUDGET or METRICS_ENABLED is configured.
+"""
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised when a scope ran more (or more repeated) statements than allowed"""
+    pass
+
+
+class QueryScope:
+    """Statements counted in one scope"""
+
+    def __init__(self, max_queries: Optional[int] = None, max_repeats: Optional[int] = None):
+        self.max_queries = max_queries
+        self.max_repeats = max_repeats
+        self.count = 0
+        self.statements: Counter = Counter()
+        self.seconds = 0.0
+        self.rows = 0
+
+    def record(self, statement: str):
+        self.count += 1
+        self.statements[statement] += 1
+
+    def record_execution(self, seconds: float, rowcount: int):
+        self.seconds += seconds
+        if rowcount > 0:
+            self.rows += rowcount
+
+    def repeated(self) -> List[Tuple[str, int]]:
+        """Statements run more than max_repeats times, most repeated first"""
+        if self.max_repeats is None:
+            return []
+        return [(statement, times) for statement, times in self.statements.most_common()
+                if times > self.max_repeats]
+
+    def problems(self) -> List[str]:
+        """Human-readable budget violations (empty when within budget)"""
+        problems = []
+        if self.max_queries is not None and self.count > self.max_queries:
+            problems.append(f'{self.count} queries (budget {self.max_queries})')
+        for statement, times in self.repeated():
+            # Same statement over and over: a relationship lazy loaded per row
+            problems.append(f'{times}x (likely N+1): {" ".join(statement.split())[:200]}')
+        return problems
+
+    def check(self):
+        """Raise QueryBudgetExceeded listing the violations, if any"""
+        problems = self.problems()
+        if problems:
+            raise QueryBudgetExceeded('Query budget exceeded: ' + '; '.join(problems))
+
+
+_current_scope: ContextVar[Optional[QueryScope]] = ContextVar('query_scope', default=None)
+_installed = set()
+_install_lock = threading.Lock()
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.record(statement)
+        if context is not None:
+            context.query_started = time.perf_counter()
+
+
+def _time_statement(conn, cursor, statement, parameters, context, executemany):
+    scope = _current_scope.get()
+    started = getattr(context, 'query_started', None)
+    if scope is not None and started is not None:
+        scope.record_execution(time.perf_counter() - started, cursor.rowcount)
+
+
+def install(engine: Engine):
+    """Count and time the statements of an engine (idempotent; cheap when no scope is open)"""
+    with _install_lock:
+        if id(engine) in _installed:
+            return
+        event.listen(engine, 'before_cursor_execute', _count_statement)
+        event.listen(engine, 'after_cursor_execute', _time_statement)
+        _installed.add(id(engine))
+
+
+def current_scope() -> Optional[QueryScope]:
+    """The open scope of the current context, if any"""
+    return _current_scope.get()
+
+
+def begin_scope(max_queries: Optional[int] = None, max_repeats: Optional[int] = None):
+    """Open a scope in the current context; returns the token for end_scope"""
+    return _current_scope.set(QueryScope(max_queries, max_repeats))
+
+
+def end_scope(token) -> Optional[QueryScope]:
+    """Close the scope opened with token and return it"""
+    scope = _current_scope.get()
+    _current_scope.reset(token)
+    return scope
+
+
+@contextmanager
+def query_budget(max_queries: Optional[int] = None, max_repeats: Optional[int] = None,
+                 engine: Optional[Engine] = None) -> Iterator[QueryScope]:
+    """
+    Count the statements of a block and fail it when over budget
+
+    Args:
+        max_queries: Most statements allowed in the block (None: no limit)
+        max_repeats: Most runs allowed of one statement text (None: no limit)
+        engine: Engine to count on, the application engine by default
+    """
+    if engine is None:
+        from infrastructure.databases.mssql import engine
+    install(engine)
+    token = begin_scope(max_queries, max_repeats)
+    try:
+        yield _current_scope.get()
+    finally:
+        scope = end_scope(token)
+    scope.check()
@@ -0,0 +1,73 @@
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from infrastructure.databases.mssql import SessionLocal, get_session
+
+UNIT_OF_WORK_KEY = 'unit_of_work_depth'
+PINNED_KEY = 'unit_of_work_pinned'
+
+
+def in_unit_of_work(session: Session) -> bool:
+    """Check whether the session is currently inside a UnitOfWork block"""
+    return session.info.get(UNIT_OF_WORK_KEY, 0) > 0
+
+
+@event.listens_for(SessionLocal, 'loaded_as_persistent')
+def _pin_loaded_instance(session, instance):
+    # The identity map only holds weak references. Repositories hand out
+    # domain objects, not models, so rows loaded inside a unit of work would
+    # be garbage collected and re-selected by the next call (get -> update).
+    if in_unit_of_work(session):
+        session.info.setdefault(PINNED_KEY, []).append(instance)
+
+
+class UnitOfWork:
+    """
+    Transaction spanning several repository calls.
+
+    Repositories working on the same session only flush while a unit of work
+    is open; the outermost block commits once on success and rolls back on
+    error. Nested blocks join the outer transaction.
+
+        with UnitOfWork() as uow:
+            payment = PaymentRepository(uow.session).get_by_id(1)
+            ...
+    """
+
+    def __init__(self, session: Optional[Session] = None, close_on_exit: bool = False):
+        self.session = session if session is not None else get_session()
+        self.close_on_exit = close_on_exit
+        self._outermost = False
+
+    def __enter__(self) -> 'UnitOfWork':
+        depth = self.session.info.get(UNIT_OF_WORK_KEY, 0)
+        self._outermost = depth == 0
+        self.session.info[UNIT_OF_WORK_KEY] = depth + 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.session.info[UNIT_OF_WORK_KEY] -= 1
+        if not self._outermost:
+            return False
+
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.session.rollback()
+        finally:
+            self.session.info.pop(PINNED_KEY, None)
+            if self.close_on_exit:
+                self.session.close()
+        return False
+
+    def commit(self):
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+    def flush(self):
+        self.session.flush()
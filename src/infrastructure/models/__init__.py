@@ -4,9 +4,11 @@ from .booking_model import BookingModel
 from .chat_thread_model import ChatThreadModel
 from .complaint_model import ComplaintModel
 from .credential_model import CredentialModel
+from .idempotency_key_model import IdempotencyKeyModel
 from .message_model import MessageModel
 from .moderation_action_model import ModerationActionModel
 from .notification_model import NotificationModel
+from .notification_counter_model import NotificationCounterModel
 from .payment_model import PaymentModel
 from .payout_model import PayoutModel
 from .review_model import ReviewModel
@@ -24,9 +26,11 @@ __all__ = [
     "ChatThreadModel",
     "ComplaintModel",
     "CredentialModel",
+    "IdempotencyKeyModel",
     "MessageModel",
     "ModerationActionModel",
     "NotificationModel",
+    "NotificationCounterModel",
     "PaymentModel",
     "PayoutModel",
     "ReviewModel",
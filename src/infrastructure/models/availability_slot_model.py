@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Time, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Time, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,9 @@ from infrastructure.databases.base import Base
 
 class AvailabilitySlotModel(Base):
     __tablename__ = 'availability_slots'
+    __table_args__ = (
+        Index('ix_availability_slots_tutor_id_weekday', 'tutor_id', 'weekday'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     tutor_id = Column(Integer, ForeignKey('tutor_profiles.user_id'), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, DECIMAL, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, DECIMAL, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,15 @@ from infrastructure.databases.base import Base
 
 class BookingModel(Base):
     __tablename__ = 'bookings'
+    __table_args__ = (
+        Index('ix_bookings_tutor_id_created_at', 'tutor_id', 'created_at', 'id'),
+        Index('ix_bookings_student_id_created_at', 'student_id', 'created_at', 'id'),
+        Index('ix_bookings_status_created_at', 'status', 'created_at', 'id'),
+        Index('ix_bookings_created_at', 'created_at', 'id'),
+        Index('ix_bookings_tutor_id_start_at', 'tutor_id', 'start_at', 'end_at'),
+        Index('ix_bookings_student_id_start_at', 'student_id', 'start_at'),
+        Index('ix_bookings_start_at', 'start_at', 'end_at'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     student_id = Column(Integer, ForeignKey('student_profiles.user_id'), nullable=False)
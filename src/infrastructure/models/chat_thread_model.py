@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,12 @@ from infrastructure.databases.base import Base
 
 class ChatThreadModel(Base):
     __tablename__ = 'chat_threads'
+    __table_args__ = (
+        Index('ix_chat_threads_student_id_tutor_id', 'student_id', 'tutor_id'),
+        # Inbox of either participant, most recently active first
+        Index('ix_chat_threads_student_id_last_activity_at', 'student_id', 'last_activity_at', 'id'),
+        Index('ix_chat_threads_tutor_id_last_activity_at', 'tutor_id', 'last_activity_at', 'id'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     student_id = Column(Integer, ForeignKey('student_profiles.user_id'), nullable=False)
@@ -13,6 +19,17 @@ class ChatThreadModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    # Summary projection, kept current by MessageRepository in the message's transaction
+    last_message_id = Column(Integer, nullable=True)
+    last_message_at = Column(DateTime, nullable=True)
+    last_sender_id = Column(Integer, nullable=True)
+    last_message_snippet = Column(String(200), nullable=True)
+    last_activity_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # last message, else creation
+    student_unread_count = Column(Integer, default=0, nullable=False)
+    tutor_unread_count = Column(Integer, default=0, nullable=False)
+    student_last_read_id = Column(Integer, nullable=True)  # last message id the student has seen
+    tutor_last_read_id = Column(Integer, nullable=True)
+    
     # Relationships
     student = relationship("StudentProfileModel", back_populates="chat_threads")
     tutor = relationship("TutorProfileModel", back_populates="chat_threads")
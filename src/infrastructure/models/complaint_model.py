@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,12 @@ from infrastructure.databases.base import Base
 
 class ComplaintModel(Base):
     __tablename__ = 'complaints'
+    __table_args__ = (
+        Index('ix_complaints_raised_by_user', 'raised_by_user'),
+        Index('ix_complaints_against_user', 'against_user'),
+        Index('ix_complaints_status', 'status'),
+        Index('ix_complaints_booking_id', 'booking_id'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     raised_by_user = Column(Integer, ForeignKey('users.id'), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,10 @@ from infrastructure.databases.base import Base
 
 class CredentialModel(Base):
     __tablename__ = 'credentials'
+    __table_args__ = (
+        Index('ix_credentials_tutor_id_verified', 'tutor_id', 'verified'),
+        Index('ix_credentials_verified', 'verified'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     tutor_id = Column(Integer, ForeignKey('tutor_profiles.user_id'), nullable=False)
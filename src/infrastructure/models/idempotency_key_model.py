@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
+from datetime import datetime
+
+from infrastructure.databases.base import Base
+
+class IdempotencyKeyModel(Base):
+    __tablename__ = 'idempotency_keys'
+    __table_args__ = (
+        Index('ux_idempotency_keys_key', 'key', unique=True),
+        Index('ix_idempotency_keys_expires_at', 'expires_at'),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    key = Column(String(400), nullable=False)             # '<METHOD> <path> <Idempotency-Key header>'
+    request_hash = Column(String(64), nullable=False)     # sha256 of the request body
+    status_code = Column(Integer, nullable=True)          # NULL while the first request is in flight
+    content_type = Column(String(100), nullable=True)
+    response_body = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    
+    def __repr__(self):
+        return f"<IdempotencyKeyModel(id={self.id}, key='{self.key}', status_code={self.status_code})>"
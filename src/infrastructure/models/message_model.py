@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,11 @@ from infrastructure.databases.base import Base
 
 class MessageModel(Base):
     __tablename__ = 'messages'
+    __table_args__ = (
+        Index('ix_messages_thread_id_created_at', 'thread_id', 'created_at'),
+        Index('ix_messages_thread_id_id', 'thread_id', 'id'),
+        Index('ix_messages_sender_id', 'sender_id'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     thread_id = Column(Integer, ForeignKey('chat_threads.id'), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,10 @@ from infrastructure.databases.base import Base
 
 class ModerationActionModel(Base):
     __tablename__ = 'moderation_actions'
+    __table_args__ = (
+        Index('ix_moderation_actions_complaint_id_created_at', 'complaint_id', 'created_at'),
+        Index('ix_moderation_actions_moderator_id_created_at', 'moderator_id', 'created_at'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     complaint_id = Column(Integer, ForeignKey('complaints.id'), nullable=False)
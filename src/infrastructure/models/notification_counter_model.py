@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from datetime import datetime
+
+from infrastructure.databases.base import Base
+
+class NotificationCounterModel(Base):
+    """Denormalized per-user unread notification count (sent and not read)"""
+    __tablename__ = 'notification_counters'
+    
+    user_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
+    unread_count = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<NotificationCounterModel(user_id={self.user_id}, unread_count={self.unread_count})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,17 @@ from infrastructure.databases.base import Base
 
 class NotificationModel(Base):
     __tablename__ = 'notifications'
+    __table_args__ = (
+        Index('ix_notifications_user_id_read_at_created_at', 'user_id', 'read_at', 'created_at'),
+        Index('ix_notifications_user_id_created_at', 'user_id', 'created_at', 'id', mssql_include=['updated_at']),
+        Index('ix_notifications_type_created_at', 'type', 'created_at', 'id'),
+        Index('ix_notifications_channel_created_at', 'channel', 'created_at', 'id'),
+        # Dispatch queue: only notifications still waiting to be delivered
+        Index('ix_notifications_outbox', 'channel', 'next_attempt_at', 'id',
+              mssql_include=['created_at'],
+              mssql_where=text('sent_at IS NULL AND failed_at IS NULL'),
+              sqlite_where=text('sent_at IS NULL AND failed_at IS NULL')),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
@@ -18,6 +29,12 @@ class NotificationModel(Base):
     read_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Delivery bookkeeping (see services/notification_dispatch_service.py)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # due time, or lease end while claimed
+    claim_token = Column(String(32), nullable=True)   # dispatcher run that claimed (and delivered) the row
+    last_error = Column(String(500), nullable=True)
+    failed_at = Column(DateTime, nullable=True)       # delivery given up after the last attempt
     
     # Relationships
     user = relationship("UserModel", back_populates="notifications")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, DECIMAL, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, DECIMAL, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,12 @@ from infrastructure.databases.base import Base
 
 class PaymentModel(Base):
     __tablename__ = 'payments'
+    __table_args__ = (
+        Index('ix_payments_booking_id', 'booking_id'),
+        Index('ix_payments_provider_txn_id', 'provider_txn_id'),
+        Index('ix_payments_status_created_at', 'status', 'created_at', 'id'),
+        Index('ix_payments_created_at', 'created_at', 'id'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     booking_id = Column(Integer, ForeignKey('bookings.id'), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, DECIMAL, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, DECIMAL, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,18 @@ from infrastructure.databases.base import Base
 
 class PayoutModel(Base):
     __tablename__ = 'payouts'
+    __table_args__ = (
+        Index('ix_payouts_tutor_id_status', 'tutor_id', 'status', mssql_include=['amount']),
+        Index('ix_payouts_tutor_id_created_at', 'tutor_id', 'created_at', 'id', mssql_include=['updated_at']),
+        Index('ix_payouts_status_created_at', 'status', 'created_at', 'id'),
+        Index('ix_payouts_created_at', 'created_at', 'id'),
+        Index('ix_payouts_booking_id_created_at', 'booking_id', 'created_at', 'id'),
+        Index('ix_payouts_batch_id_status', 'batch_id', 'status', 'id'),
+        # Unique among keyed rows only; payouts created one by one carry no key
+        Index('ux_payouts_idempotency_key', 'idempotency_key', unique=True,
+              mssql_where=text('idempotency_key IS NOT NULL'),
+              sqlite_where=text('idempotency_key IS NOT NULL')),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     tutor_id = Column(Integer, ForeignKey('tutor_profiles.user_id'), nullable=False)
@@ -13,6 +25,8 @@ class PayoutModel(Base):
     amount = Column(DECIMAL(10, 2), nullable=False)
     status = Column(Enum('Pending', 'Processing', 'Paid', 'Failed', name='payout_status'),
                     default='Pending', nullable=False)
+    batch_id = Column(String(64), nullable=True)          # payout run that created the row
+    idempotency_key = Column(String(64), nullable=True)   # e.g. 'booking:42', makes batch reruns safe
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,11 @@ from infrastructure.databases.base import Base
 
 class ReviewModel(Base):
     __tablename__ = 'reviews'
+    __table_args__ = (
+        Index('ix_reviews_tutor_id_created_at', 'tutor_id', 'created_at', 'id', mssql_include=['rating']),
+        Index('ix_reviews_student_id_created_at', 'student_id', 'created_at', 'id'),
+        Index('ix_reviews_booking_id', 'booking_id'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     booking_id = Column(Integer, ForeignKey('bookings.id'), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, DECIMAL, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, DECIMAL, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,10 @@ from infrastructure.databases.base import Base
 
 class ServiceListingModel(Base):
     __tablename__ = 'service_listings'
+    __table_args__ = (
+        Index('ix_service_listings_tutor_id_active', 'tutor_id', 'active'),
+        Index('ix_service_listings_active', 'active'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     tutor_id = Column(Integer, ForeignKey('tutor_profiles.user_id'), nullable=False)
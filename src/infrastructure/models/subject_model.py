@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,9 @@ from infrastructure.databases.base import Base
 
 class SubjectModel(Base):
     __tablename__ = 'subjects'
+    __table_args__ = (
+        Index('ix_subjects_level', 'level'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False, unique=True)
@@ -1,9 +1,12 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from infrastructure.databases.base import Base
 
 class TodoModel(Base):
     __tablename__ = 'todos'
-    __table_args__ = {'extend_existing': True}  # Thêm dòng này
+    __table_args__ = (
+        Index('ix_todos_status', 'status'),
+        {'extend_existing': True},  # Thêm dòng này
+    )
 
     id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Enum, DECIMAL, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, Enum, DECIMAL, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,10 @@ from infrastructure.databases.base import Base
 
 class TutorProfileModel(Base):
     __tablename__ = 'tutor_profiles'
+    __table_args__ = (
+        Index('ix_tutor_profiles_verification_status', 'verification_status'),
+        Index('ix_tutor_profiles_rating_avg', 'rating_avg', 'rating_count'),
+    )
     
     user_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
     full_name = Column(String(255), nullable=False)
@@ -17,6 +21,12 @@ class TutorProfileModel(Base):
                                 default='Unverified', nullable=False)
     rating_avg = Column(DECIMAL(3, 2), default=0.00, nullable=False)
     rating_count = Column(Integer, default=0, nullable=False)
+    # Review histogram, maintained together with rating_avg/rating_count by ReviewRepository
+    rating_1_count = Column(Integer, default=0, nullable=False)
+    rating_2_count = Column(Integer, default=0, nullable=False)
+    rating_3_count = Column(Integer, default=0, nullable=False)
+    rating_4_count = Column(Integer, default=0, nullable=False)
+    rating_5_count = Column(Integer, default=0, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,9 @@ from infrastructure.databases.base import Base
 
 class TutorSubjectModel(Base):
     __tablename__ = 'tutor_subjects'
+    __table_args__ = (
+        Index('ix_tutor_subjects_subject_id', 'subject_id'),
+    )
     
     tutor_id = Column(Integer, ForeignKey('tutor_profiles.user_id'), primary_key=True)
     subject_id = Column(Integer, ForeignKey('subjects.id'), primary_key=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,10 @@ from infrastructure.databases.base import Base
 
 class UserModel(Base):
     __tablename__ = 'users'
+    __table_args__ = (
+        Index('ix_users_role', 'role'),
+        Index('ix_users_status', 'status'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     email = Column(String(255), nullable=False, unique=True)
@@ -0,0 +1,3 @@
+from .senders import InAppNotificationSender, LogNotificationSender, build_senders
+
+__all__ = ['InAppNotificationSender', 'LogNotificationSender', 'build_senders']
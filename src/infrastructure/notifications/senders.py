@@ -0,0 +1,39 @@
+import logging
+from typing import Dict, List
+
+from domain.models.interfaces.inotification_sender import INotificationSender
+from domain.models.notification import Notification, NotificationChannel
+
+logger = logging.getLogger(__name__)
+
+
+class InAppNotificationSender(INotificationSender):
+    """In-app notifications are delivered by being stored; sending only marks them sent"""
+
+    channel = NotificationChannel.IN_APP
+
+    def send_batch(self, notifications: List[Notification]) -> Dict[int, str]:
+        return {}
+
+
+class LogNotificationSender(INotificationSender):
+    """
+    Stand-in for a channel without a provider yet: logs each notification
+    and reports it delivered. Replace per channel in build_senders.
+    """
+
+    def __init__(self, channel: NotificationChannel):
+        self.channel = channel
+
+    def send_batch(self, notifications: List[Notification]) -> Dict[int, str]:
+        for notification in notifications:
+            logger.info('%s notification %s to user %s: %s', self.channel.value,
+                        notification.id, notification.user_id, notification.payload)
+        return {}
+
+
+def build_senders() -> Dict[NotificationChannel, INotificationSender]:
+    """Sender of every channel"""
+    senders = {channel: LogNotificationSender(channel) for channel in NotificationChannel}
+    senders[NotificationChannel.IN_APP] = InAppNotificationSender()
+    return senders
@@ -0,0 +1,7 @@
+from .backends import PubSubBackend, LocalPubSubBackend, RedisPubSubBackend, build_backend
+from .broker import EventBroker, Subscription, event_broker
+
+__all__ = [
+    'PubSubBackend', 'LocalPubSubBackend', 'RedisPubSubBackend', 'build_backend',
+    'EventBroker', 'Subscription', 'event_broker'
+]
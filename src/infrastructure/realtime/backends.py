@@ -0,0 +1,97 @@
+import logging
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
+
+from domain.models.stream_event import StreamEvent
+
+logger = logging.getLogger(__name__)
+
+Deliver = Callable[[List[int], StreamEvent], None]
+
+
+class PubSubBackend(ABC):
+    """Carries published stream events to the EventBroker of every process"""
+
+    @abstractmethod
+    def start(self, deliver: Deliver, on_gap: Callable[[], None]):
+        """
+        Begin passing received events to deliver(user_ids, event). on_gap is
+        called whenever events may have been missed (e.g. a reconnect).
+        """
+        pass
+
+    @abstractmethod
+    def publish(self, user_ids: List[int], event: StreamEvent):
+        pass
+
+
+class LocalPubSubBackend(PubSubBackend):
+    """Delivers in the publishing process only: enough for a single worker process"""
+
+    def __init__(self):
+        self._deliver: Optional[Deliver] = None
+
+    def start(self, deliver: Deliver, on_gap: Callable[[], None]):
+        self._deliver = deliver
+
+    def publish(self, user_ids: List[int], event: StreamEvent):
+        if self._deliver is not None:
+            self._deliver(user_ids, event)
+
+
+class RedisPubSubBackend(PubSubBackend):
+    """
+    Fan-out through one Redis pub/sub channel (optional `redis` package), so
+    an event published by any process reaches subscribers in all of them.
+    Events are pickled. A listener thread per process resubscribes after
+    connection errors and reports the gap; publish errors are logged.
+    """
+
+    def __init__(self, client, channel: str = 'stream:events'):
+        self.client = client
+        self.channel = channel
+
+    def start(self, deliver: Deliver, on_gap: Callable[[], None]):
+        threading.Thread(target=self._listen, args=(deliver, on_gap), name='stream-pubsub', daemon=True).start()
+
+    def _listen(self, deliver: Deliver, on_gap: Callable[[], None]):
+        while True:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                # Whatever was published before this point was not seen
+                on_gap()
+                for message in pubsub.listen():
+                    if message.get('type') == 'message':
+                        user_ids, event = pickle.loads(message['data'])
+                        deliver(user_ids, event)
+            except Exception as e:
+                logger.warning('Stream pub/sub connection lost: %s', e)
+                on_gap()
+                time.sleep(1)
+
+    def publish(self, user_ids: List[int], event: StreamEvent):
+        try:
+            self.client.publish(self.channel, pickle.dumps((user_ids, event)))
+        except Exception as e:
+            logger.warning('Stream publish of %s %s failed: %s', event.kind, event.id, e)
+
+
+def build_backend(backend: str = 'local', redis_url: Optional[str] = None) -> PubSubBackend:
+    """
+    Backend named by config. 'redis' falls back to in-process delivery when
+    the redis package or URL is missing, so a single process works unchanged.
+    """
+    if backend == 'redis':
+        try:
+            import redis
+        except ImportError:
+            logger.warning('STREAM_BACKEND=redis but the redis package is not installed; using local pub/sub')
+        else:
+            if redis_url:
+                return RedisPubSubBackend(redis.Redis.from_url(redis_url))
+            logger.warning('STREAM_BACKEND=redis but STREAM_REDIS_URL is not set; using local pub/sub')
+    return LocalPubSubBackend()
@@ -0,0 +1,186 @@
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Optional, Set
+
+from config import get_config
+from domain.models.interfaces.ievent_broker import IEventBroker, ISubscription
+from domain.models.stream_event import StreamEvent, StreamCursor
+from infrastructure.realtime.backends import PubSubBackend, build_backend
+
+
+class Subscription(ISubscription):
+    """Queue of events for one connected client; bounded so a stalled client cannot grow it"""
+
+    def __init__(self, broker: 'EventBroker', user_id: int, max_queue: int):
+        self.broker = broker
+        self.user_id = user_id
+        self.max_queue = max_queue
+        self.overflowed = False
+        self._events: deque = deque()
+        self._condition = threading.Condition()
+
+    def push(self, event: StreamEvent):
+        with self._condition:
+            if len(self._events) >= self.max_queue:
+                self.overflowed = True
+            else:
+                self._events.append(event)
+            self._condition.notify()
+
+    def mark_overflowed(self):
+        with self._condition:
+            self.overflowed = True
+            self._condition.notify()
+
+    def wait(self, timeout: float) -> List[StreamEvent]:
+        with self._condition:
+            if not self._events and not self.overflowed:
+                self._condition.wait(timeout)
+            events = list(self._events)
+            self._events.clear()
+            return events
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class _Buffer:
+    """Recent events of one user; floor is the cursor below which events may be missing"""
+
+    def __init__(self, size: int, floor: StreamCursor):
+        self.events: deque = deque(maxlen=size)
+        self.floor = floor
+
+    def append(self, event: StreamEvent):
+        if len(self.events) == self.events.maxlen:
+            self.floor.advance(self.events[0])
+        self.events.append(event)
+
+    def ceiling(self) -> StreamCursor:
+        cursor = StreamCursor(self.floor.message_id, self.floor.notification_id)
+        for event in self.events:
+            cursor.advance(event)
+        return cursor
+
+
+class EventBroker(IEventBroker):
+    """
+    In-process fan-out of stream events to subscribed clients, fed by a
+    pub/sub backend so events published in any process arrive here.
+
+    Besides live delivery it keeps the last buffer_size events of up to
+    max_users users. Once the watermark (highest ids committed before this
+    broker saw every event) is known, a reconnect or long-poll whose cursor
+    is past the buffer's floor is answered from memory: idle clients cost
+    no database reads. Anything older falls back to the database.
+    """
+
+    def __init__(self, backend: PubSubBackend, buffer_size: int = 100, max_users: int = 10000,
+                 queue_size: int = 1000):
+        self.backend = backend
+        self.buffer_size = buffer_size
+        self.max_users = max_users
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._buffers: 'OrderedDict[int, _Buffer]' = OrderedDict()
+        self._watermark: Optional[StreamCursor] = None
+        self._latest = StreamCursor()
+        self._evicted_floor = StreamCursor()
+        self._lock = threading.Lock()
+        backend.start(self._deliver, self.reset)
+
+    def publish(self, user_ids: Iterable[int], event: StreamEvent):
+        self.backend.publish(sorted(set(user_ids)), event)
+
+    def subscribe(self, user_id: int) -> Subscription:
+        subscription = Subscription(self, user_id, self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.user_id]
+
+    def _deliver(self, user_ids: List[int], event: StreamEvent):
+        """Called by the backend for every event published in any process"""
+        with self._lock:
+            self._latest.advance(event)
+            targets = []
+            for user_id in user_ids:
+                self._buffer(user_id).append(event)
+                targets.extend(self._subscribers.get(user_id, ()))
+        for subscription in targets:
+            subscription.push(event)
+
+    def _buffer(self, user_id: int) -> _Buffer:
+        buffer = self._buffers.get(user_id)
+        if buffer is not None:
+            self._buffers.move_to_end(user_id)
+            return buffer
+        if len(self._buffers) >= self.max_users:
+            _, evicted = self._buffers.popitem(last=False)
+            self._evicted_floor = self._evicted_floor.merged(evicted.ceiling())
+        # Events of this user evicted earlier are below the eviction floor
+        buffer = self._buffers[user_id] = _Buffer(
+            self.buffer_size, StreamCursor(self._evicted_floor.message_id, self._evicted_floor.notification_id)
+        )
+        return buffer
+
+    def recent(self, user_id: int, cursor: StreamCursor) -> Optional[List[StreamEvent]]:
+        with self._lock:
+            if self._watermark is None:
+                return None
+            buffer = self._buffers.get(user_id)
+            floor = (buffer.floor if buffer else self._evicted_floor).merged(self._watermark)
+            if not cursor.covers(floor):
+                return None
+            return [event for event in buffer.events if not cursor.has_seen(event)] if buffer else []
+
+    def latest_cursor(self) -> Optional[StreamCursor]:
+        """Highest ids known to this broker (None until the watermark is set)"""
+        with self._lock:
+            return None if self._watermark is None else self._latest.merged(self._watermark)
+
+    def needs_watermark(self) -> bool:
+        return self._watermark is None
+
+    def set_watermark(self, cursor: StreamCursor):
+        with self._lock:
+            if self._watermark is None:
+                self._watermark = cursor
+
+    def reset(self):
+        """Forget everything after a possible gap in delivery; live clients are told to resume"""
+        with self._lock:
+            self._buffers.clear()
+            self._watermark = None
+            self._evicted_floor = StreamCursor()
+            targets = [subscription for subscribers in self._subscribers.values() for subscription in subscribers]
+        for subscription in targets:
+            subscription.mark_overflowed()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'subscribers': sum(len(subscribers) for subscribers in self._subscribers.values()),
+                'buffered_users': len(self._buffers),
+            }
+
+
+def _build_broker() -> EventBroker:
+    config = get_config()
+    return EventBroker(
+        build_backend(config.STREAM_BACKEND, config.STREAM_REDIS_URL),
+        buffer_size=config.STREAM_BUFFER_SIZE,
+        max_users=config.STREAM_MAX_BUFFERED_USERS,
+        queue_size=config.STREAM_QUEUE_SIZE
+    )
+
+
+# One broker per process, shared by all requests
+event_broker = _build_broker()
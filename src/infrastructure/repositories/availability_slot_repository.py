@@ -1,15 +1,24 @@
-from typing import List, Optional
+from datetime import time
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from domain.models.interfaces.iavailability_slot_repository import IAvailabilitySlotRepository
 from domain.models.availability_slot import AvailabilitySlot, Weekday
 from infrastructure.models.availability_slot_model import AvailabilitySlotModel
 from infrastructure.repositories.base_repository import BaseRepository
+from infrastructure.repositories.mapping import enum_lookup
+
+WEEKDAY = enum_lookup(Weekday)
 
 class AvailabilitySlotRepository(BaseRepository[AvailabilitySlotModel], IAvailabilitySlotRepository):
     """
     Availability Slot Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('tutor_id', 'weekday'),              # get_by_tutor_id, get_by_tutor_and_weekday
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(AvailabilitySlotModel, session)
     
@@ -21,7 +30,7 @@ class AvailabilitySlotRepository(BaseRepository[AvailabilitySlotModel], IAvailab
         return AvailabilitySlot(
             id=model.id,
             tutor_id=model.tutor_id,
-            weekday=Weekday(model.weekday.value) if hasattr(model.weekday, 'value') else Weekday(model.weekday),
+            weekday=WEEKDAY(model.weekday),
             start_time=model.start_time,
             end_time=model.end_time,
             timezone=model.timezone,
@@ -61,7 +70,7 @@ class AvailabilitySlotRepository(BaseRepository[AvailabilitySlotModel], IAvailab
         except Exception as e:
             raise ValueError(f'Error getting availability slots by tutor_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_tutor_and_weekday(self, tutor_id: int, weekday: Weekday) -> List[AvailabilitySlot]:
         """Get availability slots for a tutor on a specific weekday"""
@@ -73,12 +82,12 @@ class AvailabilitySlotRepository(BaseRepository[AvailabilitySlotModel], IAvailab
         except Exception as e:
             raise ValueError(f'Error getting availability slots by tutor and weekday: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def update(self, availability_slot: AvailabilitySlot) -> AvailabilitySlot:
         """Update availability slot"""
         try:
-            model = self.session.query(AvailabilitySlotModel).filter_by(id=availability_slot.id).first()
+            model = self.session.get(AvailabilitySlotModel, availability_slot.id)
             if not model:
                 raise ValueError(f'Availability slot with id {availability_slot.id} not found')
             
@@ -88,30 +97,34 @@ class AvailabilitySlotRepository(BaseRepository[AvailabilitySlotModel], IAvailab
             model.timezone = availability_slot.timezone
             model.updated_at = availability_slot.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating availability slot: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, slot_id: int) -> bool:
         """Delete availability slot"""
         return super().delete(slot_id)
     
     def delete_by_tutor_id(self, tutor_id: int) -> bool:
-        """Delete all availability slots for a tutor"""
+        """Delete all availability slots for a tutor (one DELETE statement)"""
+        self.delete_where(AvailabilitySlotModel.tutor_id == tutor_id)
+        return True
+    
+    def get_window_rows(self) -> List[Tuple[int, str, time, time, str]]:
+        """(tutor_id, weekday, start_time, end_time, timezone) for every slot, without domain mapping"""
         try:
-            models = self.session.query(AvailabilitySlotModel).filter_by(tutor_id=tutor_id).all()
-            for model in models:
-                self.session.delete(model)
-            
-            self.session.commit()
-            return True
+            return self.session.query(
+                AvailabilitySlotModel.tutor_id,
+                AvailabilitySlotModel.weekday,
+                AvailabilitySlotModel.start_time,
+                AvailabilitySlotModel.end_time,
+                AvailabilitySlotModel.timezone
+            ).all()
         except Exception as e:
-            self.session.rollback()
-            raise ValueError(f'Error deleting availability slots: {str(e)}')
+            raise ValueError(f'Error getting availability windows: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
@@ -1,11 +1,35 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List, Optional, Type
-from sqlalchemy.orm import Session
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Type, TypeVar, Generic
+from sqlalchemy import and_, delete, func, inspect, insert, or_, update
+from sqlalchemy.orm import Query, Session
 from infrastructure.databases.mssql import SessionLocal
 from infrastructure.databases.base import Base
+from infrastructure.databases.unit_of_work import UnitOfWork, in_unit_of_work
+from infrastructure.repositories.pagination import decode_cursor
+from infrastructure.repositories.eager_loading import IncludeSpec, load_options
+from infrastructure.repositories.mapping import RowMapper
 
 T = TypeVar('T', bound=Base)
 
+# Rows (or ids) written per statement/commit by the bulk primitives
+BULK_CHUNK_SIZE = 1000
+# SQL Server accepts at most 2100 bound parameters per statement (IN lists, VALUES)
+MAX_STATEMENT_PARAMS = 2000
+# and at most 1000 rows in one INSERT ... VALUES
+MAX_VALUES_ROWS = 1000
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    """Yield lists of up to `size` items without materializing the input"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
 
 class BaseRepository(Generic[T], ABC):
     """
@@ -25,72 +49,141 @@ class BaseRepository(Generic[T], ABC):
             self.session = SessionLocal()
             self._owns_session = True   # Own the session, should close it
 
+    def transaction(self) -> UnitOfWork:
+        """
+        Open a unit of work on this repository's session.
+        Calls made inside the block share one transaction and commit once.
+        """
+        return UnitOfWork(self.session, close_on_exit=self._owns_session)
+
+    def _commit(self):
+        """Commit, or only flush when a unit of work owns the transaction"""
+        if in_unit_of_work(self.session):
+            self.session.flush()
+        else:
+            self.session.commit()
+
+    def _rollback(self):
+        """Roll back, unless a unit of work will do it on exit"""
+        if not in_unit_of_work(self.session):
+            self.session.rollback()
+
+    def _release(self):
+        """Close the session only if this repository created it"""
+        if self._owns_session and not in_unit_of_work(self.session):
+            self.session.close()
+
+    def _query(self, include: Optional[IncludeSpec] = None) -> Query:
+        """Query on the model with the relationships of the include spec eager loaded"""
+        return self.session.query(self.model_class).options(*load_options(self.model_class, include))
+
+    def _keyset(self, query: Query, limit: Optional[int] = None, after: Optional[str] = None,
+                order_col=None) -> Query:
+        """
+        Apply (created_at, id) keyset pagination, newest first.
+        `after` is a cursor from pagination.encode_cursor; limit=None keeps the query unbounded.
+        order_col replaces created_at as the sort column (it must be NOT NULL).
+        """
+        created_col = self.model_class.created_at if order_col is None else order_col
+        key_col = inspect(self.model_class).primary_key[0]
+        query = query.order_by(created_col.desc(), key_col.desc())
+        if after:
+            created_at, last_key = decode_cursor(after)
+            query = query.filter(or_(
+                created_col < created_at,
+                and_(created_col == created_at, key_col < last_key)
+            ))
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    def _created_between(self, created_from: Optional[datetime] = None,
+                         created_to: Optional[datetime] = None) -> list:
+        """Criteria for created_at in [created_from, created_to); open ends are left out"""
+        criteria = []
+        if created_from is not None:
+            criteria.append(self.model_class.created_at >= created_from)
+        if created_to is not None:
+            criteria.append(self.model_class.created_at < created_to)
+        return criteria
+
+    def _stream_rows(self, mapper: RowMapper, *criteria,
+                     chunk_size: int = BULK_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Rows matching criteria as mapper dicts, oldest (created_at, id) first.
+        One query whose result is fetched chunk_size rows at a time (server-side
+        cursor where the driver has one), so memory does not grow with the result.
+        The session must stay open until the iterator is exhausted or closed.
+        """
+        key_col = inspect(self.model_class).primary_key[0]
+        try:
+            query = self.session.query(*mapper.columns).filter(*criteria).order_by(
+                self.model_class.created_at, key_col
+            ).yield_per(chunk_size)
+            for row in query:
+                yield mapper(row)
+        except Exception as e:
+            raise ValueError(f'Error streaming {self.model_class.__name__} rows: {str(e)}')
+        finally:
+            self._release()
+
     def add(self, entity: T) -> T:
         """Add a new entity to the database"""
         try:
             self.session.add(entity)
-            self.session.commit()
-            self.session.refresh(entity)
+            self._commit()
             return entity
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error adding {self.model_class.__name__}: {str(e)}')
         finally:
-            if self._owns_session:
-                self.session.close()
+            self._release()
 
-    def get_by_id(self, id: int) -> Optional[T]:
-        """Get entity by ID"""
+    def get_by_id(self, id: int, include: Optional[IncludeSpec] = None) -> Optional[T]:
+        """Get entity by ID (with the relationships of the include spec loaded)"""
         try:
-            return self.session.query(self.model_class).filter(
-                self.model_class.id == id
-            ).first()
+            return self.session.get(self.model_class, id, options=load_options(self.model_class, include))
         except Exception as e:
             raise ValueError(f'Error getting {self.model_class.__name__} by ID: {str(e)}')
         finally:
-            if self._owns_session:
-                self.session.close()
+            self._release()
 
-    def get_all(self) -> List[T]:
-        """Get all entities"""
+    def get_all(self, limit: Optional[int] = None, after: Optional[str] = None,
+                include: Optional[IncludeSpec] = None) -> List[T]:
+        """Get all entities (one keyset page when limit is given)"""
         try:
-            return self.session.query(self.model_class).all()
+            return self._keyset(self._query(include), limit, after).all()
         except Exception as e:
             raise ValueError(f'Error getting all {self.model_class.__name__}: {str(e)}')
         finally:
-            if self._owns_session:
-                self.session.close()
+            self._release()
 
     def update(self, entity: T) -> T:
         """Update an existing entity"""
         try:
             self.session.merge(entity)
-            self.session.commit()
+            self._commit()
             return entity
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating {self.model_class.__name__}: {str(e)}')
         finally:
-            if self._owns_session:
-                self.session.close()
+            self._release()
 
     def delete(self, id: int) -> bool:
         """Delete an entity by ID"""
         try:
-            entity = self.session.query(self.model_class).filter(
-                self.model_class.id == id
-            ).first()
+            entity = self.session.get(self.model_class, id)
             if entity:
                 self.session.delete(entity)
-                self.session.commit()
+                self._commit()
                 return True
             return False
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error deleting {self.model_class.__name__}: {str(e)}')
         finally:
-            if self._owns_session:
-                self.session.close()
+            self._release()
 
     def exists(self, id: int) -> bool:
         """Check if entity exists by ID"""
@@ -101,8 +194,7 @@ class BaseRepository(Generic[T], ABC):
         except Exception as e:
             raise ValueError(f'Error checking {self.model_class.__name__} existence: {str(e)}')
         finally:
-            if self._owns_session:
-                self.session.close()
+            self._release()
 
     def count(self) -> int:
         """Count total entities"""
@@ -111,13 +203,12 @@ class BaseRepository(Generic[T], ABC):
         except Exception as e:
             raise ValueError(f'Error counting {self.model_class.__name__}: {str(e)}')
         finally:
-            if self._owns_session:
-                self.session.close()
+            self._release()
 
-    def find_by(self, **kwargs) -> List[T]:
+    def find_by(self, include: Optional[IncludeSpec] = None, **kwargs) -> List[T]:
         """Find entities by arbitrary criteria"""
         try:
-            query = self.session.query(self.model_class)
+            query = self._query(include)
             for key, value in kwargs.items():
                 if hasattr(self.model_class, key):
                     query = query.filter(getattr(self.model_class, key) == value)
@@ -125,13 +216,12 @@ class BaseRepository(Generic[T], ABC):
         except Exception as e:
             raise ValueError(f'Error finding {self.model_class.__name__}: {str(e)}')
         finally:
-            if self._owns_session:
-                self.session.close()
+            self._release()
 
-    def find_one_by(self, **kwargs) -> Optional[T]:
+    def find_one_by(self, include: Optional[IncludeSpec] = None, **kwargs) -> Optional[T]:
         """Find single entity by arbitrary criteria"""
         try:
-            query = self.session.query(self.model_class)
+            query = self._query(include)
             for key, value in kwargs.items():
                 if hasattr(self.model_class, key):
                     query = query.filter(getattr(self.model_class, key) == value)
@@ -139,8 +229,118 @@ class BaseRepository(Generic[T], ABC):
         except Exception as e:
             raise ValueError(f'Error finding {self.model_class.__name__}: {str(e)}')
         finally:
-            if self._owns_session:
-                self.session.close()
+            self._release()
+
+    def fingerprint(self, *criteria) -> Tuple[int, Optional[datetime], Optional[int]]:
+        """(count, latest updated_at, highest id) of the rows matching criteria, in one aggregate query"""
+        key_col = inspect(self.model_class).primary_key[0]
+        try:
+            count, last_updated, max_id = self.session.query(
+                func.count(key_col), func.max(self.model_class.updated_at), func.max(key_col)
+            ).filter(*criteria).one()
+            return count, last_updated, max_id
+        except Exception as e:
+            raise ValueError(f'Error getting {self.model_class.__name__} fingerprint: {str(e)}')
+        finally:
+            self._release()
+
+    def max_id(self) -> int:
+        """Highest primary key in the table (0 when empty), one index seek"""
+        key_col = inspect(self.model_class).primary_key[0]
+        try:
+            return self.session.query(func.max(key_col)).scalar() or 0
+        except Exception as e:
+            raise ValueError(f'Error getting highest {self.model_class.__name__} id: {str(e)}')
+        finally:
+            self._release()
+
+    def _row_values(self, row: Any) -> Dict[str, Any]:
+        """Column values of a model instance (unset columns left to their defaults) or a mapping"""
+        if isinstance(row, Mapping):
+            return dict(row)
+        return {
+            column.key: getattr(row, column.key)
+            for column in inspect(self.model_class).column_attrs
+            if getattr(row, column.key) is not None
+        }
+
+    def add_many(self, rows: Iterable[Any], chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        """
+        Insert rows (model instances or column mappings) in bulk, committing once per chunk.
+        Rows are sent as multi-row INSERT ... VALUES statements, each with as many
+        rows as fit in the statement parameter limit, or as one executemany per
+        chunk when the driver batches those itself (pyodbc fast_executemany).
+        Generated keys are not read back. Returns the number of rows inserted.
+        """
+        fast_executemany = getattr(self.session.get_bind().dialect, 'fast_executemany', False)
+        inserted = 0
+        try:
+            for chunk in _chunks((self._row_values(row) for row in rows), chunk_size):
+                if fast_executemany:
+                    self.session.execute(insert(self.model_class), chunk)
+                else:
+                    self._insert_values(chunk)
+                self._commit()
+                inserted += len(chunk)
+            return inserted
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error adding {self.model_class.__name__} rows: {str(e)}')
+        finally:
+            self._release()
+
+    def _insert_values(self, rows: List[Dict[str, Any]]):
+        """Multi-row INSERT ... VALUES statements for rows, grouped by the columns they set"""
+        by_columns: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_columns.setdefault(tuple(sorted(row)), []).append(row)
+        # Columns with defaults are bound as parameters too, so size by the whole table
+        per_row = len(self.model_class.__table__.columns)
+        rows_per_statement = max(1, min(MAX_VALUES_ROWS, MAX_STATEMENT_PARAMS // per_row))
+        for group in by_columns.values():
+            for batch in _chunks(group, rows_per_statement):
+                self.session.execute(insert(self.model_class).values(batch))
+
+    def update_many(self, values: Mapping[str, Any], *criteria, ids: Optional[Iterable[int]] = None,
+                    chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        """
+        UPDATE ... SET values WHERE criteria, as one statement, or one
+        statement and commit per chunk of primary keys when ids is given.
+        Instances already loaded in the session are not refreshed.
+        Returns the number of rows updated.
+        """
+        statement = update(self.model_class).where(*criteria).values(**values)
+        return self._execute_chunked(statement, ids, chunk_size, 'updating')
+
+    def delete_where(self, *criteria, ids: Optional[Iterable[int]] = None,
+                     chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        """
+        DELETE ... WHERE criteria, as one statement, or one statement and
+        commit per chunk of primary keys when ids is given.
+        ORM cascades do not run. Returns the number of rows deleted.
+        """
+        statement = delete(self.model_class).where(*criteria)
+        return self._execute_chunked(statement, ids, chunk_size, 'deleting')
+
+    def _execute_chunked(self, statement, ids: Optional[Iterable[int]], chunk_size: int, action: str) -> int:
+        """Run a set-based UPDATE/DELETE, split into primary-key chunks when ids is given"""
+        statement = statement.execution_options(synchronize_session=False)
+        key_col = inspect(self.model_class).primary_key[0]
+        affected = 0
+        try:
+            if ids is None:
+                affected = self.session.execute(statement).rowcount
+                self._commit()
+            else:
+                for chunk in _chunks(ids, min(chunk_size, MAX_STATEMENT_PARAMS)):
+                    affected += self.session.execute(statement.where(key_col.in_(chunk))).rowcount
+                    self._commit()
+            return affected
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error {action} {self.model_class.__name__} rows: {str(e)}')
+        finally:
+            self._release()
 
     @abstractmethod
     def _model_to_domain(self, model: T) -> object:
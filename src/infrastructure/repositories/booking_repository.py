@@ -1,17 +1,58 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from domain.models.interfaces.ibooking_repository import IBookingRepository
-from domain.models.booking import Booking, BookingStatus
+from domain.models.booking import Booking, BookingDetail, BookingStatus, BLOCKING_BOOKING_STATUSES
 from infrastructure.models.booking_model import BookingModel
-from infrastructure.repositories.base_repository import BaseRepository
+from infrastructure.repositories.base_repository import BaseRepository, BULK_CHUNK_SIZE
+from infrastructure.repositories.complaint_repository import ComplaintRepository
+from infrastructure.repositories.eager_loading import InvalidIncludeError
+from infrastructure.repositories.mapping import RowMapper, enum_lookup, to_decimal
+from infrastructure.repositories.payment_repository import PaymentRepository
+from infrastructure.repositories.payout_repository import PayoutRepository
+from infrastructure.repositories.review_repository import ReviewRepository
+from infrastructure.repositories.service_listing_repository import ServiceListingRepository
+from infrastructure.repositories.student_profile_repository import StudentProfileRepository
+from infrastructure.repositories.subject_repository import SubjectRepository
+from infrastructure.repositories.tutor_profile_repository import TutorProfileRepository
 from datetime import datetime
-from decimal import Decimal
+
+BOOKING_STATUS = enum_lookup(BookingStatus)
 
 class BookingRepository(BaseRepository[BookingModel], IBookingRepository):
     """
     Booking Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('student_id', 'created_at', 'id'),   # get_by_student_id (keyset)
+        ('tutor_id', 'created_at', 'id'),     # get_by_tutor_id (keyset)
+        ('status', 'created_at', 'id'),       # get_by_status (keyset), iter_rows with statuses
+        ('created_at', 'id'),                 # iter_rows
+        ('start_at',),                        # get_by_date_range, get_blocking_rows
+        ('student_id', 'start_at'),           # get_upcoming_bookings
+        ('tutor_id', 'start_at'),             # get_upcoming_bookings, has_overlapping_booking
+    ]
+    
+    # Columns of the raw read path
+    ROW_MAPPER = RowMapper([
+        BookingModel.id, BookingModel.student_id, BookingModel.tutor_id, BookingModel.service_id,
+        BookingModel.subject_id, BookingModel.start_at, BookingModel.end_at, BookingModel.hours,
+        BookingModel.status, BookingModel.total_amount, BookingModel.created_at, BookingModel.updated_at
+    ])
+    
+    # Relationship -> repository that maps its rows (BookingDetail field of the same name)
+    DETAIL_RELATIONSHIPS = {
+        'student': StudentProfileRepository,
+        'tutor': TutorProfileRepository,
+        'service': ServiceListingRepository,
+        'subject': SubjectRepository,
+        'payment': PaymentRepository,
+        'payouts': PayoutRepository,
+        'review': ReviewRepository,
+        'complaints': ComplaintRepository,
+    }
+    
     def __init__(self, session: Session = None):
         super().__init__(BookingModel, session)
     
@@ -28,9 +69,9 @@ class BookingRepository(BaseRepository[BookingModel], IBookingRepository):
             subject_id=model.subject_id,
             start_at=model.start_at,
             end_at=model.end_at,
-            hours=Decimal(str(model.hours)),
-            status=BookingStatus(model.status.value),
-            total_amount=Decimal(str(model.total_amount)),
+            hours=to_decimal(model.hours),
+            status=BOOKING_STATUS(model.status),
+            total_amount=to_decimal(model.total_amount),
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -63,35 +104,83 @@ class BookingRepository(BaseRepository[BookingModel], IBookingRepository):
         model = super().get_by_id(booking_id)
         return self._model_to_domain(model)
     
-    def get_by_student_id(self, student_id: int) -> List[Booking]:
+    def _model_to_detail(self, model: BookingModel, include: Iterable[str]) -> BookingDetail:
+        """Map a booking and its loaded relationships (only those in include are touched)"""
+        related = {}
+        for name in include:
+            mapper = self.DETAIL_RELATIONSHIPS[name](self.session)._model_to_domain
+            value = getattr(model, name)
+            related[name] = [mapper(item) for item in value] if isinstance(value, list) else mapper(value)
+        return BookingDetail(self._model_to_domain(model), **related)
+    
+    def _detail_include(self, include: Optional[Iterable[str]]) -> List[str]:
+        include = list(self.DETAIL_RELATIONSHIPS) if include is None else list(include)
+        unknown = [name for name in include if name not in self.DETAIL_RELATIONSHIPS]
+        if unknown:
+            raise InvalidIncludeError(f"Unknown booking detail relationship(s): {', '.join(unknown)}")
+        return include
+    
+    def get_detail(self, booking_id: int, include: Optional[Iterable[str]] = None) -> Optional[BookingDetail]:
+        """Get a booking with its related records, eager loaded in a fixed number of queries"""
+        include = self._detail_include(include)
+        try:
+            model = self._query(include).filter(BookingModel.id == booking_id).first()
+            return self._model_to_detail(model, include) if model else None
+        except Exception as e:
+            raise ValueError(f'Error getting booking detail: {str(e)}')
+        finally:
+            self._release()
+    
+    def get_details_by_student_id(
+        self,
+        student_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        include: Optional[Iterable[str]] = None
+    ) -> List[BookingDetail]:
+        """Get a student's bookings with related records; the query count does not grow with the page"""
+        include = self._detail_include(include)
+        try:
+            query = self._query(include).filter(BookingModel.student_id == student_id)
+            models = self._keyset(query, limit, after).all()
+            return [self._model_to_detail(model, include) for model in models]
+        except Exception as e:
+            raise ValueError(f'Error getting booking details by student_id: {str(e)}')
+        finally:
+            self._release()
+    
+    def get_by_student_id(self, student_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Booking]:
         """Get all bookings for a student"""
         try:
-            models = self.session.query(BookingModel).filter_by(student_id=student_id).all()
+            query = self.session.query(BookingModel).filter_by(student_id=student_id)
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting bookings by student_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
-    def get_by_tutor_id(self, tutor_id: int) -> List[Booking]:
+    def get_by_tutor_id(self, tutor_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Booking]:
         """Get all bookings for a tutor"""
         try:
-            models = self.session.query(BookingModel).filter_by(tutor_id=tutor_id).all()
+            query = self.session.query(BookingModel).filter_by(tutor_id=tutor_id)
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting bookings by tutor_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
-    def get_by_status(self, status: BookingStatus) -> List[Booking]:
+    def get_by_status(self, status: BookingStatus, limit: Optional[int] = None, after: Optional[str] = None) -> List[Booking]:
         """Get bookings by status"""
         try:
-            models = self.session.query(BookingModel).filter_by(status=status.value).all()
+            query = self.session.query(BookingModel).filter_by(status=status.value)
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting bookings by status: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Booking]:
         """Get bookings within a date range"""
@@ -104,7 +193,7 @@ class BookingRepository(BaseRepository[BookingModel], IBookingRepository):
         except Exception as e:
             raise ValueError(f'Error getting bookings by date range: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_upcoming_bookings(self, user_id: int) -> List[Booking]:
         """Get upcoming bookings for a user"""
@@ -119,12 +208,12 @@ class BookingRepository(BaseRepository[BookingModel], IBookingRepository):
         except Exception as e:
             raise ValueError(f'Error getting upcoming bookings: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def update(self, booking: Booking) -> Booking:
         """Update booking"""
         try:
-            model = self.session.query(BookingModel).filter_by(id=booking.id).first()
+            model = self.session.get(BookingModel, booking.id)
             if not model:
                 raise ValueError(f'Booking with id {booking.id} not found')
             
@@ -135,15 +224,56 @@ class BookingRepository(BaseRepository[BookingModel], IBookingRepository):
             model.total_amount = booking.total_amount
             model.updated_at = booking.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating booking: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, booking_id: int) -> bool:
         """Delete booking"""
         return super().delete(booking_id)
+    
+    def iter_rows(
+        self,
+        statuses: Optional[Iterable[BookingStatus]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream bookings (oldest first) as JSON-ready dicts; status and date filters run in SQL"""
+        criteria = self._created_between(created_from, created_to)
+        if statuses:
+            criteria.append(BookingModel.status.in_([status.value for status in statuses]))
+        return self._stream_rows(self.ROW_MAPPER, *criteria, chunk_size=chunk_size)
+    
+    def get_blocking_rows(self, start: datetime, end: datetime) -> List[Tuple[int, datetime, datetime]]:
+        """(tutor_id, start_at, end_at) of bookings holding tutor time that overlap [start, end)"""
+        try:
+            return self.session.query(
+                BookingModel.tutor_id, BookingModel.start_at, BookingModel.end_at
+            ).filter(
+                BookingModel.start_at < end,
+                BookingModel.end_at > start,
+                BookingModel.status.in_([status.value for status in BLOCKING_BOOKING_STATUSES])
+            ).all()
+        except Exception as e:
+            raise ValueError(f'Error getting blocking bookings: {str(e)}')
+        finally:
+            self._release()
+    
+    def has_overlapping_booking(self, tutor_id: int, start: datetime, end: datetime) -> bool:
+        """Check whether the tutor already has a blocking booking overlapping [start, end)"""
+        try:
+            return self.session.query(BookingModel.id).filter(
+                BookingModel.tutor_id == tutor_id,
+                BookingModel.start_at < end,
+                BookingModel.end_at > start,
+                BookingModel.status.in_([status.value for status in BLOCKING_BOOKING_STATUSES])
+            ).first() is not None
+        except Exception as e:
+            raise ValueError(f'Error checking booking overlap: {str(e)}')
+        finally:
+            self._release()
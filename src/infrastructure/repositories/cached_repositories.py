@@ -0,0 +1,163 @@
+from typing import Callable, List, Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from domain.models.subject import Subject, SubjectLevel
+from domain.models.tutor_profile import TutorProfile
+from domain.models.service_listing import ServiceListing
+from infrastructure.cache.read_through import (
+    ReadThroughCache,
+    subject_cache,
+    tutor_profile_cache,
+    service_listing_cache
+)
+from infrastructure.databases.unit_of_work import in_unit_of_work
+from infrastructure.repositories.subject_repository import SubjectRepository
+from infrastructure.repositories.tutor_profile_repository import TutorProfileRepository
+from infrastructure.repositories.service_listing_repository import ServiceListingRepository
+
+
+def invalidate_on_commit(session: Session, invalidate: Callable[[], None]):
+    """
+    Invalidate now and again once the session's transaction commits, so a
+    reader cannot cache the pre-commit row in between.
+    """
+    invalidate()
+    event.listen(session, 'after_commit', lambda _session: invalidate(), once=True)
+
+
+def invalidate_after_write(session: Session, invalidate: Callable[[], None]):
+    """Invalidate after a repository write (which has committed unless in a unit of work)"""
+    if in_unit_of_work(session):
+        invalidate_on_commit(session, invalidate)
+    else:
+        invalidate()
+
+
+class CachedSubjectRepository(SubjectRepository):
+    """
+    SubjectRepository with read-through caching of get_by_id, get_by_name,
+    get_by_level and get_all. Any subject write clears the whole cache.
+    """
+    
+    def __init__(self, session: Session = None, cache: ReadThroughCache = subject_cache):
+        super().__init__(session)
+        self.cache = cache
+    
+    def _invalidate(self):
+        invalidate_after_write(self.session, self.cache.invalidate)
+    
+    def get_by_id(self, subject_id: int) -> Optional[Subject]:
+        """Get subject by ID (cached)"""
+        return self.cache.get_or_load(('id', subject_id), super().get_by_id, subject_id)
+    
+    def get_by_name(self, name: str) -> Optional[Subject]:
+        """Get subject by name (cached)"""
+        return self.cache.get_or_load(('name', name), super().get_by_name, name)
+    
+    def get_by_level(self, level: SubjectLevel) -> List[Subject]:
+        """Get subjects by level (cached)"""
+        return self.cache.get_or_load(('level', level.value), super().get_by_level, level)
+    
+    def get_all(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[Subject]:
+        """Get all subjects (cached per page)"""
+        return self.cache.get_or_load(('all', limit, after), super().get_all, limit, after)
+    
+    def add(self, subject: Subject) -> Subject:
+        """Add a new subject"""
+        try:
+            return super().add(subject)
+        finally:
+            self._invalidate()
+    
+    def update(self, subject: Subject) -> Subject:
+        """Update subject"""
+        try:
+            return super().update(subject)
+        finally:
+            self._invalidate()
+    
+    def delete(self, subject_id: int) -> bool:
+        """Delete subject"""
+        try:
+            return super().delete(subject_id)
+        finally:
+            self._invalidate()
+
+
+class CachedTutorProfileRepository(TutorProfileRepository):
+    """
+    TutorProfileRepository with read-through caching of get_by_user_id.
+    Writes drop the tutor's entry; rating changes made by ReviewRepository
+    drop it as well.
+    """
+    
+    def __init__(self, session: Session = None, cache: ReadThroughCache = tutor_profile_cache):
+        super().__init__(session)
+        self.cache = cache
+    
+    def _invalidate(self, user_id: int):
+        invalidate_after_write(self.session, lambda: self.cache.invalidate(user_id))
+    
+    def get_by_user_id(self, user_id: int) -> Optional[TutorProfile]:
+        """Get tutor profile by user ID (cached)"""
+        return self.cache.get_or_load(user_id, super().get_by_user_id, user_id)
+    
+    def add(self, tutor_profile: TutorProfile) -> TutorProfile:
+        """Add a new tutor profile"""
+        try:
+            return super().add(tutor_profile)
+        finally:
+            self._invalidate(tutor_profile.user_id)
+    
+    def update(self, tutor_profile: TutorProfile) -> TutorProfile:
+        """Update tutor profile"""
+        try:
+            return super().update(tutor_profile)
+        finally:
+            self._invalidate(tutor_profile.user_id)
+    
+    def delete(self, user_id: int) -> bool:
+        """Delete tutor profile"""
+        try:
+            return super().delete(user_id)
+        finally:
+            self._invalidate(user_id)
+
+
+class CachedServiceListingRepository(ServiceListingRepository):
+    """
+    ServiceListingRepository with read-through caching of get_active_listings.
+    Any listing write drops the cached list.
+    """
+    
+    def __init__(self, session: Session = None, cache: ReadThroughCache = service_listing_cache):
+        super().__init__(session)
+        self.cache = cache
+    
+    def _invalidate(self):
+        invalidate_after_write(self.session, self.cache.invalidate)
+    
+    def get_active_listings(self) -> List[ServiceListing]:
+        """Get all active service listings (cached)"""
+        return self.cache.get_or_load('active', super().get_active_listings)
+    
+    def add(self, service_listing: ServiceListing) -> ServiceListing:
+        """Add a new service listing"""
+        try:
+            return super().add(service_listing)
+        finally:
+            self._invalidate()
+    
+    def update(self, service_listing: ServiceListing) -> ServiceListing:
+        """Update service listing"""
+        try:
+            return super().update(service_listing)
+        finally:
+            self._invalidate()
+    
+    def delete(self, service_id: int) -> bool:
+        """Delete service listing"""
+        try:
+            return super().delete(service_id)
+        finally:
+            self._invalidate()
@@ -1,15 +1,33 @@
 from typing import List, Optional
+from sqlalchemy import bindparam, case, func, select, union_all, update
 from sqlalchemy.orm import Session
 from domain.models.interfaces.ichat_thread_repository import IChatThreadRepository
 from domain.models.chat_thread import ChatThread
 from infrastructure.models.chat_thread_model import ChatThreadModel
-from infrastructure.repositories.base_repository import BaseRepository
+from infrastructure.models.message_model import MessageModel
+from infrastructure.repositories.base_repository import BaseRepository, BULK_CHUNK_SIZE
+
+# Characters of the last message kept on the thread for inbox listings
+SNIPPET_LENGTH = 200
+
+
+def message_snippet(body: str) -> str:
+    """Inbox preview of a message body"""
+    return (body or '')[:SNIPPET_LENGTH]
 
 class ChatThreadRepository(BaseRepository[ChatThreadModel], IChatThreadRepository):
     """
     Chat Thread Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('student_id', 'tutor_id'),           # get_by_participants, get_by_student_id
+        ('tutor_id',),                        # get_by_tutor_id
+        ('student_id', 'last_activity_at', 'id'), # get_summaries_by_user_id (keyset, student side)
+        ('tutor_id', 'last_activity_at', 'id'),   # get_summaries_by_user_id (keyset, tutor side)
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(ChatThreadModel, session)
     
@@ -23,7 +41,14 @@ class ChatThreadRepository(BaseRepository[ChatThreadModel], IChatThreadRepositor
             student_id=model.student_id,
             tutor_id=model.tutor_id,
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            last_message_id=model.last_message_id,
+            last_message_at=model.last_message_at,
+            last_sender_id=model.last_sender_id,
+            last_message_snippet=model.last_message_snippet,
+            last_activity_at=model.last_activity_at,
+            student_unread_count=model.student_unread_count,
+            tutor_unread_count=model.tutor_unread_count
         )
     
     def _domain_to_model(self, domain: ChatThread) -> ChatThreadModel:
@@ -33,7 +58,8 @@ class ChatThreadRepository(BaseRepository[ChatThreadModel], IChatThreadRepositor
             student_id=domain.student_id,
             tutor_id=domain.tutor_id,
             created_at=domain.created_at,
-            updated_at=domain.updated_at
+            updated_at=domain.updated_at,
+            last_activity_at=domain.last_activity_at
         )
     
     def add(self, chat_thread: ChatThread) -> ChatThread:
@@ -57,7 +83,7 @@ class ChatThreadRepository(BaseRepository[ChatThreadModel], IChatThreadRepositor
         except Exception as e:
             raise ValueError(f'Error getting chat thread by participants: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_student_id(self, student_id: int) -> List[ChatThread]:
         """Get all chat threads for a student"""
@@ -67,7 +93,7 @@ class ChatThreadRepository(BaseRepository[ChatThreadModel], IChatThreadRepositor
         except Exception as e:
             raise ValueError(f'Error getting chat threads by student_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_tutor_id(self, tutor_id: int) -> List[ChatThread]:
         """Get all chat threads for a tutor"""
@@ -77,7 +103,7 @@ class ChatThreadRepository(BaseRepository[ChatThreadModel], IChatThreadRepositor
         except Exception as e:
             raise ValueError(f'Error getting chat threads by tutor_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_user_id(self, user_id: int) -> List[ChatThread]:
         """Get all chat threads for a user (student or tutor)"""
@@ -89,25 +115,142 @@ class ChatThreadRepository(BaseRepository[ChatThreadModel], IChatThreadRepositor
         except Exception as e:
             raise ValueError(f'Error getting chat threads by user_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
+    
+    def get_summaries_by_user_id(self, user_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[ChatThread]:
+        """
+        Threads of a user (student or tutor) with their summary projection,
+        most recently active first. Each side is a keyset seek on its own
+        index; the union of both pages is ordered and cut once more.
+        """
+        try:
+            activity = ChatThreadModel.last_activity_at
+            sides = [
+                self._keyset(
+                    self.session.query(ChatThreadModel.id).filter(participant == user_id), limit, after, activity
+                ).subquery()
+                for participant in (ChatThreadModel.student_id, ChatThreadModel.tutor_id)
+            ]
+            ids = union_all(*(select(side.c.id) for side in sides))
+            query = self.session.query(ChatThreadModel).filter(ChatThreadModel.id.in_(ids))
+            models = self._keyset(query, limit, order_col=activity).all()
+            return [self._model_to_domain(model) for model in models]
+        except Exception as e:
+            raise ValueError(f'Error getting chat thread summaries: {str(e)}')
+        finally:
+            self._release()
+    
+    def mark_read(self, thread_id: int, user_id: int) -> Optional[ChatThread]:
+        """Reset the user's unread count and remember the last message as read (one UPDATE)"""
+        try:
+            def reset(participant, column, fallback):
+                return case((participant == user_id, fallback), else_=column)
+            
+            self.session.execute(
+                update(ChatThreadModel).where(ChatThreadModel.id == thread_id).values(
+                    student_unread_count=reset(ChatThreadModel.student_id, ChatThreadModel.student_unread_count, 0),
+                    tutor_unread_count=reset(ChatThreadModel.tutor_id, ChatThreadModel.tutor_unread_count, 0),
+                    student_last_read_id=reset(ChatThreadModel.student_id, ChatThreadModel.student_last_read_id,
+                                               ChatThreadModel.last_message_id),
+                    tutor_last_read_id=reset(ChatThreadModel.tutor_id, ChatThreadModel.tutor_last_read_id,
+                                             ChatThreadModel.last_message_id),
+                    updated_at=ChatThreadModel.updated_at
+                ).execution_options(synchronize_session=False)
+            )
+            model = self.session.query(ChatThreadModel).filter_by(id=thread_id).populate_existing().first()
+            self._commit()
+            return self._model_to_domain(model)
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error marking chat thread as read: {str(e)}')
+        finally:
+            self._release()
+    
+    def rebuild_summaries(self, chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        """
+        Recompute the summary projection of every thread from messages:
+        the last message of each thread comes from one ROW_NUMBER() window
+        query and is written back with one executemany per chunk; unread
+        counts are then recounted in one set-based UPDATE. Threads written
+        before the projection existed count as read up to their last message.
+        Returns the number of threads that have messages.
+        """
+        try:
+            ranked = select(
+                MessageModel.thread_id, MessageModel.id, MessageModel.sender_id,
+                MessageModel.body, MessageModel.created_at,
+                func.row_number().over(
+                    partition_by=MessageModel.thread_id, order_by=MessageModel.id.desc()
+                ).label('position')
+            ).subquery()
+            last_messages = self.session.execute(select(ranked).where(ranked.c.position == 1)).all()
+            
+            threads = ChatThreadModel.__table__
+            unprojected = threads.c.last_message_id.is_(None)
+            
+            def read_up_to(last_read):
+                return case((unprojected, func.coalesce(last_read, bindparam('message_id_'))), else_=last_read)
+            
+            statement = update(threads).where(threads.c.id == bindparam('thread_id_')).values(
+                last_message_id=bindparam('message_id_'),
+                last_message_at=bindparam('created_at_'),
+                last_sender_id=bindparam('sender_id_'),
+                last_message_snippet=bindparam('snippet_'),
+                last_activity_at=bindparam('created_at_'),
+                student_last_read_id=read_up_to(threads.c.student_last_read_id),
+                tutor_last_read_id=read_up_to(threads.c.tutor_last_read_id),
+                updated_at=threads.c.updated_at
+            )
+            for start in range(0, len(last_messages), chunk_size):
+                self.session.execute(statement, [
+                    {
+                        'thread_id_': row.thread_id,
+                        'message_id_': row.id,
+                        'created_at_': row.created_at,
+                        'sender_id_': row.sender_id,
+                        'snippet_': message_snippet(row.body)
+                    }
+                    for row in last_messages[start:start + chunk_size]
+                ])
+            
+            def unread(reader, last_read):
+                return select(func.count(MessageModel.id)).where(
+                    MessageModel.thread_id == ChatThreadModel.id,
+                    MessageModel.sender_id != reader,
+                    MessageModel.id > func.coalesce(last_read, 0)
+                ).scalar_subquery()
+            
+            self.session.execute(
+                update(ChatThreadModel).values(
+                    student_unread_count=unread(ChatThreadModel.student_id, ChatThreadModel.student_last_read_id),
+                    tutor_unread_count=unread(ChatThreadModel.tutor_id, ChatThreadModel.tutor_last_read_id),
+                    updated_at=ChatThreadModel.updated_at
+                ).execution_options(synchronize_session=False)
+            )
+            self._commit()
+            return len(last_messages)
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error rebuilding chat thread summaries: {str(e)}')
+        finally:
+            self._release()
     
     def update(self, chat_thread: ChatThread) -> ChatThread:
         """Update chat thread"""
         try:
-            model = self.session.query(ChatThreadModel).filter_by(id=chat_thread.id).first()
+            model = self.session.get(ChatThreadModel, chat_thread.id)
             if not model:
                 raise ValueError(f'Chat thread with id {chat_thread.id} not found')
             
             model.updated_at = chat_thread.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating chat thread: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, thread_id: int) -> bool:
         """Delete chat thread"""
@@ -4,12 +4,24 @@ from domain.models.interfaces.icomplaint_repository import IComplaintRepository
 from domain.models.complaint import Complaint, ComplaintType, ComplaintStatus
 from infrastructure.models.complaint_model import ComplaintModel
 from infrastructure.repositories.base_repository import BaseRepository
+from infrastructure.repositories.mapping import enum_lookup
+
+COMPLAINT_TYPE = enum_lookup(ComplaintType)
+COMPLAINT_STATUS = enum_lookup(ComplaintStatus)
 
 class ComplaintRepository(BaseRepository[ComplaintModel], IComplaintRepository):
     """
     Complaint Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('raised_by_user',),                  # get_by_user_raised
+        ('against_user',),                    # get_by_user_against
+        ('status',),                          # get_by_status
+        ('booking_id',),                      # get_by_booking_id
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(ComplaintModel, session)
     
@@ -23,9 +35,9 @@ class ComplaintRepository(BaseRepository[ComplaintModel], IComplaintRepository):
             raised_by_user=model.raised_by_user,
             against_user=model.against_user,
             booking_id=model.booking_id,
-            type=ComplaintType(model.type.value) if hasattr(model.type, 'value') else ComplaintType(model.type),
+            type=COMPLAINT_TYPE(model.type),
             detail=model.detail,
-            status=ComplaintStatus(model.status.value) if hasattr(model.status, 'value') else ComplaintStatus(model.status),
+            status=COMPLAINT_STATUS(model.status),
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -63,7 +75,7 @@ class ComplaintRepository(BaseRepository[ComplaintModel], IComplaintRepository):
         except Exception as e:
             raise ValueError(f'Error getting complaints by user_raised: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_user_against(self, user_id: int) -> List[Complaint]:
         """Get complaints against a user"""
@@ -73,7 +85,7 @@ class ComplaintRepository(BaseRepository[ComplaintModel], IComplaintRepository):
         except Exception as e:
             raise ValueError(f'Error getting complaints by user_against: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_status(self, status: ComplaintStatus) -> List[Complaint]:
         """Get complaints by status"""
@@ -83,7 +95,7 @@ class ComplaintRepository(BaseRepository[ComplaintModel], IComplaintRepository):
         except Exception as e:
             raise ValueError(f'Error getting complaints by status: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_booking_id(self, booking_id: int) -> List[Complaint]:
         """Get complaints for a booking"""
@@ -93,12 +105,12 @@ class ComplaintRepository(BaseRepository[ComplaintModel], IComplaintRepository):
         except Exception as e:
             raise ValueError(f'Error getting complaints by booking_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def update(self, complaint: Complaint) -> Complaint:
         """Update complaint"""
         try:
-            model = self.session.query(ComplaintModel).filter_by(id=complaint.id).first()
+            model = self.session.get(ComplaintModel, complaint.id)
             if not model:
                 raise ValueError(f'Complaint with id {complaint.id} not found')
             
@@ -107,14 +119,13 @@ class ComplaintRepository(BaseRepository[ComplaintModel], IComplaintRepository):
             model.status = complaint.status.value
             model.updated_at = complaint.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating complaint: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, complaint_id: int) -> bool:
         """Delete complaint"""
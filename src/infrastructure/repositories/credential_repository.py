@@ -4,12 +4,21 @@ from domain.models.interfaces.icredential_repository import ICredentialRepositor
 from domain.models.credential import Credential, CredentialType
 from infrastructure.models.credential_model import CredentialModel
 from infrastructure.repositories.base_repository import BaseRepository
+from infrastructure.repositories.mapping import enum_lookup
+
+CREDENTIAL_TYPE = enum_lookup(CredentialType)
 
 class CredentialRepository(BaseRepository[CredentialModel], ICredentialRepository):
     """
     Credential Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('tutor_id', 'verified'),             # get_by_tutor_id, get_verified_credentials
+        ('verified',),                        # get_unverified_credentials
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(CredentialModel, session)
     
@@ -21,7 +30,7 @@ class CredentialRepository(BaseRepository[CredentialModel], ICredentialRepositor
         return Credential(
             id=model.id,
             tutor_id=model.tutor_id,
-            type=CredentialType(model.type.value),
+            type=CREDENTIAL_TYPE(model.type),
             issuer=model.issuer,
             file_url=model.file_url,
             verified=model.verified,
@@ -63,12 +72,12 @@ class CredentialRepository(BaseRepository[CredentialModel], ICredentialRepositor
         except Exception as e:
             raise ValueError(f'Error getting credentials by tutor_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def update(self, credential: Credential) -> Credential:
         """Update credential"""
         try:
-            model = self.session.query(CredentialModel).filter_by(id=credential.id).first()
+            model = self.session.get(CredentialModel, credential.id)
             if not model:
                 raise ValueError(f'Credential with id {credential.id} not found')
             
@@ -79,14 +88,13 @@ class CredentialRepository(BaseRepository[CredentialModel], ICredentialRepositor
             model.verified_at = credential.verified_at
             model.updated_at = credential.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating credential: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, credential_id: int) -> bool:
         """Delete credential"""
@@ -102,7 +110,7 @@ class CredentialRepository(BaseRepository[CredentialModel], ICredentialRepositor
         except Exception as e:
             raise ValueError(f'Error getting verified credentials: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_unverified_credentials(self) -> List[Credential]:
         """Get all unverified credentials"""
@@ -112,4 +120,4 @@ class CredentialRepository(BaseRepository[CredentialModel], ICredentialRepositor
         except Exception as e:
             raise ValueError(f'Error getting unverified credentials: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
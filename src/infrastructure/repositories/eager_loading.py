@@ -0,0 +1,72 @@
+"""
+Declarative eager loading for repository queries.
+
+Relationships are lazy by default, so code walking them from a list of
+rows issues one query per row and relationship (N+1). An include spec
+names the relationships to load with the query instead:
+
+    ('payment', 'payouts', 'tutor.user')          # strategy picked per relationship
+    {'payouts': 'joined', 'tutor.user': 'select'}  # explicit strategies
+
+A dotted path loads each hop. Without an explicit strategy, to-one
+relationships are joined into the main query (one row per parent,
+no extra round trip) and collections are loaded with one
+SELECT ... WHERE fk IN (...) per relationship, which avoids the row
+multiplication of joining several collections. Either way the number of
+queries depends on the spec, not on the number of rows.
+"""
+from typing import Iterable, List, Mapping, Optional, Union
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, selectinload
+
+IncludeSpec = Union[Iterable[str], Mapping[str, Optional[str]]]
+
+STRATEGIES = {
+    'joined': joinedload,
+    'select': selectinload,
+}
+
+
+class InvalidIncludeError(ValueError):
+    """Raised when an include spec names an unknown relationship or strategy"""
+    pass
+
+
+def _default_strategy(relationship) -> str:
+    return 'select' if relationship.uselist else 'joined'
+
+
+def load_options(model_class: type, include: Optional[IncludeSpec]) -> List:
+    """
+    Loader options for Query.options() / Session.get(options=...)
+
+    Args:
+        model_class: Model the query starts from
+        include: Dotted relationship paths, optionally mapped to 'joined' or 'select'
+
+    Returns:
+        One chained loader option per path (empty for no include)
+    """
+    if not include:
+        return []
+    paths = include.items() if isinstance(include, Mapping) else ((path, None) for path in include)
+
+    options = []
+    for path, strategy in paths:
+        if strategy is not None and strategy not in STRATEGIES:
+            raise InvalidIncludeError(f"Unknown loading strategy '{strategy}' for '{path}'")
+        hops = path.split('.')
+        current, option = model_class, None
+        for position, name in enumerate(hops):
+            relationship = inspect(current).relationships.get(name)
+            if relationship is None:
+                raise InvalidIncludeError(f"{current.__name__} has no relationship '{name}' (in '{path}')")
+            # The explicit strategy applies to the last hop, intermediate hops use the default
+            hop_strategy = strategy if strategy and position == len(hops) - 1 else _default_strategy(relationship)
+            attribute = getattr(current, name)
+            loader = STRATEGIES[hop_strategy]
+            option = loader(attribute) if option is None else getattr(option, loader.__name__)(attribute)
+            current = relationship.mapper.class_
+        options.append(option)
+    return options
@@ -0,0 +1,101 @@
+from typing import Optional
+from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from domain.models.interfaces.iidempotency_key_repository import IIdempotencyKeyRepository
+from domain.models.idempotency_record import IdempotencyRecord
+from infrastructure.models.idempotency_key_model import IdempotencyKeyModel
+from infrastructure.repositories.base_repository import BaseRepository
+
+class IdempotencyKeyRepository(BaseRepository[IdempotencyKeyModel], IIdempotencyKeyRepository):
+    """
+    Idempotency Key Repository Implementation
+    """
+    
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('key',),                             # claim, complete, release
+        ('expires_at',),                      # purge_expired
+    ]
+    
+    def __init__(self, session: Session = None):
+        super().__init__(IdempotencyKeyModel, session)
+    
+    def _model_to_domain(self, model: IdempotencyKeyModel) -> IdempotencyRecord:
+        """Convert SQLAlchemy model to domain entity"""
+        if not model:
+            return None
+        
+        return IdempotencyRecord(
+            id=model.id,
+            key=model.key,
+            request_hash=model.request_hash,
+            status_code=model.status_code,
+            content_type=model.content_type,
+            response_body=model.response_body,
+            created_at=model.created_at,
+            expires_at=model.expires_at
+        )
+    
+    def _domain_to_model(self, domain: IdempotencyRecord) -> IdempotencyKeyModel:
+        """Convert domain entity to SQLAlchemy model"""
+        return IdempotencyKeyModel(
+            id=domain.id,
+            key=domain.key,
+            request_hash=domain.request_hash,
+            status_code=domain.status_code,
+            content_type=domain.content_type,
+            response_body=domain.response_body,
+            created_at=domain.created_at,
+            expires_at=domain.expires_at
+        )
+    
+    def _get_model(self, key: str) -> Optional[IdempotencyKeyModel]:
+        return self.session.query(IdempotencyKeyModel).filter_by(key=key).first()
+    
+    def claim(self, record: IdempotencyRecord) -> Optional[IdempotencyRecord]:
+        """Store an in-flight record (expires_at is its lease); return the live record already holding the key, None if claimed"""
+        try:
+            existing = self._get_model(record.key)
+            if existing is not None:
+                if existing.expires_at > datetime.utcnow():
+                    return self._model_to_domain(existing)
+                # Expired response, or a lapsed lease of a request that never finished
+                self.session.delete(existing)
+                self.session.flush()
+            
+            self.session.add(self._domain_to_model(record))
+            self._commit()
+            return None
+        except IntegrityError:
+            # Another process inserted the key between our read and insert
+            self._rollback()
+            existing = self._get_model(record.key)
+            return self._model_to_domain(existing) if existing else IdempotencyRecord(
+                key=record.key, request_hash=record.request_hash, expires_at=record.expires_at
+            )
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error claiming idempotency key: {str(e)}')
+        finally:
+            self._release()
+    
+    def complete(self, key: str, status_code: int, content_type: Optional[str], response_body: str,
+                 expires_at: datetime) -> bool:
+        """Record the response of an in-flight key, kept until expires_at"""
+        # In-flight only: after a lapsed lease, the first response recorded wins
+        updated = self.update_many(
+            {'status_code': status_code, 'content_type': content_type, 'response_body': response_body,
+             'expires_at': expires_at},
+            IdempotencyKeyModel.key == key,
+            IdempotencyKeyModel.status_code.is_(None)
+        )
+        return updated > 0
+    
+    def release(self, key: str) -> bool:
+        """Drop an in-flight claim so the request can be retried"""
+        return self.delete_where(IdempotencyKeyModel.key == key, IdempotencyKeyModel.status_code.is_(None)) > 0
+    
+    def purge_expired(self, now: datetime) -> int:
+        """Delete expired records"""
+        return self.delete_where(IdempotencyKeyModel.expires_at <= now)
@@ -0,0 +1,95 @@
+"""
+Fast conversions for repository mappers.
+
+Mapping runs once per row, so on large lists its per-row cost adds up.
+DECIMAL columns already load as Decimal and enum columns as their string
+value; the helpers here pass those through or resolve them with one dict
+lookup instead of re-parsing:
+
+    BOOKING_STATUS = enum_lookup(BookingStatus)
+    status=BOOKING_STATUS(model.status), hours=to_decimal(model.hours)
+
+RowMapper is the raw read path: a column-only query (no ORM entities,
+no identity map, no domain objects) turned straight into JSON-ready dicts.
+"""
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Type
+
+
+def to_decimal(value: Any) -> Optional[Decimal]:
+    """Decimal of a numeric column value (Decimals pass through unchanged)"""
+    if value is None or type(value) is Decimal:
+        return value
+    return Decimal(str(value))
+
+
+class EnumLookup:
+    """Precomputed value -> member table of an enum; members map to themselves"""
+
+    __slots__ = ('enum_cls', 'table')
+
+    def __init__(self, enum_cls: Type[Enum]):
+        self.enum_cls = enum_cls
+        self.table: Dict[Any, Enum] = {member.value: member for member in enum_cls}
+        self.table.update({member: member for member in enum_cls})
+
+    def __call__(self, value: Any) -> Enum:
+        try:
+            return self.table[value]
+        except (KeyError, TypeError):
+            # Member of another enum class with the same values (e.g. a model-side enum)
+            if isinstance(value, Enum) and value.value in self.table:
+                return self.table[value.value]
+            raise ValueError(f'{value!r} is not a valid {self.enum_cls.__name__}')
+
+
+@lru_cache(maxsize=None)
+def enum_lookup(enum_cls: Type[Enum]) -> EnumLookup:
+    """Shared EnumLookup of an enum class (built once per process)"""
+    return EnumLookup(enum_cls)
+
+
+def _json_converter(column) -> Optional[Callable[[Any], Any]]:
+    """Conversion of one column's values to JSON types, None when they already are"""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return None
+    if python_type in (datetime, date, time):
+        return python_type.isoformat
+    if python_type is Decimal:
+        return str
+    if issubclass(python_type, Enum):
+        return lambda value: value.value if isinstance(value, Enum) else value
+    return None
+
+
+class RowMapper:
+    """
+    Compiled Row -> dict conversion for a fixed list of columns.
+
+    The converter of each column is chosen once, from its type: datetimes
+    become ISO strings and Decimals strings (as the response schemas
+    render them); everything else is copied as is.
+    """
+
+    def __init__(self, columns: Sequence, names: Optional[Sequence[str]] = None):
+        self.columns = list(columns)
+        self.names = tuple(names) if names is not None else tuple(column.key for column in self.columns)
+        converters = [_json_converter(column) for column in self.columns]
+        self._converted = tuple((position, converter) for position, converter in enumerate(converters)
+                                if converter is not None)
+
+    def __call__(self, row: Sequence) -> Dict[str, Any]:
+        values = list(row)
+        for position, converter in self._converted:
+            value = values[position]
+            if value is not None:
+                values[position] = converter(value)
+        return dict(zip(self.names, values))
+
+    def many(self, rows: Iterable[Sequence]) -> List[Dict[str, Any]]:
+        return [self(row) for row in rows]
@@ -1,15 +1,25 @@
 from typing import List, Optional
+from sqlalchemy import and_, case, func, or_, select, update
 from sqlalchemy.orm import Session
 from domain.models.interfaces.imessage_repository import IMessageRepository
 from domain.models.message import Message
 from infrastructure.models.message_model import MessageModel
+from infrastructure.models.chat_thread_model import ChatThreadModel
 from infrastructure.repositories.base_repository import BaseRepository
+from infrastructure.repositories.chat_thread_repository import message_snippet
 
 class MessageRepository(BaseRepository[MessageModel], IMessageRepository):
     """
     Message Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('thread_id', 'created_at'),          # get_by_thread_id, get_latest_messages_in_thread
+        ('sender_id',),                       # get_by_sender_id
+        ('thread_id', 'id'),                  # get_for_user_after (per thread of the user)
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(MessageModel, session)
     
@@ -40,11 +50,74 @@ class MessageRepository(BaseRepository[MessageModel], IMessageRepository):
             updated_at=domain.updated_at
         )
     
+    def _project_added(self, model: MessageModel):
+        """Make a new message its thread's last message and count it unread for the other participant"""
+        newer = or_(ChatThreadModel.last_message_id.is_(None), ChatThreadModel.last_message_id < model.id)
+        
+        def if_newer(column, value):
+            return case((newer, value), else_=column)
+        
+        def count_for(participant, column):
+            return case((participant == model.sender_id, column), else_=column + 1)
+        
+        self.session.execute(
+            update(ChatThreadModel).where(ChatThreadModel.id == model.thread_id).values(
+                last_message_id=if_newer(ChatThreadModel.last_message_id, model.id),
+                last_message_at=if_newer(ChatThreadModel.last_message_at, model.created_at),
+                last_sender_id=if_newer(ChatThreadModel.last_sender_id, model.sender_id),
+                last_message_snippet=if_newer(ChatThreadModel.last_message_snippet, message_snippet(model.body)),
+                last_activity_at=if_newer(ChatThreadModel.last_activity_at, model.created_at),
+                student_unread_count=count_for(ChatThreadModel.student_id, ChatThreadModel.student_unread_count),
+                tutor_unread_count=count_for(ChatThreadModel.tutor_id, ChatThreadModel.tutor_unread_count)
+            ).execution_options(synchronize_session=False)
+        )
+    
+    def _project_deleted(self, model: MessageModel):
+        """Uncount a deleted unread message and, if it was the last one, fall back to the one before"""
+        def uncount_for(participant, last_read, column):
+            unread = and_(participant != model.sender_id, model.id > func.coalesce(last_read, 0), column > 0)
+            return case((unread, column - 1), else_=column)
+        
+        values = dict(
+            student_unread_count=uncount_for(ChatThreadModel.student_id, ChatThreadModel.student_last_read_id,
+                                             ChatThreadModel.student_unread_count),
+            tutor_unread_count=uncount_for(ChatThreadModel.tutor_id, ChatThreadModel.tutor_last_read_id,
+                                           ChatThreadModel.tutor_unread_count)
+        )
+        thread = self.session.query(ChatThreadModel.last_message_id, ChatThreadModel.created_at).filter(
+            ChatThreadModel.id == model.thread_id
+        ).first()
+        if thread is not None and thread.last_message_id == model.id:
+            previous = self.session.query(MessageModel).filter(
+                MessageModel.thread_id == model.thread_id,
+                MessageModel.id < model.id
+            ).order_by(MessageModel.id.desc()).first()
+            values.update(
+                last_message_id=previous.id if previous else None,
+                last_message_at=previous.created_at if previous else None,
+                last_sender_id=previous.sender_id if previous else None,
+                last_message_snippet=message_snippet(previous.body) if previous else None,
+                last_activity_at=previous.created_at if previous else thread.created_at
+            )
+        self.session.execute(
+            update(ChatThreadModel).where(ChatThreadModel.id == model.thread_id).values(**values)
+            .execution_options(synchronize_session=False)
+        )
+    
     def add(self, message: Message) -> Message:
-        """Add a new message"""
-        model = self._domain_to_model(message)
-        saved_model = super().add(model)
-        return self._model_to_domain(saved_model)
+        """Add a new message and update its thread's summary in the same transaction"""
+        try:
+            model = self._domain_to_model(message)
+            self.session.add(model)
+            self.session.flush()
+            self._project_added(model)
+            self._commit()
+            return self._model_to_domain(model)
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error adding message: {str(e)}')
+        finally:
+            self._release()
     
     def get_by_id(self, message_id: int) -> Optional[Message]:
         """Get message by ID"""
@@ -59,7 +132,7 @@ class MessageRepository(BaseRepository[MessageModel], IMessageRepository):
         except Exception as e:
             raise ValueError(f'Error getting messages by thread_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_sender_id(self, sender_id: int) -> List[Message]:
         """Get all messages by a sender"""
@@ -69,7 +142,7 @@ class MessageRepository(BaseRepository[MessageModel], IMessageRepository):
         except Exception as e:
             raise ValueError(f'Error getting messages by sender_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_latest_messages_in_thread(self, thread_id: int, limit: int = 50) -> List[Message]:
         """Get latest messages in a thread"""
@@ -83,31 +156,66 @@ class MessageRepository(BaseRepository[MessageModel], IMessageRepository):
         except Exception as e:
             raise ValueError(f'Error getting latest messages: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
+    
+    def get_for_user_after(self, user_id: int, after_id: int, limit: int) -> List[Message]:
+        """Messages with id > after_id in the threads of a user (student or tutor), oldest first"""
+        try:
+            threads = select(ChatThreadModel.id).where(
+                or_(ChatThreadModel.student_id == user_id, ChatThreadModel.tutor_id == user_id)
+            )
+            models = self.session.query(MessageModel).filter(
+                MessageModel.thread_id.in_(threads),
+                MessageModel.id > after_id
+            ).order_by(MessageModel.id).limit(limit).all()
+            return [self._model_to_domain(model) for model in models]
+        except Exception as e:
+            raise ValueError(f'Error getting new messages for user: {str(e)}')
+        finally:
+            self._release()
     
     def update(self, message: Message) -> Message:
         """Update message"""
         try:
-            model = self.session.query(MessageModel).filter_by(id=message.id).first()
+            model = self.session.get(MessageModel, message.id)
             if not model:
                 raise ValueError(f'Message with id {message.id} not found')
             
             model.body = message.body
             model.attachment_url = message.attachment_url
             model.updated_at = message.updated_at
+            # Keep the inbox preview in step when the last message is edited
+            self.session.execute(
+                update(ChatThreadModel).where(
+                    ChatThreadModel.id == model.thread_id,
+                    ChatThreadModel.last_message_id == model.id
+                ).values(last_message_snippet=message_snippet(model.body)).execution_options(synchronize_session=False)
+            )
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating message: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, message_id: int) -> bool:
-        """Delete message"""
-        return super().delete(message_id)
+        """Delete message (and take it out of its thread's summary)"""
+        try:
+            model = self.session.get(MessageModel, message_id)
+            if not model:
+                return False
+            
+            self._project_deleted(model)
+            self.session.delete(model)
+            self._commit()
+            return True
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error deleting message: {str(e)}')
+        finally:
+            self._release()
     
     def count_messages_in_thread(self, thread_id: int) -> int:
         """Count messages in a thread"""
@@ -117,4 +225,4 @@ class MessageRepository(BaseRepository[MessageModel], IMessageRepository):
         except Exception as e:
             raise ValueError(f'Error counting messages in thread: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
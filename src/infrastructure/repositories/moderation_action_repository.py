@@ -4,12 +4,21 @@ from domain.models.interfaces.imoderation_action_repository import IModerationAc
 from domain.models.moderation_action import ModerationAction, ModerationActionType
 from infrastructure.models.moderation_action_model import ModerationActionModel
 from infrastructure.repositories.base_repository import BaseRepository
+from infrastructure.repositories.mapping import enum_lookup
+
+MODERATION_ACTION_TYPE = enum_lookup(ModerationActionType)
 
 class ModerationActionRepository(BaseRepository[ModerationActionModel], IModerationActionRepository):
     """
     Moderation Action Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('complaint_id', 'created_at'),       # get_by_complaint_id
+        ('moderator_id', 'created_at'),       # get_by_moderator_id
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(ModerationActionModel, session)
     
@@ -22,7 +31,7 @@ class ModerationActionRepository(BaseRepository[ModerationActionModel], IModerat
             id=model.id,
             complaint_id=model.complaint_id,
             moderator_id=model.moderator_id,
-            action=ModerationActionType(model.action.value) if hasattr(model.action, 'value') else ModerationActionType(model.action),
+            action=MODERATION_ACTION_TYPE(model.action),
             note=model.note,
             created_at=model.created_at,
             updated_at=model.updated_at
@@ -61,7 +70,7 @@ class ModerationActionRepository(BaseRepository[ModerationActionModel], IModerat
         except Exception as e:
             raise ValueError(f'Error getting moderation actions by complaint_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_moderator_id(self, moderator_id: int) -> List[ModerationAction]:
         """Get all moderation actions by a moderator"""
@@ -73,12 +82,12 @@ class ModerationActionRepository(BaseRepository[ModerationActionModel], IModerat
         except Exception as e:
             raise ValueError(f'Error getting moderation actions by moderator_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def update(self, moderation_action: ModerationAction) -> ModerationAction:
         """Update moderation action"""
         try:
-            model = self.session.query(ModerationActionModel).filter_by(id=moderation_action.id).first()
+            model = self.session.get(ModerationActionModel, moderation_action.id)
             if not model:
                 raise ValueError(f'Moderation action with id {moderation_action.id} not found')
             
@@ -86,14 +95,13 @@ class ModerationActionRepository(BaseRepository[ModerationActionModel], IModerat
             model.note = moderation_action.note
             model.updated_at = moderation_action.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating moderation action: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, action_id: int) -> bool:
         """Delete moderation action"""
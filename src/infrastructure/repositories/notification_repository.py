@@ -1,15 +1,32 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import bindparam, case, func, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from domain.models.interfaces.inotification_repository import INotificationRepository
-from domain.models.notification import Notification, NotificationType, NotificationChannel
+from domain.models.notification import Notification, NotificationType, NotificationChannel, ChannelQueueStats
 from infrastructure.models.notification_model import NotificationModel
-from infrastructure.repositories.base_repository import BaseRepository
+from infrastructure.models.notification_counter_model import NotificationCounterModel
+from infrastructure.repositories.base_repository import BaseRepository, MAX_STATEMENT_PARAMS
+from infrastructure.repositories.mapping import enum_lookup
+
+NOTIFICATION_TYPE = enum_lookup(NotificationType)
+NOTIFICATION_CHANNEL = enum_lookup(NotificationChannel)
 
 class NotificationRepository(BaseRepository[NotificationModel], INotificationRepository):
     """
     Notification Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('user_id', 'created_at', 'id'),      # get_by_user_id (keyset), fingerprint_by_user_id, get_for_user_after
+        ('user_id', 'read_at', 'created_at'), # get_unread_by_user_id, mark_all_read_for_user, unread counter backfill
+        ('type', 'created_at', 'id'),         # get_by_type (keyset)
+        ('channel', 'created_at', 'id'),      # get_by_channel (keyset)
+        ('channel', 'next_attempt_at', 'id'), # claim_pending, get_queue_stats (filtered to the unsent)
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(NotificationModel, session)
     
@@ -21,13 +38,17 @@ class NotificationRepository(BaseRepository[NotificationModel], INotificationRep
         return Notification(
             id=model.id,
             user_id=model.user_id,
-            type=NotificationType(model.type.value) if hasattr(model.type, 'value') else NotificationType(model.type),
-            channel=NotificationChannel(model.channel.value) if hasattr(model.channel, 'value') else NotificationChannel(model.channel),
+            type=NOTIFICATION_TYPE(model.type),
+            channel=NOTIFICATION_CHANNEL(model.channel),
             payload=model.payload,
             sent_at=model.sent_at,
             read_at=model.read_at,
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            attempts=model.attempts,
+            next_attempt_at=model.next_attempt_at,
+            last_error=model.last_error,
+            failed_at=model.failed_at
         )
     
     def _domain_to_model(self, domain: Notification) -> NotificationModel:
@@ -41,109 +62,414 @@ class NotificationRepository(BaseRepository[NotificationModel], INotificationRep
             sent_at=domain.sent_at,
             read_at=domain.read_at,
             created_at=domain.created_at,
-            updated_at=domain.updated_at
+            updated_at=domain.updated_at,
+            attempts=domain.attempts,
+            next_attempt_at=domain.next_attempt_at or domain.created_at,
+            last_error=domain.last_error,
+            failed_at=domain.failed_at
+        )
+    
+    @staticmethod
+    def _is_unread(model: NotificationModel) -> bool:
+        return model.sent_at is not None and model.read_at is None
+    
+    def _count_unread(self, user_id: int) -> int:
+        return self.session.query(func.count(NotificationModel.id)).filter(
+            NotificationModel.user_id == user_id,
+            NotificationModel.read_at.is_(None),
+            NotificationModel.sent_at.isnot(None)
+        ).scalar()
+    
+    def _create_counter(self, user_id: int) -> Optional[int]:
+        """
+        Create a user's counter row from a COUNT (which sees this transaction's
+        own changes). Returns None if another transaction created it first.
+        """
+        count = self._count_unread(user_id)
+        try:
+            with self.session.begin_nested():
+                self.session.add(NotificationCounterModel(user_id=user_id, unread_count=count))
+            return count
+        except IntegrityError:
+            return None
+    
+    def _bump_unread(self, user_id: int, delta: int):
+        """Shift a user's unread counter inside the current transaction"""
+        if not delta:
+            return
+        statement = update(NotificationCounterModel).where(
+            NotificationCounterModel.user_id == user_id
+        ).values(
+            unread_count=NotificationCounterModel.unread_count + delta,
+            updated_at=datetime.utcnow()
+        ).execution_options(synchronize_session=False)
+        if self.session.execute(statement).rowcount == 0 and self._create_counter(user_id) is None:
+            # Created concurrently from a COUNT that could not see our uncommitted change
+            self.session.execute(statement)
+    
+    def _bump_unread_many(self, deltas: Dict[int, int]):
+        """Shift the unread counters of several users: one executemany for the existing ones"""
+        deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        existing = {
+            user_id for (user_id,) in self.session.query(NotificationCounterModel.user_id).filter(
+                NotificationCounterModel.user_id.in_(list(deltas))
+            )
+        }
+        for user_id in deltas.keys() - existing:
+            if self._create_counter(user_id) is None:
+                existing.add(user_id)
+        if not existing:
+            return
+        counters = NotificationCounterModel.__table__
+        self.session.execute(
+            update(counters).where(counters.c.user_id == bindparam('counter_user_id')).values(
+                unread_count=counters.c.unread_count + bindparam('delta'),
+                updated_at=datetime.utcnow()
+            ),
+            [{'counter_user_id': user_id, 'delta': deltas[user_id]} for user_id in existing]
         )
     
     def add(self, notification: Notification) -> Notification:
-        """Add a new notification"""
-        model = self._domain_to_model(notification)
-        saved_model = super().add(model)
-        return self._model_to_domain(saved_model)
+        """Add a new notification (and count it if it is already sent)"""
+        try:
+            model = self._domain_to_model(notification)
+            self.session.add(model)
+            self.session.flush()
+            if self._is_unread(model):
+                self._bump_unread(model.user_id, 1)
+            self._commit()
+            return self._model_to_domain(model)
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error adding notification: {str(e)}')
+        finally:
+            self._release()
     
     def get_by_id(self, notification_id: int) -> Optional[Notification]:
         """Get notification by ID"""
         model = super().get_by_id(notification_id)
         return self._model_to_domain(model)
     
-    def get_by_user_id(self, user_id: int) -> List[Notification]:
+    def get_by_user_id(self, user_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Notification]:
         """Get all notifications for a user"""
         try:
-            models = self.session.query(NotificationModel).filter_by(user_id=user_id).order_by(
-                NotificationModel.created_at.desc()
-            ).all()
+            query = self.session.query(NotificationModel).filter_by(user_id=user_id)
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting notifications by user_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
-    def get_unread_by_user_id(self, user_id: int) -> List[Notification]:
+    def get_unread_by_user_id(self, user_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Notification]:
         """Get unread notifications for a user"""
         try:
-            models = self.session.query(NotificationModel).filter_by(
+            query = self.session.query(NotificationModel).filter_by(
                 user_id=user_id, read_at=None
-            ).filter(NotificationModel.sent_at.isnot(None)).order_by(
-                NotificationModel.created_at.desc()
-            ).all()
+            ).filter(NotificationModel.sent_at.isnot(None))
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting unread notifications: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
-    def get_by_type(self, notification_type: NotificationType) -> List[Notification]:
+    def get_by_type(self, notification_type: NotificationType, limit: Optional[int] = None, after: Optional[str] = None) -> List[Notification]:
         """Get notifications by type"""
         try:
-            models = self.session.query(NotificationModel).filter_by(type=notification_type.value).all()
+            query = self.session.query(NotificationModel).filter_by(type=notification_type.value)
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting notifications by type: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
-    def get_by_channel(self, channel: NotificationChannel) -> List[Notification]:
+    def get_by_channel(self, channel: NotificationChannel, limit: Optional[int] = None, after: Optional[str] = None) -> List[Notification]:
         """Get notifications by channel"""
         try:
-            models = self.session.query(NotificationModel).filter_by(channel=channel.value).all()
+            query = self.session.query(NotificationModel).filter_by(channel=channel.value)
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting notifications by channel: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def update(self, notification: Notification) -> Notification:
         """Update notification"""
         try:
-            model = self.session.query(NotificationModel).filter_by(id=notification.id).first()
+            model = self.session.get(NotificationModel, notification.id)
             if not model:
                 raise ValueError(f'Notification with id {notification.id} not found')
             
+            was_unread = self._is_unread(model)
             model.type = notification.type.value
             model.channel = notification.channel.value
             model.payload = notification.payload
             model.sent_at = notification.sent_at
             model.read_at = notification.read_at
             model.updated_at = notification.updated_at
+            model.attempts = notification.attempts
+            model.next_attempt_at = notification.next_attempt_at or model.next_attempt_at
+            model.last_error = notification.last_error
+            model.failed_at = notification.failed_at
+            # Flushed first: a counter backfilled from COUNT must already see this change
+            self.session.flush()
+            self._bump_unread(model.user_id, int(self._is_unread(model)) - int(was_unread))
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating notification: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, notification_id: int) -> bool:
         """Delete notification"""
-        return super().delete(notification_id)
-    
-    def mark_all_read_for_user(self, user_id: int) -> bool:
-        """Mark all notifications as read for a user"""
         try:
-            from datetime import datetime
-            models = self.session.query(NotificationModel).filter_by(
-                user_id=user_id, read_at=None
-            ).all()
+            model = self.session.get(NotificationModel, notification_id)
+            if not model:
+                return False
             
-            for model in models:
-                model.read_at = datetime.utcnow()
-                model.updated_at = datetime.utcnow()
+            user_id, was_unread = model.user_id, self._is_unread(model)
+            # Flushed first: a counter backfilled from COUNT must not count the deleted row
+            self.session.delete(model)
+            self.session.flush()
+            if was_unread:
+                self._bump_unread(user_id, -1)
+            self._commit()
+            return True
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error deleting notification: {str(e)}')
+        finally:
+            self._release()
+    
+    def mark_read(self, notification_id: int, user_id: int) -> Optional[Notification]:
+        """Mark one of the user's notifications as read; None if it is not theirs"""
+        try:
+            model = self.session.get(NotificationModel, notification_id)
+            if not model or model.user_id != user_id:
+                return None
             
-            self.session.commit()
+            now = datetime.utcnow()
+            # Conditional UPDATE: of two concurrent calls only one decrements
+            marked = self.session.execute(
+                update(NotificationModel).where(
+                    NotificationModel.id == notification_id,
+                    NotificationModel.read_at.is_(None)
+                ).values(read_at=now, updated_at=now).execution_options(synchronize_session=False)
+            ).rowcount
+            if marked and model.sent_at is not None:
+                self._bump_unread(user_id, -1)
+            self._commit()
+            notification = self._model_to_domain(model)
+            if marked:
+                notification.read_at = notification.updated_at = now
+            return notification
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error marking notification as read: {str(e)}')
+        finally:
+            self._release()
+    
+    def mark_all_read_for_user(self, user_id: int) -> bool:
+        """Mark all sent, unread notifications of a user as read (one UPDATE) and reset the counter"""
+        try:
+            now = datetime.utcnow()
+            marked = self.session.execute(
+                update(NotificationModel).where(
+                    NotificationModel.user_id == user_id,
+                    NotificationModel.read_at.is_(None),
+                    NotificationModel.sent_at.isnot(None)
+                ).values(read_at=now, updated_at=now).execution_options(synchronize_session=False)
+            ).rowcount
+            self._bump_unread(user_id, -marked)
+            self._commit()
             return True
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error marking notifications as read: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
+    
+    def get_unread_count(self, user_id: int) -> int:
+        """Unread badge count: one primary-key read (the first read backfills the counter)"""
+        try:
+            # Column query: always read from the database, never a stale identity-map copy
+            counter = self.session.query(NotificationCounterModel.unread_count).filter(
+                NotificationCounterModel.user_id == user_id
+            )
+            count = counter.scalar()
+            if count is not None:
+                return count
+            count = self._create_counter(user_id)
+            self._commit()
+            return count if count is not None else counter.scalar()
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error getting unread notification count: {str(e)}')
+        finally:
+            self._release()
+    
+    def get_for_user_after(self, user_id: int, after_id: int, limit: int) -> List[Notification]:
+        """Notifications of a user with id > after_id, oldest first (stream catch-up)"""
+        try:
+            models = self.session.query(NotificationModel).filter(
+                NotificationModel.user_id == user_id,
+                NotificationModel.id > after_id
+            ).order_by(NotificationModel.id).limit(limit).all()
+            return [self._model_to_domain(model) for model in models]
+        except Exception as e:
+            raise ValueError(f'Error getting new notifications for user: {str(e)}')
+        finally:
+            self._release()
+    
+    def fingerprint_by_user_id(self, user_id: int) -> Tuple[int, Optional[datetime], Optional[int]]:
+        """(count, latest updated_at, highest id) of a user's notifications"""
+        return self.fingerprint(NotificationModel.user_id == user_id)
+    
+    @staticmethod
+    def _queued(channel: NotificationChannel):
+        """Criteria matching the rows of ix_notifications_outbox for a channel"""
+        return (
+            NotificationModel.channel == channel.value,
+            NotificationModel.sent_at.is_(None),
+            NotificationModel.failed_at.is_(None)
+        )
+    
+    def claim_pending(
+        self,
+        channel: NotificationChannel,
+        token: str,
+        limit: int,
+        lease_until: datetime
+    ) -> List[Notification]:
+        """
+        Claim up to limit due notifications of a channel, oldest due first.
+        Claimed rows get the token and are due again only at lease_until, so a
+        dispatcher that dies mid-batch has its rows picked up after the lease.
+        """
+        try:
+            now = datetime.utcnow()
+            due = self._queued(channel) + (NotificationModel.next_attempt_at <= now,)
+            ids = [
+                notification_id for (notification_id,) in self.session.query(NotificationModel.id).filter(*due)
+                .order_by(NotificationModel.next_attempt_at, NotificationModel.id)
+                .limit(min(limit, MAX_STATEMENT_PARAMS))
+            ]
+            if not ids:
+                return []
+            # Repeating the due criteria makes concurrent claims of the same rows exclusive;
+            # queue bookkeeping leaves updated_at (and so inbox ETags) alone
+            self.session.execute(
+                update(NotificationModel).where(NotificationModel.id.in_(ids), *due).values(
+                    claim_token=token,
+                    next_attempt_at=lease_until,
+                    updated_at=NotificationModel.updated_at
+                ).execution_options(synchronize_session=False)
+            )
+            models = self.session.query(NotificationModel).filter(
+                NotificationModel.id.in_(ids),
+                NotificationModel.claim_token == token
+            ).order_by(NotificationModel.id).populate_existing().all()
+            self._commit()
+            return [self._model_to_domain(model) for model in models]
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error claiming notifications: {str(e)}')
+        finally:
+            self._release()
+    
+    def mark_sent_many(self, notification_ids: List[int], token: str, sent_at: datetime) -> int:
+        """
+        Mark claimed notifications sent with one UPDATE, then add the ones
+        now unread to their users' counters, in the same transaction.
+        Rows whose lease expired and were claimed again are skipped.
+        """
+        if not notification_ids:
+            return 0
+        try:
+            mine = (NotificationModel.id.in_(notification_ids), NotificationModel.claim_token == token)
+            sent = self.session.execute(
+                update(NotificationModel).where(*mine, NotificationModel.sent_at.is_(None)).values(
+                    sent_at=sent_at,
+                    updated_at=sent_at,
+                    last_error=None
+                ).execution_options(synchronize_session=False)
+            ).rowcount
+            unread = self.session.query(NotificationModel.user_id, func.count(NotificationModel.id)).filter(
+                *mine,
+                NotificationModel.sent_at.isnot(None),
+                NotificationModel.read_at.is_(None)
+            ).group_by(NotificationModel.user_id).all()
+            self._bump_unread_many(dict(unread))
+            self._commit()
+            return sent
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error marking notifications as sent: {str(e)}')
+        finally:
+            self._release()
+    
+    def record_failures(self, notifications: List[Notification], token: str) -> int:
+        """Store the retry state of failed, claimed notifications (one executemany) and release them"""
+        if not notifications:
+            return 0
+        try:
+            table = NotificationModel.__table__
+            statement = update(table).where(
+                table.c.id == bindparam('notification_id'),
+                table.c.claim_token == token
+            ).values(
+                attempts=bindparam('new_attempts'),
+                next_attempt_at=bindparam('new_next_attempt_at'),
+                last_error=bindparam('new_last_error'),
+                failed_at=bindparam('new_failed_at'),
+                claim_token=None,
+                updated_at=table.c.updated_at
+            )
+            self.session.execute(statement, [
+                {
+                    'notification_id': notification.id,
+                    'new_attempts': notification.attempts,
+                    'new_next_attempt_at': notification.next_attempt_at,
+                    'new_last_error': (notification.last_error or '')[:500],
+                    'new_failed_at': notification.failed_at
+                }
+                for notification in notifications
+            ])
+            self._commit()
+            return len(notifications)
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error recording notification failures: {str(e)}')
+        finally:
+            self._release()
+    
+    def get_queue_stats(self) -> Dict[NotificationChannel, ChannelQueueStats]:
+        """Depth, due count and oldest creation time per channel, one grouped query over the queue index"""
+        try:
+            now = datetime.utcnow()
+            rows = self.session.query(
+                NotificationModel.channel,
+                func.count(NotificationModel.id),
+                func.sum(case((NotificationModel.next_attempt_at <= now, 1), else_=0)),
+                func.min(NotificationModel.created_at)
+            ).filter(
+                NotificationModel.sent_at.is_(None),
+                NotificationModel.failed_at.is_(None)
+            ).group_by(NotificationModel.channel).all()
+            stats = {channel: ChannelQueueStats(channel) for channel in NotificationChannel}
+            for channel, depth, due, oldest in rows:
+                channel = NOTIFICATION_CHANNEL(channel)
+                stats[channel] = ChannelQueueStats(channel, depth, int(due or 0), oldest)
+            return stats
+        except Exception as e:
+            raise ValueError(f'Error getting notification queue stats: {str(e)}')
+        finally:
+            self._release()
@@ -0,0 +1,39 @@
+import base64
+import json
+from datetime import datetime
+from typing import Mapping, Tuple, Union
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+    pass
+
+
+def encode_cursor(created_at: Union[datetime, str], id: int) -> str:
+    """Build an opaque cursor pointing just after the (created_at, id) row (created_at may be ISO already)"""
+    created_at = created_at if isinstance(created_at, str) else created_at.isoformat()
+    raw = json.dumps([created_at, id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(id)
+    except Exception:
+        raise InvalidCursorError('Invalid pagination cursor')
+
+
+def next_cursor(items: list, limit: int, attribute: str = 'created_at'):
+    """
+    Cursor for the page after `items` (sorted on `attribute`, id), or None when this was the last page.
+    Items are objects or, on the raw read path, dicts.
+    """
+    if not limit or len(items) < limit:
+        return None
+    last = items[-1]
+    if isinstance(last, Mapping):
+        return encode_cursor(last[attribute], last['id'])
+    return encode_cursor(getattr(last, attribute), last.id)
@@ -1,16 +1,35 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from datetime import datetime
 from sqlalchemy.orm import Session
 from domain.models.interfaces.ipayment_repository import IPaymentRepository
 from domain.models.payment import Payment, PaymentMethod, PaymentStatus
 from infrastructure.models.payment_model import PaymentModel
-from infrastructure.repositories.base_repository import BaseRepository
-from decimal import Decimal
+from infrastructure.repositories.base_repository import BaseRepository, BULK_CHUNK_SIZE
+from infrastructure.repositories.mapping import RowMapper, enum_lookup, to_decimal
+
+PAYMENT_METHOD = enum_lookup(PaymentMethod)
+PAYMENT_STATUS = enum_lookup(PaymentStatus)
 
 class PaymentRepository(BaseRepository[PaymentModel], IPaymentRepository):
     """
     Payment Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('booking_id',),                      # get_by_booking_id, payouts.get_payable_booking_rows (exists)
+        ('status', 'created_at', 'id'),       # get_by_status (keyset), iter_rows with statuses
+        ('created_at', 'id'),                 # iter_rows
+        ('provider_txn_id',),                 # get_by_provider_txn_id
+    ]
+    
+    # Columns of the raw read path (the fields of PaymentResponseSchema)
+    ROW_MAPPER = RowMapper([
+        PaymentModel.id, PaymentModel.booking_id, PaymentModel.method, PaymentModel.provider_txn_id,
+        PaymentModel.amount, PaymentModel.currency, PaymentModel.status,
+        PaymentModel.created_at, PaymentModel.updated_at
+    ])
+    
     def __init__(self, session: Session = None):
         super().__init__(PaymentModel, session)
     
@@ -22,11 +41,11 @@ class PaymentRepository(BaseRepository[PaymentModel], IPaymentRepository):
         return Payment(
             id=model.id,
             booking_id=model.booking_id,
-            method=PaymentMethod(model.method),
+            method=PAYMENT_METHOD(model.method),
             provider_txn_id=model.provider_txn_id,
-            amount=Decimal(str(model.amount)),
+            amount=to_decimal(model.amount),
             currency=model.currency,
-            status=PaymentStatus(model.status),
+            status=PAYMENT_STATUS(model.status),
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -64,12 +83,12 @@ class PaymentRepository(BaseRepository[PaymentModel], IPaymentRepository):
         except Exception as e:
             raise ValueError(f'Error getting payment by booking_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def update(self, payment: Payment) -> Payment:
         """Update payment"""
         try:
-            model = self.session.query(PaymentModel).filter_by(id=payment.id).first()
+            model = self.session.get(PaymentModel, payment.id)
             if not model:
                 raise ValueError(f'Payment with id {payment.id} not found')
             
@@ -80,28 +99,52 @@ class PaymentRepository(BaseRepository[PaymentModel], IPaymentRepository):
             model.status = payment.status.value
             model.updated_at = payment.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating payment: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, payment_id: int) -> bool:
         """Delete payment"""
         return super().delete(payment_id)
     
-    def get_by_status(self, status: PaymentStatus) -> List[Payment]:
+    def get_by_status(self, status: PaymentStatus, limit: Optional[int] = None, after: Optional[str] = None) -> List[Payment]:
         """Get payments by status"""
         try:
-            models = self.session.query(PaymentModel).filter_by(status=status.value).all()
+            query = self.session.query(PaymentModel).filter_by(status=status.value)
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting payments by status: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
+    
+    def get_rows_by_status(self, status: PaymentStatus, limit: Optional[int] = None,
+                           after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get payments by status as JSON-ready dicts, skipping entity and domain object construction"""
+        try:
+            query = self.session.query(*self.ROW_MAPPER.columns).filter(PaymentModel.status == status.value)
+            return self.ROW_MAPPER.many(self._keyset(query, limit, after))
+        except Exception as e:
+            raise ValueError(f'Error getting payment rows by status: {str(e)}')
+        finally:
+            self._release()
+    
+    def iter_rows(
+        self,
+        statuses: Optional[Iterable[PaymentStatus]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream payments (oldest first) as JSON-ready dicts; status and date filters run in SQL"""
+        criteria = self._created_between(created_from, created_to)
+        if statuses:
+            criteria.append(PaymentModel.status.in_([status.value for status in statuses]))
+        return self._stream_rows(self.ROW_MAPPER, *criteria, chunk_size=chunk_size)
     
     def get_by_provider_txn_id(self, provider_txn_id: str) -> Optional[Payment]:
         """Get payment by provider transaction ID"""
@@ -111,4 +154,4 @@ class PaymentRepository(BaseRepository[PaymentModel], IPaymentRepository):
         except Exception as e:
             raise ValueError(f'Error getting payment by provider_txn_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
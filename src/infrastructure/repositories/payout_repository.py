@@ -1,16 +1,46 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime
 from sqlalchemy.orm import Session
 from domain.models.interfaces.ipayout_repository import IPayoutRepository
-from domain.models.payout import Payout, PayoutStatus
+from domain.models.booking import BookingStatus
+from domain.models.payment import PaymentStatus
+from domain.models.payout import Payout, PayoutStatus, TutorEarnings
+from infrastructure.models.booking_model import BookingModel
+from infrastructure.models.payment_model import PaymentModel
 from infrastructure.models.payout_model import PayoutModel
-from infrastructure.repositories.base_repository import BaseRepository
+from infrastructure.repositories.base_repository import BaseRepository, BULK_CHUNK_SIZE
+from infrastructure.repositories.mapping import RowMapper, enum_lookup, to_decimal
 from decimal import Decimal
+from sqlalchemy import func
+
+# Keep IN lists well below the 2100 parameter limit of SQL Server
+IN_CLAUSE_CHUNK = 1000
+
+PAYOUT_STATUS = enum_lookup(PayoutStatus)
 
 class PayoutRepository(BaseRepository[PayoutModel], IPayoutRepository):
     """
     Payout Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('tutor_id', 'created_at', 'id'),     # get_by_tutor_id (keyset), fingerprint_by_tutor_id
+        ('booking_id', 'created_at', 'id'),   # get_by_booking_id (keyset)
+        ('status', 'created_at', 'id'),       # get_by_status (keyset), iter_rows with statuses
+        ('created_at', 'id'),                 # iter_rows
+        ('tutor_id', 'status'),               # earnings_summaries
+        ('booking_id',),                      # get_payable_booking_rows (anti-join)
+        ('batch_id', 'status', 'id'),         # transition_batch_status
+        ('idempotency_key',),                 # unique key of batch payouts
+    ]
+    
+    # Columns of the raw read path (the fields of PayoutResponseSchema)
+    ROW_MAPPER = RowMapper([
+        PayoutModel.id, PayoutModel.tutor_id, PayoutModel.booking_id, PayoutModel.amount,
+        PayoutModel.status, PayoutModel.batch_id, PayoutModel.created_at, PayoutModel.updated_at
+    ])
+    
     def __init__(self, session: Session = None):
         super().__init__(PayoutModel, session)
     
@@ -23,10 +53,12 @@ class PayoutRepository(BaseRepository[PayoutModel], IPayoutRepository):
             id=model.id,
             tutor_id=model.tutor_id,
             booking_id=model.booking_id,
-            amount=Decimal(str(model.amount)),
-            status=PayoutStatus(model.status.value) if hasattr(model.status, 'value') else PayoutStatus(model.status),
+            amount=to_decimal(model.amount),
+            status=PAYOUT_STATUS(model.status),
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            batch_id=model.batch_id,
+            idempotency_key=model.idempotency_key
         )
     
     def _domain_to_model(self, domain: Payout) -> PayoutModel:
@@ -38,7 +70,9 @@ class PayoutRepository(BaseRepository[PayoutModel], IPayoutRepository):
             amount=domain.amount,
             status=domain.status.value,
             created_at=domain.created_at,
-            updated_at=domain.updated_at
+            updated_at=domain.updated_at,
+            batch_id=domain.batch_id,
+            idempotency_key=domain.idempotency_key
         )
     
     def add(self, payout: Payout) -> Payout:
@@ -52,40 +86,71 @@ class PayoutRepository(BaseRepository[PayoutModel], IPayoutRepository):
         model = super().get_by_id(payout_id)
         return self._model_to_domain(model)
     
-    def get_by_tutor_id(self, tutor_id: int) -> List[Payout]:
+    def get_by_tutor_id(self, tutor_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Payout]:
         """Get all payouts for a tutor"""
         try:
-            models = self.session.query(PayoutModel).filter_by(tutor_id=tutor_id).all()
+            query = self.session.query(PayoutModel).filter_by(tutor_id=tutor_id)
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting payouts by tutor_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
+    
+    def fingerprint_by_tutor_id(self, tutor_id: int) -> Tuple[int, Optional[datetime], Optional[int]]:
+        """(count, latest updated_at, highest id) of a tutor's payouts"""
+        return self.fingerprint(PayoutModel.tutor_id == tutor_id)
     
-    def get_by_booking_id(self, booking_id: int) -> List[Payout]:
+    def get_by_booking_id(self, booking_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Payout]:
         """Get payouts for a booking"""
         try:
-            models = self.session.query(PayoutModel).filter_by(booking_id=booking_id).all()
+            query = self.session.query(PayoutModel).filter_by(booking_id=booking_id)
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting payouts by booking_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
-    def get_by_status(self, status: PayoutStatus) -> List[Payout]:
+    def get_by_status(self, status: PayoutStatus, limit: Optional[int] = None, after: Optional[str] = None) -> List[Payout]:
         """Get payouts by status"""
         try:
-            models = self.session.query(PayoutModel).filter_by(status=status.value).all()
+            query = self.session.query(PayoutModel).filter_by(status=status.value)
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting payouts by status: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
+    
+    def get_rows_by_status(self, status: PayoutStatus, limit: Optional[int] = None,
+                           after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get payouts by status as JSON-ready dicts, skipping entity and domain object construction"""
+        try:
+            query = self.session.query(*self.ROW_MAPPER.columns).filter(PayoutModel.status == status.value)
+            return self.ROW_MAPPER.many(self._keyset(query, limit, after))
+        except Exception as e:
+            raise ValueError(f'Error getting payout rows by status: {str(e)}')
+        finally:
+            self._release()
+    
+    def iter_rows(
+        self,
+        statuses: Optional[Iterable[PayoutStatus]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream payouts (oldest first) as JSON-ready dicts; status and date filters run in SQL"""
+        criteria = self._created_between(created_from, created_to)
+        if statuses:
+            criteria.append(PayoutModel.status.in_([status.value for status in statuses]))
+        return self._stream_rows(self.ROW_MAPPER, *criteria, chunk_size=chunk_size)
     
     def update(self, payout: Payout) -> Payout:
         """Update payout"""
         try:
-            model = self.session.query(PayoutModel).filter_by(id=payout.id).first()
+            model = self.session.get(PayoutModel, payout.id)
             if not model:
                 raise ValueError(f'Payout with id {payout.id} not found')
             
@@ -93,19 +158,136 @@ class PayoutRepository(BaseRepository[PayoutModel], IPayoutRepository):
             model.status = payout.status.value
             model.updated_at = payout.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating payout: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, payout_id: int) -> bool:
         """Delete payout"""
         return super().delete(payout_id)
     
-    def get_pending_payouts(self) -> List[Payout]:
+    def get_pending_payouts(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[Payout]:
         """Get all pending payouts"""
-        return self.get_by_status(PayoutStatus.PENDING)
+        return self.get_by_status(PayoutStatus.PENDING, limit, after)
+    
+    def earnings_summary(self, tutor_id: int) -> TutorEarnings:
+        """Get payout totals and counts by status for a tutor (one GROUP BY query)"""
+        return self.earnings_summaries([tutor_id])[tutor_id]
+    
+    def earnings_summaries(self, tutor_ids: List[int]) -> Dict[int, TutorEarnings]:
+        """Get payout totals and counts by status for many tutors"""
+        try:
+            tutor_ids = list(dict.fromkeys(tutor_ids))
+            summaries = {tutor_id: TutorEarnings(tutor_id) for tutor_id in tutor_ids}
+            for start in range(0, len(tutor_ids), IN_CLAUSE_CHUNK):
+                chunk = tutor_ids[start:start + IN_CLAUSE_CHUNK]
+                rows = self.session.query(
+                    PayoutModel.tutor_id,
+                    PayoutModel.status,
+                    func.sum(PayoutModel.amount),
+                    func.count(PayoutModel.id)
+                ).filter(
+                    PayoutModel.tutor_id.in_(chunk)
+                ).group_by(PayoutModel.tutor_id, PayoutModel.status).all()
+                
+                for tutor_id, status, total, count in rows:
+                    status = PAYOUT_STATUS(status)
+                    summary = summaries[tutor_id]
+                    summary.totals_by_status[status] = Decimal(total or 0)
+                    summary.counts_by_status[status] = count
+            return summaries
+        except Exception as e:
+            raise ValueError(f'Error getting earnings summary: {str(e)}')
+        finally:
+            self._release()
+    
+    def get_payable_booking_rows(
+        self,
+        after_booking_id: int = 0,
+        limit: int = BULK_CHUNK_SIZE,
+        completed_before: Optional[datetime] = None
+    ) -> List[Tuple[int, int, Decimal]]:
+        """
+        (booking_id, tutor_id, captured amount) of completed bookings with a
+        captured payment and no payout yet, in booking id order after after_booking_id.
+        Each booking is listed once; when a capture was recorded twice (a retried
+        capture) the largest captured amount is used, never their sum.
+        """
+        try:
+            has_payout = self.session.query(PayoutModel.id).filter(
+                PayoutModel.booking_id == BookingModel.id
+            ).exists()
+            captured = (
+                PaymentModel.booking_id == BookingModel.id,
+                PaymentModel.status == PaymentStatus.CAPTURED.value
+            )
+            captured_amount = self.session.query(
+                func.max(PaymentModel.amount)
+            ).filter(*captured).correlate(BookingModel).scalar_subquery()
+            query = self.session.query(
+                BookingModel.id, BookingModel.tutor_id, captured_amount
+            ).filter(
+                BookingModel.status == BookingStatus.COMPLETED.value,
+                BookingModel.id > after_booking_id,
+                self.session.query(PaymentModel.id).filter(*captured).exists(),
+                ~has_payout
+            )
+            if completed_before is not None:
+                query = query.filter(BookingModel.end_at < completed_before)
+            return [tuple(row) for row in query.order_by(BookingModel.id).limit(limit)]
+        except Exception as e:
+            raise ValueError(f'Error getting payable bookings: {str(e)}')
+        finally:
+            self._release()
+    
+    def add_batch(self, payouts: Iterable[Payout], chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        """Insert payouts with multi-row INSERTs (ids are not read back)"""
+        return self.add_many(
+            ({
+                'tutor_id': payout.tutor_id,
+                'booking_id': payout.booking_id,
+                'amount': payout.amount,
+                'status': payout.status.value,
+                'batch_id': payout.batch_id,
+                'idempotency_key': payout.idempotency_key,
+                'created_at': payout.created_at,
+                'updated_at': payout.updated_at
+            } for payout in payouts),
+            chunk_size
+        )
+    
+    def transition_batch_status(
+        self,
+        batch_id: str,
+        from_status: PayoutStatus,
+        to_status: PayoutStatus,
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> int:
+        """Move every payout of a batch from one status to another, one UPDATE per chunk"""
+        moved = 0
+        last_id = 0
+        while True:
+            try:
+                ids = [row[0] for row in self.session.query(PayoutModel.id).filter(
+                    PayoutModel.batch_id == batch_id,
+                    PayoutModel.status == from_status.value,
+                    PayoutModel.id > last_id
+                ).order_by(PayoutModel.id).limit(chunk_size)]
+            except Exception as e:
+                raise ValueError(f'Error getting payouts of batch {batch_id}: {str(e)}')
+            finally:
+                self._release()
+            if not ids:
+                return moved
+            # Re-check the status so a concurrent transition is not overwritten
+            moved += self.update_many(
+                {'status': to_status.value, 'updated_at': datetime.utcnow()},
+                PayoutModel.status == from_status.value,
+                ids=ids,
+                chunk_size=chunk_size
+            )
+            last_id = ids[-1]
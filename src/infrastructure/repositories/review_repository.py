@@ -1,16 +1,43 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 from domain.models.interfaces.ireview_repository import IReviewRepository
 from domain.models.review import Review
 from infrastructure.models.review_model import ReviewModel
+from infrastructure.models.tutor_profile_model import TutorProfileModel
 from infrastructure.repositories.base_repository import BaseRepository
-from sqlalchemy import func
+from infrastructure.cache.read_through import tutor_profile_cache
+from infrastructure.repositories.cached_repositories import invalidate_on_commit
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import case, func, update
+
+RATING_STARS = range(1, 6)
+# Profiles fixed per UPDATE batch during reconciliation
+RECONCILE_CHUNK = 500
+
+
+def _histogram_column(stars: int):
+    return getattr(TutorProfileModel, f'rating_{stars}_count')
+
+
+def _rating_avg(histogram: Dict[int, int]) -> Decimal:
+    count = sum(histogram.values())
+    if not count:
+        return Decimal('0.00')
+    total = sum(stars * n for stars, n in histogram.items())
+    return (Decimal(total) / count).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
 class ReviewRepository(BaseRepository[ReviewModel], IReviewRepository):
     """
     Review Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('booking_id',),                      # get_by_booking_id
+        ('tutor_id', 'created_at', 'id'),     # get_by_tutor_id (keyset), get_average_rating_for_tutor
+        ('student_id', 'created_at', 'id'),   # get_by_student_id (keyset)
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(ReviewModel, session)
     
@@ -43,11 +70,55 @@ class ReviewRepository(BaseRepository[ReviewModel], IReviewRepository):
             updated_at=domain.updated_at
         )
     
+    def _apply_rating_change(self, tutor_id: int, added: Optional[int] = None, removed: Optional[int] = None):
+        """
+        Adjust the tutor's rating histogram, count and average in one UPDATE.
+        Runs in the caller's transaction; every SET expression reads the
+        pre-update row, so concurrent reviews never overwrite each other.
+        """
+        if added == removed:
+            return
+
+        def delta(stars: int) -> int:
+            return (1 if stars == added else 0) - (1 if stars == removed else 0)
+
+        count_delta = (1 if added else 0) - (1 if removed else 0)
+        new_count = TutorProfileModel.rating_count + count_delta
+        new_total = sum(stars * (_histogram_column(stars) + delta(stars)) for stars in RATING_STARS)
+        values = {
+            _histogram_column(stars): _histogram_column(stars) + delta(stars)
+            for stars in RATING_STARS if delta(stars)
+        }
+        values[TutorProfileModel.rating_count] = new_count
+        values[TutorProfileModel.rating_avg] = case(
+            (new_count > 0, func.round(new_total * 1.0 / new_count, 2)),
+            else_=0
+        )
+        self.session.execute(
+            update(TutorProfileModel)
+            .where(TutorProfileModel.user_id == tutor_id)
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        # A profile already loaded in this session would otherwise keep the old numbers
+        profile = self.session.identity_map.get(self.session.identity_key(TutorProfileModel, tutor_id))
+        if profile is not None:
+            self.session.expire(profile)
+        invalidate_on_commit(self.session, lambda: tutor_profile_cache.invalidate(tutor_id))
+
     def add(self, review: Review) -> Review:
-        """Add a new review"""
-        model = self._domain_to_model(review)
-        saved_model = super().add(model)
-        return self._model_to_domain(saved_model)
+        """Add a new review and count it in the tutor's rating"""
+        try:
+            model = self._domain_to_model(review)
+            self.session.add(model)
+            self._apply_rating_change(model.tutor_id, added=model.rating)
+            self._commit()
+            return self._model_to_domain(model)
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error adding review: {str(e)}')
+        finally:
+            self._release()
     
     def get_by_id(self, review_id: int) -> Optional[Review]:
         """Get review by ID"""
@@ -62,58 +133,121 @@ class ReviewRepository(BaseRepository[ReviewModel], IReviewRepository):
         except Exception as e:
             raise ValueError(f'Error getting review by booking_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
-    def get_by_tutor_id(self, tutor_id: int) -> List[Review]:
+    def get_by_tutor_id(self, tutor_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Review]:
         """Get all reviews for a tutor"""
         try:
-            models = self.session.query(ReviewModel).filter_by(tutor_id=tutor_id).all()
+            query = self.session.query(ReviewModel).filter_by(tutor_id=tutor_id)
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting reviews by tutor_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
-    def get_by_student_id(self, student_id: int) -> List[Review]:
+    def get_by_student_id(self, student_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> List[Review]:
         """Get all reviews by a student"""
         try:
-            models = self.session.query(ReviewModel).filter_by(student_id=student_id).all()
+            query = self.session.query(ReviewModel).filter_by(student_id=student_id)
+            models = self._keyset(query, limit, after).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting reviews by student_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def update(self, review: Review) -> Review:
         """Update review"""
         try:
-            model = self.session.query(ReviewModel).filter_by(id=review.id).first()
+            model = self.session.get(ReviewModel, review.id)
             if not model:
                 raise ValueError(f'Review with id {review.id} not found')
             
+            self._apply_rating_change(model.tutor_id, added=review.rating, removed=model.rating)
             model.rating = review.rating
             model.comment = review.comment
             model.updated_at = review.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating review: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, review_id: int) -> bool:
-        """Delete review"""
-        return super().delete(review_id)
+        """Delete review and remove it from the tutor's rating"""
+        try:
+            model = self.session.get(ReviewModel, review_id)
+            if not model:
+                return False
+            
+            self._apply_rating_change(model.tutor_id, removed=model.rating)
+            self.session.delete(model)
+            self._commit()
+            return True
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error deleting review: {str(e)}')
+        finally:
+            self._release()
     
     def get_average_rating_for_tutor(self, tutor_id: int) -> float:
-        """Get average rating for a tutor"""
+        """Get average rating for a tutor (denormalized on the tutor profile)"""
         try:
-            result = self.session.query(func.avg(ReviewModel.rating)).filter_by(tutor_id=tutor_id).scalar()
+            result = self.session.query(TutorProfileModel.rating_avg).filter_by(user_id=tutor_id).scalar()
             return float(result) if result else 0.0
         except Exception as e:
             raise ValueError(f'Error getting average rating: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
+    
+    def reconcile_rating_aggregates(self, dry_run: bool = False) -> List[int]:
+        """
+        Recompute every tutor's rating histogram/count/average from the
+        reviews table and fix the profiles that drifted.
+        Returns the user_ids of the drifted profiles.
+        """
+        try:
+            actual = {}
+            rows = self.session.query(
+                ReviewModel.tutor_id, ReviewModel.rating, func.count(ReviewModel.id)
+            ).group_by(ReviewModel.tutor_id, ReviewModel.rating)
+            for tutor_id, rating, count in rows:
+                actual.setdefault(tutor_id, {stars: 0 for stars in RATING_STARS})[rating] = count
+            
+            empty = {stars: 0 for stars in RATING_STARS}
+            stored = self.session.query(
+                TutorProfileModel.user_id,
+                TutorProfileModel.rating_count,
+                TutorProfileModel.rating_avg,
+                *[_histogram_column(stars) for stars in RATING_STARS]
+            ).yield_per(RECONCILE_CHUNK)
+            
+            fixes = []
+            for user_id, rating_count, rating_avg, *counts in stored:
+                histogram = actual.get(user_id, empty)
+                expected_avg = _rating_avg(histogram)
+                if (list(counts) == [histogram[stars] for stars in RATING_STARS]
+                        and rating_count == sum(histogram.values())
+                        and Decimal(str(rating_avg or 0)) == expected_avg):
+                    continue
+                fix = {f'rating_{stars}_count': histogram[stars] for stars in RATING_STARS}
+                fix.update(user_id=user_id, rating_count=sum(histogram.values()), rating_avg=expected_avg)
+                fixes.append(fix)
+            
+            if not dry_run:
+                for start in range(0, len(fixes), RECONCILE_CHUNK):
+                    # ORM bulk UPDATE by primary key: one executemany per chunk
+                    self.session.execute(update(TutorProfileModel), fixes[start:start + RECONCILE_CHUNK])
+                self._commit()
+                if fixes:
+                    tutor_profile_cache.invalidate()
+            return [fix['user_id'] for fix in fixes]
+        except Exception as e:
+            self._rollback()
+            raise ValueError(f'Error reconciling rating aggregates: {str(e)}')
+        finally:
+            self._release()
@@ -4,13 +4,19 @@ from domain.models.interfaces.iservice_listing_repository import IServiceListing
 from domain.models.service_listing import ServiceListing
 from infrastructure.models.service_listing_model import ServiceListingModel
 from infrastructure.repositories.base_repository import BaseRepository
-from decimal import Decimal
+from infrastructure.repositories.mapping import to_decimal
 
 class ServiceListingRepository(BaseRepository[ServiceListingModel], IServiceListingRepository):
     """
     Service Listing Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('tutor_id', 'active'),               # get_by_tutor_id, get_active_listings_by_tutor
+        ('active',),                          # get_active_listings
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(ServiceListingModel, session)
     
@@ -24,7 +30,7 @@ class ServiceListingRepository(BaseRepository[ServiceListingModel], IServiceList
             tutor_id=model.tutor_id,
             title=model.title,
             description=model.description,
-            price_per_hour=Decimal(str(model.price_per_hour)),
+            price_per_hour=to_decimal(model.price_per_hour),
             active=model.active,
             created_at=model.created_at,
             updated_at=model.updated_at
@@ -62,7 +68,7 @@ class ServiceListingRepository(BaseRepository[ServiceListingModel], IServiceList
         except Exception as e:
             raise ValueError(f'Error getting service listings by tutor_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_active_listings(self) -> List[ServiceListing]:
         """Get all active service listings"""
@@ -72,7 +78,7 @@ class ServiceListingRepository(BaseRepository[ServiceListingModel], IServiceList
         except Exception as e:
             raise ValueError(f'Error getting active service listings: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_active_listings_by_tutor(self, tutor_id: int) -> List[ServiceListing]:
         """Get active service listings for a tutor"""
@@ -84,12 +90,12 @@ class ServiceListingRepository(BaseRepository[ServiceListingModel], IServiceList
         except Exception as e:
             raise ValueError(f'Error getting active listings by tutor: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def update(self, service_listing: ServiceListing) -> ServiceListing:
         """Update service listing"""
         try:
-            model = self.session.query(ServiceListingModel).filter_by(id=service_listing.id).first()
+            model = self.session.get(ServiceListingModel, service_listing.id)
             if not model:
                 raise ValueError(f'Service listing with id {service_listing.id} not found')
             
@@ -99,14 +105,13 @@ class ServiceListingRepository(BaseRepository[ServiceListingModel], IServiceList
             model.active = service_listing.active
             model.updated_at = service_listing.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating service listing: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, service_id: int) -> bool:
         """Delete service listing"""
@@ -122,4 +127,4 @@ class ServiceListingRepository(BaseRepository[ServiceListingModel], IServiceList
         except Exception as e:
             raise ValueError(f'Error searching service listings by title: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
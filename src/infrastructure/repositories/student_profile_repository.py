@@ -10,6 +10,11 @@ class StudentProfileRepository(BaseRepository[StudentProfileModel], IStudentProf
     Student Profile Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('user_id',),                         # get_by_user_id (primary key)
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(StudentProfileModel, session)
     
@@ -50,7 +55,7 @@ class StudentProfileRepository(BaseRepository[StudentProfileModel], IStudentProf
         except Exception as e:
             raise ValueError(f'Error getting student profile by user_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def update(self, student_profile: StudentProfile) -> StudentProfile:
         """Update student profile"""
@@ -63,14 +68,13 @@ class StudentProfileRepository(BaseRepository[StudentProfileModel], IStudentProf
             model.dob = student_profile.dob
             model.updated_at = student_profile.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating student profile: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, user_id: int) -> bool:
         """Delete student profile"""
@@ -80,13 +84,13 @@ class StudentProfileRepository(BaseRepository[StudentProfileModel], IStudentProf
                 return False
             
             self.session.delete(model)
-            self.session.commit()
+            self._commit()
             return True
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error deleting student profile: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def search_by_name(self, name: str) -> List[StudentProfile]:
         """Search student profiles by name"""
@@ -98,9 +102,9 @@ class StudentProfileRepository(BaseRepository[StudentProfileModel], IStudentProf
         except Exception as e:
             raise ValueError(f'Error searching student profiles by name: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
-    def get_all(self) -> List[StudentProfile]:
+    def get_all(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[StudentProfile]:
         """Get all student profiles"""
-        models = super().get_all()
+        models = super().get_all(limit, after)
         return [self._model_to_domain(model) for model in models]
@@ -2,7 +2,7 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 from infrastructure.repositories.base_repository import BaseRepository
 from infrastructure.models.student_profile_model import StudentProfileModel
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import get_session
 
 class StudentRepository(BaseRepository[StudentProfileModel]):
     """
@@ -10,8 +10,11 @@ class StudentRepository(BaseRepository[StudentProfileModel]):
     Example of how to use BaseRepository for other entities
     """
     
+    # Example finders only; the columns they use are not on student_profiles
+    QUERY_PATHS = []
+    
     def __init__(self, session: Session = None):
-        super().__init__(StudentProfileModel, session or session)
+        super().__init__(StudentProfileModel, session or get_session())
     
     def get_students_by_grade(self, grade: str) -> List[StudentProfileModel]:
         """Get students by grade level"""
@@ -30,7 +33,7 @@ class StudentRepository(BaseRepository[StudentProfileModel]):
         except Exception as e:
             raise ValueError(f'Error searching students by name: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_students_by_subject_interest(self, subject_id: int) -> List[StudentProfileModel]:
         """Get students interested in a specific subject"""
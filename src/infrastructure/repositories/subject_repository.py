@@ -4,12 +4,21 @@ from domain.models.interfaces.isubject_repository import ISubjectRepository
 from domain.models.subject import Subject, SubjectLevel
 from infrastructure.models.subject_model import SubjectModel
 from infrastructure.repositories.base_repository import BaseRepository
+from infrastructure.repositories.mapping import enum_lookup
+
+SUBJECT_LEVEL = enum_lookup(SubjectLevel)
 
 class SubjectRepository(BaseRepository[SubjectModel], ISubjectRepository):
     """
     Subject Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('name',),                            # get_by_name (unique)
+        ('level',),                           # get_by_level
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(SubjectModel, session)
     
@@ -18,13 +27,10 @@ class SubjectRepository(BaseRepository[SubjectModel], ISubjectRepository):
         if not model:
             return None
         
-        # Handle enum conversion - model.level might already be SubjectLevel enum
-        level = model.level if isinstance(model.level, SubjectLevel) else SubjectLevel(model.level)
-        
         return Subject(
             id=model.id,
             name=model.name,
-            level=level,
+            level=SUBJECT_LEVEL(model.level),
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -58,7 +64,7 @@ class SubjectRepository(BaseRepository[SubjectModel], ISubjectRepository):
         except Exception as e:
             raise ValueError(f'Error getting subject by name: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_level(self, level: SubjectLevel) -> List[Subject]:
         """Get subjects by level"""
@@ -68,17 +74,17 @@ class SubjectRepository(BaseRepository[SubjectModel], ISubjectRepository):
         except Exception as e:
             raise ValueError(f'Error getting subjects by level: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
-    def get_all(self) -> List[Subject]:
+    def get_all(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[Subject]:
         """Get all subjects"""
-        models = super().get_all()
+        models = super().get_all(limit, after)
         return [self._model_to_domain(model) for model in models]
     
     def update(self, subject: Subject) -> Subject:
         """Update subject"""
         try:
-            model = self.session.query(SubjectModel).filter_by(id=subject.id).first()
+            model = self.session.get(SubjectModel, subject.id)
             if not model:
                 raise ValueError(f'Subject with id {subject.id} not found')
             
@@ -86,14 +92,13 @@ class SubjectRepository(BaseRepository[SubjectModel], ISubjectRepository):
             model.level = subject.level.value
             model.updated_at = subject.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating subject: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, subject_id: int) -> bool:
         """Delete subject"""
@@ -109,4 +114,4 @@ class SubjectRepository(BaseRepository[SubjectModel], ISubjectRepository):
         except Exception as e:
             raise ValueError(f'Error searching subjects by name: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
@@ -9,7 +9,7 @@ from config import Config
 from sqlalchemy import Column, Integer, String, DateTime
 from infrastructure.databases.base import Base
 from infrastructure.models.todo_model import TodoModel
-from infrastructure.databases.mssql import session
+from infrastructure.databases.mssql import get_session
 from infrastructure.repositories.base_repository import BaseRepository
 
 load_dotenv()
@@ -19,8 +19,13 @@ class TodoRepository(BaseRepository[TodoModel], ITodoRepository):
     Todo Repository implementation inheriting from BaseRepository
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('status',),                          # get_todos_by_status
+    ]
+    
     def __init__(self, session: Session = None):
-        super().__init__(TodoModel, session or session)
+        super().__init__(TodoModel, session or get_session())
         self._todos = []
         self._id_counter = 1
 
@@ -1,16 +1,25 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from domain.models.interfaces.itutor_profile_repository import ITutorProfileRepository
 from domain.models.tutor_profile import TutorProfile, VerificationStatus
 from infrastructure.models.tutor_profile_model import TutorProfileModel
 from infrastructure.repositories.base_repository import BaseRepository
-from decimal import Decimal
+from infrastructure.repositories.mapping import enum_lookup, to_decimal
+
+VERIFICATION_STATUS = enum_lookup(VerificationStatus)
 
 class TutorProfileRepository(BaseRepository[TutorProfileModel], ITutorProfileRepository):
     """
     Tutor Profile Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('user_id',),                         # get_by_user_id (primary key)
+        ('verification_status',),             # get_by_verification_status
+        ('rating_avg',),                      # get_by_rating_range
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(TutorProfileModel, session)
     
@@ -24,10 +33,11 @@ class TutorProfileRepository(BaseRepository[TutorProfileModel], ITutorProfileRep
             full_name=model.full_name,
             bio=model.bio,
             years_experience=model.years_experience,
-            hourly_rate=Decimal(str(model.hourly_rate)),
-            verification_status=VerificationStatus(model.verification_status.value) if hasattr(model.verification_status, 'value') else VerificationStatus(model.verification_status),
+            hourly_rate=to_decimal(model.hourly_rate),
+            verification_status=VERIFICATION_STATUS(model.verification_status),
             rating_avg=float(model.rating_avg),
             rating_count=model.rating_count,
+            rating_histogram={stars: getattr(model, f'rating_{stars}_count') or 0 for stars in range(1, 6)},
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -43,6 +53,7 @@ class TutorProfileRepository(BaseRepository[TutorProfileModel], ITutorProfileRep
             verification_status=domain.verification_status.value,
             rating_avg=domain.rating_avg,
             rating_count=domain.rating_count,
+            **{f'rating_{stars}_count': domain.rating_histogram.get(stars, 0) for stars in range(1, 6)},
             created_at=domain.created_at,
             updated_at=domain.updated_at
         )
@@ -61,7 +72,7 @@ class TutorProfileRepository(BaseRepository[TutorProfileModel], ITutorProfileRep
         except Exception as e:
             raise ValueError(f'Error getting tutor profile by user_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def update(self, tutor_profile: TutorProfile) -> TutorProfile:
         """Update tutor profile"""
@@ -75,18 +86,16 @@ class TutorProfileRepository(BaseRepository[TutorProfileModel], ITutorProfileRep
             model.years_experience = tutor_profile.years_experience
             model.hourly_rate = tutor_profile.hourly_rate
             model.verification_status = tutor_profile.verification_status.value
-            model.rating_avg = tutor_profile.rating_avg
-            model.rating_count = tutor_profile.rating_count
+            # rating_* columns are owned by ReviewRepository and updated in place
             model.updated_at = tutor_profile.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating tutor profile: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, user_id: int) -> bool:
         """Delete tutor profile"""
@@ -96,13 +105,13 @@ class TutorProfileRepository(BaseRepository[TutorProfileModel], ITutorProfileRep
                 return False
             
             self.session.delete(model)
-            self.session.commit()
+            self._commit()
             return True
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error deleting tutor profile: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_verification_status(self, status: VerificationStatus) -> List[TutorProfile]:
         """Get tutor profiles by verification status"""
@@ -112,7 +121,7 @@ class TutorProfileRepository(BaseRepository[TutorProfileModel], ITutorProfileRep
         except Exception as e:
             raise ValueError(f'Error getting tutor profiles by verification status: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def search_by_name(self, name: str) -> List[TutorProfile]:
         """Search tutor profiles by name"""
@@ -124,21 +133,41 @@ class TutorProfileRepository(BaseRepository[TutorProfileModel], ITutorProfileRep
         except Exception as e:
             raise ValueError(f'Error searching tutor profiles by name: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_verified_tutors(self) -> List[TutorProfile]:
         """Get all verified tutors"""
         return self.get_by_verification_status(VerificationStatus.VERIFIED)
     
     def get_by_rating_range(self, min_rating: float, max_rating: float) -> List[TutorProfile]:
-        """Get tutors by rating range"""
+        """Get tutors by rating range, best rated first"""
         try:
             models = self.session.query(TutorProfileModel).filter(
                 TutorProfileModel.rating_avg >= min_rating,
                 TutorProfileModel.rating_avg <= max_rating
-            ).all()
+            ).order_by(TutorProfileModel.rating_avg.desc(), TutorProfileModel.rating_count.desc()).all()
             return [self._model_to_domain(model) for model in models]
         except Exception as e:
             raise ValueError(f'Error getting tutors by rating range: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
+    
+    def get_search_rows(self) -> List[Tuple]:
+        """
+        Column tuples for the search index, skipping domain mapping:
+        (user_id, full_name, bio, hourly_rate, verification_status, rating_avg, rating_count)
+        """
+        try:
+            return self.session.query(
+                TutorProfileModel.user_id,
+                TutorProfileModel.full_name,
+                TutorProfileModel.bio,
+                TutorProfileModel.hourly_rate,
+                TutorProfileModel.verification_status,
+                TutorProfileModel.rating_avg,
+                TutorProfileModel.rating_count
+            ).all()
+        except Exception as e:
+            raise ValueError(f'Error getting tutor search rows: {str(e)}')
+        finally:
+            self._release()
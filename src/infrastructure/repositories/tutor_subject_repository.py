@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from domain.models.interfaces.itutor_subject_repository import ITutorSubjectRepository
 from domain.models.tutor_subject import TutorSubject
 from infrastructure.models.tutor_subject_model import TutorSubjectModel
+from infrastructure.models.subject_model import SubjectModel
 from infrastructure.repositories.base_repository import BaseRepository
 
 class TutorSubjectRepository(BaseRepository[TutorSubjectModel], ITutorSubjectRepository):
@@ -10,6 +11,12 @@ class TutorSubjectRepository(BaseRepository[TutorSubjectModel], ITutorSubjectRep
     Tutor Subject Repository Implementation
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('tutor_id', 'subject_id'),           # get_by_tutor_id, get_by_tutor_and_subject (primary key)
+        ('subject_id',),                      # get_by_subject_id
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(TutorSubjectModel, session)
     
@@ -48,7 +55,7 @@ class TutorSubjectRepository(BaseRepository[TutorSubjectModel], ITutorSubjectRep
         except Exception as e:
             raise ValueError(f'Error getting tutor subjects by tutor_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_subject_id(self, subject_id: int) -> List[TutorSubject]:
         """Get all tutors for a subject"""
@@ -58,7 +65,7 @@ class TutorSubjectRepository(BaseRepository[TutorSubjectModel], ITutorSubjectRep
         except Exception as e:
             raise ValueError(f'Error getting tutor subjects by subject_id: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_tutor_and_subject(self, tutor_id: int, subject_id: int) -> Optional[TutorSubject]:
         """Get tutor subject by tutor and subject ID"""
@@ -70,7 +77,7 @@ class TutorSubjectRepository(BaseRepository[TutorSubjectModel], ITutorSubjectRep
         except Exception as e:
             raise ValueError(f'Error getting tutor subject by tutor and subject: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def update(self, tutor_subject: TutorSubject) -> TutorSubject:
         """Update tutor subject"""
@@ -84,14 +91,13 @@ class TutorSubjectRepository(BaseRepository[TutorSubjectModel], ITutorSubjectRep
             
             model.updated_at = tutor_subject.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating tutor subject: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, tutor_id: int, subject_id: int) -> bool:
         """Delete tutor subject"""
@@ -103,25 +109,28 @@ class TutorSubjectRepository(BaseRepository[TutorSubjectModel], ITutorSubjectRep
                 return False
             
             self.session.delete(model)
-            self.session.commit()
+            self._commit()
             return True
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error deleting tutor subject: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete_by_tutor_id(self, tutor_id: int) -> bool:
-        """Delete all subjects for a tutor"""
+        """Delete all subjects for a tutor (one DELETE statement)"""
+        self.delete_where(TutorSubjectModel.tutor_id == tutor_id)
+        return True
+    
+    def get_subject_level_rows(self) -> List[Tuple[int, int, str]]:
+        """(tutor_id, subject_id, subject level) for every tutor subject, in one join"""
         try:
-            models = self.session.query(TutorSubjectModel).filter_by(tutor_id=tutor_id).all()
-            for model in models:
-                self.session.delete(model)
-            
-            self.session.commit()
-            return True
+            return self.session.query(
+                TutorSubjectModel.tutor_id,
+                TutorSubjectModel.subject_id,
+                SubjectModel.level
+            ).join(SubjectModel, SubjectModel.id == TutorSubjectModel.subject_id).all()
         except Exception as e:
-            self.session.rollback()
-            raise ValueError(f'Error deleting tutor subjects: {str(e)}')
+            raise ValueError(f'Error getting tutor subject levels: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
@@ -4,12 +4,23 @@ from infrastructure.models.user_model import UserModel
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from infrastructure.repositories.base_repository import BaseRepository
+from infrastructure.repositories.mapping import enum_lookup
+
+USER_ROLE = enum_lookup(UserRole)
+USER_STATUS = enum_lookup(UserStatus)
 
 class UserRepository(BaseRepository[UserModel], IUserRepository):
     """
     User Repository implementation inheriting from BaseRepository
     """
     
+    # Index-backed lookup paths: leading index columns in order (see databases/index_check.py)
+    QUERY_PATHS = [
+        ('email',),                           # get_by_email (unique)
+        ('role',),                            # get_by_role
+        ('status',),                          # get_by_status
+    ]
+    
     def __init__(self, session: Session = None):
         super().__init__(UserModel, session)
     
@@ -22,8 +33,8 @@ class UserRepository(BaseRepository[UserModel], IUserRepository):
             id=model.id,
             email=model.email,
             password_hash=model.password_hash,
-            role=UserRole(model.role.value),
-            status=UserStatus(model.status.value),
+            role=USER_ROLE(model.role),
+            status=USER_STATUS(model.status),
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -63,17 +74,17 @@ class UserRepository(BaseRepository[UserModel], IUserRepository):
         except Exception as e:
             raise ValueError(f'Error getting user by email: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
-    def get_all(self) -> List[User]:
+    def get_all(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[User]:
         """Get all users"""
-        models = super().get_all()
+        models = super().get_all(limit, after)
         return [self._model_to_domain(model) for model in models]
     
     def update(self, user: User) -> User:
         """Update user"""
         try:
-            model = self.session.query(UserModel).filter_by(id=user.id).first()
+            model = self.session.get(UserModel, user.id)
             if not model:
                 raise ValueError(f'User with id {user.id} not found')
             
@@ -83,14 +94,13 @@ class UserRepository(BaseRepository[UserModel], IUserRepository):
             model.status = user.status.value
             model.updated_at = user.updated_at
             
-            self.session.commit()
-            self.session.refresh(model)
+            self._commit()
             return self._model_to_domain(model)
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             raise ValueError(f'Error updating user: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def delete(self, user_id: int) -> bool:
         """Delete user"""
@@ -112,7 +122,7 @@ class UserRepository(BaseRepository[UserModel], IUserRepository):
         except Exception as e:
             raise ValueError(f'Error getting users by role: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
     
     def get_by_status(self, status: UserStatus) -> List[User]:
         """Get users by status"""
@@ -122,7 +132,7 @@ class UserRepository(BaseRepository[UserModel], IUserRepository):
         except Exception as e:
             raise ValueError(f'Error getting users by status: {str(e)}')
         finally:
-            self.session.close()
+            self._release()
         return self.find_one_by(email=email) is not None
     
     def get_active_users(self) -> List[UserModel]:
@@ -0,0 +1,160 @@
+-- Composite indexes of the repository lookup paths (QUERY_PATHS of each
+-- repository; checked by python -m infrastructure.databases.index_check).
+-- Definitions are those of the current models, INCLUDE columns included.
+
+-- availability_slots
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_availability_slots_tutor_id_weekday' AND object_id = OBJECT_ID('dbo.availability_slots'))
+    CREATE INDEX ix_availability_slots_tutor_id_weekday ON availability_slots (tutor_id, weekday);
+GO
+
+-- bookings
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_bookings_start_at' AND object_id = OBJECT_ID('dbo.bookings'))
+    CREATE INDEX ix_bookings_start_at ON bookings (start_at, end_at);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_bookings_status_created_at' AND object_id = OBJECT_ID('dbo.bookings'))
+    CREATE INDEX ix_bookings_status_created_at ON bookings (status, created_at, id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_bookings_student_id_created_at' AND object_id = OBJECT_ID('dbo.bookings'))
+    CREATE INDEX ix_bookings_student_id_created_at ON bookings (student_id, created_at, id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_bookings_student_id_start_at' AND object_id = OBJECT_ID('dbo.bookings'))
+    CREATE INDEX ix_bookings_student_id_start_at ON bookings (student_id, start_at);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_bookings_tutor_id_created_at' AND object_id = OBJECT_ID('dbo.bookings'))
+    CREATE INDEX ix_bookings_tutor_id_created_at ON bookings (tutor_id, created_at, id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_bookings_tutor_id_start_at' AND object_id = OBJECT_ID('dbo.bookings'))
+    CREATE INDEX ix_bookings_tutor_id_start_at ON bookings (tutor_id, start_at, end_at);
+GO
+
+-- chat_threads
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_chat_threads_student_id_tutor_id' AND object_id = OBJECT_ID('dbo.chat_threads'))
+    CREATE INDEX ix_chat_threads_student_id_tutor_id ON chat_threads (student_id, tutor_id);
+GO
+
+-- complaints
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_complaints_against_user' AND object_id = OBJECT_ID('dbo.complaints'))
+    CREATE INDEX ix_complaints_against_user ON complaints (against_user);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_complaints_booking_id' AND object_id = OBJECT_ID('dbo.complaints'))
+    CREATE INDEX ix_complaints_booking_id ON complaints (booking_id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_complaints_raised_by_user' AND object_id = OBJECT_ID('dbo.complaints'))
+    CREATE INDEX ix_complaints_raised_by_user ON complaints (raised_by_user);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_complaints_status' AND object_id = OBJECT_ID('dbo.complaints'))
+    CREATE INDEX ix_complaints_status ON complaints (status);
+GO
+
+-- credentials
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_credentials_tutor_id_verified' AND object_id = OBJECT_ID('dbo.credentials'))
+    CREATE INDEX ix_credentials_tutor_id_verified ON credentials (tutor_id, verified);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_credentials_verified' AND object_id = OBJECT_ID('dbo.credentials'))
+    CREATE INDEX ix_credentials_verified ON credentials (verified);
+GO
+
+-- messages
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_messages_sender_id' AND object_id = OBJECT_ID('dbo.messages'))
+    CREATE INDEX ix_messages_sender_id ON messages (sender_id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_messages_thread_id_created_at' AND object_id = OBJECT_ID('dbo.messages'))
+    CREATE INDEX ix_messages_thread_id_created_at ON messages (thread_id, created_at);
+GO
+
+-- moderation_actions
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_moderation_actions_complaint_id_created_at' AND object_id = OBJECT_ID('dbo.moderation_actions'))
+    CREATE INDEX ix_moderation_actions_complaint_id_created_at ON moderation_actions (complaint_id, created_at);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_moderation_actions_moderator_id_created_at' AND object_id = OBJECT_ID('dbo.moderation_actions'))
+    CREATE INDEX ix_moderation_actions_moderator_id_created_at ON moderation_actions (moderator_id, created_at);
+GO
+
+-- notifications
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_notifications_channel_created_at' AND object_id = OBJECT_ID('dbo.notifications'))
+    CREATE INDEX ix_notifications_channel_created_at ON notifications (channel, created_at, id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_notifications_type_created_at' AND object_id = OBJECT_ID('dbo.notifications'))
+    CREATE INDEX ix_notifications_type_created_at ON notifications (type, created_at, id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_notifications_user_id_created_at' AND object_id = OBJECT_ID('dbo.notifications'))
+    CREATE INDEX ix_notifications_user_id_created_at ON notifications (user_id, created_at, id) INCLUDE (updated_at);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_notifications_user_id_read_at_created_at' AND object_id = OBJECT_ID('dbo.notifications'))
+    CREATE INDEX ix_notifications_user_id_read_at_created_at ON notifications (user_id, read_at, created_at);
+GO
+
+-- payments
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_payments_booking_id' AND object_id = OBJECT_ID('dbo.payments'))
+    CREATE INDEX ix_payments_booking_id ON payments (booking_id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_payments_provider_txn_id' AND object_id = OBJECT_ID('dbo.payments'))
+    CREATE INDEX ix_payments_provider_txn_id ON payments (provider_txn_id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_payments_status_created_at' AND object_id = OBJECT_ID('dbo.payments'))
+    CREATE INDEX ix_payments_status_created_at ON payments (status, created_at, id);
+GO
+
+-- payouts
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_payouts_booking_id_created_at' AND object_id = OBJECT_ID('dbo.payouts'))
+    CREATE INDEX ix_payouts_booking_id_created_at ON payouts (booking_id, created_at, id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_payouts_status_created_at' AND object_id = OBJECT_ID('dbo.payouts'))
+    CREATE INDEX ix_payouts_status_created_at ON payouts (status, created_at, id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_payouts_tutor_id_created_at' AND object_id = OBJECT_ID('dbo.payouts'))
+    CREATE INDEX ix_payouts_tutor_id_created_at ON payouts (tutor_id, created_at, id) INCLUDE (updated_at);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_payouts_tutor_id_status' AND object_id = OBJECT_ID('dbo.payouts'))
+    CREATE INDEX ix_payouts_tutor_id_status ON payouts (tutor_id, status) INCLUDE (amount);
+GO
+
+-- reviews
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_reviews_booking_id' AND object_id = OBJECT_ID('dbo.reviews'))
+    CREATE INDEX ix_reviews_booking_id ON reviews (booking_id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_reviews_student_id_created_at' AND object_id = OBJECT_ID('dbo.reviews'))
+    CREATE INDEX ix_reviews_student_id_created_at ON reviews (student_id, created_at, id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_reviews_tutor_id_created_at' AND object_id = OBJECT_ID('dbo.reviews'))
+    CREATE INDEX ix_reviews_tutor_id_created_at ON reviews (tutor_id, created_at, id) INCLUDE (rating);
+GO
+
+-- service_listings
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_service_listings_active' AND object_id = OBJECT_ID('dbo.service_listings'))
+    CREATE INDEX ix_service_listings_active ON service_listings (active);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_service_listings_tutor_id_active' AND object_id = OBJECT_ID('dbo.service_listings'))
+    CREATE INDEX ix_service_listings_tutor_id_active ON service_listings (tutor_id, active);
+GO
+
+-- subjects
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_subjects_level' AND object_id = OBJECT_ID('dbo.subjects'))
+    CREATE INDEX ix_subjects_level ON subjects (level);
+GO
+
+-- todos
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_todos_status' AND object_id = OBJECT_ID('dbo.todos'))
+    CREATE INDEX ix_todos_status ON todos (status);
+GO
+
+-- tutor_profiles
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_tutor_profiles_rating_avg' AND object_id = OBJECT_ID('dbo.tutor_profiles'))
+    CREATE INDEX ix_tutor_profiles_rating_avg ON tutor_profiles (rating_avg, rating_count);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_tutor_profiles_verification_status' AND object_id = OBJECT_ID('dbo.tutor_profiles'))
+    CREATE INDEX ix_tutor_profiles_verification_status ON tutor_profiles (verification_status);
+GO
+
+-- tutor_subjects
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_tutor_subjects_subject_id' AND object_id = OBJECT_ID('dbo.tutor_subjects'))
+    CREATE INDEX ix_tutor_subjects_subject_id ON tutor_subjects (subject_id);
+GO
+
+-- users
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_users_role' AND object_id = OBJECT_ID('dbo.users'))
+    CREATE INDEX ix_users_role ON users (role);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_users_status' AND object_id = OBJECT_ID('dbo.users'))
+    CREATE INDEX ix_users_status ON users (status);
+GO
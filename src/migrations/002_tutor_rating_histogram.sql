@@ -0,0 +1,28 @@
+-- Review histogram next to rating_avg/rating_count, maintained by
+-- ReviewRepository on every review write.
+
+IF COL_LENGTH('dbo.tutor_profiles', 'rating_1_count') IS NULL
+    ALTER TABLE tutor_profiles ADD rating_1_count INT NOT NULL CONSTRAINT df_tutor_profiles_rating_1_count DEFAULT (0);
+GO
+IF COL_LENGTH('dbo.tutor_profiles', 'rating_2_count') IS NULL
+    ALTER TABLE tutor_profiles ADD rating_2_count INT NOT NULL CONSTRAINT df_tutor_profiles_rating_2_count DEFAULT (0);
+GO
+IF COL_LENGTH('dbo.tutor_profiles', 'rating_3_count') IS NULL
+    ALTER TABLE tutor_profiles ADD rating_3_count INT NOT NULL CONSTRAINT df_tutor_profiles_rating_3_count DEFAULT (0);
+GO
+IF COL_LENGTH('dbo.tutor_profiles', 'rating_4_count') IS NULL
+    ALTER TABLE tutor_profiles ADD rating_4_count INT NOT NULL CONSTRAINT df_tutor_profiles_rating_4_count DEFAULT (0);
+GO
+IF COL_LENGTH('dbo.tutor_profiles', 'rating_5_count') IS NULL
+    ALTER TABLE tutor_profiles ADD rating_5_count INT NOT NULL CONSTRAINT df_tutor_profiles_rating_5_count DEFAULT (0);
+GO
+
+-- Fill from the reviews written so far (scripts/reconcile_ratings.py does
+-- the same, and also repairs rating_avg/rating_count)
+UPDATE tutor_profiles SET
+    rating_1_count = (SELECT COUNT(*) FROM reviews r WHERE r.tutor_id = tutor_profiles.user_id AND r.rating = 1),
+    rating_2_count = (SELECT COUNT(*) FROM reviews r WHERE r.tutor_id = tutor_profiles.user_id AND r.rating = 2),
+    rating_3_count = (SELECT COUNT(*) FROM reviews r WHERE r.tutor_id = tutor_profiles.user_id AND r.rating = 3),
+    rating_4_count = (SELECT COUNT(*) FROM reviews r WHERE r.tutor_id = tutor_profiles.user_id AND r.rating = 4),
+    rating_5_count = (SELECT COUNT(*) FROM reviews r WHERE r.tutor_id = tutor_profiles.user_id AND r.rating = 5);
+GO
@@ -0,0 +1,21 @@
+-- Payout runs: the run that created each payout, and a key that makes a
+-- rerun skip bookings already paid out (unique among keyed rows only).
+
+-- Filtered indexes need these (sqlcmd defaults QUOTED_IDENTIFIER to OFF)
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+GO
+
+IF COL_LENGTH('dbo.payouts', 'batch_id') IS NULL
+    ALTER TABLE payouts ADD batch_id VARCHAR(64) NULL;
+GO
+IF COL_LENGTH('dbo.payouts', 'idempotency_key') IS NULL
+    ALTER TABLE payouts ADD idempotency_key VARCHAR(64) NULL;
+GO
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_payouts_batch_id_status' AND object_id = OBJECT_ID('dbo.payouts'))
+    CREATE INDEX ix_payouts_batch_id_status ON payouts (batch_id, status, id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ux_payouts_idempotency_key' AND object_id = OBJECT_ID('dbo.payouts'))
+    CREATE UNIQUE INDEX ux_payouts_idempotency_key ON payouts (idempotency_key) WHERE idempotency_key IS NOT NULL;
+GO
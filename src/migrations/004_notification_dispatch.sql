@@ -0,0 +1,33 @@
+-- Delivery bookkeeping of the notification dispatcher
+-- (services/notification_dispatch_service.py).
+--
+-- Existing unsent notifications become due at once and are delivered by
+-- the next dispatcher run. To skip them instead, mark them failed:
+--     UPDATE notifications SET failed_at = GETUTCDATE(), last_error = 'before dispatch'
+--     WHERE sent_at IS NULL;
+
+-- Filtered indexes need these (sqlcmd defaults QUOTED_IDENTIFIER to OFF)
+SET ANSI_NULLS ON;
+SET QUOTED_IDENTIFIER ON;
+GO
+
+IF COL_LENGTH('dbo.notifications', 'attempts') IS NULL
+    ALTER TABLE notifications ADD attempts INT NOT NULL CONSTRAINT df_notifications_attempts DEFAULT (0);
+GO
+IF COL_LENGTH('dbo.notifications', 'next_attempt_at') IS NULL
+    ALTER TABLE notifications ADD next_attempt_at DATETIME NOT NULL CONSTRAINT df_notifications_next_attempt_at DEFAULT (GETUTCDATE());
+GO
+IF COL_LENGTH('dbo.notifications', 'claim_token') IS NULL
+    ALTER TABLE notifications ADD claim_token VARCHAR(32) NULL;
+GO
+IF COL_LENGTH('dbo.notifications', 'last_error') IS NULL
+    ALTER TABLE notifications ADD last_error VARCHAR(500) NULL;
+GO
+IF COL_LENGTH('dbo.notifications', 'failed_at') IS NULL
+    ALTER TABLE notifications ADD failed_at DATETIME NULL;
+GO
+
+-- Dispatch queue: only notifications still waiting to be delivered
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_notifications_outbox' AND object_id = OBJECT_ID('dbo.notifications'))
+    CREATE INDEX ix_notifications_outbox ON notifications (channel, next_attempt_at, id) INCLUDE (created_at) WHERE sent_at IS NULL AND failed_at IS NULL;
+GO
@@ -0,0 +1,5 @@
+-- Stream catch-up reads a user's messages past a cursor id, per thread.
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_messages_thread_id_id' AND object_id = OBJECT_ID('dbo.messages'))
+    CREATE INDEX ix_messages_thread_id_id ON messages (thread_id, id);
+GO
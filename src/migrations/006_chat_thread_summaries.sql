@@ -0,0 +1,50 @@
+-- Chat thread summaries: last message, unread counts and read positions,
+-- kept current by MessageRepository in the message's transaction.
+--
+-- Then fill them from the messages written so far:
+--     python -m scripts.rebuild_chat_summaries
+
+IF COL_LENGTH('dbo.chat_threads', 'last_message_id') IS NULL
+    ALTER TABLE chat_threads ADD last_message_id INT NULL;
+GO
+IF COL_LENGTH('dbo.chat_threads', 'last_message_at') IS NULL
+    ALTER TABLE chat_threads ADD last_message_at DATETIME NULL;
+GO
+IF COL_LENGTH('dbo.chat_threads', 'last_sender_id') IS NULL
+    ALTER TABLE chat_threads ADD last_sender_id INT NULL;
+GO
+IF COL_LENGTH('dbo.chat_threads', 'last_message_snippet') IS NULL
+    ALTER TABLE chat_threads ADD last_message_snippet VARCHAR(200) NULL;
+GO
+IF COL_LENGTH('dbo.chat_threads', 'last_activity_at') IS NULL
+    ALTER TABLE chat_threads ADD last_activity_at DATETIME NOT NULL CONSTRAINT df_chat_threads_last_activity_at DEFAULT (GETUTCDATE());
+GO
+IF COL_LENGTH('dbo.chat_threads', 'student_unread_count') IS NULL
+    ALTER TABLE chat_threads ADD student_unread_count INT NOT NULL CONSTRAINT df_chat_threads_student_unread_count DEFAULT (0);
+GO
+IF COL_LENGTH('dbo.chat_threads', 'tutor_unread_count') IS NULL
+    ALTER TABLE chat_threads ADD tutor_unread_count INT NOT NULL CONSTRAINT df_chat_threads_tutor_unread_count DEFAULT (0);
+GO
+IF COL_LENGTH('dbo.chat_threads', 'student_last_read_id') IS NULL
+    ALTER TABLE chat_threads ADD student_last_read_id INT NULL;
+GO
+IF COL_LENGTH('dbo.chat_threads', 'tutor_last_read_id') IS NULL
+    ALTER TABLE chat_threads ADD tutor_last_read_id INT NULL;
+GO
+
+-- Threads without messages are ordered by creation (the rebuild job moves
+-- threads with messages to their last message)
+UPDATE chat_threads SET last_activity_at = created_at WHERE last_message_id IS NULL;
+GO
+
+-- Inbox of either participant, most recently active first. The tutor one
+-- replaces the plain tutor_id index.
+IF EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_chat_threads_tutor_id' AND object_id = OBJECT_ID('dbo.chat_threads'))
+    DROP INDEX ix_chat_threads_tutor_id ON chat_threads;
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_chat_threads_student_id_last_activity_at' AND object_id = OBJECT_ID('dbo.chat_threads'))
+    CREATE INDEX ix_chat_threads_student_id_last_activity_at ON chat_threads (student_id, last_activity_at, id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_chat_threads_tutor_id_last_activity_at' AND object_id = OBJECT_ID('dbo.chat_threads'))
+    CREATE INDEX ix_chat_threads_tutor_id_last_activity_at ON chat_threads (tutor_id, last_activity_at, id);
+GO
@@ -0,0 +1,11 @@
+-- Exports scan whole tables in (created_at, id) order, in keyset pages.
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_bookings_created_at' AND object_id = OBJECT_ID('dbo.bookings'))
+    CREATE INDEX ix_bookings_created_at ON bookings (created_at, id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_payments_created_at' AND object_id = OBJECT_ID('dbo.payments'))
+    CREATE INDEX ix_payments_created_at ON payments (created_at, id);
+GO
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'ix_payouts_created_at' AND object_id = OBJECT_ID('dbo.payouts'))
+    CREATE INDEX ix_payouts_created_at ON payouts (created_at, id);
+GO
@@ -0,0 +1,129 @@
+"""
+Measure the availability index on a synthetic tutor population.
+
+Builds an AvailabilityIndex in memory (no database) from random weekly
+slots in several timezones and random blocking bookings, then times:
+
+    build                  slots + bookings -> free/busy arrays (what a rebuild costs)
+    week grid              free_grid: hourly windows for a full week, all tutors at once
+    week, per window       the same week as one free_tutors call per window (the loop it replaces)
+    free tutors            free_tutors for one window and subject
+    batched are_free       are_free for --checks random (tutor, window) pairs
+    next free windows      next_free_windows of one tutor
+
+The week grid is checked against is_free (one tutor and window at a
+time) on a sample before anything is timed. Run from src/:
+
+    python -m scripts.benchmark_availability [--tutors 100000] [--bookings 50000] [--repeat 5]
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, time as clock_time, timedelta
+
+import numpy as np
+
+from domain.models.availability_slot import Weekday
+from services.availability_service import AvailabilityIndex
+
+TIMEZONES = ('UTC', 'Asia/Ho_Chi_Minh', 'Europe/London', 'America/New_York')
+HORIZON_DAYS = 28
+SUBJECTS = 200
+
+
+def synthetic_rows(tutors: int, slots_per_tutor: int, bookings: int, origin: datetime):
+    """(slot_rows, booking_rows, subject_rows) shaped like the repositories' raw rows"""
+    rng = random.Random(2)
+    weekdays = [weekday.value for weekday in Weekday]
+    slots = []
+    for tutor in range(tutors):
+        zone = rng.choice(TIMEZONES)
+        for _ in range(slots_per_tutor):
+            hour = rng.randint(6, 18)
+            end = min(hour + rng.randint(1, 5), 23)
+            slots.append((tutor, rng.choice(weekdays), clock_time(hour), clock_time(end), zone))
+    booking_rows = []
+    for _ in range(bookings):
+        start = origin + timedelta(days=rng.randint(0, HORIZON_DAYS - 1), hours=rng.randint(0, 23))
+        booking_rows.append((rng.randrange(tutors), start, start + timedelta(hours=1)))
+    subjects = [(tutor, rng.randint(1, SUBJECTS), 'K12') for tutor in range(tutors) for _ in range(3)]
+    return slots, booking_rows, subjects
+
+
+def best_of(repeat: int, run) -> float:
+    """Fastest of `repeat` runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def check_grid(index: AvailabilityIndex, grid_start: datetime, samples: int = 2000) -> bool:
+    """free_grid agrees with is_free on random (tutor, window) cells"""
+    tutor_ids, matrix = index.free_grid(grid_start, 60, 168, 60)
+    if not len(tutor_ids):
+        return True
+    rng = random.Random(3)
+    for _ in range(samples):
+        row, window = rng.randrange(len(tutor_ids)), rng.randrange(168)
+        start = grid_start + timedelta(hours=window)
+        if index.is_free(int(tutor_ids[row]), start, start + timedelta(hours=1)) != bool(matrix[row, window]):
+            return False
+    return True
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the availability index')
+    parser.add_argument('--tutors', type=int, default=100000, help='tutors in the index')
+    parser.add_argument('--slots', type=int, default=3, help='weekly slots per tutor')
+    parser.add_argument('--bookings', type=int, default=50000, help='blocking bookings in the horizon')
+    parser.add_argument('--checks', type=int, default=10000, help='pairs per batched are_free call')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per measurement (best is reported)')
+    args = parser.parse_args(argv)
+
+    origin = datetime.utcnow().replace(second=0, microsecond=0)
+    slots, bookings, subjects = synthetic_rows(args.tutors, args.slots, args.bookings, origin)
+
+    def build():
+        return AvailabilityIndex(slots, bookings, subjects, origin, HORIZON_DAYS)
+
+    index = build()
+    # A full week starting on the next midnight, hourly
+    week_start = (origin + timedelta(days=1)).replace(hour=0, minute=0)
+    if not check_grid(index, week_start):
+        print('free_grid disagrees with is_free', file=sys.stderr)
+        return 1
+
+    rng = np.random.default_rng(4)
+    pair_tutors = rng.integers(0, args.tutors, args.checks)
+    pair_starts = [origin + timedelta(minutes=int(m)) for m in rng.integers(0, (HORIZON_DAYS - 1) * 1440, args.checks)]
+    pair_ends = [start + timedelta(hours=1) for start in pair_starts]
+    one_window = week_start + timedelta(days=1, hours=10)
+
+    def week_per_window():
+        for hour in range(168):
+            start = week_start + timedelta(hours=hour)
+            index.free_tutors(start, start + timedelta(hours=1))
+
+    measurements = [
+        ('build', max(1, args.repeat // 2), build),
+        ('week grid', args.repeat, lambda: index.free_grid(week_start, 60, 168, 60)),
+        ('week, per window', args.repeat, week_per_window),
+        ('free tutors', args.repeat, lambda: index.free_tutors(one_window, one_window + timedelta(hours=1), 5)),
+        (f'batched are_free ({args.checks})', args.repeat, lambda: index.are_free(pair_tutors, pair_starts, pair_ends)),
+        ('next free windows', args.repeat, lambda: index.next_free_windows(7, origin, 5, 60)),
+    ]
+
+    print(f'{args.tutors} tutors, {len(slots)} slots, {len(bookings)} bookings, '
+          f'{HORIZON_DAYS}-day horizon, best of {args.repeat}')
+    print(f'{"":<30}{"ms":>10}')
+    for name, repeat, run in measurements:
+        print(f'  {name:<28}{best_of(repeat, run) * 1000:>10.2f}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Measure rows/sec of the payment read paths, before and after the fast mappers.
+
+Seeds an in-memory SQLite database (the configured database is not
+touched) and times, per path, loading a list of payments and turning it
+into JSON-ready data:
+
+    legacy mapper   ORM entities, Decimal(str()) and Enum() per row, schema dump
+    domain mapper   ORM entities, PaymentRepository._model_to_domain, schema dump
+    raw rows        column query + RowMapper (what GET /payments/status/<s> uses)
+
+plus the mapping step alone on already loaded entities. Run from src/:
+
+    python -m scripts.benchmark_mappers [--rows 20000] [--repeat 5]
+"""
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import infrastructure.databases  # noqa: F401  (registers every model on Base.metadata)
+from infrastructure.databases.base import Base
+from infrastructure.models.payment_model import PaymentModel
+from infrastructure.repositories.payment_repository import PaymentRepository
+from domain.models.payment import Payment, PaymentMethod, PaymentStatus
+from api.schemas.payment import PaymentResponseSchema
+
+
+def legacy_model_to_domain(model: PaymentModel) -> Payment:
+    """The mapper as it was: string round trip for Decimals, Enum() call per value"""
+    return Payment(
+        id=model.id,
+        booking_id=model.booking_id,
+        method=PaymentMethod(model.method.value) if hasattr(model.method, 'value') else PaymentMethod(model.method),
+        provider_txn_id=model.provider_txn_id,
+        amount=Decimal(str(model.amount)),
+        currency=model.currency,
+        status=PaymentStatus(model.status.value) if hasattr(model.status, 'value') else PaymentStatus(model.status),
+        created_at=model.created_at,
+        updated_at=model.updated_at
+    )
+
+
+def seed(session: Session, rows: int):
+    now = datetime.utcnow()
+    session.execute(insert(PaymentModel), [
+        {
+            'booking_id': i, 'method': 'Card', 'provider_txn_id': f'txn-{i}',
+            'amount': Decimal('25.50') + i % 100, 'currency': 'USD', 'status': 'Captured',
+            'created_at': now - timedelta(seconds=i), 'updated_at': now
+        }
+        for i in range(1, rows + 1)
+    ])
+    session.commit()
+
+
+def best_of(repeat: int, run) -> float:
+    """Fastest of `repeat` runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark repository mappers and the raw rows path')
+    parser.add_argument('--rows', type=int, default=20000, help='payments to load per run')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per path (best is reported)')
+    args = parser.parse_args(argv)
+
+    engine = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+    Base.metadata.create_all(engine, tables=[PaymentModel.__table__])
+    session = Session(engine, expire_on_commit=False)
+    seed(session, args.rows)
+
+    repository = PaymentRepository(session)
+    schema = PaymentResponseSchema()
+    status = PaymentStatus.CAPTURED
+
+    def entities():
+        session.expunge_all()
+        return session.query(PaymentModel).filter(PaymentModel.status == status.value).all()
+
+    paths = [
+        ('legacy mapper', lambda: schema.dump([legacy_model_to_domain(m) for m in entities()], many=True)),
+        ('domain mapper', lambda: schema.dump([repository._model_to_domain(m) for m in entities()], many=True)),
+        ('raw rows', lambda: repository.get_rows_by_status(status)),
+    ]
+    loaded = entities()
+    mapping_only = [
+        ('legacy mapper', lambda: [legacy_model_to_domain(m) for m in loaded]),
+        ('domain mapper', lambda: [repository._model_to_domain(m) for m in loaded]),
+    ]
+
+    print(f'{args.rows} payments, best of {args.repeat}')
+    print(f'{"query + map + serialize":<28}{"rows/sec":>14}')
+    for name, run in paths:
+        print(f'  {name:<26}{args.rows / best_of(args.repeat, run):>14,.0f}')
+    print(f'{"map loaded entities only":<28}{"rows/sec":>14}')
+    for name, run in mapping_only:
+        print(f'  {name:<26}{args.rows / best_of(args.repeat, run):>14,.0f}')
+    session.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
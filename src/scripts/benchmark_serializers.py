@@ -0,0 +1,103 @@
+"""
+Measure response serialization of payment and payout lists, before and after
+the compiled serializers and the fast JSON provider.
+
+Builds domain objects in memory (no database) and times, per payload:
+
+    marshmallow + stdlib   Schema.dump, then Flask's default provider (jsonify as it was)
+    compiled + fast json   compile_schema(...).dump, then FastJSONProvider
+
+plus the dump and encode steps alone. Both paths are checked to produce
+the same JSON before anything is timed. Run from src/:
+
+    python -m scripts.benchmark_serializers [--items 10000] [--repeat 5]
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from api import json_provider
+from api.json_provider import FastJSONProvider
+from api.schemas.payment import PaymentResponseSchema
+from api.schemas.payout import PayoutResponseSchema
+from api.serializers import compile_schema
+from domain.models.payment import Payment, PaymentMethod, PaymentStatus
+from domain.models.payout import Payout, PayoutStatus
+
+
+def payments(items: int):
+    now = datetime.utcnow()
+    return [
+        Payment(
+            id=i, booking_id=i, method=PaymentMethod.CARD, provider_txn_id=f'txn-{i}',
+            amount=Decimal('25.50') + i % 100, currency='USD', status=PaymentStatus.CAPTURED,
+            created_at=now - timedelta(seconds=i), updated_at=now
+        )
+        for i in range(1, items + 1)
+    ]
+
+
+def payouts(items: int):
+    now = datetime.utcnow()
+    return [
+        Payout(
+            id=i, tutor_id=i % 50, booking_id=i, amount=Decimal('20.40') + i % 100,
+            status=PayoutStatus.PENDING, batch_id=None if i % 3 else f'batch-{i // 3}',
+            created_at=now - timedelta(seconds=i), updated_at=now
+        )
+        for i in range(1, items + 1)
+    ]
+
+
+def best_of(repeat: int, run) -> float:
+    """Fastest of `repeat` runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark response serialization')
+    parser.add_argument('--items', type=int, default=10000, help='objects per payload')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per path (best is reported)')
+    args = parser.parse_args(argv)
+
+    app = Flask(__name__)
+    stdlib, fast = DefaultJSONProvider(app), FastJSONProvider(app)
+    encoder = 'orjson' if json_provider.orjson is not None else 'stdlib json (orjson not installed)'
+    print(f'{args.items} items per payload, best of {args.repeat}, fast provider on {encoder}')
+
+    for label, schema_cls, objects in (('payments', PaymentResponseSchema, payments(args.items)),
+                                       ('payouts', PayoutResponseSchema, payouts(args.items))):
+        schema, serializer = schema_cls(), compile_schema(schema_cls)
+        dumped, compiled = schema.dump(objects, many=True), serializer.dump(objects, many=True)
+        if json.loads(stdlib.dumps(dumped)) != json.loads(fast.dumps_bytes(compiled)):
+            print(f'{label}: compiled output differs from Schema.dump', file=sys.stderr)
+            return 1
+
+        paths = [
+            ('marshmallow + stdlib', lambda: stdlib.dumps(schema.dump(objects, many=True))),
+            ('compiled + fast json', lambda: fast.dumps_bytes(serializer.dump(objects, many=True))),
+            ('  Schema.dump only', lambda: schema.dump(objects, many=True)),
+            ('  compiled dump only', lambda: serializer.dump(objects, many=True)),
+            ('  stdlib encode only', lambda: stdlib.dumps(dumped)),
+            ('  fast encode only', lambda: fast.dumps_bytes(compiled)),
+        ]
+        print(f'{label:<28}{"ms":>10}{"items/sec":>14}')
+        for name, run in paths:
+            seconds = best_of(args.repeat, run)
+            print(f'  {name:<26}{seconds * 1000:>10.1f}{args.items / seconds:>14,.0f}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
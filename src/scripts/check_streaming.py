@@ -0,0 +1,80 @@
+"""
+Regression check: streamed responses go out as they are produced, with the
+full after_request chain (access log, compression, metrics) in place.
+
+Builds an app on a throwaway SQLite database and checks that
+
+    GET /stream/events      yields its first chunk right away (not after STREAM_MAX_SECONDS)
+    GET /exports/payments   is sent without a Content-Length (not buffered in memory)
+
+Run from src/:
+
+    python -m scripts.check_streaming
+"""
+import os
+import sys
+import tempfile
+import threading
+
+# Before the config and engine are imported
+_database = os.path.join(tempfile.mkdtemp(), 'check_streaming.db')
+os.environ['DATABASE_URI'] = f'sqlite:///{_database}'
+os.environ['ACCESS_LOG_ENABLED'] = 'True'
+os.environ['ACCESS_LOG_SAMPLE_RATE'] = '1'
+os.environ.setdefault('STREAM_MAX_SECONDS', '30')
+
+from flask import Flask  # noqa: E402
+
+from api.middleware import middleware  # noqa: E402
+from api.controllers.stream_controller import bp as stream_bp  # noqa: E402
+from api.controllers.exports_controller import bp as exports_bp  # noqa: E402
+from infrastructure.databases import init_db  # noqa: E402
+
+FIRST_CHUNK_TIMEOUT = 5  # seconds
+
+
+def build_app() -> Flask:
+    app = Flask(__name__)
+    app.register_blueprint(stream_bp)
+    app.register_blueprint(exports_bp)
+    init_db(app)
+    middleware(app)
+    return app
+
+
+def first_chunk(client, path: str):
+    """First body chunk of a streamed GET, or None when none arrives in time"""
+    result = {}
+
+    def read():
+        response = client.get(path, buffered=False)
+        result['chunk'] = next(iter(response.response), None)
+        response.close()
+
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    reader.join(FIRST_CHUNK_TIMEOUT)
+    return result.get('chunk')
+
+
+def main() -> int:
+    client = build_app().test_client()
+    failures = []
+
+    if first_chunk(client, '/stream/events?user_id=1') is None:
+        failures.append(f'/stream/events sent nothing within {FIRST_CHUNK_TIMEOUT}s')
+
+    response = client.get('/exports/payments', buffered=False)
+    if not response.is_streamed or 'Content-Length' in response.headers:
+        failures.append('/exports/payments was buffered before sending (Content-Length set)')
+    response.close()
+
+    for failure in failures:
+        print(f'FAIL {failure}', file=sys.stderr)
+    if not failures:
+        print('OK streamed responses are not buffered')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,25 @@
+"""
+Recompute the chat thread summaries (last message, unread counts) from the
+messages table.
+
+Message writes keep chat_threads.last_message_* and the unread counters
+current; this job fills them for threads written before the columns
+existed and repairs drift. Threads nobody marked read yet count as read
+up to their current last message. Run from src/:
+
+    python -m scripts.rebuild_chat_summaries
+"""
+import sys
+
+from infrastructure.repositories.chat_thread_repository import ChatThreadRepository
+
+
+def main(argv=None) -> int:
+    # No session passed: the repository opens and closes its own
+    rebuilt = ChatThreadRepository().rebuild_summaries()
+    print(f'rebuilt summaries of {rebuilt} thread(s) with messages')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
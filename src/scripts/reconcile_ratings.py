@@ -0,0 +1,32 @@
+"""
+Recompute denormalized tutor rating aggregates from the reviews table.
+
+Review writes keep tutor_profiles.rating_* current incrementally; this job
+repairs rows that drifted (manual SQL edits, rows written before the columns
+existed). Run from src/:
+
+    python -m scripts.reconcile_ratings [--dry-run]
+"""
+import argparse
+import sys
+
+from infrastructure.repositories.review_repository import ReviewRepository
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Reconcile tutor rating aggregates')
+    parser.add_argument('--dry-run', action='store_true', help='only report drifted tutors')
+    args = parser.parse_args(argv)
+
+    # No session passed: the repository opens and closes its own
+    drifted = ReviewRepository().reconcile_rating_aggregates(dry_run=args.dry_run)
+
+    action = 'would fix' if args.dry_run else 'fixed'
+    print(f'{action} rating aggregates of {len(drifted)} tutor(s)')
+    for tutor_id in drifted:
+        print(f'  tutor {tutor_id}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Deliver queued notifications (Email/SMS/Push, and InApp ones stored unsent).
+Run from src/:
+
+    python -m scripts.run_notification_dispatcher [--channel Email ...] [--drain]
+
+Without --drain it polls until interrupted, logging queue depth and
+delivery metrics every --stats-interval seconds. Several dispatchers may
+run side by side: batches are claimed with a lease, so each notification
+is delivered by one of them (again only if its dispatcher dies mid-batch).
+"""
+import argparse
+import json
+import logging
+import sys
+import threading
+
+from config import get_config
+from domain.models.notification import NotificationChannel
+from infrastructure.notifications import build_senders
+from infrastructure.repositories.notification_repository import NotificationRepository
+from services.notification_dispatch_service import NotificationDispatchService
+
+logger = logging.getLogger('notification_dispatcher')
+
+
+def log_stats(service: NotificationDispatchService):
+    queues = {
+        channel.value: {'depth': stats.depth, 'due': stats.due, 'oldest_age_seconds': round(stats.oldest_age_seconds(), 3)}
+        for channel, stats in service.queue_stats().items()
+    }
+    logger.info('queue %s delivery %s', json.dumps(queues), json.dumps(service.metrics.snapshot()))
+
+
+def main(argv=None) -> int:
+    config = get_config()
+    parser = argparse.ArgumentParser(description='Deliver queued notifications')
+    parser.add_argument('--channel', action='append', choices=[channel.value for channel in NotificationChannel],
+                        help='channel to serve (repeatable), all by default')
+    parser.add_argument('--drain', action='store_true', help='exit once nothing is due')
+    parser.add_argument('--batch-size', type=int, default=config.NOTIFICATION_BATCH_SIZE)
+    parser.add_argument('--concurrency', type=int, default=config.NOTIFICATION_CONCURRENCY,
+                        help='batches in flight per channel')
+    parser.add_argument('--stats-interval', type=float, default=60, help='seconds between metrics log lines')
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    service = NotificationDispatchService(
+        # No session passed: each repository opens and closes its own per call
+        NotificationRepository,
+        build_senders(),
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        max_attempts=config.NOTIFICATION_MAX_ATTEMPTS,
+        retry_base_seconds=config.NOTIFICATION_RETRY_BASE_SECONDS,
+        retry_max_seconds=config.NOTIFICATION_RETRY_MAX_SECONDS,
+        lease_seconds=config.NOTIFICATION_LEASE_SECONDS,
+        poll_interval=config.NOTIFICATION_POLL_INTERVAL
+    )
+    channels = [NotificationChannel(channel) for channel in args.channel] if args.channel else None
+
+    stop = threading.Event()
+    runner = threading.Thread(target=service.run, args=(channels, stop, args.drain), name='notify-dispatch')
+    runner.start()
+    try:
+        while runner.is_alive():
+            runner.join(args.stats_interval)
+            log_stats(service)
+    except KeyboardInterrupt:
+        logger.info('stopping: finishing batches in flight')
+        stop.set()
+        runner.join()
+        log_stats(service)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
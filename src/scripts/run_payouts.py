@@ -0,0 +1,51 @@
+"""
+Batch payout run: create payouts for completed bookings with a captured
+payment and move them Pending -> Processing -> Paid. Run from src/:
+
+    python -m scripts.run_payouts generate --batch 2026-10 [--before 2026-11-01]
+    python -m scripts.run_payouts process --batch 2026-10
+    python -m scripts.run_payouts complete --batch 2026-10
+    python -m scripts.run_payouts all --batch 2026-10 [--before 2026-11-01]
+
+Every step is safe to rerun: bookings that already have a payout are
+skipped and status moves only touch payouts still in the source status.
+"""
+import argparse
+import sys
+from datetime import datetime
+from decimal import Decimal
+
+from config import get_config
+from infrastructure.repositories.payout_repository import PayoutRepository
+from services.payout_service import PayoutService
+
+
+def main(argv=None) -> int:
+    config = get_config()
+    parser = argparse.ArgumentParser(description='Run a batch payout')
+    parser.add_argument('step', choices=['generate', 'process', 'complete', 'all'])
+    parser.add_argument('--batch', required=True, help='batch label stored on the payouts, e.g. 2026-10')
+    parser.add_argument('--before', type=datetime.fromisoformat,
+                        help='only bookings that ended before this time (ISO format, UTC)')
+    parser.add_argument('--chunk-size', type=int, default=config.PAYOUT_BATCH_CHUNK_SIZE,
+                        help='rows per statement and commit')
+    args = parser.parse_args(argv)
+
+    # No session passed: the repository opens and closes its own per call
+    service = PayoutService(PayoutRepository(), Decimal(config.PAYOUT_COMMISSION_RATE))
+
+    if args.step in ('generate', 'all'):
+        created = 0
+        for count in service.iter_generate_batch(args.batch, args.before, args.chunk_size):
+            created += count
+            print(f'  {created} payout(s) created', flush=True)
+        print(f'generated {created} payout(s) in batch {args.batch}')
+    if args.step in ('process', 'all'):
+        print(f'moved {service.process_batch(args.batch, args.chunk_size)} payout(s) to Processing')
+    if args.step in ('complete', 'all'):
+        print(f'moved {service.complete_batch(args.batch, args.chunk_size)} payout(s) to Paid')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
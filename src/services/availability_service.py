@@ -0,0 +1,367 @@
+import time as clock
+from datetime import datetime, time, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import numpy as np
+
+from domain.models.availability_slot import Weekday
+from domain.models.interfaces.iavailability_slot_repository import IAvailabilitySlotRepository
+from domain.models.interfaces.ibooking_repository import IBookingRepository
+from domain.models.interfaces.itutor_subject_repository import ITutorSubjectRepository
+from services.index_cache import IndexCache
+
+# Weekday enum values in date.weekday() order (Mon = 0)
+WEEKDAY_NUMBERS = {weekday.value: number for number, weekday in enumerate(Weekday)}
+MINUTES_PER_DAY = 24 * 60
+
+
+def _utc_naive(value: datetime) -> datetime:
+    """Bookings are stored as naive UTC; normalize aware inputs the same way"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _zone(name: Optional[str]):
+    try:
+        return ZoneInfo(name or 'UTC')
+    except (ZoneInfoNotFoundError, ValueError):
+        return timezone.utc
+
+
+def _merge_free(avail_tutor, avail_start, avail_end, busy_tutor, busy_start, busy_end):
+    """
+    Free time per tutor = union(availability) - union(busy), for all tutors
+    at once. Start/end events are sorted by (tutor, minute) and
+    cumulative-summed; since every tutor's events sum to zero the running
+    totals never leak between tutors. Returns (tutor, start, end) arrays
+    sorted by tutor then start, with touching pieces merged.
+    """
+    n_avail, n_busy = len(avail_tutor), len(busy_tutor)
+    tutor = np.concatenate([avail_tutor, avail_tutor, busy_tutor, busy_tutor])
+    minute = np.concatenate([avail_start, avail_end, busy_start, busy_end])
+    avail_delta = np.concatenate([np.ones(n_avail, np.int32), -np.ones(n_avail, np.int32),
+                                  np.zeros(2 * n_busy, np.int32)])
+    busy_delta = np.concatenate([np.zeros(2 * n_avail, np.int32),
+                                 np.ones(n_busy, np.int32), -np.ones(n_busy, np.int32)])
+    if len(tutor) < 2:
+        empty = np.empty(0, np.int64)
+        return empty, empty, empty
+
+    order = np.lexsort((minute, tutor))
+    tutor, minute = tutor[order], minute[order]
+    available = np.cumsum(avail_delta[order])
+    busy = np.cumsum(busy_delta[order])
+
+    # Piece i runs from event i to event i + 1 of the same tutor
+    free = ((tutor[:-1] == tutor[1:]) & (available[:-1] > 0) & (busy[:-1] == 0)
+            & (minute[1:] > minute[:-1]))
+    piece_tutor, piece_start, piece_end = tutor[:-1][free], minute[:-1][free], minute[1:][free]
+    if not len(piece_tutor):
+        return piece_tutor, piece_start, piece_end
+
+    first = np.ones(len(piece_tutor), bool)
+    first[1:] = (piece_tutor[1:] != piece_tutor[:-1]) | (piece_start[1:] != piece_end[:-1])
+    starts = np.flatnonzero(first)
+    lasts = np.append(starts[1:] - 1, len(piece_tutor) - 1)
+    return piece_tutor[starts], piece_start[starts], piece_end[lasts]
+
+
+class AvailabilityIndex:
+    """
+    Free/busy intervals of every tutor over a fixed horizon, as flat NumPy
+    arrays of minutes since `origin` (naive UTC), sorted by (tutor, start).
+
+    Weekly slots are expanded to concrete dates in the slot's own timezone
+    (so DST shifts are honoured) and blocking bookings are subtracted.
+    `available_*` keeps the expanded slots without bookings, `free_*` the
+    bookable remainder.
+    """
+
+    def __init__(
+        self,
+        slot_rows: Iterable[Tuple[int, str, time, time, str]],
+        booking_rows: Iterable[Tuple[int, datetime, datetime]],
+        subject_rows: Iterable[Tuple[int, int, str]],
+        origin: datetime,
+        horizon_days: int
+    ):
+        self.built_at = clock.monotonic()
+        self.origin = _utc_naive(origin).replace(second=0, microsecond=0)
+        self.horizon = horizon_days * MINUTES_PER_DAY
+
+        slots = list(slot_rows)
+        tutors, starts, ends = self._expand_slots(slots, horizon_days)
+        self.available_tutor, self.available_start, self.available_end = _merge_free(
+            tutors, starts, ends, *(np.empty(0, np.int64),) * 3
+        )
+
+        bookings = list(booking_rows)
+        busy_tutor = np.fromiter((row[0] for row in bookings), np.int64, len(bookings))
+        busy_start = np.fromiter((self._minute(row[1]) for row in bookings), np.int64, len(bookings))
+        busy_end = np.fromiter((self._minute(row[2]) for row in bookings), np.int64, len(bookings))
+        self.free_tutor, self.free_start, self.free_end = _merge_free(
+            tutors, starts, ends, busy_tutor, np.clip(busy_start, 0, self.horizon), np.clip(busy_end, 0, self.horizon)
+        )
+
+        # (tutor, minute) packed in one int64 so batch lookups are one searchsorted
+        self._span = self.horizon + 1
+        self._free_keys = self.free_tutor * self._span + self.free_start
+        self._available_keys = self.available_tutor * self._span + self.available_start
+
+        by_subject: Dict[int, set] = {}
+        for tutor_id, subject_id, _level in subject_rows:
+            by_subject.setdefault(subject_id, set()).add(tutor_id)
+        self.subject_tutors = {subject_id: np.array(sorted(ids), np.int64) for subject_id, ids in by_subject.items()}
+
+    def _minute(self, value: datetime) -> int:
+        return int((_utc_naive(value) - self.origin).total_seconds() // 60)
+
+    def _datetime(self, minute: int) -> datetime:
+        return self.origin + timedelta(minutes=int(minute))
+
+    def _expand_slots(self, slots: List[Tuple], horizon_days: int):
+        """Weekly slots -> concrete (tutor, start, end) minutes inside the horizon"""
+        if not slots:
+            empty = np.empty(0, np.int64)
+            return empty, empty, empty
+
+        # One extra day each side: local dates can fall outside the UTC horizon
+        first_day = self.origin.date() - timedelta(days=1)
+        dates = [first_day + timedelta(days=d) for d in range(horizon_days + 3)]
+        date_weekday = np.array([day.weekday() for day in dates])
+        origin_minute = self.origin.hour * 60 + self.origin.minute
+        date_minute = np.array([(day - self.origin.date()).days * MINUTES_PER_DAY - origin_minute
+                                for day in dates], np.int64)
+
+        zone_names = sorted({row[4] or 'UTC' for row in slots})
+        zone_index = {name: i for i, name in enumerate(zone_names)}
+        # UTC offset (minutes) of each zone on each local date, taken at noon
+        offsets = np.array([
+            [_zone(name).utcoffset(datetime.combine(day, time(12))) // timedelta(minutes=1) for day in dates]
+            for name in zone_names
+        ], np.int64)
+
+        slot_tutor = np.array([row[0] for row in slots], np.int64)
+        slot_weekday = np.array([WEEKDAY_NUMBERS[getattr(row[1], 'value', row[1])] for row in slots])
+        slot_start = np.array([row[2].hour * 60 + row[2].minute for row in slots], np.int64)
+        slot_end = np.array([row[3].hour * 60 + row[3].minute for row in slots], np.int64)
+        slot_zone = np.array([zone_index[row[4] or 'UTC'] for row in slots])
+
+        # Every (slot, date) pair whose weekday matches
+        slot_i, date_i = np.nonzero(slot_weekday[:, None] == date_weekday[None, :])
+        base = date_minute[date_i] - offsets[slot_zone[slot_i], date_i]
+        starts = base + slot_start[slot_i]
+        ends = base + slot_end[slot_i]
+        starts, ends = np.clip(starts, 0, self.horizon), np.clip(ends, 0, self.horizon)
+        keep = ends > starts
+        return slot_tutor[slot_i][keep], starts[keep], ends[keep]
+
+    def _covers(self, keys, ends, tutors, query_starts, query_ends) -> np.ndarray:
+        if not len(keys):
+            return np.zeros(len(tutors), bool)
+        # Last interval of the tutor starting at or before the query start
+        idx = np.searchsorted(keys, tutors * self._span + query_starts, side='right') - 1
+        safe = np.clip(idx, 0, len(keys) - 1)
+        inside = (query_starts >= 0) & (query_ends <= self.horizon) & (query_starts < query_ends)
+        return inside & (idx >= 0) & (keys[safe] // self._span == tutors) & (ends[safe] >= query_ends)
+
+    def are_free(self, tutor_ids: Sequence[int], starts: Sequence[datetime], ends: Sequence[datetime]) -> np.ndarray:
+        """Batch check: is tutor_ids[i] free for the whole of [starts[i], ends[i])"""
+        tutors = np.asarray(tutor_ids, np.int64)
+        query_starts = np.array([self._minute(value) for value in starts], np.int64)
+        query_ends = np.array([self._minute(value) for value in ends], np.int64)
+        return self._covers(self._free_keys, self.free_end, tutors, query_starts, query_ends)
+
+    def is_free(self, tutor_id: int, start: datetime, end: datetime) -> bool:
+        return bool(self.are_free([tutor_id], [start], [end])[0])
+
+    def within_availability(self, tutor_id: int, start: datetime, end: datetime) -> bool:
+        """Inside the tutor's slots, ignoring bookings"""
+        return bool(self._covers(self._available_keys, self.available_end, np.array([tutor_id], np.int64),
+                                 np.array([self._minute(start)]), np.array([self._minute(end)]))[0])
+
+    def next_free_windows(self, tutor_id: int, after: datetime, count: int = 5,
+                          duration_minutes: int = 60) -> List[Tuple[datetime, datetime]]:
+        """The first `count` free windows of at least duration_minutes starting at/after `after`"""
+        lo, hi = np.searchsorted(self.free_tutor, [tutor_id, tutor_id + 1])
+        starts = np.maximum(self.free_start[lo:hi], max(self._minute(after), 0))
+        ends = self.free_end[lo:hi]
+        keep = np.flatnonzero(ends - starts >= duration_minutes)[:count]
+        return [(self._datetime(starts[i]), self._datetime(ends[i])) for i in keep]
+
+    def free_tutors(self, start: datetime, end: datetime, subject_id: Optional[int] = None) -> List[int]:
+        """Ids of all tutors free for the whole of [start, end), optionally teaching subject_id"""
+        query_start, query_end = self._minute(start), self._minute(end)
+        if query_start < 0 or query_end > self.horizon or query_start >= query_end:
+            return []
+        tutors = np.unique(self.free_tutor[(self.free_start <= query_start) & (self.free_end >= query_end)])
+        if subject_id is not None:
+            tutors = np.intersect1d(tutors, self.subject_tutors.get(subject_id, np.empty(0, np.int64)),
+                                    assume_unique=True)
+        return tutors.tolist()
+
+    def free_grid(self, grid_start: datetime, step_minutes: int, count: int, duration_minutes: int,
+                  subject_id: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Free matrix for a regular grid of windows [grid_start + k*step, +duration), k < count.
+        Returns (tutor_ids, matrix) with matrix[i, k] True when tutor_ids[i] is free in window k.
+        Each free interval marks its run of windows in a difference array, so the
+        cost is O(intervals + tutors * count) regardless of the grid size.
+        """
+        origin = self._minute(grid_start)
+        # Only intervals reaching into the grid matter
+        near = (self.free_end > origin) & (self.free_start < origin + (count - 1) * step_minutes + duration_minutes)
+        if subject_id is not None:
+            near &= np.isin(self.free_tutor, self.subject_tutors.get(subject_id, np.empty(0, np.int64)))
+        tutor, start, end = self.free_tutor[near], self.free_start[near], self.free_end[near]
+        # tutor is sorted, so unique ids are where the value changes
+        tutor_ids = tutor[np.flatnonzero(np.diff(tutor, prepend=-1))]
+
+        first = np.maximum(-((origin - start) // step_minutes), 0)            # ceil((start - origin) / step)
+        last = np.minimum((end - duration_minutes - origin) // step_minutes, count - 1)
+        valid = first <= last
+        rows = np.searchsorted(tutor_ids, tutor[valid])
+
+        # +1 where a run of windows starts, -1 after it ends. A tutor's runs
+        # never share a window, so each fancy-index update hits distinct cells
+        # and the running sum stays 0/1. Windows are the leading axis and the
+        # running sum adds whole rows (much faster than np.cumsum over axis 0).
+        marks = np.zeros((count + 1) * len(tutor_ids), np.int8)
+        marks[first[valid] * len(tutor_ids) + rows] = 1
+        marks[(last[valid] + 1) * len(tutor_ids) + rows] -= 1
+        marks = marks.reshape(count + 1, len(tutor_ids))
+        for window in range(1, count):
+            marks[window] += marks[window - 1]
+        return tutor_ids, (marks[:count] > 0).T
+
+
+class AvailabilityService:
+    """
+    Service class for tutor availability
+    Answers free/busy questions from an in-memory index of slots and
+    blocking bookings, rebuilt per process when slots or tutor subjects
+    change and every AVAILABILITY_INDEX_TTL seconds. New bookings reach the
+    index with the TTL rebuild; can_book checks them in the database
+    """
+
+    def __init__(
+        self,
+        availability_repository: IAvailabilitySlotRepository,
+        booking_repository: IBookingRepository,
+        tutor_subject_repository: ITutorSubjectRepository,
+        index_cache: IndexCache,
+        horizon_days: int = 28
+    ):
+        self.availability_repository = availability_repository
+        self.booking_repository = booking_repository
+        self.tutor_subject_repository = tutor_subject_repository
+        self.index_cache = index_cache
+        self.horizon_days = horizon_days
+
+    def build_index(self) -> AvailabilityIndex:
+        """
+        Load slots, blocking bookings in the horizon and tutor subjects
+        (three queries) and build a fresh index
+
+        Returns:
+            New AvailabilityIndex starting now
+        """
+        origin = datetime.utcnow()
+        return AvailabilityIndex(
+            self.availability_repository.get_window_rows(),
+            self.booking_repository.get_blocking_rows(origin, origin + timedelta(days=self.horizon_days)),
+            self.tutor_subject_repository.get_subject_level_rows(),
+            origin,
+            self.horizon_days
+        )
+
+    def get_index(self) -> AvailabilityIndex:
+        return self.index_cache.get(self.build_index)
+
+    def can_book(self, tutor_id: int, start: datetime, end: datetime) -> bool:
+        """
+        Check a proposed booking: inside the tutor's slots (index) and not
+        overlapping a blocking booking (database, so bookings made since the
+        index was built count too)
+
+        Args:
+            tutor_id: ID of the tutor
+            start: Booking start (UTC)
+            end: Booking end (UTC, exclusive)
+
+        Returns:
+            True when the booking can be made
+        """
+        if not self.get_index().within_availability(tutor_id, start, end):
+            return False
+        return not self.booking_repository.has_overlapping_booking(tutor_id, _utc_naive(start), _utc_naive(end))
+
+    def get_next_free_windows(
+        self,
+        tutor_id: int,
+        after: datetime,
+        count: int = 5,
+        duration_minutes: int = 60
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Get the next free windows of a tutor
+
+        Args:
+            tutor_id: ID of the tutor
+            after: Earliest start (UTC)
+            count: Maximum number of windows
+            duration_minutes: Minimum window length
+
+        Returns:
+            List of (start, end) pairs in UTC
+        """
+        return self.get_index().next_free_windows(tutor_id, after, count, duration_minutes)
+
+    def get_free_tutors(self, start: datetime, end: datetime, subject_id: Optional[int] = None) -> List[int]:
+        """
+        Get all tutors free for the whole window
+
+        Args:
+            start: Window start (UTC)
+            end: Window end (UTC, exclusive)
+            subject_id: Only tutors teaching this subject
+
+        Returns:
+            List of tutor IDs
+        """
+        return self.get_index().free_tutors(start, end, subject_id)
+
+    def get_free_grid(
+        self,
+        grid_start: datetime,
+        step_minutes: int,
+        count: int,
+        duration_minutes: int,
+        subject_id: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> Tuple[List[datetime], int, List[Tuple[int, List[int]]]]:
+        """
+        Get which tutors are free in each window of a regular grid
+        (e.g. every hour of a week), for all tutors at once
+
+        Args:
+            grid_start: Start of the first window (UTC)
+            step_minutes: Minutes between window starts
+            count: Number of windows
+            duration_minutes: Length of each window
+            subject_id: Only tutors teaching this subject
+            limit: Maximum number of tutors returned
+            offset: Tutors to skip
+
+        Returns:
+            (window starts, number of tutors free in at least one window,
+             page of (tutor_id, positions of its free windows))
+        """
+        tutor_ids, matrix = self.get_index().free_grid(grid_start, step_minutes, count, duration_minutes, subject_id)
+        rows = np.flatnonzero(matrix.any(axis=1))
+        page = [(int(tutor_ids[row]), np.flatnonzero(matrix[row]).tolist()) for row in rows[offset:offset + limit]]
+        windows = [grid_start + timedelta(minutes=step_minutes * k) for k in range(count)]
+        return windows, len(rows), page
@@ -0,0 +1,48 @@
+from typing import Iterable, List, Optional
+
+from domain.models.booking import BookingDetail
+from domain.models.interfaces.ibooking_repository import IBookingRepository
+
+
+class BookingDetailService:
+    """
+    Service class for booking detail views (a booking and its related records)
+    """
+
+    def __init__(self, repository: IBookingRepository):
+        self.repository = repository
+
+    def get_booking_detail(self, booking_id: int, include: Optional[Iterable[str]] = None) -> Optional[BookingDetail]:
+        """
+        Get a booking with its related records
+
+        Args:
+            booking_id: ID of the booking
+            include: Relationships to load (student, tutor, service, subject,
+                payment, payouts, review, complaints), all when None
+
+        Returns:
+            BookingDetail if found, None otherwise
+        """
+        return self.repository.get_detail(booking_id, include)
+
+    def get_student_booking_details(
+        self,
+        student_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        include: Optional[Iterable[str]] = None
+    ) -> List[BookingDetail]:
+        """
+        Get one page of a student's bookings with their related records
+
+        Args:
+            student_id: ID of the student
+            limit: Maximum number of items (page size), None for all
+            after: Cursor of the last item of the previous page
+            include: Relationships to load, all when None
+
+        Returns:
+            List of BookingDetail objects, newest booking first
+        """
+        return self.repository.get_details_by_student_id(student_id, limit, after, include)
@@ -0,0 +1,79 @@
+from typing import List, Optional
+
+from domain.models.subject import Subject, SubjectLevel
+from domain.models.tutor_profile import TutorProfile
+from domain.models.service_listing import ServiceListing
+from domain.models.interfaces.isubject_repository import ISubjectRepository
+from domain.models.interfaces.itutor_profile_repository import ITutorProfileRepository
+from domain.models.interfaces.iservice_listing_repository import IServiceListingRepository
+
+
+class CatalogService:
+    """
+    Service class for the read-only catalog: subjects, tutor profiles and
+    active service listings. Built on the cached repositories, so catalog
+    pages are served from the read-through caches.
+    """
+
+    def __init__(
+        self,
+        subject_repository: ISubjectRepository,
+        tutor_profile_repository: ITutorProfileRepository,
+        service_listing_repository: IServiceListingRepository
+    ):
+        self.subject_repository = subject_repository
+        self.tutor_profile_repository = tutor_profile_repository
+        self.service_listing_repository = service_listing_repository
+
+    def list_subjects(self, level: Optional[SubjectLevel] = None) -> List[Subject]:
+        """
+        Get all subjects, or those of one level
+
+        Args:
+            level: Only subjects of this level
+
+        Returns:
+            List of Subject objects
+        """
+        if level is not None:
+            return self.subject_repository.get_by_level(level)
+        return self.subject_repository.get_all()
+
+    def get_subject(self, subject_id: int) -> Optional[Subject]:
+        """
+        Get subject by ID
+
+        Args:
+            subject_id: Subject ID
+
+        Returns:
+            Subject object if found, None otherwise
+        """
+        return self.subject_repository.get_by_id(subject_id)
+
+    def get_tutor_profile(self, user_id: int) -> Optional[TutorProfile]:
+        """
+        Get a tutor's profile
+
+        Args:
+            user_id: User ID of the tutor
+
+        Returns:
+            TutorProfile object if found, None otherwise
+        """
+        return self.tutor_profile_repository.get_by_user_id(user_id)
+
+    def list_active_listings(self, tutor_id: Optional[int] = None) -> List[ServiceListing]:
+        """
+        Get active service listings, optionally of one tutor
+
+        Args:
+            tutor_id: Only listings of this tutor
+
+        Returns:
+            List of ServiceListing objects
+        """
+        listings = self.service_listing_repository.get_active_listings()
+        if tutor_id is not None:
+            listings = [listing for listing in listings if listing.tutor_id == tutor_id]
+        return listings
@@ -0,0 +1,116 @@
+from typing import List, Optional
+
+from domain.models.chat_thread import ChatThreadSummary
+from domain.models.message import Message
+from domain.models.stream_event import StreamEvent
+from domain.models.interfaces.ichat_thread_repository import IChatThreadRepository
+from domain.models.interfaces.imessage_repository import IMessageRepository
+from domain.models.interfaces.ievent_broker import IEventBroker
+
+
+class ChatService:
+    """
+    Service class for chat messages between a student and a tutor
+    """
+
+    def __init__(
+        self,
+        thread_repository: IChatThreadRepository,
+        message_repository: IMessageRepository,
+        broker: Optional[IEventBroker] = None
+    ):
+        self.thread_repository = thread_repository
+        self.message_repository = message_repository
+        self.broker = broker
+
+    def send_message(
+        self,
+        thread_id: int,
+        sender_id: int,
+        body: str,
+        attachment_url: Optional[str] = None
+    ) -> Optional[Message]:
+        """
+        Post a message to a thread and push it to both participants' streams
+
+        Args:
+            thread_id: ID of the chat thread
+            sender_id: ID of the sending user (must take part in the thread)
+            body: Message text
+            attachment_url: Optional attachment
+
+        Returns:
+            Created Message, None if the thread does not exist
+        """
+        thread = self.thread_repository.get_by_id(thread_id)
+        if not thread:
+            return None
+        if not thread.involves_user(sender_id):
+            raise ValueError("Sender is not a participant of this thread")
+
+        message = self.message_repository.add(Message(
+            thread_id=thread_id,
+            sender_id=sender_id,
+            body=body,
+            attachment_url=attachment_url
+        ))
+        if self.broker is not None:
+            self.broker.publish(thread.get_participants(), StreamEvent(message))
+        return message
+
+    def get_latest_messages(self, thread_id: int, user_id: int, limit: int = 50) -> Optional[List[Message]]:
+        """
+        Get the latest messages of a thread, oldest first
+
+        Args:
+            thread_id: ID of the chat thread
+            user_id: Requesting user (must take part in the thread)
+            limit: Maximum number of messages
+
+        Returns:
+            List of Message objects, None if the thread does not exist
+        """
+        thread = self.thread_repository.get_by_id(thread_id)
+        if not thread:
+            return None
+        if not thread.involves_user(user_id):
+            raise ValueError("User is not a participant of this thread")
+        return self.message_repository.get_latest_messages_in_thread(thread_id, limit)
+
+    def get_thread_summaries(
+        self,
+        user_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> List[ChatThreadSummary]:
+        """
+        Get a user's threads for an inbox listing, most recently active first
+
+        Args:
+            user_id: User ID (student or tutor)
+            limit: Maximum number of items (page size), None for all
+            after: Cursor of the last item of the previous page
+
+        Returns:
+            List of ChatThreadSummary objects (last message and unread count)
+        """
+        threads = self.thread_repository.get_summaries_by_user_id(user_id, limit, after)
+        return [ChatThreadSummary(thread, user_id) for thread in threads]
+
+    def mark_thread_read(self, thread_id: int, user_id: int) -> Optional[ChatThreadSummary]:
+        """
+        Mark all messages of a thread as read by a user
+
+        Args:
+            thread_id: ID of the chat thread
+            user_id: Reading user (must take part in the thread)
+
+        Returns:
+            Updated ChatThreadSummary, None if the thread does not exist
+        """
+        thread = self.thread_repository.get_by_id(thread_id)
+        if not thread:
+            return None
+        if not thread.involves_user(user_id):
+            raise ValueError("User is not a participant of this thread")
+        return ChatThreadSummary(self.thread_repository.mark_read(thread_id, user_id), user_id)
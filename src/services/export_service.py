@@ -0,0 +1,93 @@
+from typing import Any, Dict, Iterable, Iterator, Optional
+from datetime import datetime
+
+from domain.models.booking import BookingStatus
+from domain.models.payment import PaymentStatus
+from domain.models.payout import PayoutStatus
+from domain.models.interfaces.ibooking_repository import IBookingRepository
+from domain.models.interfaces.ipayment_repository import IPaymentRepository
+from domain.models.interfaces.ipayout_repository import IPayoutRepository
+
+
+class ExportService:
+    """
+    Service class for bulk exports (finance reconciliation).
+    Exports are iterators: rows are read from the database while they are sent.
+    """
+
+    def __init__(
+        self,
+        payment_repository: IPaymentRepository,
+        payout_repository: IPayoutRepository,
+        booking_repository: IBookingRepository,
+        chunk_size: int = 1000
+    ):
+        self.payment_repository = payment_repository
+        self.payout_repository = payout_repository
+        self.booking_repository = booking_repository
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def _check_range(created_from: Optional[datetime], created_to: Optional[datetime]):
+        if created_from and created_to and created_from >= created_to:
+            raise ValueError("'from' must be before 'to'")
+
+    def export_payments(
+        self,
+        statuses: Optional[Iterable[PaymentStatus]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream payments, oldest first
+
+        Args:
+            statuses: Only payments in one of these statuses (all when empty)
+            created_from: Only payments created at or after this time
+            created_to: Only payments created before this time
+
+        Returns:
+            Iterator of dicts with the fields of PaymentResponseSchema
+        """
+        self._check_range(created_from, created_to)
+        return self.payment_repository.iter_rows(statuses, created_from, created_to, self.chunk_size)
+
+    def export_payouts(
+        self,
+        statuses: Optional[Iterable[PayoutStatus]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream payouts, oldest first
+
+        Args:
+            statuses: Only payouts in one of these statuses (all when empty)
+            created_from: Only payouts created at or after this time
+            created_to: Only payouts created before this time
+
+        Returns:
+            Iterator of dicts with the fields of PayoutResponseSchema
+        """
+        self._check_range(created_from, created_to)
+        return self.payout_repository.iter_rows(statuses, created_from, created_to, self.chunk_size)
+
+    def export_bookings(
+        self,
+        statuses: Optional[Iterable[BookingStatus]] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream bookings, oldest first
+
+        Args:
+            statuses: Only bookings in one of these statuses (all when empty)
+            created_from: Only bookings created at or after this time
+            created_to: Only bookings created before this time
+
+        Returns:
+            Iterator of booking dicts
+        """
+        self._check_range(created_from, created_to)
+        return self.booking_repository.iter_rows(statuses, created_from, created_to, self.chunk_size)
@@ -0,0 +1,149 @@
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from datetime import datetime, timedelta
+
+from domain.models.idempotency_record import IdempotencyRecord
+from domain.models.interfaces.iidempotency_key_repository import IIdempotencyKeyRepository
+from services.ttl_cache import TTLCache
+
+
+class IdempotencyKeyReused(ValueError):
+    """The key was already used with a different request body"""
+    pass
+
+
+class IdempotencyKeyInProgress(Exception):
+    """The first request with this key is still running (possibly in another process)"""
+    pass
+
+
+class IdempotencyService:
+    """
+    Runs a request handler at most once per idempotency key.
+
+    Responses are kept in an in-process LRU and in the idempotency_keys
+    table, so replays are answered from memory or with one indexed read,
+    from any process. Concurrent duplicates in this process wait for the
+    first one instead of running the handler again. Only successful (2xx,
+    3xx) responses are kept: error responses, which the views also produce
+    for caught database errors, and handlers that raise release the key so
+    the retry runs again (a failed attempt's writes were rolled back).
+
+    A claim is only leased (lease_seconds) while its handler runs, and is
+    kept for ttl_seconds once the response is recorded. A claim left by a
+    process that died mid-request therefore blocks retries for the lease,
+    not the whole TTL; a handler outliving its lease may run twice.
+    """
+
+    def __init__(
+        self,
+        repository_factory: Callable[[], IIdempotencyKeyRepository],
+        ttl_seconds: int = 86400,
+        max_entries: int = 10000,
+        wait_seconds: float = 10.0,
+        lease_seconds: float = 60.0
+    ):
+        # A factory, not an instance: sessions must not be shared across threads
+        self.repository_factory = repository_factory
+        self.ttl_seconds = ttl_seconds
+        self.wait_seconds = wait_seconds
+        self.lease_seconds = lease_seconds
+        self.cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._next_purge = 0.0
+
+    def execute(
+        self,
+        key: str,
+        request_hash: str,
+        handler: Callable[[], Tuple[int, Optional[str], str]]
+    ) -> Tuple[IdempotencyRecord, bool]:
+        """
+        Run handler once for key, or return the response it produced before
+        
+        Args:
+            key: Idempotency key, scoped to the endpoint by the caller
+            request_hash: Fingerprint of the request body
+            handler: Produces (status_code, content_type, body)
+            
+        Returns:
+            (record holding the response, True if it is a replay)
+            
+        Raises:
+            IdempotencyKeyReused: The key was used with another request body
+            IdempotencyKeyInProgress: The first request is still running
+        """
+        while True:
+            record = self.cache.get(key)
+            if record is not None:
+                return self._replay(record, request_hash), True
+
+            with self._lock:
+                event = self._in_flight.get(key)
+                leader = event is None
+                if leader:
+                    event = self._in_flight[key] = threading.Event()
+
+            if not leader:
+                if not event.wait(self.wait_seconds):
+                    raise IdempotencyKeyInProgress('A request with this Idempotency-Key is still in progress')
+                # Replay the leader's response, or take over if it failed
+                continue
+
+            try:
+                return self._execute_once(key, request_hash, handler)
+            finally:
+                with self._lock:
+                    del self._in_flight[key]
+                event.set()
+
+    def _execute_once(self, key, request_hash, handler) -> Tuple[IdempotencyRecord, bool]:
+        now = datetime.utcnow()
+        self._purge_expired(now)
+        record = IdempotencyRecord(key=key, request_hash=request_hash, expires_at=now + timedelta(seconds=self.lease_seconds))
+
+        existing = self.repository_factory().claim(record)
+        if existing is not None:
+            if not existing.is_complete():
+                raise IdempotencyKeyInProgress('A request with this Idempotency-Key is still in progress')
+            self._remember(existing)
+            return self._replay(existing, request_hash), True
+
+        try:
+            record.status_code, record.content_type, record.response_body = handler()
+        except Exception:
+            self.repository_factory().release(key)
+            raise
+
+        if not self.is_final(record.status_code):
+            self.repository_factory().release(key)
+        else:
+            record.expires_at = datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
+            self.repository_factory().complete(
+                key, record.status_code, record.content_type, record.response_body, record.expires_at
+            )
+            self._remember(record)
+        return record, False
+
+    @staticmethod
+    def is_final(status_code: int) -> bool:
+        """Whether a response is kept and replayed (otherwise the request may be retried)"""
+        return status_code < 400
+
+    def _remember(self, record: IdempotencyRecord):
+        """Cache a completed record no longer than its database expiry"""
+        self.cache.set(record.key, record, (record.expires_at - datetime.utcnow()).total_seconds())
+
+    def _replay(self, record: IdempotencyRecord, request_hash: str) -> IdempotencyRecord:
+        if record.request_hash != request_hash:
+            raise IdempotencyKeyReused('Idempotency-Key was already used with a different request')
+        return record
+
+    def _purge_expired(self, now: datetime):
+        """Delete expired rows at most once per minute per process"""
+        if time.monotonic() < self._next_purge:
+            return
+        self._next_purge = time.monotonic() + 60
+        self.repository_factory().purge_expired(now)
@@ -0,0 +1,54 @@
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
+
+
+class IndexCache:
+    """
+    Process-wide holder of an in-memory index (search, availability).
+    The index object must carry a `built_at` time.monotonic() stamp; it is
+    rebuilt once older than ttl_seconds or after invalidate(). Only the very
+    first build blocks callers: a rebuild is done by one caller at a time
+    while the others keep getting the previous index. Invalidations are
+    coalesced, an invalidated index is rebuilt at most once every
+    min_rebuild_seconds.
+    """
+
+    def __init__(self, ttl_seconds: int = 300, min_rebuild_seconds: float = 1.0):
+        self.ttl_seconds = ttl_seconds
+        self.min_rebuild_seconds = min_rebuild_seconds
+        # (index, generation it was built at), replaced as a whole
+        self._entry: Optional[Tuple[Any, int]] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _fresh(self, entry) -> bool:
+        if entry is None:
+            return False
+        index, generation = entry
+        age = time.monotonic() - index.built_at
+        if age >= self.ttl_seconds:
+            return False
+        return generation == self._generation or age < self.min_rebuild_seconds
+
+    def get(self, build: Callable[[], Any]):
+        entry = self._entry
+        if self._fresh(entry):
+            return entry[0]
+        if not self._lock.acquire(blocking=entry is None):
+            return entry[0]
+        try:
+            entry = self._entry
+            if not self._fresh(entry):
+                generation = self._generation
+                # Kept even when invalidated while building (the rows read may
+                # predate the write): it stays stale and is rebuilt once more
+                entry = (build(), generation)
+                self._entry = entry
+            return entry[0]
+        finally:
+            self._lock.release()
+
+    def invalidate(self):
+        """Mark the index stale (e.g. after the source rows changed); it is served until rebuilt"""
+        self._generation += 1
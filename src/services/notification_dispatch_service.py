@@ -0,0 +1,273 @@
+import logging
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta
+
+from domain.models.notification import Notification, NotificationChannel, ChannelQueueStats
+from domain.models.interfaces.inotification_repository import INotificationRepository
+from domain.models.interfaces.inotification_sender import INotificationSender
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(ordered: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list (None when empty)"""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class DispatchMetrics:
+    """
+    Per-channel delivery counters plus the most recent queue latencies
+    (created_at -> sent_at) and batch send times, for percentiles.
+    """
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._channels: Dict[NotificationChannel, dict] = {}
+        self._lock = threading.Lock()
+
+    def _channel(self, channel: NotificationChannel) -> dict:
+        stats = self._channels.get(channel)
+        if stats is None:
+            stats = self._channels[channel] = {
+                'batches': 0, 'sent': 0, 'retried': 0, 'failed': 0,
+                'latency': deque(maxlen=self.window), 'send_time': deque(maxlen=self.window)
+            }
+        return stats
+
+    def record_batch(
+        self,
+        channel: NotificationChannel,
+        latencies: Iterable[float],
+        retried: int,
+        failed: int,
+        send_seconds: float
+    ):
+        with self._lock:
+            stats = self._channel(channel)
+            latencies = list(latencies)
+            stats['batches'] += 1
+            stats['sent'] += len(latencies)
+            stats['retried'] += retried
+            stats['failed'] += failed
+            stats['latency'].extend(latencies)
+            stats['send_time'].append(send_seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Counters and p50/p95/max latencies (seconds) per channel name"""
+        with self._lock:
+            channels = {channel: (dict(stats), sorted(stats['latency']), sorted(stats['send_time']))
+                        for channel, stats in self._channels.items()}
+        result = {}
+        for channel, (stats, latency, send_time) in channels.items():
+            result[channel.value] = {
+                'batches': stats['batches'],
+                'sent': stats['sent'],
+                'retried': stats['retried'],
+                'failed': stats['failed'],
+                'latency_p50': _percentile(latency, 0.50),
+                'latency_p95': _percentile(latency, 0.95),
+                'latency_max': latency[-1] if latency else None,
+                'send_time_p50': _percentile(send_time, 0.50),
+                'send_time_p95': _percentile(send_time, 0.95),
+            }
+        return result
+
+
+class NotificationDispatchService:
+    """
+    Delivers queued notifications through their channel's sender.
+
+    The notifications table is the queue: a notification waits while it
+    has no sent_at and has not been given up. Creating one is therefore a
+    single INSERT, whatever the channel costs. Per channel, a poller claims
+    batches (leased to this dispatcher) and hands them to a bounded worker
+    pool; each worker sends its batch and writes the outcome back in bulk:
+    one UPDATE for the delivered (plus their unread counters) and one
+    executemany for the failed, which back off exponentially until
+    max_attempts. Rows of a dispatcher that dies are claimed again once
+    their lease runs out, so delivery is at-least-once.
+    """
+
+    def __init__(
+        self,
+        repository_factory: Callable[[], INotificationRepository],
+        senders: Dict[NotificationChannel, INotificationSender],
+        batch_size: int = 100,
+        concurrency: int = 4,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 30,
+        retry_max_seconds: float = 3600,
+        lease_seconds: float = 300,
+        poll_interval: float = 1.0,
+        metrics: Optional[DispatchMetrics] = None
+    ):
+        if batch_size < 1 or concurrency < 1 or max_attempts < 1:
+            raise ValueError("batch_size, concurrency and max_attempts must be positive")
+        # A factory, not an instance: sessions must not be shared across threads
+        self.repository_factory = repository_factory
+        self.senders = senders
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.metrics = metrics or DispatchMetrics()
+
+    def retry_delay(self, attempts: int) -> timedelta:
+        """
+        Backoff before the next attempt
+
+        Args:
+            attempts: Failed attempts so far (1 after the first failure)
+
+        Returns:
+            base * 2^(attempts - 1), capped at the maximum, with jitter in [50%, 100%]
+        """
+        delay = min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (attempts - 1))
+        return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+    def claim_batch(self, channel: NotificationChannel) -> Tuple[str, List[Notification]]:
+        """
+        Claim the next due batch of a channel
+
+        Args:
+            channel: Channel to claim from
+
+        Returns:
+            (claim token, claimed notifications; empty when nothing is due)
+        """
+        token = uuid.uuid4().hex
+        lease_until = datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+        return token, self.repository_factory().claim_pending(channel, token, self.batch_size, lease_until)
+
+    def deliver(self, channel: NotificationChannel, token: str, batch: List[Notification]) -> Tuple[int, int, int]:
+        """
+        Send a claimed batch and write the outcome back
+
+        Args:
+            channel: Channel of the batch
+            token: Claim token returned by claim_batch
+            batch: Claimed notifications
+
+        Returns:
+            (sent, scheduled for retry, given up)
+        """
+        started = time.perf_counter()
+        try:
+            errors = self.senders[channel].send_batch(batch) or {}
+        except Exception as e:
+            errors = {notification.id: str(e) or type(e).__name__ for notification in batch}
+        send_seconds = time.perf_counter() - started
+
+        delivered = [notification for notification in batch if notification.id not in errors]
+        failed = [notification for notification in batch if notification.id in errors]
+        for notification in failed:
+            notification.schedule_retry(errors[notification.id], self.retry_delay(notification.attempts + 1),
+                                        self.max_attempts)
+
+        repository = self.repository_factory()
+        sent_at = datetime.utcnow()
+        sent = repository.mark_sent_many([notification.id for notification in delivered], token, sent_at)
+        repository.record_failures(failed, token)
+
+        given_up = sum(1 for notification in failed if notification.is_failed())
+        self.metrics.record_batch(
+            channel,
+            [(sent_at - notification.created_at).total_seconds() for notification in delivered],
+            len(failed) - given_up,
+            given_up,
+            send_seconds
+        )
+        if given_up:
+            logger.warning('Gave up %d %s notification(s) after %d attempts', given_up, channel.value, self.max_attempts)
+        return sent, len(failed) - given_up, given_up
+
+    def dispatch_once(self, channel: NotificationChannel) -> int:
+        """
+        Claim and deliver one batch in the calling thread
+
+        Args:
+            channel: Channel to dispatch
+
+        Returns:
+            Number of notifications claimed (0 when nothing was due)
+        """
+        token, batch = self.claim_batch(channel)
+        if batch:
+            self.deliver(channel, token, batch)
+        return len(batch)
+
+    def run(
+        self,
+        channels: Optional[Iterable[NotificationChannel]] = None,
+        stop: Optional[threading.Event] = None,
+        drain: bool = False
+    ):
+        """
+        Run one poller and one worker pool per channel until stop is set
+
+        Args:
+            channels: Channels to serve, all with a sender by default
+            stop: Event that ends the run; in-flight batches are finished first
+            drain: Return once no channel has anything due instead of polling
+        """
+        stop = stop or threading.Event()
+        pollers = [
+            threading.Thread(target=self._poll, args=(channel, stop, drain),
+                             name=f'notify-{channel.value}', daemon=True)
+            for channel in (channels or self.senders)
+        ]
+        for poller in pollers:
+            poller.start()
+        for poller in pollers:
+            poller.join()
+
+    def _poll(self, channel: NotificationChannel, stop: threading.Event, drain: bool):
+        """Claim batches while a worker is free; at most `concurrency` batches in flight"""
+        slots = threading.BoundedSemaphore(self.concurrency)
+
+        def work(token: str, batch: List[Notification]):
+            try:
+                self.deliver(channel, token, batch)
+            except Exception:
+                # The rows stay claimed and are retried when the lease ends
+                logger.exception('Delivering %s notifications failed', channel.value)
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix=f'notify-{channel.value}') as pool:
+            while True:
+                slots.acquire()
+                if stop.is_set():
+                    break
+                try:
+                    token, batch = self.claim_batch(channel)
+                except Exception:
+                    logger.exception('Claiming %s notifications failed', channel.value)
+                    batch = []
+                if batch:
+                    pool.submit(work, token, batch)
+                    continue
+                slots.release()
+                if drain:
+                    break
+                stop.wait(self.poll_interval)
+
+    def queue_stats(self) -> Dict[NotificationChannel, ChannelQueueStats]:
+        """
+        Get the dispatch queue of every channel
+
+        Returns:
+            ChannelQueueStats per channel (depth, due, oldest waiting)
+        """
+        return self.repository_factory().get_queue_stats()
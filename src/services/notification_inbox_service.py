@@ -0,0 +1,123 @@
+from typing import List, Optional, Tuple
+from datetime import datetime
+
+from domain.models.notification import Notification, NotificationType, NotificationChannel
+from domain.models.stream_event import StreamEvent
+from domain.models.interfaces.inotification_repository import INotificationRepository
+from domain.models.interfaces.ievent_broker import IEventBroker
+
+
+class NotificationInboxService:
+    """
+    Service class for a user's notification inbox
+    Keeps the per-user unread counter in step with every inbox change,
+    so badge reads never count rows
+    """
+
+    def __init__(self, repository: INotificationRepository, broker: Optional[IEventBroker] = None):
+        self.repository = repository
+        self.broker = broker
+
+    def notify(
+        self,
+        user_id: int,
+        type: NotificationType,
+        payload: str,
+        channel: NotificationChannel = NotificationChannel.IN_APP
+    ) -> Notification:
+        """
+        Create a notification for a user
+        
+        In-app notifications are delivered by being stored, so they are
+        sent (and counted as unread) right away; other channels count once
+        their delivery marks them sent. The new notification is pushed to
+        the user's event stream either way.
+        
+        Args:
+            user_id: Recipient user ID
+            type: Notification type
+            payload: JSON payload as text
+            channel: Delivery channel
+            
+        Returns:
+            Created Notification object
+        """
+        notification = Notification(user_id=user_id, type=type, channel=channel, payload=payload)
+        if channel == NotificationChannel.IN_APP:
+            notification.sent_at = notification.created_at
+        notification = self.repository.add(notification)
+        if self.broker is not None:
+            self.broker.publish([user_id], StreamEvent(notification))
+        return notification
+
+    def get_inbox(
+        self,
+        user_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        unread_only: bool = False
+    ) -> List[Notification]:
+        """
+        Get a user's notifications, newest first
+        
+        Args:
+            user_id: User ID
+            limit: Maximum number of items (page size), None for all
+            after: Cursor of the last item of the previous page
+            unread_only: Only sent, unread notifications
+            
+        Returns:
+            List of Notification objects
+        """
+        if unread_only:
+            return self.repository.get_unread_by_user_id(user_id, limit, after)
+        return self.repository.get_by_user_id(user_id, limit, after)
+
+    def get_inbox_fingerprint(self, user_id: int) -> Tuple[int, Optional[datetime], Optional[int]]:
+        """
+        Get a cheap version stamp of a user's inbox (for conditional GET)
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            (count, latest updated_at, highest id)
+        """
+        return self.repository.fingerprint_by_user_id(user_id)
+
+    def get_unread_count(self, user_id: int) -> int:
+        """
+        Get the unread badge count of a user
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Number of sent, unread notifications (one key lookup)
+        """
+        return self.repository.get_unread_count(user_id)
+
+    def mark_read(self, user_id: int, notification_id: int) -> Optional[Notification]:
+        """
+        Mark one notification as read
+        
+        Args:
+            user_id: Owner of the notification
+            notification_id: Notification ID
+            
+        Returns:
+            Updated Notification, None if not found or owned by someone else
+        """
+        return self.repository.mark_read(notification_id, user_id)
+
+    def mark_all_read(self, user_id: int) -> bool:
+        """
+        Mark all sent notifications of a user as read
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            True when done
+        """
+        return self.repository.mark_all_read_for_user(user_id)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from decimal import Decimal
 from datetime import datetime
 
@@ -82,15 +82,16 @@ class PaymentService:
         Returns:
             Updated Payment object if successful, None if payment not found
         """
-        payment = self.repository.get_by_id(payment_id)
-        if not payment:
-            return None
+        with self.repository.transaction():
+            payment = self.repository.get_by_id(payment_id)
+            if not payment:
+                return None
             
-        if payment.status != PaymentStatus.AUTHORIZED:
-            raise ValueError(f"Cannot capture payment with status: {payment.status.value}")
+            if payment.status != PaymentStatus.AUTHORIZED:
+                raise ValueError(f"Cannot capture payment with status: {payment.status.value}")
             
-        payment.capture()
-        return self.repository.update(payment)
+            payment.capture()
+            return self.repository.update(payment)
 
     def refund_payment(self, payment_id: int) -> Optional[Payment]:
         """
@@ -102,15 +103,16 @@ class PaymentService:
         Returns:
             Updated Payment object if successful, None if payment not found
         """
-        payment = self.repository.get_by_id(payment_id)
-        if not payment:
-            return None
+        with self.repository.transaction():
+            payment = self.repository.get_by_id(payment_id)
+            if not payment:
+                return None
             
-        if payment.status != PaymentStatus.CAPTURED:
-            raise ValueError(f"Cannot refund payment with status: {payment.status.value}")
+            if payment.status != PaymentStatus.CAPTURED:
+                raise ValueError(f"Cannot refund payment with status: {payment.status.value}")
             
-        payment.refund()
-        return self.repository.update(payment)
+            payment.refund()
+            return self.repository.update(payment)
 
     def fail_payment(self, payment_id: int) -> Optional[Payment]:
         """
@@ -122,24 +124,51 @@ class PaymentService:
         Returns:
             Updated Payment object if successful, None if payment not found
         """
-        payment = self.repository.get_by_id(payment_id)
-        if not payment:
-            return None
+        with self.repository.transaction():
+            payment = self.repository.get_by_id(payment_id)
+            if not payment:
+                return None
             
-        payment.fail()
-        return self.repository.update(payment)
+            payment.fail()
+            return self.repository.update(payment)
 
-    def list_payments_by_status(self, status: PaymentStatus) -> List[Payment]:
+    def list_payments_by_status(
+        self,
+        status: PaymentStatus,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> List[Payment]:
         """
         Get all payments with a specific status
         
         Args:
             status: Payment status to filter by
+            limit: Maximum number of items (page size), None for all
+            after: Cursor of the last item of the previous page
             
         Returns:
             List of Payment objects
         """
-        return self.repository.get_by_status(status)
+        return self.repository.get_by_status(status, limit, after)
+
+    def list_payment_rows_by_status(
+        self,
+        status: PaymentStatus,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get payments with a specific status, ready to be sent as JSON
+
+        Args:
+            status: Payment status to filter by
+            limit: Maximum number of items (page size), None for all
+            after: Cursor of the last item of the previous page
+
+        Returns:
+            List of dicts with the fields of PaymentResponseSchema
+        """
+        return self.repository.get_rows_by_status(status, limit, after)
 
     def update_payment_status(self, payment_id: int, new_status: PaymentStatus) -> Optional[Payment]:
         """
@@ -152,13 +181,14 @@ class PaymentService:
         Returns:
             Updated Payment object if successful, None if payment not found
         """
-        payment = self.repository.get_by_id(payment_id)
-        if not payment:
-            return None
+        with self.repository.transaction():
+            payment = self.repository.get_by_id(payment_id)
+            if not payment:
+                return None
             
-        payment.status = new_status
-        payment.updated_at = datetime.utcnow()
-        return self.repository.update(payment)
+            payment.status = new_status
+            payment.updated_at = datetime.utcnow()
+            return self.repository.update(payment)
 
     def is_payment_successful(self, payment_id: int) -> bool:
         """
@@ -1,8 +1,8 @@
-from typing import List, Optional
-from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from decimal import Decimal, ROUND_HALF_UP
 from datetime import datetime
 
-from domain.models.payout import Payout, PayoutStatus
+from domain.models.payout import Payout, PayoutStatus, TutorEarnings, booking_payout_key
 from domain.models.interfaces.ipayout_repository import IPayoutRepository
 
 
@@ -12,8 +12,24 @@ class PayoutService:
     Handles payout creation, processing, and management for tutors
     """
     
-    def __init__(self, repository: IPayoutRepository):
+    def __init__(self, repository: IPayoutRepository, commission_rate: Decimal = Decimal('0.00')):
+        if not Decimal('0') <= commission_rate < Decimal('1'):
+            raise ValueError("Commission rate must be in [0, 1)")
         self.repository = repository
+        self.commission_rate = commission_rate
+
+    def payout_amount(self, captured_amount: Decimal) -> Decimal:
+        """
+        Tutor share of a captured payment
+        
+        Args:
+            captured_amount: Amount captured from the student
+            
+        Returns:
+            Amount after commission, rounded to cents
+        """
+        amount = Decimal(captured_amount) * (Decimal('1') - self.commission_rate)
+        return amount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
     def create_payout(
         self, 
@@ -54,29 +70,55 @@ class PayoutService:
         """
         return self.repository.get_by_id(payout_id)
 
-    def get_tutor_payouts(self, tutor_id: int) -> List[Payout]:
+    def get_tutor_payouts(
+        self,
+        tutor_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> List[Payout]:
         """
         Get all payouts for a specific tutor
         
         Args:
             tutor_id: Tutor ID
+            limit: Maximum number of items (page size), None for all
+            after: Cursor of the last item of the previous page
             
         Returns:
             List of Payout objects
         """
-        return self.repository.get_by_tutor_id(tutor_id)
+        return self.repository.get_by_tutor_id(tutor_id, limit, after)
+
+    def get_tutor_payouts_fingerprint(self, tutor_id: int) -> Tuple[int, Optional[datetime], Optional[int]]:
+        """
+        Get a cheap version stamp of a tutor's payouts (for conditional GET)
+        
+        Args:
+            tutor_id: Tutor ID
+            
+        Returns:
+            (count, latest updated_at, highest id)
+        """
+        return self.repository.fingerprint_by_tutor_id(tutor_id)
 
-    def get_booking_payouts(self, booking_id: int) -> List[Payout]:
+    def get_booking_payouts(
+        self,
+        booking_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> List[Payout]:
         """
         Get all payouts for a specific booking
         
         Args:
             booking_id: Booking ID
+            limit: Maximum number of items (page size), None for all
+            after: Cursor of the last item of the previous page
             
         Returns:
             List of Payout objects
         """
-        return self.repository.get_by_booking_id(booking_id)
+        return self.repository.get_by_booking_id(booking_id, limit, after)
 
     def process_payout(self, payout_id: int) -> Optional[Payout]:
         """
@@ -88,15 +130,16 @@ class PayoutService:
         Returns:
             Updated Payout object if successful, None if payout not found
         """
-        payout = self.repository.get_by_id(payout_id)
-        if not payout:
-            return None
+        with self.repository.transaction():
+            payout = self.repository.get_by_id(payout_id)
+            if not payout:
+                return None
             
-        if payout.status != PayoutStatus.PENDING:
-            raise ValueError(f"Cannot process payout with status: {payout.status.value}")
+            if payout.status != PayoutStatus.PENDING:
+                raise ValueError(f"Cannot process payout with status: {payout.status.value}")
             
-        payout.process()
-        return self.repository.update(payout)
+            payout.process()
+            return self.repository.update(payout)
 
     def complete_payout(self, payout_id: int) -> Optional[Payout]:
         """
@@ -108,15 +151,16 @@ class PayoutService:
         Returns:
             Updated Payout object if successful, None if payout not found
         """
-        payout = self.repository.get_by_id(payout_id)
-        if not payout:
-            return None
+        with self.repository.transaction():
+            payout = self.repository.get_by_id(payout_id)
+            if not payout:
+                return None
             
-        if payout.status not in [PayoutStatus.PENDING, PayoutStatus.PROCESSING]:
-            raise ValueError(f"Cannot complete payout with status: {payout.status.value}")
+            if payout.status not in [PayoutStatus.PENDING, PayoutStatus.PROCESSING]:
+                raise ValueError(f"Cannot complete payout with status: {payout.status.value}")
             
-        payout.mark_paid()
-        return self.repository.update(payout)
+            payout.mark_paid()
+            return self.repository.update(payout)
 
     def fail_payout(self, payout_id: int) -> Optional[Payout]:
         """
@@ -128,33 +172,88 @@ class PayoutService:
         Returns:
             Updated Payout object if successful, None if payout not found
         """
-        payout = self.repository.get_by_id(payout_id)
-        if not payout:
-            return None
+        with self.repository.transaction():
+            payout = self.repository.get_by_id(payout_id)
+            if not payout:
+                return None
             
-        payout.fail()
-        return self.repository.update(payout)
+            payout.fail()
+            return self.repository.update(payout)
 
-    def get_pending_payouts(self) -> List[Payout]:
+    def get_pending_payouts(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[Payout]:
         """
         Get all pending payouts for processing
         
+        Args:
+            limit: Maximum number of items (page size), None for all
+            after: Cursor of the last item of the previous page
+            
         Returns:
             List of pending Payout objects
         """
-        return self.repository.get_by_status(PayoutStatus.PENDING)
+        return self.repository.get_by_status(PayoutStatus.PENDING, limit, after)
 
-    def get_payouts_by_status(self, status: PayoutStatus) -> List[Payout]:
+    def get_payouts_by_status(
+        self,
+        status: PayoutStatus,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> List[Payout]:
         """
         Get all payouts with a specific status
         
         Args:
             status: Payout status to filter by
+            limit: Maximum number of items (page size), None for all
+            after: Cursor of the last item of the previous page
             
         Returns:
             List of Payout objects
         """
-        return self.repository.get_by_status(status)
+        return self.repository.get_by_status(status, limit, after)
+
+    def get_payout_rows_by_status(
+        self,
+        status: PayoutStatus,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get payouts with a specific status, ready to be sent as JSON
+
+        Args:
+            status: Payout status to filter by
+            limit: Maximum number of items (page size), None for all
+            after: Cursor of the last item of the previous page
+
+        Returns:
+            List of dicts with the fields of PayoutResponseSchema
+        """
+        return self.repository.get_rows_by_status(status, limit, after)
+
+    def get_earnings_summary(self, tutor_id: int) -> TutorEarnings:
+        """
+        Get paid / pending totals and payout counts for a tutor
+        
+        Args:
+            tutor_id: Tutor ID
+            
+        Returns:
+            TutorEarnings aggregated in the database
+        """
+        return self.repository.earnings_summary(tutor_id)
+
+    def get_earnings_summaries(self, tutor_ids: List[int]) -> Dict[int, TutorEarnings]:
+        """
+        Get earnings summaries for many tutors at once
+        
+        Args:
+            tutor_ids: Tutor IDs
+            
+        Returns:
+            Mapping of tutor ID to TutorEarnings
+        """
+        return self.repository.earnings_summaries(tutor_ids)
 
     def calculate_tutor_earnings(self, tutor_id: int) -> Decimal:
         """
@@ -166,14 +265,7 @@ class PayoutService:
         Returns:
             Total earnings amount
         """
-        payouts = self.get_tutor_payouts(tutor_id)
-        total = Decimal('0.00')
-        
-        for payout in payouts:
-            if payout.status == PayoutStatus.PAID:
-                total += payout.amount
-                
-        return total
+        return self.get_earnings_summary(tutor_id).total_earnings
 
     def calculate_pending_earnings(self, tutor_id: int) -> Decimal:
         """
@@ -185,14 +277,7 @@ class PayoutService:
         Returns:
             Pending earnings amount
         """
-        payouts = self.get_tutor_payouts(tutor_id)
-        total = Decimal('0.00')
-        
-        for payout in payouts:
-            if payout.status in [PayoutStatus.PENDING, PayoutStatus.PROCESSING]:
-                total += payout.amount
-                
-        return total
+        return self.get_earnings_summary(tutor_id).pending_earnings
 
     def update_payout_status(self, payout_id: int, new_status: PayoutStatus) -> Optional[Payout]:
         """
@@ -205,13 +290,14 @@ class PayoutService:
         Returns:
             Updated Payout object if successful, None if payout not found
         """
-        payout = self.repository.get_by_id(payout_id)
-        if not payout:
-            return None
+        with self.repository.transaction():
+            payout = self.repository.get_by_id(payout_id)
+            if not payout:
+                return None
             
-        payout.status = new_status
-        payout.updated_at = datetime.utcnow()
-        return self.repository.update(payout)
+            payout.status = new_status
+            payout.updated_at = datetime.utcnow()
+            return self.repository.update(payout)
 
     def is_payout_completed(self, payout_id: int) -> bool:
         """
@@ -225,3 +311,97 @@ class PayoutService:
         """
         payout = self.repository.get_by_id(payout_id)
         return payout is not None and payout.is_paid()
+
+    def iter_generate_batch(
+        self,
+        batch_id: str,
+        completed_before: Optional[datetime] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[int]:
+        """
+        Create Pending payouts for completed bookings with a captured payment
+        and no payout yet, one chunk of bookings at a time
+        
+        Each chunk is read, inserted and committed before the next one is
+        read, so memory stays bounded. Payouts carry the key
+        'booking:<id>'; bookings that already have a payout are skipped, so
+        rerunning a batch (or an interrupted one) creates nothing twice.
+        
+        Args:
+            batch_id: Label of this run, stored on every payout it creates
+            completed_before: Only bookings that ended before this time
+            chunk_size: Bookings per read/insert/commit
+            
+        Yields:
+            Number of payouts created by each chunk
+        """
+        after = 0
+        while True:
+            rows = self.repository.get_payable_booking_rows(after, chunk_size, completed_before)
+            if not rows:
+                return
+            now = datetime.utcnow()
+            payouts = [
+                Payout(
+                    tutor_id=tutor_id,
+                    booking_id=booking_id,
+                    amount=self.payout_amount(captured),
+                    status=PayoutStatus.PENDING,
+                    created_at=now,
+                    updated_at=now,
+                    batch_id=batch_id,
+                    idempotency_key=booking_payout_key(booking_id)
+                )
+                for booking_id, tutor_id, captured in rows
+            ]
+            yield self.repository.add_batch(payouts, chunk_size)
+            after = rows[-1][0]
+
+    def generate_batch(
+        self,
+        batch_id: str,
+        completed_before: Optional[datetime] = None,
+        chunk_size: int = 1000
+    ) -> int:
+        """
+        Create all payouts of a batch (see iter_generate_batch)
+        
+        Args:
+            batch_id: Label of this run
+            completed_before: Only bookings that ended before this time
+            chunk_size: Bookings per read/insert/commit
+            
+        Returns:
+            Number of payouts created
+        """
+        return sum(self.iter_generate_batch(batch_id, completed_before, chunk_size))
+
+    def process_batch(self, batch_id: str, chunk_size: int = 1000) -> int:
+        """
+        Move the Pending payouts of a batch to Processing
+        
+        Args:
+            batch_id: Batch to process
+            chunk_size: Payouts per UPDATE/commit
+            
+        Returns:
+            Number of payouts moved (0 on a rerun)
+        """
+        return self.repository.transition_batch_status(
+            batch_id, PayoutStatus.PENDING, PayoutStatus.PROCESSING, chunk_size
+        )
+
+    def complete_batch(self, batch_id: str, chunk_size: int = 1000) -> int:
+        """
+        Move the Processing payouts of a batch to Paid
+        
+        Args:
+            batch_id: Batch to complete
+            chunk_size: Payouts per UPDATE/commit
+            
+        Returns:
+            Number of payouts moved (0 on a rerun)
+        """
+        return self.repository.transition_batch_status(
+            batch_id, PayoutStatus.PROCESSING, PayoutStatus.PAID, chunk_size
+        )
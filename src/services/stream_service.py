@@ -0,0 +1,95 @@
+from typing import List, Optional, Tuple
+
+from domain.models.stream_event import StreamEvent, StreamCursor
+from domain.models.interfaces.ievent_broker import IEventBroker, ISubscription
+from domain.models.interfaces.imessage_repository import IMessageRepository
+from domain.models.interfaces.inotification_repository import INotificationRepository
+
+
+class StreamService:
+    """
+    Read side of the per-user event streams (new messages and notifications).
+
+    Live events come from the broker; a client resuming from a cursor is
+    caught up from the broker's buffer when it covers the cursor and from
+    the database otherwise, one bounded page per kind at a time.
+    """
+
+    def __init__(
+        self,
+        message_repository: IMessageRepository,
+        notification_repository: INotificationRepository,
+        broker: IEventBroker,
+        catch_up_limit: int = 500
+    ):
+        self.message_repository = message_repository
+        self.notification_repository = notification_repository
+        self.broker = broker
+        self.catch_up_limit = catch_up_limit
+
+    def _ensure_watermark(self):
+        if self.broker.needs_watermark():
+            self.broker.set_watermark(StreamCursor(
+                self.message_repository.max_id(), self.notification_repository.max_id()
+            ))
+
+    def start_cursor(self) -> StreamCursor:
+        """
+        Cursor of a client connecting without Last-Event-ID (only newer events are sent)
+
+        Returns:
+            Latest ids seen by the broker
+        """
+        self._ensure_watermark()
+        return self.broker.latest_cursor() or StreamCursor()
+
+    def backlog(self, user_id: int, cursor: StreamCursor) -> Tuple[List[StreamEvent], bool]:
+        """
+        Get the events of a user past a cursor
+
+        Args:
+            user_id: User ID
+            cursor: Position the client has seen
+
+        Returns:
+            (events oldest first, True if more are waiting beyond this page)
+        """
+        self._ensure_watermark()
+        events = self.broker.recent(user_id, cursor)
+        if events is not None:
+            return events, False
+
+        messages = self.message_repository.get_for_user_after(user_id, cursor.message_id, self.catch_up_limit)
+        notifications = self.notification_repository.get_for_user_after(
+            user_id, cursor.notification_id, self.catch_up_limit
+        )
+        events = [StreamEvent(entity) for entity in messages + notifications]
+        events.sort(key=lambda event: event.entity.created_at)
+        more = len(messages) == self.catch_up_limit or len(notifications) == self.catch_up_limit
+        return events, more
+
+    def subscribe(self, user_id: int, cursor: Optional[StreamCursor]) -> Tuple[ISubscription, StreamCursor, List[StreamEvent], bool]:
+        """
+        Open a live subscription and read what the client missed
+
+        Subscribing first means an event published during the catch-up
+        arrives on the subscription too; callers skip the backlog's events
+        by event.key. Live events are not filtered by the cursor: one
+        committed out of id order is still new to this client.
+
+        Args:
+            user_id: User ID
+            cursor: Position from Last-Event-ID, None for a fresh stream
+
+        Returns:
+            (subscription, cursor, backlog, True if the backlog was truncated)
+        """
+        subscription = self.broker.subscribe(user_id)
+        try:
+            if cursor is None:
+                return subscription, self.start_cursor(), [], False
+            events, more = self.backlog(user_id, cursor)
+            return subscription, cursor, events, more
+        except Exception:
+            subscription.close()
+            raise
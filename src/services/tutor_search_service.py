@@ -0,0 +1,358 @@
+import heapq
+import math
+import re
+import time as clock
+import unicodedata
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import datetime, time, timedelta
+from itertools import chain, islice
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from domain.models.interfaces.iavailability_slot_repository import IAvailabilitySlotRepository
+from domain.models.interfaces.itutor_profile_repository import ITutorProfileRepository
+from domain.models.interfaces.itutor_subject_repository import ITutorSubjectRepository
+from domain.models.availability_slot import Weekday
+from domain.models.tutor_profile import VerificationStatus
+from domain.models.tutor_search import TutorSearchHit, TutorSearchQuery, TutorSearchResult
+from services.availability_service import MINUTES_PER_DAY, WEEKDAY_NUMBERS, _zone
+from services.index_cache import IndexCache
+
+TOKEN_PATTERN = re.compile(r'\w+')
+# A term found in the tutor's name counts this much more than one in the bio
+NAME_WEIGHT = 3.0
+# Facet buckets: hourly rate ranges (upper bound exclusive) and minimum ratings
+RATE_BUCKETS = [(Decimal('0'), Decimal('25')), (Decimal('25'), Decimal('50')),
+                (Decimal('50'), Decimal('100')), (Decimal('100'), None)]
+RATING_BUCKETS = [4, 3, 2, 1]
+WEEKDAYS = [weekday.value for weekday in Weekday]
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+FACETS = ('subject_id', 'level', 'verification_status', 'weekday', 'hourly_rate', 'rating')
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-case, accent-folded word tokens ("Nguyễn" -> "nguyen")"""
+    if not text:
+        return []
+    folded = unicodedata.normalize('NFKD', text.lower())
+    folded = ''.join(ch for ch in folded if not unicodedata.combining(ch)).replace('đ', 'd')
+    return TOKEN_PATTERN.findall(folded)
+
+
+def _minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def _enum_value(value) -> str:
+    return value.value if hasattr(value, 'value') else value
+
+
+def _merged(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Sorted union of [start, end) intervals; touching intervals are joined"""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _rate_bucket(rate: Decimal) -> str:
+    for low, high in RATE_BUCKETS:
+        if high is None or rate < high:
+            return f'{low}-{high}' if high is not None else f'{low}+'
+    return ''
+
+
+class _TutorDocument:
+    __slots__ = ('tutor_id', 'full_name', 'hourly_rate', 'verification_status',
+                 'rating_avg', 'rating_count', 'subject_ids')
+
+    def __init__(self, tutor_id, full_name, hourly_rate, verification_status, rating_avg, rating_count):
+        self.tutor_id = tutor_id
+        self.full_name = full_name
+        self.hourly_rate = Decimal(hourly_rate or 0)
+        self.verification_status = verification_status
+        self.rating_avg = float(rating_avg or 0)
+        self.rating_count = rating_count or 0
+        self.subject_ids = []
+
+
+class TutorSearchIndex:
+    """
+    Immutable in-memory search index over all tutors.
+
+    Text matching uses an inverted index (term -> {tutor_id: weight}); the
+    last query term also matches as a prefix. Every filter resolves to a set
+    of tutor ids (posting sets for facets, bisected slices of presorted ids
+    for rate/rating) and the sets are intersected smallest first. Without
+    text the ranking is rating_avg, then rating_count, precomputed at build
+    time.
+    """
+
+    def __init__(self, profile_rows: Iterable[Tuple], subject_rows: Iterable[Tuple], window_rows: Iterable[Tuple]):
+        self.built_at = clock.monotonic()
+        self.documents: Dict[int, _TutorDocument] = {}
+        self.postings: Dict[str, Dict[int, float]] = {}
+        for user_id, full_name, bio, hourly_rate, status, rating_avg, rating_count in profile_rows:
+            self.documents[user_id] = _TutorDocument(
+                user_id, full_name, hourly_rate, _enum_value(status), rating_avg, rating_count
+            )
+            for weight, text in ((NAME_WEIGHT, full_name), (1.0, bio)):
+                for term in tokenize(text):
+                    weights = self.postings.setdefault(term, {})
+                    weights[user_id] = weights.get(user_id, 0.0) + weight
+        self.vocabulary = sorted(self.postings)
+        self.all_ids: Set[int] = set(self.documents)
+
+        self.by_subject: Dict[int, Set[int]] = {}
+        self.by_level: Dict[str, Set[int]] = {}
+        levels_of: Dict[int, Set[str]] = {}
+        for tutor_id, subject_id, level in subject_rows:
+            document = self.documents.get(tutor_id)
+            if document is None:
+                continue
+            level = _enum_value(level)
+            document.subject_ids.append(subject_id)
+            levels_of.setdefault(tutor_id, set()).add(level)
+            self.by_subject.setdefault(subject_id, set()).add(tutor_id)
+            self.by_level.setdefault(level, set()).add(tutor_id)
+
+        self.by_status: Dict[str, Set[int]] = {}
+        for document in self.documents.values():
+            self.by_status.setdefault(document.verification_status, set()).add(document.tutor_id)
+
+        # Slots in UTC minutes of the week (each zone's offset when the index
+        # is built) and merged per tutor, so back-to-back slots cover a window
+        # together. UTC weekday -> [(tutor_id, start, end)] of the merged
+        # intervals touching that day.
+        self.windows: Dict[str, List[Tuple[int, int, int]]] = {}
+        self.by_weekday: Dict[str, Set[int]] = {}
+        for tutor_id, intervals in self._utc_intervals(window_rows).items():
+            for start, end in _merged(intervals):
+                for day in range(start // MINUTES_PER_DAY, (end - 1) // MINUTES_PER_DAY + 1):
+                    weekday = WEEKDAYS[day]
+                    self.windows.setdefault(weekday, []).append((tutor_id, start, end))
+                    self.by_weekday.setdefault(weekday, set()).add(tutor_id)
+
+        # Facet counting. Subjects (many values) are counted per tutor. The
+        # other facets have few values, so each tutor gets one small int per
+        # group naming its combination of values; counting is then a Counter
+        # over ints plus an expansion of the few distinct combinations.
+        self._subjects_of = {t: tuple(d.subject_ids) for t, d in self.documents.items()}
+        weekdays_of: Dict[int, Set[str]] = {}
+        for weekday, members in self.by_weekday.items():
+            for tutor_id in members:
+                weekdays_of.setdefault(tutor_id, set()).add(weekday)
+        self._facet_groups = []
+        for combination_of in (
+            lambda d: (('verification_status', d.verification_status),
+                       ('hourly_rate', _rate_bucket(d.hourly_rate)))
+                      + tuple(('rating', f'{stars}+') for stars in RATING_BUCKETS if d.rating_avg >= stars),
+            lambda d: tuple(('level', level) for level in sorted(levels_of.get(d.tutor_id, ()))),
+            lambda d: tuple(('weekday', weekday) for weekday in sorted(weekdays_of.get(d.tutor_id, ()))),
+        ):
+            combinations: Dict[Tuple, int] = {}
+            code_of = {}
+            for document in self.documents.values():
+                code_of[document.tutor_id] = combinations.setdefault(combination_of(document), len(combinations))
+            self._facet_groups.append((code_of, list(combinations)))
+
+        # Ids presorted by rate / rating so range filters are two bisects and a slice
+        by_rate = sorted(self.documents.values(), key=lambda d: d.hourly_rate)
+        self.rate_keys = [document.hourly_rate for document in by_rate]
+        self.rate_ids = [document.tutor_id for document in by_rate]
+        by_rating = sorted(self.documents.values(), key=lambda d: d.rating_avg)
+        self.rating_keys = [document.rating_avg for document in by_rating]
+        self.rating_ids = [document.tutor_id for document in by_rating]
+
+        ranked = sorted(self.documents.values(), key=lambda d: (-d.rating_avg, -d.rating_count, d.tutor_id))
+        self.rank: Dict[int, int] = {document.tutor_id: position for position, document in enumerate(ranked)}
+        self.ranked_ids: List[int] = [document.tutor_id for document in ranked]
+        self._all_facets = self._facet_counts(self.all_ids)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def _utc_intervals(self, window_rows: Iterable[Tuple]) -> Dict[int, List[Tuple[int, int]]]:
+        """tutor_id -> slots as [start, end) UTC minutes of the week, split at the week's end"""
+        now = datetime.utcnow()
+        offsets: Dict[Optional[str], int] = {}
+        intervals: Dict[int, List[Tuple[int, int]]] = {}
+        for tutor_id, weekday, start_time, end_time, zone in window_rows:
+            local_start, length = _minutes(start_time), _minutes(end_time) - _minutes(start_time)
+            if tutor_id not in self.documents or length <= 0:
+                continue
+            if zone not in offsets:
+                offsets[zone] = _zone(zone).utcoffset(now) // timedelta(minutes=1)
+            day = WEEKDAY_NUMBERS[_enum_value(weekday)] * MINUTES_PER_DAY
+            start = (day + local_start - offsets[zone]) % MINUTES_PER_WEEK
+            end = start + length
+            tutor_intervals = intervals.setdefault(tutor_id, [])
+            if end > MINUTES_PER_WEEK:
+                tutor_intervals.append((0, end - MINUTES_PER_WEEK))
+                end = MINUTES_PER_WEEK
+            tutor_intervals.append((start, end))
+        return intervals
+
+    def _idf(self, tutor_count: int) -> float:
+        return math.log(1 + len(self.documents) / tutor_count)
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        start = bisect_left(self.vocabulary, prefix)
+        terms = []
+        for term in self.vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def _text_scores(self, terms: List[str]) -> Dict[int, float]:
+        """tutor_id -> relevance for tutors matching every query term"""
+        scores: Optional[Dict[int, float]] = None
+        for position, term in enumerate(terms):
+            expansions = [term] if term in self.postings else []
+            if position == len(terms) - 1:
+                expansions = self._prefix_terms(term)
+            term_scores: Dict[int, float] = {}
+            for expansion in expansions:
+                weights = self.postings[expansion]
+                idf = self._idf(len(weights))
+                for tutor_id, weight in weights.items():
+                    term_scores[tutor_id] = max(term_scores.get(tutor_id, 0.0), idf * weight)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {tutor_id: score + term_scores[tutor_id]
+                          for tutor_id, score in scores.items() if tutor_id in term_scores}
+            if not scores:
+                return {}
+        return scores or {}
+
+    def _available(self, query: TutorSearchQuery) -> Set[int]:
+        """Tutors available for the whole UTC window of the query"""
+        weekday = query.weekday.value
+        if query.start_time is None and query.end_time is None:
+            return self.by_weekday.get(weekday, set())
+        day = WEEKDAY_NUMBERS[weekday] * MINUTES_PER_DAY
+        start = day + (_minutes(query.start_time) if query.start_time else 0)
+        end = day + (_minutes(query.end_time) if query.end_time else MINUTES_PER_DAY)
+        return {tutor_id for tutor_id, slot_start, slot_end in self.windows.get(weekday, ())
+                if slot_start <= start and slot_end >= end}
+
+    def _facet_counts(self, matched: Set[int]) -> Dict[str, Dict[str, int]]:
+        subjects = Counter(chain.from_iterable(map(self._subjects_of.__getitem__, matched)))
+        facets = {name: {} for name in FACETS}
+        facets['subject_id'] = {str(subject_id): n for subject_id, n in subjects.items()}
+        for code_of, combinations in self._facet_groups:
+            for code, n in Counter(map(code_of.__getitem__, matched)).items():
+                for name, value in combinations[code]:
+                    facets[name][value] = facets[name].get(value, 0) + n
+        return facets
+
+    @staticmethod
+    def _range(keys: List, ids: List[int], low=None, high=None) -> Set[int]:
+        start = bisect_left(keys, low) if low is not None else 0
+        end = bisect_right(keys, high) if high is not None else len(keys)
+        return set(ids[start:end])
+
+    def search(self, query: TutorSearchQuery) -> TutorSearchResult:
+        """Filter, rank and page the index; facet counts cover all matches"""
+        terms = tokenize(query.text)
+        scores = self._text_scores(terms) if terms else None
+
+        sets = []
+        if scores is not None:
+            sets.append(scores.keys())
+        if query.subject_ids:
+            sets.append(set().union(*(self.by_subject.get(s, set()) for s in query.subject_ids)))
+        if query.levels:
+            sets.append(set().union(*(self.by_level.get(l.value, set()) for l in query.levels)))
+        if query.verification_statuses:
+            sets.append(set().union(*(self.by_status.get(v.value, set()) for v in query.verification_statuses)))
+        if query.weekday is not None:
+            sets.append(self._available(query))
+        if query.min_rate is not None or query.max_rate is not None:
+            sets.append(self._range(self.rate_keys, self.rate_ids, query.min_rate, query.max_rate))
+        if query.min_rating is not None:
+            sets.append(self._range(self.rating_keys, self.rating_ids, low=query.min_rating))
+
+        if sets:
+            sets.sort(key=len)
+            matched = set(sets[0]).intersection(*sets[1:])
+        else:
+            matched = self.all_ids
+
+        wanted = query.offset + query.limit
+        if scores is not None:
+            rank = self.rank
+            top = heapq.nsmallest(wanted, matched, key=lambda tutor_id: (-scores[tutor_id], rank[tutor_id]))
+        else:
+            # Walk the precomputed ranking; stops as soon as the page is full
+            top = list(islice(filter(matched.__contains__, self.ranked_ids), wanted))
+
+        items = []
+        for tutor_id in top[query.offset:]:
+            document = self.documents[tutor_id]
+            items.append(TutorSearchHit(
+                tutor_id=tutor_id,
+                full_name=document.full_name,
+                hourly_rate=document.hourly_rate,
+                verification_status=VerificationStatus(document.verification_status),
+                rating_avg=document.rating_avg,
+                rating_count=document.rating_count,
+                subject_ids=list(document.subject_ids),
+                score=round(scores[tutor_id], 4) if scores is not None else 0.0
+            ))
+
+        facets = self._all_facets if matched is self.all_ids else self._facet_counts(matched)
+        next_offset = wanted if wanted < len(matched) else None
+        return TutorSearchResult(items=items, total=len(matched), facets=facets, next_offset=next_offset)
+
+
+class TutorSearchService:
+    """
+    Service class for tutor search
+    Combines name/bio text search with subject, level, rate, rating,
+    verification and availability facets in one query
+    """
+
+    def __init__(
+        self,
+        profile_repository: ITutorProfileRepository,
+        tutor_subject_repository: ITutorSubjectRepository,
+        availability_repository: IAvailabilitySlotRepository,
+        index_cache: IndexCache
+    ):
+        self.profile_repository = profile_repository
+        self.tutor_subject_repository = tutor_subject_repository
+        self.availability_repository = availability_repository
+        self.index_cache = index_cache
+
+    def build_index(self) -> TutorSearchIndex:
+        """
+        Load all tutors, their subjects and availability (three queries)
+        and build a fresh index
+
+        Returns:
+            New TutorSearchIndex
+        """
+        return TutorSearchIndex(
+            self.profile_repository.get_search_rows(),
+            self.tutor_subject_repository.get_subject_level_rows(),
+            self.availability_repository.get_window_rows()
+        )
+
+    def search(self, query: TutorSearchQuery) -> TutorSearchResult:
+        """
+        Search tutors
+
+        Args:
+            query: Text and facet filters plus limit/offset
+
+        Returns:
+            Ranked page of hits with total and facet counts
+        """
+        return self.index_cache.get(self.build_index).search(query)
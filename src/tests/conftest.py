@@ -0,0 +1,54 @@
+"""
+Shared fixtures. The suite runs against a throwaway SQLite file, so
+DATABASE_URI is set before the application modules read the config.
+Run from src/:
+
+    python -m pytest -q tests
+"""
+import importlib
+import os
+import pkgutil
+import tempfile
+
+_db_dir = tempfile.mkdtemp(prefix='tests-db-')
+os.environ['DATABASE_URI'] = 'sqlite:///' + os.path.join(_db_dir, 'test.db')
+os.environ.setdefault('ACCESS_LOG_ENABLED', 'False')
+
+import pytest
+
+import infrastructure.models
+from infrastructure.databases.base import Base
+from infrastructure.databases.mssql import SessionLocal, engine
+
+# Register every model on Base.metadata
+for _module in pkgutil.iter_modules(infrastructure.models.__path__):
+    importlib.import_module(f'infrastructure.models.{_module.name}')
+
+
+@pytest.fixture
+def session():
+    """A session on freshly created tables, dropped again afterwards"""
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def make_client(session):
+    """Test client factory for an app serving the given blueprints on the test tables"""
+    from flask import Flask
+    from infrastructure.databases.mssql import init_mssql
+
+    def make(*blueprints):
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+        for blueprint in blueprints:
+            app.register_blueprint(blueprint)
+        init_mssql(app)
+        return app.test_client()
+
+    return make
@@ -0,0 +1,149 @@
+import json
+import logging
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask, Response, jsonify, request
+
+from api import access_log
+from api.access_log import JsonLineFormatter, begin_access_log, capture_body, log_access
+
+
+class Recorder(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.entries = []
+
+    def emit(self, record):
+        self.entries.append(record.msg)
+
+
+@pytest.fixture
+def recorder():
+    handler = Recorder()
+    logger = access_log.logger
+    level, propagate = logger.level, logger.propagate
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    try:
+        yield handler
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(level)
+        logger.propagate = propagate
+
+
+def make_config(**overrides):
+    values = dict(ACCESS_LOG_SAMPLE_RATE=1.0, ACCESS_LOG_SLOW_MS=1000.0, ACCESS_LOG_BODY_MAX_BYTES=8)
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def make_app(config):
+    app = Flask(__name__)
+    app.before_request(begin_access_log)
+    app.after_request(lambda response: log_access(response, config) or response)
+
+    @app.route('/ok')
+    def ok():
+        return jsonify({'ok': True})
+
+    @app.route('/fail')
+    def fail():
+        return jsonify({'error': 'boom'}), 500
+
+    @app.route('/stream')
+    def stream():
+        def generate():
+            yield 'a'
+            yield 'b'
+        return Response(generate(), mimetype='text/plain')
+
+    @app.route('/echo', methods=['POST'])
+    @capture_body(max_bytes=4)
+    def echo():
+        return jsonify(request.get_json())
+
+    @app.route('/default-cap', methods=['POST'])
+    @capture_body()
+    def default_cap():
+        return jsonify({'ok': True})
+
+    @app.route('/no-capture', methods=['POST'])
+    def no_capture():
+        return jsonify({'ok': True})
+
+    return app.test_client()
+
+
+def test_logs_one_entry_per_request(recorder):
+    client = make_app(make_config())
+
+    response = client.get('/ok')
+
+    assert response.status_code == 200
+    [entry] = recorder.entries
+    assert entry['method'] == 'GET'
+    assert entry['path'] == '/ok'
+    assert entry['endpoint'] == 'ok'
+    assert entry['status'] == 200
+    assert entry['bytes'] == response.content_length
+    assert entry['duration_ms'] >= 0
+    assert 'body' not in entry
+
+
+def test_unsampled_requests_are_skipped_but_errors_are_always_logged(recorder):
+    client = make_app(make_config(ACCESS_LOG_SAMPLE_RATE=0.0))
+
+    client.get('/ok')
+    client.get('/fail')
+
+    assert [entry['status'] for entry in recorder.entries] == [500]
+
+
+def test_slow_requests_are_always_logged(recorder):
+    client = make_app(make_config(ACCESS_LOG_SAMPLE_RATE=0.0, ACCESS_LOG_SLOW_MS=0.0))
+
+    client.get('/ok')
+
+    assert len(recorder.entries) == 1
+
+
+def test_streamed_response_is_not_buffered_to_measure_it(recorder):
+    client = make_app(make_config())
+
+    response = client.get('/stream')
+
+    [entry] = recorder.entries
+    assert entry['bytes'] is None
+    assert response.get_data(as_text=True) == 'ab'
+
+
+def test_capture_body_truncates_to_its_cap(recorder):
+    client = make_app(make_config())
+
+    response = client.post('/echo', json={'name': 'value'})
+
+    assert response.get_json() == {'name': 'value'}
+    assert recorder.entries[0]['body'] == '{"na...'
+
+
+def test_capture_body_without_cap_uses_the_configured_one(recorder):
+    client = make_app(make_config())
+
+    client.post('/default-cap', data='0123456789')
+    client.post('/default-cap', data='short')
+    client.post('/no-capture', data='secret')
+
+    assert [entry.get('body') for entry in recorder.entries] == ['01234567...', 'short', None]
+
+
+def test_json_line_formatter():
+    record = logging.LogRecord('access', logging.INFO, __file__, 1, {'status': 200}, None, None)
+    record.created = 0.0
+
+    line = JsonLineFormatter().format(record)
+
+    assert json.loads(line) == {'ts': '1970-01-01T00:00:00.000Z', 'status': 200}
+    assert '\n' not in line
@@ -0,0 +1,98 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+
+from infrastructure.models.availability_slot_model import AvailabilitySlotModel
+from infrastructure.models.booking_model import BookingModel
+from infrastructure.repositories.availability_slot_repository import AvailabilitySlotRepository
+from infrastructure.repositories.booking_repository import BookingRepository
+from infrastructure.repositories.tutor_subject_repository import TutorSubjectRepository
+from services.availability_service import AvailabilityIndex, AvailabilityService
+from services.index_cache import IndexCache
+
+MONDAY = datetime(2026, 1, 5)
+
+
+def _at(hour, minute=0):
+    return MONDAY + timedelta(hours=hour, minutes=minute)
+
+
+@pytest.fixture
+def index():
+    slots = [
+        (1, 'Mon', time(9), time(12), 'UTC'),
+        # Touching slots merge into one window
+        (2, 'Mon', time(9), time(10), 'UTC'),
+        (2, 'Mon', time(10), time(11), 'UTC'),
+        # 09:00-12:00 in New York is 14:00-17:00 UTC in January
+        (3, 'Mon', time(9), time(12), 'America/New_York')
+    ]
+    bookings = [(1, _at(10), _at(11))]
+    subjects = [(1, 100, 'K12'), (3, 100, 'K12'), (2, 200, 'K12')]
+    return AvailabilityIndex(slots, bookings, subjects, MONDAY, horizon_days=7)
+
+
+def test_bookings_are_subtracted_from_the_slots(index):
+    assert index.is_free(1, _at(9), _at(10))
+    assert not index.is_free(1, _at(9, 30), _at(10, 30))
+    assert index.within_availability(1, _at(9, 30), _at(10, 30))
+    assert index.is_free(1, _at(11), _at(12))
+    assert index.is_free(2, _at(9, 30), _at(10, 30))
+    assert not index.is_free(2, _at(10, 30), _at(11, 30))
+    assert index.are_free([1, 2, 3], [_at(9)] * 3, [_at(10)] * 3).tolist() == [True, True, False]
+
+
+def test_slots_are_expanded_in_their_own_timezone(index):
+    assert index.is_free(3, _at(14), _at(17))
+    assert not index.is_free(3, _at(9), _at(10))
+
+
+def test_queries_outside_the_horizon_are_never_free(index):
+    assert not index.is_free(1, MONDAY - timedelta(days=7, hours=-9), MONDAY - timedelta(days=7, hours=-10))
+    assert not index.is_free(1, _at(9) + timedelta(days=7), _at(10) + timedelta(days=7))
+    assert index.free_tutors(_at(9) + timedelta(days=7), _at(10) + timedelta(days=7)) == []
+
+
+def test_free_tutors_and_next_windows(index):
+    assert index.free_tutors(_at(9), _at(10)) == [1, 2]
+    assert index.free_tutors(_at(9), _at(10), subject_id=100) == [1]
+    assert index.free_tutors(_at(9), _at(10), subject_id=999) == []
+    assert index.next_free_windows(1, MONDAY) == [(_at(9), _at(10)), (_at(11), _at(12))]
+    assert index.next_free_windows(1, MONDAY, duration_minutes=90) == []
+
+
+def test_free_grid_matches_is_free(index):
+    tutor_ids, matrix = index.free_grid(_at(8), step_minutes=30, count=20, duration_minutes=60)
+    assert tutor_ids.tolist() == [1, 2, 3]
+    for row, tutor_id in enumerate(tutor_ids):
+        for window in range(20):
+            start = _at(8) + timedelta(minutes=30 * window)
+            assert matrix[row, window] == index.is_free(int(tutor_id), start, start + timedelta(hours=1))
+
+    tutor_ids, matrix = index.free_grid(_at(9), step_minutes=60, count=3, duration_minutes=60, subject_id=100)
+    assert tutor_ids.tolist() == [1]
+    assert matrix.tolist() == [[True, False, True]]
+
+
+def test_can_book_checks_bookings_made_after_the_index_was_built(session):
+    # Tutor 1 is available all day, every day
+    session.add_all([
+        AvailabilitySlotModel(tutor_id=1, weekday=weekday, start_time=time(0), end_time=time(23, 59))
+        for weekday in ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+    ])
+    session.commit()
+    service = AvailabilityService(AvailabilitySlotRepository(session), BookingRepository(session),
+                                  TutorSubjectRepository(session), IndexCache(ttl_seconds=60))
+    start = datetime.utcnow().replace(hour=10, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    end = start + timedelta(hours=1)
+    assert service.can_book(1, start, end)
+    assert not service.can_book(2, start, end)
+
+    session.add(BookingModel(student_id=5, tutor_id=1, service_id=1, subject_id=1, start_at=start, end_at=end,
+                             hours=Decimal('1.00'), status='Confirmed', total_amount=Decimal('20.00')))
+    session.commit()
+    # The cached index has not seen the booking, the database check has
+    assert service.get_index().is_free(1, start, end)
+    assert not service.can_book(1, start + timedelta(minutes=30), end + timedelta(minutes=30))
+    assert service.can_book(1, end, end + timedelta(hours=1))
@@ -0,0 +1,72 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from infrastructure.databases.mssql import engine
+from infrastructure.models.subject_model import SubjectModel
+from infrastructure.repositories import base_repository
+from infrastructure.repositories.subject_repository import SubjectRepository
+
+
+@pytest.fixture
+def statements():
+    """(statement, executemany, parameter count) of every INSERT sent to the driver"""
+    sent = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('INSERT'):
+            sent.append((statement, executemany, len(parameters)))
+
+    event.listen(engine, 'before_cursor_execute', record)
+    yield sent
+    event.remove(engine, 'before_cursor_execute', record)
+
+
+def _subjects(count):
+    return [{'name': f'Subject {i}', 'level': 'K12'} for i in range(count)]
+
+
+def test_add_many_sends_multi_row_inserts(session, statements):
+    inserted = SubjectRepository(session).add_many(_subjects(2500))
+    assert inserted == 2500
+    assert session.query(SubjectModel).count() == 2500
+    assert statements
+    assert not any(executemany for _, executemany, _ in statements)
+    # Each statement stays under the parameter limit and carries many rows
+    per_row = len(SubjectModel.__table__.columns)
+    assert all(params <= base_repository.MAX_STATEMENT_PARAMS for _, _, params in statements)
+    assert len(statements) <= 2500 * per_row // base_repository.MAX_STATEMENT_PARAMS + 3
+
+
+def test_add_many_commits_per_chunk(session, statements):
+    repository = SubjectRepository(session)
+    assert repository.add_many(_subjects(5), chunk_size=2) == 5
+    assert len(statements) == 3
+
+
+def test_add_many_groups_rows_setting_different_columns(session):
+    created = datetime(2024, 1, 1)
+    rows = [
+        {'name': 'Algebra', 'level': 'K12'},
+        {'name': 'Topology', 'level': 'Graduate', 'created_at': created},
+        {'name': 'Geometry', 'level': 'K12'}
+    ]
+    assert SubjectRepository(session).add_many(rows) == 3
+    created_at = dict(session.query(SubjectModel.name, SubjectModel.created_at))
+    assert created_at['Topology'] == created
+    assert created_at['Algebra'] > created and created_at['Geometry'] > created
+
+
+def test_add_many_rolls_back_the_failing_chunk(session):
+    repository = SubjectRepository(session)
+    rows = _subjects(2) + [{'name': 'Subject 0', 'level': 'K12'}]
+    with pytest.raises(ValueError):
+        repository.add_many(rows, chunk_size=2)
+    assert session.query(SubjectModel).count() == 2
+
+
+def test_add_many_leaves_batching_to_fast_executemany(session, statements, monkeypatch):
+    monkeypatch.setattr(engine.dialect, 'fast_executemany', True, raising=False)
+    assert SubjectRepository(session).add_many(_subjects(30), chunk_size=20) == 30
+    assert [(executemany, params) for _, executemany, params in statements] == [(True, 20), (True, 10)]
@@ -0,0 +1,72 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from api.controllers.catalog_controller import bp
+from domain.models.subject import Subject, SubjectLevel
+from infrastructure.cache.read_through import service_listing_cache, subject_cache, tutor_profile_cache
+from infrastructure.databases.mssql import engine
+from infrastructure.models.service_listing_model import ServiceListingModel
+from infrastructure.models.subject_model import SubjectModel
+from infrastructure.models.tutor_profile_model import TutorProfileModel
+from infrastructure.repositories.cached_repositories import CachedSubjectRepository
+
+
+@pytest.fixture
+def client(session, make_client):
+    for cache in (subject_cache, tutor_profile_cache, service_listing_cache):
+        cache.invalidate()
+    session.add_all([
+        SubjectModel(id=1, name='Algebra', level='K12'),
+        SubjectModel(id=2, name='Topology', level='Graduate'),
+        TutorProfileModel(user_id=7, full_name='Alice Smith', bio='algebra', hourly_rate=Decimal('20.00')),
+        ServiceListingModel(id=1, tutor_id=7, title='Algebra 1:1', description='', price_per_hour=Decimal('20.00')),
+        ServiceListingModel(id=2, tutor_id=8, title='Topology', description='', price_per_hour=Decimal('40.00')),
+        ServiceListingModel(id=3, tutor_id=7, title='Old', description='', price_per_hour=Decimal('10.00'), active=False)
+    ])
+    session.commit()
+    return make_client(bp)
+
+
+@pytest.fixture
+def queries():
+    sent = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        sent.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', record)
+    yield sent
+    event.remove(engine, 'before_cursor_execute', record)
+
+
+def test_repeated_catalog_reads_skip_the_database(client, queries):
+    paths = ['/catalog/subjects', '/catalog/subjects?level=K12', '/catalog/subjects/2',
+             '/catalog/tutors/7', '/catalog/listings']
+    first = [client.get(path).get_json() for path in paths]
+    assert queries
+    queries.clear()
+    assert [client.get(path).get_json() for path in paths] == first
+    assert queries == []
+
+
+def test_catalog_responses(client):
+    assert sorted(subject['name'] for subject in client.get('/catalog/subjects').get_json()) == ['Algebra', 'Topology']
+    assert [subject['id'] for subject in client.get('/catalog/subjects?level=Graduate').get_json()] == [2]
+    assert client.get('/catalog/subjects/1').get_json()['level'] == 'K12'
+    assert client.get('/catalog/subjects/9').status_code == 404
+    assert client.get('/catalog/subjects?level=PhD').status_code == 400
+    profile = client.get('/catalog/tutors/7').get_json()
+    assert profile['full_name'] == 'Alice Smith'
+    assert profile['rating_histogram'] == {'1': 0, '2': 0, '3': 0, '4': 0, '5': 0}
+    assert client.get('/catalog/tutors/8').status_code == 404
+    assert [listing['id'] for listing in client.get('/catalog/listings').get_json()] == [1, 2]
+    assert [listing['id'] for listing in client.get('/catalog/listings?tutor_id=7').get_json()] == [1]
+
+
+def test_subject_write_clears_the_cached_pages(client, session):
+    assert len(client.get('/catalog/subjects').get_json()) == 2
+    CachedSubjectRepository(session).add(Subject(name='Geometry', level=SubjectLevel.K12))
+    assert len(client.get('/catalog/subjects').get_json()) == 3
+    assert subject_cache.stats()['misses'] >= 2
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from api.controllers.chat_controller import bp
+from infrastructure.models.chat_thread_model import ChatThreadModel
+from infrastructure.repositories.chat_thread_repository import ChatThreadRepository
+from infrastructure.repositories.message_repository import MessageRepository
+
+CREATED = datetime(2026, 9, 1)
+
+
+@pytest.fixture
+def client(session, make_client):
+    # Tutor 20 talks to students 10 and 11; student 10 also talks to tutor 21
+    session.add_all([
+        ChatThreadModel(id=1, student_id=10, tutor_id=20, created_at=CREATED, last_activity_at=CREATED),
+        ChatThreadModel(id=2, student_id=11, tutor_id=20, created_at=CREATED + timedelta(hours=1),
+                        last_activity_at=CREATED + timedelta(hours=1)),
+        ChatThreadModel(id=3, student_id=10, tutor_id=21, created_at=CREATED + timedelta(hours=2),
+                        last_activity_at=CREATED + timedelta(hours=2))
+    ])
+    session.commit()
+    return make_client(bp)
+
+
+def _send(client, thread_id, sender_id, body):
+    response = client.post(f'/chat/threads/{thread_id}/messages', json={'sender_id': sender_id, 'body': body})
+    assert response.status_code == 201
+    return response.get_json()['id']
+
+
+def _inbox(client, user_id, query=''):
+    return client.get(f'/chat/threads?user_id={user_id}{query}')
+
+
+def test_inbox_shows_last_message_and_unread_counts(client):
+    _send(client, 1, 10, 'hello')
+    _send(client, 1, 10, 'are you there?')
+    _send(client, 2, 20, 'x' * 300)
+
+    tutor = _inbox(client, 20).get_json()
+    assert [thread['id'] for thread in tutor] == [2, 1]
+    assert tutor[0]['last_message_snippet'] == 'x' * 200
+    assert (tutor[0]['unread_count'], tutor[0]['counterpart_id']) == (0, 11)
+    assert (tutor[1]['last_message_snippet'], tutor[1]['unread_count']) == ('are you there?', 2)
+
+    student = _inbox(client, 10).get_json()
+    # Thread 3 has no messages: ordered by its creation
+    assert [(thread['id'], thread['unread_count']) for thread in student] == [(1, 0), (3, 0)]
+    assert student[1]['last_message_id'] is None
+
+
+def test_marking_read_resets_only_the_reader(client):
+    _send(client, 1, 10, 'hello')
+    _send(client, 1, 20, 'hi!')
+    summary = client.post('/chat/threads/1/read', json={'user_id': 20}).get_json()
+    assert summary['unread_count'] == 0
+    assert _inbox(client, 10).get_json()[0]['unread_count'] == 1
+    _send(client, 1, 10, 'question')
+    assert _inbox(client, 20).get_json()[0]['unread_count'] == 1
+    assert client.post('/chat/threads/9/read', json={'user_id': 20}).status_code == 404
+    assert client.post('/chat/threads/1/read', json={'user_id': 99}).status_code == 400
+
+
+def test_inbox_pages_by_last_activity(client):
+    for thread_id, sender_id in ((2, 11), (1, 10)):
+        _send(client, thread_id, sender_id, 'ping')
+    first = _inbox(client, 20, '&limit=1')
+    assert [thread['id'] for thread in first.get_json()] == [1]
+    second = _inbox(client, 20, f"&limit=1&after={first.headers['X-Next-Cursor']}")
+    assert [thread['id'] for thread in second.get_json()] == [2]
+    third = _inbox(client, 20, f"&limit=1&after={second.headers['X-Next-Cursor']}")
+    assert third.get_json() == []
+
+
+def test_deleting_messages_falls_back_to_the_previous_one(client, session):
+    first = _send(client, 1, 10, 'first')
+    last = _send(client, 1, 10, 'second')
+    messages = MessageRepository(session)
+    messages.delete(last)
+    thread = _inbox(client, 20).get_json()[0]
+    assert (thread['last_message_id'], thread['last_message_snippet'], thread['unread_count']) == (first, 'first', 1)
+    messages.delete(first)
+    # Back to its creation time, so below thread 2 again
+    second, thread = _inbox(client, 20).get_json()
+    assert (second['id'], thread['id']) == (2, 1)
+    assert (thread['last_message_id'], thread['unread_count']) == (None, 0)
+    assert thread['last_activity_at'] == CREATED.isoformat()
+
+
+def test_rebuild_repairs_the_projection(client, session):
+    _send(client, 1, 10, 'hello')
+    last = _send(client, 1, 10, 'again')
+    client.post('/chat/threads/1/read', json={'user_id': 20})
+    _send(client, 1, 10, 'unread')
+    expected = _inbox(client, 20).get_json()
+
+    session.execute(update(ChatThreadModel).values(
+        last_message_id=None, last_message_snippet=None, student_unread_count=7, tutor_unread_count=7
+    ))
+    session.commit()
+    assert ChatThreadRepository(session).rebuild_summaries(chunk_size=1) == 1
+    rebuilt = _inbox(client, 20).get_json()
+    assert rebuilt == expected
+    assert rebuilt[0]['unread_count'] == 1
+    assert _inbox(client, 10).get_json()[0]['unread_count'] == 0
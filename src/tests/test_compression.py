@@ -0,0 +1,113 @@
+import gzip
+import json
+import os
+import zlib
+
+import pytest
+from flask import Flask, Response, jsonify
+
+from api import compression as compression_module
+from api.compression import ResponseCompression
+
+BIG = {'items': [{'id': i, 'name': f'subject {i}'} for i in range(200)]}
+
+
+@pytest.fixture
+def compression():
+    return ResponseCompression(min_size=100, cache_paths=('/cached',))
+
+
+@pytest.fixture
+def client(compression):
+    app = Flask(__name__)
+    app.after_request(compression.apply)
+
+    @app.route('/big')
+    @app.route('/cached/big')
+    def big():
+        return jsonify(BIG)
+
+    @app.route('/small')
+    def small():
+        return jsonify({'ok': True})
+
+    @app.route('/etag')
+    def etag():
+        response = jsonify(BIG)
+        response.set_etag('v1')
+        return response
+
+    @app.route('/no-transform')
+    def no_transform():
+        response = jsonify(BIG)
+        response.headers['Cache-Control'] = 'no-transform'
+        return response
+
+    @app.route('/random')
+    def random():
+        return Response(os.urandom(4096), mimetype='application/json')
+
+    @app.route('/events')
+    def events():
+        return Response(iter([b'data: 1\n\n'] * 100), mimetype='text/event-stream')
+
+    @app.route('/stream')
+    def stream():
+        return Response((json.dumps(item) + '\n' for item in BIG['items']), mimetype='application/json')
+
+    return app.test_client()
+
+
+def test_large_json_is_gzipped(client):
+    response = client.get('/big', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert json.loads(gzip.decompress(response.data)) == BIG
+
+
+@pytest.mark.skipif(compression_module.brotli is None, reason='brotli is not installed')
+def test_brotli_wins_a_tie(client):
+    response = client.get('/big', headers={'Accept-Encoding': 'gzip, br'})
+    assert response.headers['Content-Encoding'] == 'br'
+    assert json.loads(compression_module.brotli.decompress(response.data)) == BIG
+    assert client.get('/big', headers={'Accept-Encoding': 'gzip, br;q=0.5'}).headers['Content-Encoding'] == 'gzip'
+
+
+@pytest.mark.parametrize('path, accept', [
+    ('/big', 'gzip;q=0'),
+    ('/big', 'identity'),
+    ('/small', 'gzip'),
+    ('/no-transform', 'gzip'),
+    ('/random', 'gzip'),
+    ('/events', 'gzip'),
+])
+def test_left_uncompressed(client, path, accept):
+    assert 'Content-Encoding' not in client.get(path, headers={'Accept-Encoding': accept}).headers
+
+
+def test_strong_etag_is_weakened(client):
+    response = client.get('/etag', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['ETag'] == 'W/"v1"'
+    assert client.get('/etag').headers['ETag'] == '"v1"'
+
+
+def test_streamed_chunks_are_flushed_one_by_one(client):
+    response = client.get('/stream', headers={'Accept-Encoding': 'gzip'}, buffered=False)
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Length' not in response.headers
+    decompressor = zlib.decompressobj(31)
+    first = next(response.response)
+    # The first chunk decompresses on its own: nothing waits for the rest of the stream
+    assert json.loads(decompressor.decompress(first)) == BIG['items'][0]
+    rest = b''.join(response.response)
+    response.close()
+    lines = (decompressor.decompress(rest) + decompressor.flush()).decode().splitlines()
+    assert [json.loads(line) for line in lines] == BIG['items'][1:]
+
+
+def test_cached_paths_compress_once(client, compression):
+    bodies = [client.get('/cached/big', headers={'Accept-Encoding': 'gzip'}).data for _ in range(3)]
+    assert bodies[0] == bodies[1] == bodies[2]
+    assert compression.stats()['misses'] == 1 and compression.stats()['hits'] == 2
+    client.get('/big', headers={'Accept-Encoding': 'gzip'})
+    assert compression.stats()['entries'] == 1
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from flask import Flask, jsonify
+from sqlalchemy import event
+
+from api.controllers.payouts_controller import bp
+from api.middleware import add_conditional_headers
+from infrastructure.databases.mssql import engine
+from infrastructure.models.payout_model import PayoutModel
+
+UPDATED = datetime(2026, 9, 1, 12, 30, 15, 250000)
+
+
+@pytest.fixture
+def client(session, make_client):
+    session.add_all([
+        PayoutModel(id=i, tutor_id=7, booking_id=i, amount=Decimal('10.00'), status='Pending',
+                    created_at=UPDATED + timedelta(minutes=i), updated_at=UPDATED)
+        for i in (1, 2)
+    ])
+    session.commit()
+    return make_client(bp)
+
+
+@pytest.fixture
+def queries():
+    sent = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        sent.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', record)
+    yield sent
+    event.remove(engine, 'before_cursor_execute', record)
+
+
+def _touch(session, payout_id):
+    session.get(PayoutModel, payout_id).updated_at = UPDATED + timedelta(hours=1)
+    session.commit()
+
+
+def test_entity_etag_and_last_modified(client, session):
+    first = client.get('/payouts/1')
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert etag.startswith('W/')
+    assert first.headers['Last-Modified'] == 'Tue, 01 Sep 2026 12:30:15 GMT'
+    assert first.headers['Cache-Control'] == 'private, no-cache'
+
+    cached = client.get('/payouts/1', headers={'If-None-Match': etag})
+    assert cached.status_code == 304 and cached.data == b''
+    assert cached.headers['ETag'] == etag
+    assert client.get('/payouts/1', headers={'If-Modified-Since': first.headers['Last-Modified']}).status_code == 304
+    # If-None-Match wins over If-Modified-Since
+    assert client.get('/payouts/1', headers={'If-None-Match': 'W/"other"',
+                                             'If-Modified-Since': first.headers['Last-Modified']}).status_code == 200
+
+    _touch(session, 1)
+    assert client.get('/payouts/1', headers={'If-None-Match': etag}).status_code == 200
+    assert client.get('/payouts/9').status_code == 404
+
+
+def test_collection_304_is_decided_by_one_fingerprint_query(client, session, queries):
+    first = client.get('/payouts/tutor/7?limit=5')
+    etag = first.headers['ETag']
+    assert len(first.get_json()) == 2
+    queries.clear()
+
+    assert client.get('/payouts/tutor/7?limit=5', headers={'If-None-Match': etag}).status_code == 304
+    assert len(queries) == 1 and 'count(' in queries[0].lower()
+    # Another page or filter never shares the ETag
+    assert client.get('/payouts/tutor/7?limit=1', headers={'If-None-Match': etag}).status_code == 200
+
+    _touch(session, 2)
+    assert client.get('/payouts/tutor/7?limit=5', headers={'If-None-Match': etag}).status_code == 200
+
+
+def test_middleware_falls_back_to_a_body_hash_etag():
+    app = Flask(__name__)
+    app.after_request(add_conditional_headers)
+
+    @app.route('/plain')
+    def plain():
+        return jsonify({'ok': True})
+
+    client = app.test_client()
+    etag = client.get('/plain').headers['ETag']
+    assert client.get('/plain', headers={'If-None-Match': etag}).status_code == 304
+    assert 'ETag' not in client.post('/plain').headers
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from api.controllers.booking_details_controller import bp
+from infrastructure.databases.query_counter import QueryBudgetExceeded, query_budget
+from infrastructure.models.booking_model import BookingModel
+from infrastructure.models.complaint_model import ComplaintModel
+from infrastructure.models.payment_model import PaymentModel
+from infrastructure.models.payout_model import PayoutModel
+from infrastructure.models.service_listing_model import ServiceListingModel
+from infrastructure.models.student_profile_model import StudentProfileModel
+from infrastructure.models.subject_model import SubjectModel
+from infrastructure.models.tutor_profile_model import TutorProfileModel
+from infrastructure.models.user_model import UserModel
+from infrastructure.repositories.booking_repository import BookingRepository
+from infrastructure.repositories.eager_loading import InvalidIncludeError, load_options
+
+START = datetime(2026, 9, 1, 10)
+
+
+@pytest.fixture
+def bookings(session):
+    session.add_all([
+        UserModel(id=1, email='student@example.com', password_hash='x', role='Student', status='Active'),
+        UserModel(id=2, email='tutor@example.com', password_hash='x', role='Tutor', status='Active'),
+        StudentProfileModel(user_id=1, full_name='Sam Student'),
+        TutorProfileModel(user_id=2, full_name='Tia Tutor', bio='algebra', hourly_rate=Decimal('20.00')),
+        SubjectModel(id=1, name='Algebra', level='K12'),
+        ServiceListingModel(id=1, tutor_id=2, title='Algebra 1:1', description='', price_per_hour=Decimal('20.00'))
+    ])
+    for i in range(1, 6):
+        session.add(BookingModel(
+            id=i, student_id=1, tutor_id=2, service_id=1, subject_id=1, start_at=START + timedelta(days=i),
+            end_at=START + timedelta(days=i, hours=1), hours=Decimal('1.00'), status='Completed',
+            total_amount=Decimal('20.00'), created_at=START + timedelta(minutes=i)
+        ))
+        session.add(PaymentModel(booking_id=i, method='Card', provider_txn_id=f'txn-{i}',
+                                 amount=Decimal('20.00'), status='Captured'))
+        session.add_all([PayoutModel(tutor_id=2, booking_id=i, amount=Decimal('9.00'), status='Paid')
+                         for _ in range(2)])
+    session.add(ComplaintModel(raised_by_user=1, against_user=2, booking_id=3, type='Behavior', detail='late'))
+    session.commit()
+    return BookingRepository(session)
+
+
+def test_detail_query_count_does_not_grow_with_the_page(bookings):
+    with query_budget() as one:
+        detail = bookings.get_detail(3)
+    with query_budget(max_repeats=1) as page:
+        details = bookings.get_details_by_student_id(1)
+    # One joined SELECT plus one IN query each for payouts and complaints
+    assert one.count == page.count == 3
+    assert detail.student.full_name == 'Sam Student' and detail.tutor.full_name == 'Tia Tutor'
+    assert detail.payment.provider_txn_id == 'txn-3'
+    assert len(detail.payouts) == 2 and len(detail.complaints) == 1 and detail.review is None
+    assert [d.booking.id for d in details] == [5, 4, 3, 2, 1]
+    assert all(len(d.payouts) == 2 for d in details)
+
+
+def test_include_limits_what_is_loaded(bookings):
+    with query_budget() as scope:
+        detail = bookings.get_detail(1, include=['payment'])
+    assert scope.count == 1
+    assert detail.payment is not None
+    assert detail.student is None and detail.payouts == []
+    with pytest.raises(InvalidIncludeError):
+        bookings.get_detail(1, include=['teacher'])
+
+
+def test_load_options_pick_a_strategy_per_relationship(bookings, session):
+    def statements(include):
+        session.expunge_all()
+        with query_budget() as scope:
+            for booking in session.query(BookingModel).options(*load_options(BookingModel, include)):
+                booking.payment, booking.payouts, booking.tutor.user
+        return scope.count
+
+    # To-one joined into the main query, collections with one IN query
+    assert statements(['payment', 'payouts', 'tutor.user']) == 2
+    assert statements({'payment': None, 'payouts': 'joined', 'tutor.user': None}) == 1
+    assert load_options(BookingModel, None) == []
+    with pytest.raises(InvalidIncludeError):
+        load_options(BookingModel, {'payouts': 'eager'})
+    with pytest.raises(InvalidIncludeError):
+        load_options(BookingModel, ['tutor.nothing'])
+
+
+def test_lazy_loading_in_a_loop_exceeds_the_repeat_budget(bookings, session):
+    session.expunge_all()
+    with pytest.raises(QueryBudgetExceeded, match='likely N\\+1'):
+        with query_budget(max_repeats=2):
+            for booking in session.query(BookingModel).all():
+                booking.payouts
+    with pytest.raises(QueryBudgetExceeded, match='queries \\(budget 1\\)'):
+        with query_budget(max_queries=1):
+            bookings.get_detail(1)
+
+
+def test_detail_endpoints(bookings, make_client):
+    client = make_client(bp)
+    detail = client.get('/bookings/3/detail').get_json()
+    assert detail['booking']['status'] == 'Completed'
+    assert detail['subject']['name'] == 'Algebra' and len(detail['complaints']) == 1
+    partial = client.get('/bookings/3/detail?include=payouts').get_json()
+    assert partial['payment'] is None and len(partial['payouts']) == 2
+    assert client.get('/bookings/3/detail?include=teacher').status_code == 400
+    assert client.get('/bookings/9/detail').status_code == 404
+
+    page = client.get('/bookings/student/1/detail?limit=2')
+    assert [item['booking']['id'] for item in page.get_json()] == [5, 4]
+    assert 'X-Next-Cursor' in page.headers
@@ -0,0 +1,70 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from api.controllers.payouts_controller import bp
+from infrastructure.databases.mssql import engine
+from infrastructure.models.payout_model import PayoutModel
+from infrastructure.repositories import payout_repository
+from infrastructure.repositories.payout_repository import PayoutRepository
+from services.payout_service import PayoutService
+
+
+@pytest.fixture
+def payouts(session):
+    rows = [(1, '10.00', 'Paid'), (1, '15.50', 'Paid'), (1, '7.25', 'Pending'), (1, '2.75', 'Processing'),
+            (2, '30.00', 'Failed'), (3, '4.00', 'Paid')]
+    session.add_all([
+        PayoutModel(tutor_id=tutor_id, booking_id=number, amount=Decimal(amount), status=status,
+                    created_at=datetime(2026, 9, 1), updated_at=datetime(2026, 9, 1))
+        for number, (tutor_id, amount, status) in enumerate(rows, start=1)
+    ])
+    session.commit()
+
+
+@pytest.fixture
+def queries():
+    sent = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        sent.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', record)
+    yield sent
+    event.remove(engine, 'before_cursor_execute', record)
+
+
+def test_service_totals_come_from_one_query(session, payouts, queries):
+    service = PayoutService(PayoutRepository(session))
+    assert service.calculate_tutor_earnings(1) == Decimal('25.50')
+    assert service.calculate_pending_earnings(1) == Decimal('10.00')
+    assert service.calculate_tutor_earnings(9) == Decimal('0.00')
+    assert len(queries) == 3
+    assert all('GROUP BY' in statement for statement in queries)
+
+
+def test_tutor_id_lists_are_chunked(session, payouts, queries, monkeypatch):
+    monkeypatch.setattr(payout_repository, 'IN_CLAUSE_CHUNK', 2)
+    summaries = PayoutRepository(session).earnings_summaries([1, 2, 3])
+    assert len(queries) == 2
+    assert [summaries[tutor_id].total_earnings for tutor_id in (1, 2, 3)] == [
+        Decimal('25.50'), Decimal('0.00'), Decimal('4.00')
+    ]
+
+
+def test_earnings_endpoints(payouts, make_client):
+    client = make_client(bp)
+    single = client.get('/payouts/tutor/1/earnings').get_json()
+    assert single == {'tutor_id': 1, 'total_earnings': '25.50', 'pending_earnings': '10.00',
+                      'completed_payouts_count': 2, 'pending_payouts_count': 2}
+
+    many = client.get('/payouts/earnings?tutor_ids=3,1,7').get_json()
+    assert [(row['tutor_id'], row['total_earnings']) for row in many] == [(3, '4.00'), (1, '25.50'), (7, '0.00')]
+
+
+@pytest.mark.parametrize('tutor_ids', ['', 'a,b', ','.join(str(i) for i in range(501))])
+def test_earnings_endpoint_rejects_bad_id_lists(payouts, make_client, tutor_ids):
+    client = make_client(bp)
+    assert client.get(f'/payouts/earnings?tutor_ids={tutor_ids}').status_code == 400
@@ -0,0 +1,86 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from api import exports
+from api.controllers.exports_controller import bp
+from infrastructure.models.payment_model import PaymentModel
+from infrastructure.models.payout_model import PayoutModel
+
+START = datetime(2026, 9, 1)
+STATUSES = ['Captured', 'Failed', 'Captured', 'Refunded', 'Captured']
+
+
+@pytest.fixture
+def client(session, make_client):
+    for i, status in enumerate(STATUSES, start=1):
+        session.add(PaymentModel(id=i, booking_id=i, method='Card', provider_txn_id=f'txn-{i}',
+                                 amount=Decimal('12.50'), status=status, created_at=START + timedelta(days=i)))
+        session.add(PayoutModel(tutor_id=7, booking_id=i, amount=Decimal('10.00'), status='Paid',
+                                created_at=START + timedelta(days=i)))
+    session.commit()
+    return make_client(bp)
+
+
+def _ndjson(body: bytes):
+    return [json.loads(line) for line in body.decode().splitlines()]
+
+
+def test_ndjson_export_streams_oldest_first(client):
+    response = client.get('/exports/payments')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    assert response.headers['Content-Disposition'] == 'attachment; filename="payments.ndjson"'
+    rows = _ndjson(response.data)
+    assert [row['id'] for row in rows] == [1, 2, 3, 4, 5]
+    assert rows[0]['amount'] == '12.50' and rows[0]['status'] == 'Captured'
+    assert len(_ndjson(client.get('/exports/payouts').data)) == 5
+
+
+def test_filters_are_applied_in_sql(client):
+    rows = _ndjson(client.get('/exports/payments?status=Failed&status=Refunded').data)
+    assert [row['id'] for row in rows] == [2, 4]
+    window = '&from=2026-09-03T00:00:00&to=2026-09-05T00:00:00'
+    rows = _ndjson(client.get(f'/exports/payments?status=Captured{window}').data)
+    assert [row['id'] for row in rows] == [3]
+    assert client.get('/exports/payments?status=Lost').status_code == 400
+    assert client.get('/exports/payments?format=csv').status_code == 400
+
+
+def test_json_array_format(client):
+    response = client.get('/exports/payments?format=json&status=Failed')
+    assert response.mimetype == 'application/json'
+    assert [row['id'] for row in json.loads(response.data)] == [2]
+    empty = client.get('/exports/payments?format=json&status=Failed&from=2030-01-01T00:00:00')
+    assert json.loads(empty.data) == []
+
+
+@pytest.mark.parametrize('accept, gzipped', [
+    ('gzip', True),
+    ('gzip, deflate;q=0.5', True),
+    ('gzip;q=0', False),
+    ('gzip;q=0.2, identity;q=1', False),
+    ('br', False),
+])
+def test_gzip_follows_accept_encoding_quality(client, accept, gzipped):
+    response = client.get('/exports/payments', headers={'Accept-Encoding': accept})
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert (response.headers.get('Content-Encoding') == 'gzip') is gzipped
+    body = gzip.decompress(response.data) if gzipped else response.data
+    assert len(_ndjson(body)) == 5
+
+
+def test_rows_are_gathered_into_chunks(monkeypatch):
+    monkeypatch.setattr(exports, 'EXPORT_CHUNK_BYTES', 20)
+    rows = [{'id': i, 'name': 'x' * 5} for i in range(4)]
+    chunks = list(exports.ndjson_chunks(rows))
+    assert len(chunks) == 4
+    assert _ndjson(b''.join(chunks)) == rows
+    chunks = list(exports.json_array_chunks(iter(rows)))
+    assert len(chunks) > 1 and json.loads(b''.join(chunks)) == rows
+    assert json.loads(b''.join(exports.json_array_chunks([]))) == []
+    compressed = b''.join(exports.gzip_chunks(exports.ndjson_chunks(rows)))
+    assert _ndjson(gzip.decompress(compressed)) == rows
@@ -0,0 +1,117 @@
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from api.controllers.payments_controller import bp
+from domain.models.idempotency_record import IdempotencyRecord
+from infrastructure.models.idempotency_key_model import IdempotencyKeyModel
+from infrastructure.models.payment_model import PaymentModel
+from infrastructure.repositories.idempotency_key_repository import IdempotencyKeyRepository
+from infrastructure.repositories.payment_repository import PaymentRepository
+from services.idempotency_service import IdempotencyKeyInProgress, IdempotencyKeyReused, IdempotencyService
+
+PAYMENT = {'booking_id': 1, 'amount': '25.00', 'method': 'Card', 'provider_txn_id': 'txn-1'}
+
+
+@pytest.fixture
+def service(session):
+    return IdempotencyService(IdempotencyKeyRepository, ttl_seconds=60, wait_seconds=0.1, lease_seconds=5)
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client(bp)
+
+
+def _headers():
+    return {'Idempotency-Key': uuid.uuid4().hex}
+
+
+def test_replays_a_successful_response_without_running_the_handler(service):
+    calls = []
+
+    def handler():
+        calls.append(1)
+        return 201, 'application/json', '{"id": 1}'
+
+    record, replayed = service.execute('k1', 'hash', handler)
+    assert (record.status_code, replayed) == (201, False)
+    record, replayed = service.execute('k1', 'hash', handler)
+    assert (record.status_code, record.response_body, replayed) == (201, '{"id": 1}', True)
+    # From the table too, when the process cache is cold
+    service.cache.clear()
+    assert service.execute('k1', 'hash', handler)[1] is True
+    assert len(calls) == 1
+
+
+def test_key_reused_with_another_body_is_refused(service):
+    service.execute('k2', 'hash', lambda: (200, 'application/json', '{}'))
+    with pytest.raises(IdempotencyKeyReused):
+        service.execute('k2', 'other', lambda: (200, 'application/json', '{}'))
+
+
+@pytest.mark.parametrize('status_code', [400, 404, 500, 503])
+def test_error_responses_release_the_key(service, session, status_code):
+    responses = iter([(status_code, 'application/json', '{"error": "x"}'), (201, 'application/json', '{}')])
+    assert service.execute('k3', 'hash', lambda: next(responses))[0].status_code == status_code
+    assert session.query(IdempotencyKeyModel).count() == 0
+    record, replayed = service.execute('k3', 'hash', lambda: next(responses))
+    assert (record.status_code, replayed) == (201, False)
+
+
+def test_raising_handler_releases_the_key(service):
+    def fail():
+        raise RuntimeError('connection reset')
+
+    with pytest.raises(RuntimeError):
+        service.execute('k4', 'hash', fail)
+    assert service.execute('k4', 'hash', lambda: (200, None, ''))[1] is False
+
+
+def test_unfinished_claim_blocks_until_its_lease_expires(service, session):
+    IdempotencyKeyRepository().claim(
+        IdempotencyRecord(key='k5', request_hash='hash', expires_at=datetime.utcnow() + timedelta(seconds=30))
+    )
+    with pytest.raises(IdempotencyKeyInProgress):
+        service.execute('k5', 'hash', lambda: (200, None, ''))
+    session.query(IdempotencyKeyModel).update({'expires_at': datetime.utcnow() - timedelta(seconds=1)})
+    session.commit()
+    assert service.execute('k5', 'hash', lambda: (200, None, ''))[1] is False
+
+
+def test_create_payment_replays_the_created_payment(client, session):
+    headers = _headers()
+    first = client.post('/payments/', json=PAYMENT, headers=headers)
+    second = client.post('/payments/', json=PAYMENT, headers=headers)
+    assert first.status_code == second.status_code == 201
+    assert second.headers['Idempotent-Replayed'] == 'true'
+    assert second.get_json() == first.get_json()
+    assert session.query(PaymentModel).count() == 1
+
+
+def test_create_payment_database_error_is_not_replayed(client, session, monkeypatch):
+    add = PaymentRepository.add
+    failures = iter([ValueError('Error adding payment: connection reset')])
+
+    def flaky_add(self, payment):
+        for error in failures:
+            raise error
+        return add(self, payment)
+
+    monkeypatch.setattr(PaymentRepository, 'add', flaky_add)
+    headers = _headers()
+    failed = client.post('/payments/', json=PAYMENT, headers=headers)
+    assert failed.status_code == 500
+    retried = client.post('/payments/', json=PAYMENT, headers=headers)
+    assert retried.status_code == 201
+    assert 'Idempotent-Replayed' not in retried.headers
+    assert session.query(PaymentModel).one().amount == Decimal('25.00')
+
+
+def test_create_payment_invalid_body_is_a_400(client):
+    response = client.post('/payments/', json={'amount': '-1'}, headers=_headers())
+    assert response.status_code == 400
+    assert 'booking_id' in response.get_json()['errors']
+    assert client.post('/payments/', data='not json', headers=_headers()).status_code == 400
@@ -0,0 +1,102 @@
+import threading
+import time
+
+from services.index_cache import IndexCache
+
+
+class _Index:
+    def __init__(self, version):
+        self.version = version
+        self.built_at = time.monotonic()
+
+
+class _Builder:
+    """Builds numbered indexes, optionally running a hook mid-build"""
+
+    def __init__(self, during=None):
+        self.builds = 0
+        self.during = during
+
+    def __call__(self):
+        self.builds += 1
+        if self.during:
+            self.during()
+        return _Index(self.builds)
+
+
+def test_builds_once_and_reuses():
+    cache = IndexCache(ttl_seconds=60)
+    build = _Builder()
+    assert cache.get(build).version == 1
+    assert cache.get(build).version == 1
+    assert build.builds == 1
+
+
+def test_rebuilds_after_ttl():
+    cache = IndexCache(ttl_seconds=0)
+    build = _Builder()
+    cache.get(build)
+    assert cache.get(build).version == 2
+
+
+def test_invalidate_rebuilds_on_next_get():
+    cache = IndexCache(ttl_seconds=60, min_rebuild_seconds=0)
+    build = _Builder()
+    cache.get(build)
+    cache.invalidate()
+    assert cache.get(build).version == 2
+    assert cache.get(build).version == 2
+
+
+def test_invalidations_are_coalesced():
+    cache = IndexCache(ttl_seconds=60, min_rebuild_seconds=60)
+    build = _Builder()
+    cache.get(build)
+    for _ in range(10):
+        cache.invalidate()
+        assert cache.get(build).version == 1
+    assert build.builds == 1
+
+
+def test_index_built_across_an_invalidation_is_kept_and_rebuilt_once_more():
+    cache = IndexCache(ttl_seconds=60, min_rebuild_seconds=0)
+    build = _Builder(during=cache.invalidate)
+    assert cache.get(build).version == 1
+    build.during = None
+    # Stored although stale, so the next reader has something to serve
+    assert cache._entry[0].version == 1
+    assert cache.get(build).version == 2
+    assert cache.get(build).version == 2
+
+
+def test_stale_index_is_served_while_another_caller_rebuilds():
+    cache = IndexCache(ttl_seconds=60, min_rebuild_seconds=0)
+    cache.get(_Builder())
+    cache.invalidate()
+    started, release = threading.Event(), threading.Event()
+
+    def slow_build():
+        started.set()
+        release.wait(5)
+        return _Index(2)
+
+    rebuild = threading.Thread(target=cache.get, args=(slow_build,))
+    rebuild.start()
+    assert started.wait(5)
+    other = _Builder()
+    assert cache.get(other).version == 1
+    assert other.builds == 0
+    release.set()
+    rebuild.join(5)
+    assert cache.get(other).version == 2
+
+
+def test_writes_faster_than_builds_still_fill_the_cache():
+    cache = IndexCache(ttl_seconds=60, min_rebuild_seconds=60)
+    build = _Builder(during=cache.invalidate)
+    versions = []
+    for _ in range(15):
+        versions.append(cache.get(build).version)
+        cache.invalidate()
+    assert versions == [1] * 15
+    assert build.builds == 1
@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy import Column, Index, Integer, MetaData, String, Table, UniqueConstraint
+
+from infrastructure.databases.index_check import check_repositories, index_column_lists, is_supported, main
+
+
+def test_every_declared_query_path_is_index_backed():
+    problems = {
+        name: messages for name, messages in check_repositories().items()
+        # Modules needing optional packages missing here are covered by test_main_reports_success
+        if not all(message.startswith('could not be imported') for message in messages)
+    }
+    assert problems == {}
+
+
+def test_main_reports_success(capsys):
+    pytest.importorskip('dotenv')
+    assert main() == 0
+    assert 'index-backed' in capsys.readouterr().out
+
+
+def test_paths_must_be_a_leading_prefix_of_an_index():
+    table = Table(
+        'things', MetaData(),
+        Column('id', Integer, primary_key=True),
+        Column('owner_id', Integer),
+        Column('status', String(10)),
+        Column('code', String(10), unique=True),
+        Column('created_at', Integer),
+        UniqueConstraint('owner_id', 'code'),
+        Index('ix_things_status_created', 'status', 'created_at', 'id')
+    )
+    indexes = index_column_lists(table)
+    assert is_supported(('id',), indexes)
+    assert is_supported(('code',), indexes)
+    assert is_supported(('owner_id',), indexes)
+    assert is_supported(('status', 'created_at'), indexes)
+    assert not is_supported(('created_at',), indexes)
+    assert not is_supported(('status', 'id'), indexes)
@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import update
+
+from infrastructure.cache import indexes
+from infrastructure.models.subject_model import SubjectModel
+from infrastructure.models.todo_model import TodoModel
+from services.index_cache import IndexCache
+
+
+@pytest.fixture
+def watched():
+    cache = indexes.watch_tables(IndexCache(ttl_seconds=60), SubjectModel)
+    yield cache
+    indexes._watched.remove((cache, frozenset({SubjectModel.__table__.name})))
+
+
+def test_flushed_write_marks_index_stale_on_commit(session, watched):
+    session.add(SubjectModel(name='Algebra', level='K12'))
+    session.flush()
+    assert watched._generation == 0
+    session.commit()
+    assert watched._generation == 1
+
+
+def test_bulk_update_marks_index_stale_on_commit(session, watched):
+    session.add(SubjectModel(name='Algebra', level='K12'))
+    session.commit()
+    session.execute(update(SubjectModel).values(name='Geometry'))
+    session.commit()
+    assert watched._generation == 2
+
+
+def test_rolled_back_write_leaves_index_alone(session, watched):
+    session.add(SubjectModel(name='Algebra', level='K12'))
+    session.flush()
+    session.rollback()
+    session.commit()
+    assert watched._generation == 0
+
+
+def test_writes_to_other_tables_are_ignored(session, watched):
+    session.execute(update(TodoModel).values(status=TodoModel.status))
+    session.commit()
+    assert watched._generation == 0
@@ -0,0 +1,158 @@
+import re
+
+import pytest
+from flask import Flask, g, jsonify
+
+from api.controllers import metrics_controller
+from api.instrumentation import (
+    EndpointMetrics, begin_request_timing, end_request_timing, record_serialization, server_timing
+)
+from api.prometheus import CONTENT_TYPE, PrometheusText
+
+
+def test_percentiles_use_the_most_recent_window():
+    metrics = EndpointMetrics(window=4)
+    for seconds in (10.0, 1.0, 2.0, 3.0, 4.0):
+        metrics.record('payouts.get_payout', 'GET', 200, seconds)
+    metrics.record('payouts.get_payout', 'GET', 503, 0.5, db_seconds=0.1, queries=2, rows=3)
+
+    stats = metrics.snapshot()[('payouts.get_payout', 'GET')]
+
+    assert stats['requests'] == 6
+    assert stats['errors'] == 1
+    assert stats['queries'] == 2
+    assert stats['rows'] == 3
+    assert stats['seconds'] == pytest.approx(20.5)
+    # 10.0 and 1.0 fell out of the window: [0.5, 2.0, 3.0, 4.0]
+    assert stats['quantiles'] == {0.50: 3.0, 0.95: 4.0, 0.99: 4.0}
+
+
+def test_snapshot_of_empty_and_reset_registry():
+    metrics = EndpointMetrics()
+    assert metrics.snapshot() == {}
+
+    metrics.record('a', 'GET', 200, 1.0)
+    metrics.reset()
+
+    assert metrics.snapshot() == {}
+
+
+def test_server_timing_header_value():
+    value = server_timing(0.0079, 0.0041, 3, 0.0008)
+
+    assert value == 'db;dur=4.1;desc="queries=3", serialize;dur=0.8, total;dur=7.9'
+
+
+@pytest.fixture
+def metrics():
+    return EndpointMetrics()
+
+
+def make_app(metrics, add_header=True):
+    app = Flask(__name__)
+    app.before_request(begin_request_timing)
+    app.after_request(lambda response: end_request_timing(response, None, metrics, add_header))
+
+    @app.route('/items/<int:item_id>')
+    def get_item(item_id):
+        record_serialization(0.25)
+        record_serialization(0.25)
+        return jsonify({'id': item_id})
+
+    return app.test_client()
+
+
+def test_requests_are_recorded_per_endpoint_with_server_timing(metrics):
+    client = make_app(metrics)
+
+    response = client.get('/items/1')
+    client.get('/items/2')
+    client.get('/missing')
+
+    header = response.headers['Server-Timing']
+    assert re.fullmatch(r'db;dur=0\.0;desc="queries=0", serialize;dur=500\.0, total;dur=\d+\.\d', header)
+    snapshot = metrics.snapshot()
+    assert snapshot[('get_item', 'GET')]['requests'] == 2
+    assert snapshot[('get_item', 'GET')]['serialize_seconds'] == pytest.approx(1.0)
+    assert snapshot[('unmatched', 'GET')]['requests'] == 1
+
+
+def test_server_timing_header_can_be_disabled(metrics):
+    client = make_app(metrics, add_header=False)
+
+    response = client.get('/items/1')
+
+    assert 'Server-Timing' not in response.headers
+    assert metrics.snapshot()[('get_item', 'GET')]['requests'] == 1
+
+
+def test_end_request_timing_without_begin_is_a_no_op(metrics):
+    app = Flask(__name__)
+    with app.test_request_context('/'):
+        response = end_request_timing(app.response_class('x'), None, metrics)
+        assert g.get('serialize_seconds') is None
+
+    assert 'Server-Timing' not in response.headers
+    assert metrics.snapshot() == {}
+
+
+def test_prometheus_text_format():
+    text = PrometheusText()
+    text.add('requests_total', 'counter', 'Requests', [({'path': 'a"b\\c\nd'}, 3), ({}, None)])
+    text.add('requests_total', 'counter', '', [({}, 1.5)], suffix='_sum')
+    text.add('up', 'gauge', 'Up', [({}, True)])
+
+    assert text.render() == (
+        '# HELP requests_total Requests\n'
+        '# TYPE requests_total counter\n'
+        'requests_total{path="a\\"b\\\\c\\nd"} 3\n'
+        'requests_total_sum 1.5\n'
+        '# HELP up Up\n'
+        '# TYPE up gauge\n'
+        'up 1\n'
+    )
+
+
+@pytest.fixture
+def metrics_client(make_client, monkeypatch):
+    registry = EndpointMetrics()
+    monkeypatch.setattr(metrics_controller, 'endpoint_metrics', registry)
+    registry.record('payouts.get_payout', 'GET', 200, 0.2, db_seconds=0.05, queries=3, rows=1)
+    return make_client(metrics_controller.bp)
+
+
+def test_metrics_endpoint(metrics_client):
+    response = metrics_client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.content_type == CONTENT_TYPE
+    body = response.get_data(as_text=True)
+    labels = 'endpoint="payouts.get_payout",method="GET"'
+    assert f'http_requests_total{{{labels}}} 1\n' in body
+    assert f'http_request_duration_seconds{{{labels},quantile="0.99"}} 0.2\n' in body
+    assert f'http_request_duration_seconds_count{{{labels}}} 1\n' in body
+    assert f'http_request_db_queries_total{{{labels}}} 3\n' in body
+    assert '# TYPE db_pool_checked_out gauge' in body
+    assert 'stream_subscribers 0' in body
+    assert 'notification_queue_depth{channel=' in body
+
+
+def test_metrics_endpoint_requires_the_token_when_set(metrics_client, monkeypatch):
+    monkeypatch.setattr(metrics_controller.Config, 'METRICS_TOKEN', 'secret')
+
+    assert metrics_client.get('/metrics').status_code == 401
+    assert metrics_client.get('/metrics', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+    assert metrics_client.get('/metrics', headers={'Authorization': 'Bearer secret'}).status_code == 200
+
+
+def test_metrics_endpoint_survives_a_failing_source(metrics_client, monkeypatch):
+    def broken():
+        raise RuntimeError('database down')
+    monkeypatch.setattr(metrics_controller, 'get_dispatch_service', broken)
+
+    response = metrics_client.get('/metrics')
+
+    assert response.status_code == 200
+    body = response.get_data(as_text=True)
+    assert 'http_requests_total' in body
+    assert 'notification_queue_depth' not in body
@@ -0,0 +1,116 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from domain.models.interfaces.inotification_sender import INotificationSender
+from domain.models.notification import NotificationChannel, NotificationType
+from infrastructure.models.notification_counter_model import NotificationCounterModel
+from infrastructure.models.notification_model import NotificationModel
+from infrastructure.repositories.notification_repository import NotificationRepository
+from services.notification_dispatch_service import NotificationDispatchService
+from services.notification_inbox_service import NotificationInboxService
+
+EMAIL = NotificationChannel.EMAIL
+
+
+class RecordingSender(INotificationSender):
+    """Fails the ids in `failing`; remembers every batch it was given"""
+
+    channel = EMAIL
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def send_batch(self, notifications):
+        with self._lock:
+            self.batches.append([notification.id for notification in notifications])
+        return {notification.id: 'mailbox full' for notification in notifications if notification.id in self.failing}
+
+
+@pytest.fixture
+def queued(session):
+    inbox = NotificationInboxService(NotificationRepository(session))
+    return [inbox.notify(7, NotificationType.SYSTEM, '{}', EMAIL).id for _ in range(5)]
+
+
+def _service(sender, **options):
+    options.setdefault('batch_size', 2)
+    return NotificationDispatchService(NotificationRepository, {EMAIL: sender}, **options)
+
+
+def _rows(session):
+    session.expire_all()
+    return {model.id: model for model in session.query(NotificationModel)}
+
+
+def _unread(session):
+    return session.query(NotificationCounterModel.unread_count).filter_by(user_id=7).scalar()
+
+
+def test_delivered_rows_are_marked_sent_and_counted_unread(session, queued):
+    sender = RecordingSender()
+    service = _service(sender)
+    assert service.dispatch_once(EMAIL) == 2
+    assert sender.batches == [queued[:2]]
+    rows = _rows(session)
+    assert all(rows[i].sent_at is not None for i in queued[:2])
+    assert all(rows[i].sent_at is None for i in queued[2:])
+    assert _unread(session) == 2
+    assert service.metrics.snapshot()['Email']['sent'] == 2
+
+
+def test_failures_back_off_then_give_up(session, queued):
+    sender = RecordingSender(failing=[queued[0]])
+    service = _service(sender, batch_size=5, max_attempts=2, retry_base_seconds=60)
+    assert service.deliver(EMAIL, *service.claim_batch(EMAIL)) == (4, 1, 0)
+    failed = _rows(session)[queued[0]]
+    assert (failed.attempts, failed.last_error, failed.claim_token) == (1, 'mailbox full', None)
+    assert failed.next_attempt_at > datetime.utcnow() + timedelta(seconds=25)
+    # Not due yet
+    assert service.dispatch_once(EMAIL) == 0
+
+    failed.next_attempt_at = datetime.utcnow()
+    session.commit()
+    assert service.deliver(EMAIL, *service.claim_batch(EMAIL)) == (0, 0, 1)
+    assert _rows(session)[queued[0]].failed_at is not None
+    assert service.queue_stats()[EMAIL].depth == 0
+
+
+def test_sender_exceptions_fail_the_whole_batch(session, queued):
+    class BrokenSender(RecordingSender):
+        def send_batch(self, notifications):
+            raise ConnectionError('smtp down')
+
+    service = _service(BrokenSender())
+    assert service.dispatch_once(EMAIL) == 2
+    rows = _rows(session)
+    assert [rows[i].last_error for i in queued[:2]] == ['smtp down', 'smtp down']
+
+
+def test_expired_leases_are_claimed_again(session, queued):
+    service = _service(RecordingSender(), lease_seconds=-1)
+    first_token, first = service.claim_batch(EMAIL)
+    second_token, second = service.claim_batch(EMAIL)
+    assert [n.id for n in first] == [n.id for n in second] == queued[:2]
+    # Only the current holder of the claim can mark the rows sent
+    assert NotificationRepository().mark_sent_many(queued[:2], first_token, datetime.utcnow()) == 0
+    assert NotificationRepository().mark_sent_many(queued[:2], second_token, datetime.utcnow()) == 2
+
+
+def test_run_drains_every_channel_with_bounded_workers(session, queued):
+    sender = RecordingSender()
+    _service(sender, concurrency=2).run(drain=True)
+    assert sorted(i for batch in sender.batches for i in batch) == queued
+    assert all(len(batch) <= 2 for batch in sender.batches)
+    assert all(row.sent_at is not None for row in _rows(session).values())
+    assert _unread(session) == 5
+
+
+def test_retry_delay_is_capped_with_jitter():
+    service = _service(RecordingSender(), retry_base_seconds=10, retry_max_seconds=100)
+    for attempts, ceiling in [(1, 10), (3, 40), (10, 100)]:
+        delay = service.retry_delay(attempts).total_seconds()
+        assert ceiling / 2 <= delay <= ceiling
@@ -0,0 +1,98 @@
+from datetime import datetime
+
+import pytest
+
+from api.controllers.notifications_controller import bp
+from infrastructure.models.notification_counter_model import NotificationCounterModel
+from infrastructure.models.notification_model import NotificationModel
+from infrastructure.repositories.notification_repository import NotificationRepository
+
+
+@pytest.fixture
+def client(session, make_client):
+    return make_client(bp)
+
+
+def _notify(client, channel='InApp', user_id=7):
+    response = client.post('/notifications/', json={'user_id': user_id, 'type': 'System',
+                                                    'channel': channel, 'payload': '{}'})
+    assert response.status_code == 201
+    return response.get_json()['id']
+
+
+def _unread(client, user_id=7):
+    return client.get(f'/notifications/unread-count?user_id={user_id}').get_json()['unread_count']
+
+
+def _counter(session, user_id=7):
+    return session.query(NotificationCounterModel.unread_count).filter_by(user_id=user_id).scalar()
+
+
+def test_counter_follows_the_inbox(client, session):
+    first = _notify(client)
+    _notify(client)
+    # Not sent yet: not in the badge
+    _notify(client, channel='Email')
+    _notify(client, user_id=8)
+    assert _unread(client) == 2
+
+    assert client.post(f'/notifications/{first}/read', json={'user_id': 7}).status_code == 200
+    # Marking it again, or as someone else, changes nothing
+    assert client.post(f'/notifications/{first}/read', json={'user_id': 7}).status_code == 200
+    assert client.post(f'/notifications/{first}/read', json={'user_id': 8}).status_code == 404
+    assert _unread(client) == 1
+
+    read_all = client.post('/notifications/read-all', json={'user_id': 7}).get_json()
+    assert read_all == {'user_id': 7, 'unread_count': 0}
+    assert _unread(client, 8) == 1
+    # Unsent notifications are left unread
+    assert session.query(NotificationModel).filter_by(channel='Email', read_at=None).count() == 1
+
+
+def test_inbox_pages_and_unread_filter(client):
+    ids = [_notify(client) for _ in range(3)]
+    client.post(f'/notifications/{ids[1]}/read', json={'user_id': 7})
+
+    first = client.get('/notifications/?user_id=7&limit=2')
+    assert [item['id'] for item in first.get_json()] == [ids[2], ids[1]]
+    second = client.get(f"/notifications/?user_id=7&limit=2&after={first.headers['X-Next-Cursor']}")
+    assert [item['id'] for item in second.get_json()] == [ids[0]]
+    unread = client.get('/notifications/?user_id=7&unread=true').get_json()
+    assert [item['id'] for item in unread] == [ids[2], ids[0]]
+
+    etag = first.headers['ETag']
+    assert client.get('/notifications/?user_id=7&limit=2', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/notifications/?user_id=7').status_code == 200
+    assert client.get('/notifications/').status_code == 400
+
+
+def _seed_without_counter(session, count):
+    now = datetime.utcnow()
+    models = [NotificationModel(user_id=7, type='System', channel='InApp', payload='{}', sent_at=now)
+              for _ in range(count)]
+    session.add_all(models)
+    session.commit()
+    return [model.id for model in models]
+
+
+def test_first_badge_read_backfills_the_counter(session):
+    _seed_without_counter(session, 3)
+    repository = NotificationRepository(session)
+    assert _counter(session) is None
+    assert repository.get_unread_count(7) == 3
+    assert _counter(session) == 3
+
+
+def test_update_and_delete_backfill_without_counting_their_own_change(session):
+    ids = _seed_without_counter(session, 3)
+    repository = NotificationRepository(session)
+    notification = repository.get_by_id(ids[0])
+    notification.read_at = datetime.utcnow()
+    repository.update(notification)
+    assert _counter(session) == 2
+
+    session.query(NotificationCounterModel).delete()
+    session.commit()
+    repository.delete(ids[1])
+    assert _counter(session) == 1
+    assert repository.get_unread_count(7) == 1
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from api.controllers.payments_controller import bp
+from infrastructure.models.payment_model import PaymentModel
+from infrastructure.models.subject_model import SubjectModel
+from infrastructure.repositories.pagination import InvalidCursorError, decode_cursor, encode_cursor, next_cursor
+from infrastructure.repositories.subject_repository import SubjectRepository
+
+START = datetime(2026, 1, 1, 9, 0)
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(START, 42)
+    assert '=' not in cursor
+    assert decode_cursor(cursor) == (START, 42)
+    assert decode_cursor(encode_cursor(START.isoformat(), 42)) == (START, 42)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor('not-a-cursor')
+
+
+def test_next_cursor_only_for_full_pages():
+    rows = [{'id': 3, 'created_at': START.isoformat()}, {'id': 2, 'created_at': START.isoformat()}]
+    assert next_cursor(rows, 2) == encode_cursor(START, 2)
+    assert next_cursor(rows, 3) is None
+
+
+def test_pages_walk_every_row_once_across_created_at_ties(session):
+    # Pairs of rows share a created_at, so the id tie-breaker decides the order
+    session.add_all([
+        SubjectModel(id=i, name=f'Subject {i}', level='K12', created_at=START + timedelta(minutes=i // 2))
+        for i in range(1, 8)
+    ])
+    session.commit()
+
+    seen, after = [], None
+    while True:
+        page = SubjectRepository(session).get_all(limit=3, after=after)
+        seen.extend(subject.id for subject in page)
+        after = next_cursor(page, 3)
+        if after is None:
+            break
+    assert seen == [7, 6, 5, 4, 3, 2, 1]
+    assert [subject.id for subject in SubjectRepository(session).get_all()] == seen
+
+
+@pytest.fixture
+def client(session, make_client):
+    session.add_all([
+        PaymentModel(id=i, booking_id=i, method='Card', provider_txn_id=f'txn-{i}', amount=Decimal('10.00'),
+                     status='Captured' if i != 3 else 'Failed', created_at=START + timedelta(minutes=i))
+        for i in range(1, 6)
+    ])
+    session.commit()
+    return make_client(bp)
+
+
+def test_list_endpoint_returns_the_next_cursor_in_a_header(client):
+    first = client.get('/payments/status/Captured?limit=2')
+    assert first.status_code == 200
+    assert [payment['id'] for payment in first.get_json()] == [5, 4]
+    cursor = first.headers['X-Next-Cursor']
+
+    second = client.get(f'/payments/status/Captured?limit=2&after={cursor}')
+    assert [payment['id'] for payment in second.get_json()] == [2, 1]
+    third = client.get(f"/payments/status/Captured?limit=2&after={second.headers['X-Next-Cursor']}")
+    assert third.get_json() == []
+    assert 'X-Next-Cursor' not in third.headers
+
+
+@pytest.mark.parametrize('query', ['limit=0', 'limit=101', 'limit=many', 'after=garbage'])
+def test_invalid_pagination_arguments_are_rejected(client, query):
+    response = client.get(f'/payments/status/Captured?{query}')
+    assert response.status_code == 400
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from infrastructure.models.booking_model import BookingModel
+from infrastructure.models.payment_model import PaymentModel
+from infrastructure.models.payout_model import PayoutModel
+from infrastructure.repositories.payout_repository import PayoutRepository
+from services.payout_service import PayoutService
+
+
+def _booking(session, booking_id, tutor_id=1, status='Completed'):
+    start = datetime(2026, 9, 1, 10) + timedelta(days=booking_id)
+    session.add(BookingModel(
+        id=booking_id, student_id=100, tutor_id=tutor_id, service_id=1, subject_id=1,
+        start_at=start, end_at=start + timedelta(hours=1), hours=Decimal('1'),
+        status=status, total_amount=Decimal('50')
+    ))
+
+
+def _payment(session, booking_id, amount='50.00', status='Captured'):
+    session.add(PaymentModel(
+        booking_id=booking_id, method='Card', provider_txn_id=f'txn-{booking_id}-{amount}',
+        amount=Decimal(amount), status=status
+    ))
+
+
+@pytest.fixture
+def bookings(session):
+    for booking_id in range(1, 6):
+        _booking(session, booking_id, tutor_id=booking_id % 2 + 1)
+        # Booking 3: only authorized
+        _payment(session, booking_id, status='Authorized' if booking_id == 3 else 'Captured')
+    # Booking 2: the capture was recorded twice (retried capture)
+    _payment(session, 2)
+    # Booking 6: not completed
+    _booking(session, 6, status='Confirmed')
+    _payment(session, 6)
+    session.commit()
+    return session
+
+
+def test_payable_rows_list_each_booking_once(bookings):
+    rows = PayoutRepository(bookings).get_payable_booking_rows()
+    assert [row[0] for row in rows] == [1, 2, 4, 5]
+    assert dict((row[0], row[2]) for row in rows)[2] == Decimal('50.00')
+
+
+def test_duplicate_capture_takes_the_largest_amount(bookings):
+    _payment(bookings, 2, amount='60.00')
+    bookings.commit()
+    rows = PayoutRepository(bookings).get_payable_booking_rows()
+    assert dict((row[0], row[2]) for row in rows)[2] == Decimal('60.00')
+
+
+def test_generate_batch_with_duplicate_capture_chunks_and_reruns(bookings):
+    service = PayoutService(PayoutRepository(bookings), Decimal('0.10'))
+    assert list(service.iter_generate_batch('2026-09', chunk_size=3)) == [3, 1]
+    payouts = bookings.query(PayoutModel).order_by(PayoutModel.booking_id).all()
+    assert [payout.booking_id for payout in payouts] == [1, 2, 4, 5]
+    assert {payout.amount for payout in payouts} == {Decimal('45.00')}
+    assert {payout.idempotency_key for payout in payouts} == {'booking:1', 'booking:2', 'booking:4', 'booking:5'}
+    # A rerun creates nothing twice
+    assert service.generate_batch('2026-09', chunk_size=2) == 0
+
+
+def test_batch_status_moves(bookings):
+    service = PayoutService(PayoutRepository(bookings))
+    service.generate_batch('2026-09')
+    assert service.process_batch('2026-09') == 4
+    assert service.process_batch('2026-09') == 0
+    assert service.complete_batch('2026-09') == 4
+    assert {payout.status for payout in bookings.query(PayoutModel)} == {'Paid'}
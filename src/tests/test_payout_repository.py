@@ -0,0 +1,53 @@
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from api.schemas.payout import PayoutResponseSchema
+from domain.models.payout import PayoutStatus
+from infrastructure.models.payout_model import PayoutModel
+from infrastructure.repositories.payout_repository import PayoutRepository
+
+
+@pytest.fixture
+def payouts(session):
+    created = datetime(2026, 9, 1)
+    rows = [
+        (1, '10.00', 'Paid'), (1, '15.50', 'Paid'), (1, '7.25', 'Pending'),
+        (1, '2.75', 'Processing'), (2, '30.00', 'Failed'), (2, '5.00', 'Pending')
+    ]
+    for number, (tutor_id, amount, status) in enumerate(rows, start=1):
+        session.add(PayoutModel(
+            tutor_id=tutor_id, booking_id=number, amount=Decimal(amount), status=status,
+            created_at=created + timedelta(minutes=number), updated_at=created + timedelta(minutes=number)
+        ))
+    session.commit()
+    return PayoutRepository(session)
+
+
+def test_earnings_summaries_group_by_tutor_and_status(payouts):
+    summaries = payouts.earnings_summaries([1, 2, 3, 1])
+    assert set(summaries) == {1, 2, 3}
+    first = summaries[1]
+    assert first.totals_by_status == {PayoutStatus.PAID: Decimal('25.50'), PayoutStatus.PENDING: Decimal('7.25'),
+                                      PayoutStatus.PROCESSING: Decimal('2.75')}
+    assert all(type(status) is PayoutStatus for status in first.counts_by_status)
+    assert first.total_earnings == Decimal('25.50')
+    assert first.pending_earnings == Decimal('10.00')
+    assert first.completed_payouts_count == 2
+    assert summaries[2].counts_by_status == {PayoutStatus.FAILED: 1, PayoutStatus.PENDING: 1}
+    assert summaries[3].total_earnings == Decimal('0.00')
+
+
+def test_raw_rows_match_the_response_schema(payouts):
+    rows = payouts.get_rows_by_status(PayoutStatus.PAID)
+    expected = PayoutResponseSchema().dump(payouts.get_by_status(PayoutStatus.PAID), many=True)
+    # Decimals are rendered as strings once encoded
+    assert rows == json.loads(json.dumps(expected, default=str))
+
+
+def test_iter_rows_streams_oldest_first_with_filters(payouts):
+    rows = list(payouts.iter_rows(statuses=[PayoutStatus.PENDING, PayoutStatus.FAILED], chunk_size=1))
+    assert [row['booking_id'] for row in rows] == [3, 5, 6]
+    assert rows[0]['status'] == 'Pending' and rows[0]['amount'] == '7.25'
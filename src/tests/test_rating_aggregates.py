@@ -0,0 +1,72 @@
+from decimal import Decimal
+
+import pytest
+
+from domain.models.review import Review
+from infrastructure.models.tutor_profile_model import TutorProfileModel
+from infrastructure.repositories.review_repository import ReviewRepository
+from infrastructure.repositories.tutor_profile_repository import TutorProfileRepository
+
+
+@pytest.fixture
+def reviews(session):
+    session.add(TutorProfileModel(user_id=7, full_name='Alice Smith', bio='algebra', hourly_rate=Decimal('20.00')))
+    session.commit()
+    return ReviewRepository(session)
+
+
+def _aggregates(session):
+    profile = session.get(TutorProfileModel, 7)
+    session.refresh(profile)
+    histogram = [getattr(profile, f'rating_{stars}_count') for stars in range(1, 6)]
+    return profile.rating_count, profile.rating_avg, histogram
+
+
+def _review(booking_id, rating):
+    return Review(booking_id=booking_id, student_id=booking_id + 100, tutor_id=7, rating=rating)
+
+
+def test_writes_adjust_count_average_and_histogram(session, reviews):
+    first = reviews.add(_review(1, 5))
+    reviews.add(_review(2, 4))
+    reviews.add(_review(3, 2))
+    assert _aggregates(session) == (3, Decimal('3.67'), [0, 1, 0, 1, 1])
+    assert reviews.get_average_rating_for_tutor(7) == pytest.approx(3.67)
+
+    first.update_rating(3)
+    reviews.update(first)
+    assert _aggregates(session) == (3, Decimal('3.00'), [0, 1, 1, 1, 0])
+
+    assert reviews.delete(first.id)
+    assert _aggregates(session) == (2, Decimal('3.00'), [0, 1, 0, 1, 0])
+
+
+def test_deleting_the_last_review_resets_the_average(session, reviews):
+    review = reviews.add(_review(1, 4))
+    reviews.delete(review.id)
+    assert _aggregates(session) == (0, Decimal('0.00'), [0, 0, 0, 0, 0])
+    assert reviews.get_average_rating_for_tutor(7) == 0.0
+
+
+def test_profile_edits_leave_the_rating_columns_alone(session, reviews):
+    profiles = TutorProfileRepository(session)
+    stale = profiles.get_by_user_id(7)
+    reviews.add(_review(1, 5))
+    stale.bio = 'algebra and geometry'
+    profiles.update(stale)
+    assert _aggregates(session) == (1, Decimal('5.00'), [0, 0, 0, 0, 1])
+
+
+def test_reconcile_fixes_only_drifted_profiles(session, reviews):
+    reviews.add(_review(1, 5))
+    reviews.add(_review(2, 3))
+    session.add(TutorProfileModel(user_id=8, full_name='Bob Jones', bio='topology', hourly_rate=Decimal('40.00')))
+    profile = session.get(TutorProfileModel, 7)
+    profile.rating_count, profile.rating_avg, profile.rating_5_count = 9, Decimal('1.00'), 0
+    session.commit()
+
+    assert reviews.reconcile_rating_aggregates(dry_run=True) == [7]
+    assert _aggregates(session)[0] == 9
+    assert reviews.reconcile_rating_aggregates() == [7]
+    assert _aggregates(session) == (2, Decimal('4.00'), [0, 0, 1, 0, 1])
+    assert reviews.reconcile_rating_aggregates() == []
@@ -0,0 +1,67 @@
+import pytest
+from flask import Blueprint, abort, jsonify
+
+from api.middleware import middleware
+from infrastructure.databases.mssql import get_session
+from infrastructure.models.subject_model import SubjectModel
+
+bp = Blueprint('session_test', __name__)
+
+
+def _add(name):
+    get_session().add(SubjectModel(name=name, level='K12'))
+    get_session().flush()
+
+
+@bp.route('/ok')
+def ok():
+    _add('ok')
+    return jsonify({}), 201
+
+
+@bp.route('/raises')
+def raises():
+    _add('raises')
+    raise RuntimeError('half way')
+
+
+@bp.route('/caught')
+def caught():
+    _add('caught')
+    return jsonify({'error': 'half way'}), 500
+
+
+@bp.route('/aborts')
+def aborts():
+    _add('aborts')
+    abort(404)
+
+
+@pytest.fixture
+def client(make_client):
+    client = make_client(bp)
+    # The app's error handler turns every exception into a 500 response
+    middleware(client.application)
+    return client
+
+
+def _names(session):
+    session.expire_all()
+    return [name for name, in session.query(SubjectModel.name)]
+
+
+def test_successful_request_commits(client, session):
+    assert client.get('/ok').status_code == 201
+    assert _names(session) == ['ok']
+
+
+@pytest.mark.parametrize('path', ['/raises', '/caught', '/aborts'])
+def test_failed_request_rolls_back(client, session, path):
+    assert client.get(path).status_code >= 400
+    assert _names(session) == []
+
+
+def test_sessions_are_per_request(client, session):
+    client.get('/caught')
+    assert client.get('/ok').status_code == 201
+    assert _names(session) == ['ok']
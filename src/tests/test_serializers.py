@@ -0,0 +1,102 @@
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+from flask import Flask, jsonify
+from marshmallow import Schema, fields
+
+from api import json_provider
+from api.json_provider import init_json
+from api.schemas.notification import NotificationResponseSchema
+from api.schemas.payment import PaymentResponseSchema
+from api.serializers import compile_schema
+from domain.models.notification import Notification, NotificationChannel, NotificationType
+from domain.models.payment import Payment, PaymentStatus
+
+
+class Color(Enum):
+    RED = 'red'
+
+
+class Item:
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+
+class ChildSchema(Schema):
+    name = fields.Str()
+
+
+class MixedSchema(Schema):
+    id = fields.Int(required=True)
+    label = fields.Str(data_key='title')
+    code = fields.Str(attribute='internal_code')
+    active = fields.Bool()
+    ratio = fields.Float()
+    price = fields.Decimal(places=2, as_string=True)
+    exact = fields.Decimal()
+    when = fields.DateTime()
+    day = fields.Date()
+    stamp = fields.DateTime(format='%Y/%m/%d')
+    color = fields.Function(lambda obj: obj.color.value)
+    child = fields.Nested(ChildSchema, allow_none=True)
+    tags = fields.List(fields.Str())
+    note = fields.Str(allow_none=True)
+    count = fields.Int()
+
+
+def _item(**overrides):
+    values = dict(
+        id=1, label='Algebra', internal_code='ALG', active=True, ratio=0.5, price=Decimal('12.5'),
+        exact=Decimal('1.234'), when=datetime(2026, 9, 1, 12, 30, 15, 120000), day=date(2026, 9, 1),
+        stamp=datetime(2026, 9, 1), color=Color.RED, child=Item(name='inner'), tags=['a', 'b'],
+        note=None, count='7'
+    )
+    values.update(overrides)
+    return Item(**values)
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def app(request, monkeypatch):
+    if request.param == 'stdlib':
+        monkeypatch.setattr(json_provider, 'orjson', None)
+    elif json_provider.orjson is None:
+        pytest.skip('orjson is not installed')
+    app = Flask(__name__)
+    init_json(app)
+    return app
+
+
+def _encoded(app, data):
+    with app.app_context():
+        return json.loads(jsonify(data).get_data())
+
+
+@pytest.mark.parametrize('schema_cls, objects', [
+    (MixedSchema, [_item(), _item(id=2, child=None, when=datetime(2026, 1, 1, tzinfo=timezone.utc), count=3)]),
+    (PaymentResponseSchema, [Payment(id=1, booking_id=2, provider_txn_id='txn', amount=Decimal('20'),
+                                     status=PaymentStatus.CAPTURED)]),
+    (NotificationResponseSchema, [Notification(id=1, user_id=7, type=NotificationType.SYSTEM,
+                                               channel=NotificationChannel.IN_APP, payload='{}')]),
+])
+def test_compiled_output_encodes_like_schema_dump(app, schema_cls, objects):
+    expected = _encoded(app, schema_cls().dump(objects, many=True))
+    assert _encoded(app, compile_schema(schema_cls).dump(objects, many=True)) == expected
+    assert _encoded(app, compile_schema(schema_cls).dump(objects[0])) == expected[0]
+
+
+def test_configured_instances_and_mappings(app):
+    only = compile_schema(MixedSchema(only=('id', 'price')))
+    assert only.dump(_item()) == {'id': 1, 'price': '12.50'}
+    assert compile_schema(MixedSchema) is compile_schema(MixedSchema)
+    # Dicts fall back to Schema.dump
+    row = {'id': 3, 'label': 'x', 'color': Color.RED}
+    assert compile_schema(MixedSchema(only=('id', 'label'))).dump(row) == {'id': 3, 'title': 'x'}
+
+
+def test_provider_output(app):
+    with app.app_context():
+        body = jsonify({'b': Decimal('1.50'), 'a': datetime(2026, 9, 1), 'c': Color.RED, 'name': 'Zoë'}).get_data()
+    assert body == '{"a":"2026-09-01T00:00:00","b":"1.50","c":"red","name":"Zoë"}\n'.encode()
@@ -0,0 +1,120 @@
+import pytest
+
+from api.controllers import stream_controller
+from api.controllers.stream_controller import bp
+from domain.models.message import Message
+from domain.models.notification import Notification, NotificationChannel, NotificationType
+from domain.models.stream_event import StreamCursor, StreamEvent
+from infrastructure.realtime import EventBroker, LocalPubSubBackend, event_broker
+from infrastructure.repositories.message_repository import MessageRepository
+from infrastructure.repositories.notification_repository import NotificationRepository
+from services.notification_inbox_service import NotificationInboxService
+from services.stream_service import StreamService
+
+
+def _notification(id, user_id=7):
+    return StreamEvent(Notification(id=id, user_id=user_id, type=NotificationType.SYSTEM,
+                                    channel=NotificationChannel.IN_APP, payload='{}'))
+
+
+def _message(id):
+    return StreamEvent(Message(id=id, thread_id=1, sender_id=8, body='hi'))
+
+
+@pytest.fixture
+def broker():
+    return EventBroker(LocalPubSubBackend(), buffer_size=3, max_users=2, queue_size=2)
+
+
+def test_cursor_round_trip_and_ordering():
+    cursor = StreamCursor.decode('4-9')
+    assert cursor.encode() == '4-9'
+    assert cursor.has_seen(_message(4)) and not cursor.has_seen(_notification(10))
+    cursor.advance(_notification(12))
+    cursor.advance(_notification(11))
+    assert cursor.encode() == '4-12'
+    for value in ('', '1', 'a-b', '-1-2', '1-2-3'):
+        with pytest.raises(ValueError):
+            StreamCursor.decode(value)
+
+
+def test_subscribers_get_live_events_until_their_queue_overflows(broker):
+    subscription = broker.subscribe(7)
+    other = broker.subscribe(8)
+    broker.publish([7], _notification(1))
+    assert [event.id for event in subscription.wait(0)] == [1]
+    assert other.wait(0) == []
+    for id in (2, 3, 4):
+        broker.publish([7], _notification(id))
+    assert subscription.overflowed
+    subscription.close()
+    other.close()
+    assert broker.stats()['subscribers'] == 0
+
+
+def test_resume_is_served_from_the_buffer_only_past_its_floor(broker):
+    broker.publish([7], _notification(1))
+    # Without a watermark the buffer cannot prove it is complete
+    assert broker.recent(7, StreamCursor()) is None
+    broker.set_watermark(StreamCursor(0, 0))
+    broker.publish([7], _notification(2))
+    broker.publish([7], _message(5))
+    assert [event.key for event in broker.recent(7, StreamCursor(0, 1))] == [('notification', 2), ('message', 5)]
+    # Pushing notification 1 out of the buffer raises its floor
+    broker.publish([7], _notification(3))
+    assert broker.recent(7, StreamCursor(0, 0)) is None
+    assert [event.id for event in broker.recent(7, StreamCursor(5, 2))] == [3]
+    assert broker.recent(9, StreamCursor(5, 3)) == []
+    assert broker.latest_cursor().encode() == '5-3'
+
+    broker.reset()
+    assert broker.recent(7, StreamCursor(5, 3)) is None
+
+
+def test_backlog_falls_back_to_the_database(session):
+    broker = EventBroker(LocalPubSubBackend())
+    inbox = NotificationInboxService(NotificationRepository(session))
+    ids = [inbox.notify(7, NotificationType.SYSTEM, '{}').id for _ in range(3)]
+    service = StreamService(MessageRepository(session), NotificationRepository(session), broker, catch_up_limit=2)
+
+    events, more = service.backlog(7, StreamCursor())
+    assert [event.id for event in events] == ids[:2] and more
+    events, more = service.backlog(7, StreamCursor(0, ids[1]))
+    assert [event.id for event in events] == ids[2:] and not more
+    # The watermark was taken from the tables, so a new client starts at the end
+    assert service.start_cursor().encode() == f'0-{ids[-1]}'
+
+
+@pytest.fixture
+def client(session, make_client, monkeypatch):
+    event_broker.reset()
+    monkeypatch.setattr(stream_controller.Config, 'STREAM_MAX_SECONDS', 0)
+    yield make_client(bp)
+    event_broker.reset()
+
+
+def test_poll_returns_missed_events_and_the_next_cursor(client, session):
+    inbox = NotificationInboxService(NotificationRepository(session), event_broker)
+    ids = [inbox.notify(7, NotificationType.SYSTEM, '{}').id for _ in range(2)]
+
+    body = client.get('/stream/poll?user_id=7&cursor=0-0&timeout=0').get_json()
+    assert [event['id'] for event in body['events']] == ids
+    assert body['events'][0]['type'] == 'notification'
+    assert body['cursor'] == f'0-{ids[-1]}'
+
+    empty = client.get(f"/stream/poll?user_id=7&cursor={body['cursor']}&timeout=0").get_json()
+    assert empty['events'] == [] and empty['cursor'] == body['cursor']
+    assert client.get('/stream/poll?user_id=7&cursor=bad').status_code == 400
+
+
+def test_sse_replays_from_last_event_id(client, session):
+    inbox = NotificationInboxService(NotificationRepository(session), event_broker)
+    first = inbox.notify(7, NotificationType.SYSTEM, '{"n": 1}').id
+    second = inbox.notify(7, NotificationType.SYSTEM, '{"n": 2}').id
+
+    response = client.get('/stream/events?user_id=7', headers={'Last-Event-ID': f'0-{first}'})
+    assert response.mimetype == 'text/event-stream'
+    body = response.get_data(as_text=True)
+    assert body.startswith(f'retry: {stream_controller.RECONNECT_MS}\nid: 0-{first}\n\n')
+    assert f'id: 0-{second}\nevent: notification\n' in body
+    assert f'id: 0-{first}\nevent:' not in body
@@ -0,0 +1,82 @@
+from datetime import time
+from decimal import Decimal
+
+import pytest
+
+from domain.models.availability_slot import Weekday
+from domain.models.subject import SubjectLevel
+from domain.models.tutor_search import TutorSearchQuery
+from services.tutor_search_service import TutorSearchIndex, tokenize
+
+PROFILES = [
+    (1, 'Alice Nguyễn', 'algebra and geometry', Decimal('20'), 'Verified', Decimal('4.8'), 10),
+    (2, 'Bob Smith', 'calculus tutor', Decimal('60'), 'Pending', Decimal('3.5'), 4),
+    (3, 'Carol Algebrist', 'physics', Decimal('120'), 'Verified', Decimal('4.8'), 20),
+]
+SUBJECTS = [(1, 10, 'K12'), (2, 11, 'Undergrad'), (3, 10, 'K12'), (3, 12, 'Graduate')]
+SLOTS = [
+    # Back-to-back slots: together they cover 10:00-12:00
+    (1, 'Mon', time(10), time(11), 'UTC'),
+    (1, 'Mon', time(11), time(12), 'UTC'),
+    # 17:00-19:00 in Ho Chi Minh City (UTC+7) is 10:00-12:00 UTC
+    (2, 'Mon', time(17), time(19), 'Asia/Ho_Chi_Minh'),
+    # Monday 01:00-03:00 at UTC+7 starts on Sunday 18:00 UTC
+    (3, 'Mon', time(1), time(3), 'Asia/Ho_Chi_Minh'),
+    (3, 'Tue', time(10), time(11), 'UTC'),
+]
+
+
+@pytest.fixture
+def index():
+    return TutorSearchIndex(PROFILES, SUBJECTS, SLOTS)
+
+
+def _ids(index, **criteria):
+    return [hit.tutor_id for hit in index.search(TutorSearchQuery(**criteria)).items]
+
+
+def test_tokenize_folds_accents():
+    assert tokenize('Nguyễn Đức') == ['nguyen', 'duc']
+
+
+def test_text_matches_name_and_bio_with_last_term_as_prefix(index):
+    assert _ids(index, text='alg') == [3, 1]
+    assert _ids(index, text='nguyen') == [1]
+    assert _ids(index, text='calculus tut') == [2]
+
+
+def test_facet_filters_intersect(index):
+    assert _ids(index, subject_ids=[10]) == [3, 1]
+    assert _ids(index, levels=[SubjectLevel.UNDERGRAD]) == [2]
+    assert _ids(index, min_rate=Decimal('50'), max_rate=Decimal('100')) == [2]
+    assert _ids(index, subject_ids=[10], min_rating=4.9) == []
+
+
+def test_adjacent_slots_cover_a_window_together(index):
+    assert _ids(index, weekday=Weekday.MON, start_time=time(10), end_time=time(12)) == [1, 2]
+    assert _ids(index, weekday=Weekday.MON, start_time=time(10, 30), end_time=time(11, 30)) == [1, 2]
+    assert _ids(index, weekday=Weekday.MON, start_time=time(9), end_time=time(11)) == []
+
+
+def test_slots_are_matched_in_utc(index):
+    # Tutor 2's local 17:00-19:00 is not 17:00-19:00 UTC
+    assert 2 not in _ids(index, weekday=Weekday.MON, start_time=time(17), end_time=time(19))
+    assert _ids(index, weekday=Weekday.SUN, start_time=time(18), end_time=time(20)) == [3]
+    assert 3 not in _ids(index, weekday=Weekday.MON)
+    facets = index.search(TutorSearchQuery()).facets
+    assert facets['weekday'] == {'Mon': 2, 'Sun': 1, 'Tue': 1}
+
+
+def test_slot_crossing_the_week_end_is_split():
+    # Sunday 18:00-22:00 in New York ends on Monday UTC (UTC-4 or UTC-5)
+    index = TutorSearchIndex(PROFILES[:1], [], [(1, 'Sun', time(18), time(22), 'America/New_York')])
+    assert _ids(index, weekday=Weekday.SUN, start_time=time(23), end_time=time(23, 59)) == [1]
+    assert _ids(index, weekday=Weekday.MON, start_time=time(0), end_time=time(1)) == [1]
+    assert index.search(TutorSearchQuery()).facets['weekday'] == {'Mon': 1, 'Sun': 1}
+
+
+def test_pagination_and_facets_cover_all_matches(index):
+    result = index.search(TutorSearchQuery(limit=2, offset=0))
+    assert [hit.tutor_id for hit in result.items] == [3, 1]
+    assert result.total == 3 and result.next_offset == 2
+    assert result.facets['verification_status'] == {'Verified': 2, 'Pending': 1}
@@ -0,0 +1,88 @@
+import pytest
+from sqlalchemy import event
+
+from domain.models.subject import Subject, SubjectLevel
+from infrastructure.databases.mssql import SessionLocal, engine
+from infrastructure.databases.unit_of_work import PINNED_KEY, UnitOfWork, in_unit_of_work
+from infrastructure.repositories.subject_repository import SubjectRepository
+
+
+@pytest.fixture
+def commits(session):
+    counted = []
+
+    def record(session):
+        counted.append(session)
+
+    event.listen(session, 'after_commit', record)
+    yield counted
+    event.remove(session, 'after_commit', record)
+
+
+def _names():
+    other = SessionLocal()
+    try:
+        return sorted(subject.name for subject in SubjectRepository(other).get_all())
+    finally:
+        other.close()
+
+
+def test_repository_calls_commit_once_at_the_end(session, commits):
+    repository = SubjectRepository(session)
+    with UnitOfWork(session):
+        repository.add(Subject(name='Algebra', level=SubjectLevel.K12))
+        repository.add(Subject(name='Topology', level=SubjectLevel.GRADUATE))
+        assert commits == []
+        assert _names() == []
+    assert len(commits) == 1
+    assert _names() == ['Algebra', 'Topology']
+    assert not in_unit_of_work(session)
+
+
+def test_error_rolls_the_whole_block_back(session):
+    repository = SubjectRepository(session)
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(session):
+            repository.add(Subject(name='Algebra', level=SubjectLevel.K12))
+            raise RuntimeError('boom')
+    assert _names() == []
+
+
+def test_nested_blocks_join_the_outer_transaction(session, commits):
+    repository = SubjectRepository(session)
+    with UnitOfWork(session):
+        with UnitOfWork(session):
+            repository.add(Subject(name='Algebra', level=SubjectLevel.K12))
+        assert commits == []
+        assert in_unit_of_work(session)
+    assert len(commits) == 1
+
+
+def test_get_then_update_reuses_the_pinned_row(session):
+    subject = SubjectRepository(session).add(Subject(name='Algebra', level=SubjectLevel.K12))
+    repository = SubjectRepository(session)
+    sent = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        sent.append(statement)
+
+    with repository.transaction():
+        loaded = repository.get_by_id(subject.id)
+        assert session.info[PINNED_KEY]
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            loaded.name = 'Linear algebra'
+            repository.update(loaded)
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+        assert not [statement for statement in sent if statement.startswith('SELECT')]
+    assert PINNED_KEY not in session.info
+    assert _names() == ['Linear algebra']
+
+
+def test_owned_session_is_closed_after_the_transaction():
+    repository = SubjectRepository()
+    with repository.transaction():
+        assert in_unit_of_work(repository.session)
+    assert not in_unit_of_work(repository.session)
+    assert not repository.session.in_transaction()